@@ -13,6 +13,7 @@ from app.models.audit_log import AuditLog
 from app.models.announcement import Announcement
 from app.models.crypto import CryptoDeposit, CryptoWithdrawal, HotWalletBalance, ExchangeRateHistory
 from app.models.suspicious import SuspiciousCase
+from app.models.rollup import HourlyRevenueRollup, DailyRevenueRollup, RollupWatermark
 
 config = context.config
 
@@ -0,0 +1,62 @@
+"""Add hourly/daily revenue rollup tables for the dashboard
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-02-04
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Hourly rollup (closed UTC hours, maintained by RevenueRollupTask)
+    op.create_table(
+        "hourly_revenue_rollups",
+        sa.Column("bucket_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("rake", sa.Numeric(20, 2), nullable=False, server_default="0"),
+        sa.Column("hands", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("participant_hands", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("unique_players", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("bucket_start"),
+    )
+
+    # Daily rollup (sum of hourly buckets per UTC day)
+    op.create_table(
+        "daily_revenue_rollups",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("rake", sa.Numeric(20, 2), nullable=False, server_default="0"),
+        sa.Column("hands", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("day"),
+    )
+
+    # Rollup progress
+    op.create_table(
+        "rollup_watermarks",
+        sa.Column("name", sa.String(50), nullable=False),
+        sa.Column("closed_until", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("rollup_watermarks")
+    op.drop_table("daily_revenue_rollups")
+    op.drop_table("hourly_revenue_rollups")
@@ -1,26 +1,33 @@
 """보고서 내보내기 API.
 
-Excel 및 PDF 형식으로 데이터를 내보냅니다.
+Excel, CSV 및 PDF 형식으로 데이터를 내보냅니다.
+
+CSV/Excel은 DB에서 읽는 대로 스트리밍하며 최대 export_stream_max_rows 행까지
+직접 내려받습니다. 그보다 큰 보고서는 /jobs 로 백그라운드 작업을 만들고
+진행률을 조회한 뒤 파일을 내려받습니다.
 """
 
+import re
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Literal
 
-from fastapi import APIRouter, Depends, Query
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_admin_db, get_main_db
+from app.config import get_settings
 from app.models.admin_user import AdminUser
+from app.services.export_jobs import ExportJobStatus, get_export_job_manager
 from app.services.export_service import (
     ExportService,
-    export_users_report,
-    export_transactions_report,
-    export_audit_report,
-    export_revenue_report,
+    ReportSpec,
+    audit_report,
+    custom_report,
+    iterate_rows,
+    revenue_report,
+    transactions_report,
+    users_report,
 )
 from app.utils.dependencies import require_admin
 
@@ -30,21 +37,56 @@ router = APIRouter()
 class ExportFormat(str, Enum):
     """내보내기 형식."""
     EXCEL = "excel"
+    CSV = "csv"
     PDF = "pdf"
 
 
+_CONTENT_TYPES = {
+    ExportFormat.EXCEL: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.PDF: "application/pdf",
+}
+
+_EXTENSIONS = {
+    ExportFormat.EXCEL: "xlsx",
+    ExportFormat.CSV: "csv",
+    ExportFormat.PDF: "pdf",
+}
+
+
 def _get_content_type(format: ExportFormat) -> str:
     """형식에 따른 Content-Type 반환."""
-    if format == ExportFormat.EXCEL:
-        return "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-    return "application/pdf"
+    return _CONTENT_TYPES[format]
 
 
 def _get_filename(report_type: str, format: ExportFormat) -> str:
     """파일명 생성."""
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-    ext = "xlsx" if format == ExportFormat.EXCEL else "pdf"
-    return f"{report_type}_{timestamp}.{ext}"
+    return f"{report_type}_{timestamp}.{_EXTENSIONS[format]}"
+
+
+def _attachment(body, report_type: str, format: ExportFormat) -> StreamingResponse:
+    return StreamingResponse(
+        body,
+        media_type=_get_content_type(format),
+        headers={
+            "Content-Disposition": f"attachment; filename={_get_filename(report_type, format)}"
+        },
+    )
+
+
+async def _export(spec: ReportSpec, format: ExportFormat, limit: int | None = None) -> StreamingResponse:
+    """보고서 응답 생성 (CSV/Excel은 스트리밍, PDF는 최대 PDF_MAX_ROWS 행)."""
+    service = ExportService()
+    if format == ExportFormat.PDF:
+        data = await service.export_report_to_pdf(spec)
+        return _attachment(iter([data]), spec.name, format)
+
+    max_rows = get_settings().export_stream_max_rows
+    limit = min(limit, max_rows) if limit else max_rows
+    # 응답 헤더 전에 쿼리 실행 (SQL 오류는 200 대신 500)
+    body = await service.open_report(spec, format.value, limit)
+    return _attachment(body, spec.name, format)
 
 
 @router.get("/users")
@@ -52,41 +94,9 @@ async def export_users(
     format: ExportFormat = Query(ExportFormat.EXCEL, description="내보내기 형식"),
     is_active: bool | None = Query(None, description="활성 상태 필터"),
     current_user: AdminUser = Depends(require_admin),
-    db: AsyncSession = Depends(get_main_db),
 ):
     """사용자 목록 내보내기."""
-    # 사용자 데이터 조회
-    query = text("""
-        SELECT id, nickname, email, chips, is_active, 
-               created_at, last_login
-        FROM users
-        WHERE (:is_active IS NULL OR is_active = :is_active)
-        ORDER BY created_at DESC
-        LIMIT 10000
-    """)
-    result = await db.execute(query, {"is_active": is_active})
-    users = [
-        {
-            "id": str(row.id)[:8] + "...",
-            "nickname": row.nickname,
-            "email": row.email,
-            "chips": row.chips,
-            "is_active": "Y" if row.is_active else "N",
-            "created_at": row.created_at,
-            "last_login": row.last_login,
-        }
-        for row in result.fetchall()
-    ]
-
-    data = await export_users_report(users, format.value)
-
-    return StreamingResponse(
-        iter([data]),
-        media_type=_get_content_type(format),
-        headers={
-            "Content-Disposition": f"attachment; filename={_get_filename('users', format)}"
-        },
-    )
+    return await _export(users_report(is_active), format)
 
 
 @router.get("/transactions")
@@ -94,39 +104,13 @@ async def export_transactions(
     format: ExportFormat = Query(ExportFormat.EXCEL, description="내보내기 형식"),
     transaction_type: str | None = Query(None, description="거래 유형 필터"),
     status: str | None = Query(None, description="상태 필터"),
+    start_date: datetime | None = Query(None, description="시작 일시 (포함)"),
+    end_date: datetime | None = Query(None, description="종료 일시 (미포함)"),
     current_user: AdminUser = Depends(require_admin),
-    db: AsyncSession = Depends(get_main_db),
 ):
     """거래 내역 내보내기."""
-    query = text("""
-        SELECT id, user_id, type, amount, status, created_at
-        FROM transactions
-        WHERE (:type IS NULL OR type = :type)
-          AND (:status IS NULL OR status = :status)
-        ORDER BY created_at DESC
-        LIMIT 10000
-    """)
-    result = await db.execute(query, {"type": transaction_type, "status": status})
-    transactions = [
-        {
-            "id": str(row.id)[:8] + "...",
-            "user_id": str(row.user_id)[:8] + "...",
-            "type": row.type,
-            "amount": row.amount,
-            "status": row.status,
-            "created_at": row.created_at,
-        }
-        for row in result.fetchall()
-    ]
-
-    data = await export_transactions_report(transactions, format.value)
-
-    return StreamingResponse(
-        iter([data]),
-        media_type=_get_content_type(format),
-        headers={
-            "Content-Disposition": f"attachment; filename={_get_filename('transactions', format)}"
-        },
+    return await _export(
+        transactions_report(transaction_type, status, start_date, end_date), format
     )
 
 
@@ -136,41 +120,9 @@ async def export_audit_logs(
     action: str | None = Query(None, description="액션 필터"),
     admin_user_id: str | None = Query(None, description="관리자 ID 필터"),
     current_user: AdminUser = Depends(require_admin),
-    db: AsyncSession = Depends(get_admin_db),
 ):
     """감사 로그 내보내기."""
-    query = text("""
-        SELECT id, admin_username, action, target_type, target_id, 
-               ip_address, created_at
-        FROM audit_logs
-        WHERE (:action IS NULL OR action = :action)
-          AND (:admin_user_id IS NULL OR admin_user_id = :admin_user_id)
-        ORDER BY created_at DESC
-        LIMIT 10000
-    """)
-    result = await db.execute(query, {"action": action, "admin_user_id": admin_user_id})
-    audit_logs = [
-        {
-            "id": str(row.id)[:8] + "...",
-            "admin_username": row.admin_username,
-            "action": row.action,
-            "target_type": row.target_type,
-            "target_id": str(row.target_id)[:8] + "..." if row.target_id else "",
-            "ip_address": row.ip_address,
-            "created_at": row.created_at,
-        }
-        for row in result.fetchall()
-    ]
-
-    data = await export_audit_report(audit_logs, format.value)
-
-    return StreamingResponse(
-        iter([data]),
-        media_type=_get_content_type(format),
-        headers={
-            "Content-Disposition": f"attachment; filename={_get_filename('audit_logs', format)}"
-        },
-    )
+    return await _export(audit_report(action, admin_user_id), format)
 
 
 @router.get("/revenue")
@@ -178,48 +130,32 @@ async def export_revenue(
     format: ExportFormat = Query(ExportFormat.EXCEL, description="내보내기 형식"),
     days: int = Query(30, ge=1, le=365, description="조회 기간 (일)"),
     current_user: AdminUser = Depends(require_admin),
-    db: AsyncSession = Depends(get_main_db),
 ):
     """수익 보고서 내보내기."""
-    query = text("""
-        SELECT
-            DATE(created_at) as date,
-            SUM(rake_amount) as total_rake,
-            COUNT(*) as total_hands,
-            COUNT(DISTINCT player_id) as unique_players
-        FROM hand_results
-        WHERE created_at >= NOW() - INTERVAL ':days days'
-        GROUP BY DATE(created_at)
-        ORDER BY date DESC
-    """.replace(":days", str(days)))
+    spec = revenue_report(days)
+    service = ExportService()
 
+    # 일별 집계라 최대 365행: 미리 조회해서 테이블이 없거나 오류 시 빈 데이터
     try:
-        result = await db.execute(query)
-        revenue_data = [
-            {
-                "date": row.date.strftime("%Y-%m-%d") if row.date else "",
-                "total_rake": row.total_rake or 0,
-                "total_hands": row.total_hands or 0,
-                "unique_players": row.unique_players or 0,
-                "avg_rake_per_hand": round(
-                    (row.total_rake or 0) / (row.total_hands or 1), 2
-                ),
-            }
-            for row in result.fetchall()
-        ]
+        revenue_data = [row async for row in service.stream_rows(spec, limit=days + 1)]
     except Exception:
-        # 테이블이 없거나 오류 시 빈 데이터
         revenue_data = []
 
-    data = await export_revenue_report(revenue_data, format.value)
+    if format == ExportFormat.PDF:
+        data = await service.export_to_pdf(
+            data=revenue_data,
+            columns=spec.columns,
+            title=spec.title,
+        )
+        return _attachment(iter([data]), spec.name, format)
 
-    return StreamingResponse(
-        iter([data]),
-        media_type=_get_content_type(format),
-        headers={
-            "Content-Disposition": f"attachment; filename={_get_filename('revenue', format)}"
-        },
-    )
+    if format == ExportFormat.CSV:
+        body = service.stream_csv(iterate_rows(revenue_data), spec.columns)
+    else:
+        body = service.stream_excel(
+            iterate_rows(revenue_data), spec.columns, spec.sheet_name, spec.title
+        )
+    return _attachment(body, spec.name, format)
 
 
 @router.get("/custom")
@@ -229,7 +165,6 @@ async def export_custom(
     columns: str = Query(..., description="컬럼 목록 (콤마 구분)"),
     limit: int = Query(1000, ge=1, le=10000, description="최대 행 수"),
     current_user: AdminUser = Depends(require_admin),
-    db: AsyncSession = Depends(get_main_db),
 ):
     """커스텀 내보내기 (관리자 전용).
     
@@ -238,62 +173,112 @@ async def export_custom(
     allowed_tables = {"users", "transactions", "rooms", "hand_results"}
 
     if table not in allowed_tables:
-        from fastapi import HTTPException, status
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Table not allowed. Allowed: {allowed_tables}",
         )
 
     # 컬럼 파싱 및 검증 (간단한 알파벳, 언더스코어만 허용)
-    import re
     column_list = [c.strip() for c in columns.split(",")]
     for col in column_list:
         if not re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", col):
-            from fastapi import HTTPException, status
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Invalid column name: {col}",
             )
 
-    safe_columns = ", ".join(column_list)
-    query = text(f"SELECT {safe_columns} FROM {table} LIMIT :limit")
-    result = await db.execute(query, {"limit": limit})
-    rows = result.fetchall()
-
-    # 데이터 변환
-    data = []
-    for row in rows:
-        row_dict = {}
-        for i, col in enumerate(column_list):
-            val = row[i]
-            if isinstance(val, datetime):
-                row_dict[col] = val.strftime("%Y-%m-%d %H:%M:%S")
-            else:
-                row_dict[col] = str(val) if val is not None else ""
-        data.append(row_dict)
-
-    col_defs = [{"key": c, "header": c} for c in column_list]
+    return await _export(custom_report(table, column_list), format, limit)
+
+
+# =============================================================================
+# 백그라운드 내보내기 작업
+# =============================================================================
+
+
+class ExportJobRequest(BaseModel):
+    """백그라운드 내보내기 요청."""
+    report: Literal["users", "transactions", "audit-logs"]
+    format: Literal["excel", "csv"] = "csv"
+    is_active: bool | None = None
+    transaction_type: str | None = None
+    status: str | None = None
+    start_date: datetime | None = None
+    end_date: datetime | None = None
+    action: str | None = None
+    admin_user_id: str | None = None
+
+
+class ExportJobResponse(BaseModel):
+    """내보내기 작업 상태."""
+    id: str
+    report: str
+    format: str
+    status: str
+    rows_written: int
+    total_rows: int | None
+    progress: float | None
+    error: str | None
+    created_at: float
+    finished_at: float | None
+
+
+def _job_spec(request: ExportJobRequest) -> ReportSpec:
+    if request.report == "users":
+        return users_report(request.is_active)
+    if request.report == "transactions":
+        return transactions_report(
+            request.transaction_type, request.status, request.start_date, request.end_date
+        )
+    return audit_report(request.action, request.admin_user_id)
 
-    service = ExportService()
-    if format == ExportFormat.PDF:
-        file_data = await service.export_to_pdf(
-            data=data,
-            columns=col_defs,
-            title=f"{table.upper()} Report",
-            orientation="landscape",
+
+def _get_own_job(job_id: str, current_user: AdminUser):
+    job = get_export_job_manager().get(job_id)
+    if job is None or job.created_by != str(current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Export job not found",
         )
-    else:
-        file_data = await service.export_to_excel(
-            data=data,
-            columns=col_defs,
-            sheet_name=table.capitalize(),
-            title=f"{table.upper()} Report",
+    return job
+
+
+@router.post("/jobs", response_model=ExportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_export_job(
+    request: ExportJobRequest,
+    current_user: AdminUser = Depends(require_admin),
+):
+    """대용량 보고서 백그라운드 내보내기 시작."""
+    job = get_export_job_manager().start(
+        _job_spec(request), request.format, str(current_user.id)
+    )
+    return ExportJobResponse(**job.to_dict())
+
+
+@router.get("/jobs/{job_id}", response_model=ExportJobResponse)
+async def get_export_job(
+    job_id: str,
+    current_user: AdminUser = Depends(require_admin),
+):
+    """백그라운드 내보내기 진행 상태 조회."""
+    return ExportJobResponse(**_get_own_job(job_id, current_user).to_dict())
+
+
+@router.get("/jobs/{job_id}/download")
+async def download_export_job(
+    job_id: str,
+    current_user: AdminUser = Depends(require_admin),
+):
+    """완료된 백그라운드 내보내기 파일 다운로드."""
+    job = _get_own_job(job_id, current_user)
+    if job.status != ExportJobStatus.COMPLETED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Export job is {job.status.value}",
         )
 
-    return StreamingResponse(
-        iter([file_data]),
+    format = ExportFormat(job.format)
+    return FileResponse(
+        job.file_path,
         media_type=_get_content_type(format),
-        headers={
-            "Content-Disposition": f"attachment; filename={_get_filename(table, format)}"
-        },
+        filename=_get_filename(job.report, format),
     )
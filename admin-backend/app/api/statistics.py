@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends, Query, HTTPException
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_main_db
+from app.database import get_main_db, get_admin_db
 from app.utils.dependencies import require_viewer
 from app.models.admin_user import AdminUser
 from app.services.statistics_service import StatisticsService
@@ -166,9 +166,10 @@ async def get_daily_revenue(
     days: int = Query(30, ge=1, le=365, description="조회 일수"),
     current_user: AdminUser = Depends(require_viewer),
     db: AsyncSession = Depends(get_main_db),
+    admin_db: AsyncSession = Depends(get_admin_db),
 ):
     """일별 매출 조회"""
-    service = StatisticsService(db)
+    service = StatisticsService(db, admin_db=admin_db)
     data = await service.get_daily_revenue(days)
     return [DailyRevenueItem(**item) for item in data]
 
@@ -178,9 +179,10 @@ async def get_weekly_revenue(
     weeks: int = Query(12, ge=1, le=52, description="조회 주수"),
     current_user: AdminUser = Depends(require_viewer),
     db: AsyncSession = Depends(get_main_db),
+    admin_db: AsyncSession = Depends(get_admin_db),
 ):
     """주별 매출 조회"""
-    service = StatisticsService(db)
+    service = StatisticsService(db, admin_db=admin_db)
     data = await service.get_weekly_revenue(weeks)
     return [WeeklyRevenueItem(**item) for item in data]
 
@@ -190,9 +192,10 @@ async def get_monthly_revenue(
     months: int = Query(12, ge=1, le=24, description="조회 월수"),
     current_user: AdminUser = Depends(require_viewer),
     db: AsyncSession = Depends(get_main_db),
+    admin_db: AsyncSession = Depends(get_admin_db),
 ):
     """월별 매출 조회"""
-    service = StatisticsService(db)
+    service = StatisticsService(db, admin_db=admin_db)
     data = await service.get_monthly_revenue(months)
     return [MonthlyRevenueItem(**item) for item in data]
 
@@ -265,9 +268,10 @@ async def get_hourly_player_activity(
     hours: int = Query(24, ge=1, le=168, description="조회 시간 범위"),
     current_user: AdminUser = Depends(require_viewer),
     db: AsyncSession = Depends(get_main_db),
+    admin_db: AsyncSession = Depends(get_admin_db),
 ):
     """시간별 플레이어 활동 조회"""
-    service = StatisticsService(db)
+    service = StatisticsService(db, admin_db=admin_db)
     data = await service.get_hourly_player_activity(hours)
     return [HourlyActivityItem(**item) for item in data]
 
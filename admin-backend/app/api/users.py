@@ -17,6 +17,7 @@ from app.services.user_service import (
     UserServiceError,
     DuplicateEmailError,
     DuplicateNicknameError,
+    InvalidCursorError,
 )
 from app.services.audit_service import AuditService
 
@@ -53,6 +54,8 @@ class PaginatedUsers(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: str | None = None  # 다음 페이지 keyset 커서
+    total_is_estimate: bool = False  # total이 추정치인지
 
 
 class TransactionItem(BaseModel):
@@ -262,6 +265,7 @@ async def list_users(
     sort_order: str = Query("desc", description="Sort order (asc/desc)"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page (keyset pagination)"),
     current_user: AdminUser = Depends(require_viewer),
     db: AsyncSession = Depends(get_main_db),
 ):
@@ -274,9 +278,15 @@ async def list_users(
             page_size=page_size,
             is_banned=is_banned,
             sort_by=sort_by,
-            sort_order=sort_order
+            sort_order=sort_order,
+            cursor=cursor,
         )
         return PaginatedUsers(**result)
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except UserServiceError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
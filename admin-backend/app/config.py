@@ -119,7 +119,21 @@ class Settings(BaseSettings):
     
     # Fraud Detection
     fraud_consumer_enabled: bool = True  # Enable FraudEventConsumer for real-time fraud detection
-    
+    fraud_chip_flow_reconcile_interval: int = 900  # Seconds between SQL chip-flow reconciliation scans (0 = off)
+    
+    # Report Export
+    export_stream_max_rows: int = 100000  # 직접 다운로드 최대 행 수 (초과분은 백그라운드 작업 사용)
+    export_job_max_rows: int = 5000000  # 백그라운드 내보내기 최대 행 수
+    export_job_dir: str = "/tmp/admin-exports"  # 백그라운드 내보내기 파일 저장 경로
+    export_job_ttl_seconds: int = 3600  # 완료된 내보내기 파일 보관 시간 (초)
+    export_job_max_concurrent: int = 2  # 동시 실행 내보내기 작업 수
+
+    # Revenue Rollups (dashboard)
+    revenue_rollup_enabled: bool = True  # 시간별/일별 매출 사전 집계 작업 활성화
+    revenue_rollup_interval: int = 60  # 집계 갱신 간격 (초)
+    revenue_rollup_backfill_days: int = 400  # 최초 실행 시 집계할 과거 일수
+    revenue_rollup_settle_seconds: int = 120  # 시간 버킷 마감 전 대기 시간 (늦게 기록되는 핸드)
+
     # Bot Detection Thresholds
     bot_min_sample_size: int = 10  # Minimum actions for analysis
     bot_std_dev_threshold: float = 50.0  # Max std dev for "consistent timing"
@@ -21,6 +21,7 @@ _wallet_alert_service = None
 _deposit_monitor = None
 _withdrawal_executor = None
 _withdrawal_monitor = None
+_revenue_rollup_task = None
 _redis_client = None
 
 
@@ -29,12 +30,13 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager for startup/shutdown events."""
     global _fraud_consumer, _exchange_rate_task, _wallet_balance_task, _wallet_alert_service
     global _deposit_monitor, _withdrawal_executor, _withdrawal_monitor, _redis_client
+    global _revenue_rollup_task
     import asyncio
 
     # Startup
     try:
         from redis.asyncio import Redis
-        from app.database import get_main_db_session, get_admin_db_session, AdminSessionLocal
+        from app.database import get_main_db_session, get_admin_db_session, AdminSessionLocal, MainSessionLocal
 
         # Redis 클라이언트 생성 (공유)
         _redis_client = Redis.from_url(
@@ -54,6 +56,7 @@ async def lifespan(app: FastAPI):
                     fraud_redis,
                     get_main_db_session,
                     get_admin_db_session,
+                    reconcile_interval_seconds=settings.fraud_chip_flow_reconcile_interval,
                 )
                 await _fraud_consumer.start()
                 logger.info("FraudEventConsumer started successfully")
@@ -96,6 +99,27 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Failed to start HotWalletBalanceTask: {e}")
 
+        # Revenue Rollup Task 시작 (대시보드 매출/활동 사전 집계)
+        if settings.revenue_rollup_enabled:
+            try:
+                from app.tasks.revenue_rollup import RevenueRollupTask
+
+                _revenue_rollup_task = RevenueRollupTask(
+                    main_session_factory=MainSessionLocal,
+                    admin_session_factory=AdminSessionLocal,
+                    interval=settings.revenue_rollup_interval,
+                    backfill_days=settings.revenue_rollup_backfill_days,
+                    settle_seconds=settings.revenue_rollup_settle_seconds,
+                )
+                asyncio.create_task(_revenue_rollup_task.start())
+                logger.info(
+                    f"RevenueRollupTask started (interval: {settings.revenue_rollup_interval}s)"
+                )
+            except Exception as e:
+                logger.error(f"Failed to start RevenueRollupTask: {e}")
+        else:
+            logger.info("RevenueRollupTask is disabled")
+
         # TonDepositMonitor 시작 (입금 자동 감지)
         if settings.deposit_monitor_enabled:
             try:
@@ -210,6 +234,13 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error stopping HotWalletBalanceTask: {e}")
 
+    if _revenue_rollup_task:
+        try:
+            _revenue_rollup_task.stop()
+            logger.info("RevenueRollupTask stopped")
+        except Exception as e:
+            logger.error(f"Error stopping RevenueRollupTask: {e}")
+
     if _fraud_consumer:
         try:
             await _fraud_consumer.stop()
@@ -217,6 +248,13 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error stopping FraudEventConsumer: {e}")
 
+    try:
+        from app.services.export_jobs import shutdown_export_job_manager
+
+        await shutdown_export_job_manager()
+    except Exception as e:
+        logger.error(f"Error stopping export jobs: {e}")
+
     if _redis_client:
         try:
             await _redis_client.close()
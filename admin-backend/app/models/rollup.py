@@ -0,0 +1,55 @@
+from datetime import date, datetime
+from decimal import Decimal
+from sqlalchemy import BigInteger, Date, DateTime, Integer, Numeric, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class HourlyRevenueRollup(Base):
+    """Hourly revenue/activity rollup (closed UTC hours only)"""
+    __tablename__ = "hourly_revenue_rollups"
+
+    bucket_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    rake: Mapped[Decimal] = mapped_column(Numeric(20, 2), nullable=False, default=0)
+    hands: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    participant_hands: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    unique_players: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<HourlyRevenueRollup {self.bucket_start} rake={self.rake}>"
+
+
+class DailyRevenueRollup(Base):
+    """Daily revenue rollup (sum of closed hourly buckets, UTC days)"""
+    __tablename__ = "daily_revenue_rollups"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    rake: Mapped[Decimal] = mapped_column(Numeric(20, 2), nullable=False, default=0)
+    hands: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<DailyRevenueRollup {self.day} rake={self.rake}>"
+
+
+class RollupWatermark(Base):
+    """Rollup progress: every bucket before closed_until is final"""
+    __tablename__ = "rollup_watermarks"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    closed_until: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
@@ -0,0 +1,242 @@
+"""Chip Flow Tracker - 실시간 칩 흐름 매트릭스.
+
+hand_completed 이벤트의 참가자 정보만으로 플레이어 쌍별 칩 흐름을
+증분 집계합니다. 슬라이딩 윈도우 밖으로 밀려난 핸드는 집계에서 빠지므로
+이벤트당 비용은 O(핸드 참가자 수²)이며 DB 조회가 필요 없습니다.
+
+ChipDumpingDetector.detect_one_way_chip_flow()와 같은 기준을 사용합니다:
+- (loser, winner) 쌍이 같은 핸드에 참가한 횟수 = total_hands
+- 그 중 winner의 won_amount가 loser보다 큰 횟수 = winner_wins
+
+SQL 버전은 프로세스 재시작 등으로 놓친 이벤트를 보정하는
+주기적 재조정(reconciliation) 작업으로만 사용합니다.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+
+@dataclass(slots=True)
+class PairFlow:
+    """(loser, winner) 쌍의 윈도우 내 집계."""
+
+    total_hands: int = 0
+    winner_wins: int = 0
+    chips: int = 0  # loser → winner로 이동한 칩 (순손익 비례 배분)
+
+
+@dataclass(slots=True)
+class _HandRecord:
+    """윈도우에 들어있는 핸드 하나의 기여분 (eviction 시 차감)."""
+
+    timestamp: float
+    contributions: list[tuple[tuple[str, str], int, int]]  # (pair, win, chips)
+
+
+class ChipFlowTracker:
+    """슬라이딩 윈도우 기반 쌍별 칩 흐름 매트릭스.
+
+    Usage:
+        tracker = ChipFlowTracker(window_seconds=3600, min_hands=3, min_win_rate=0.9)
+        patterns = tracker.record_hand(event["participants"], timestamp)
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 3600,
+        min_hands: int = 3,
+        min_win_rate: float = 0.9,
+        max_pair_entries: int = 200_000,
+    ):
+        """Initialize ChipFlowTracker.
+
+        Args:
+            window_seconds: 슬라이딩 윈도우 길이 (초)
+            min_hands: 탐지에 필요한 최소 동반 핸드 수
+            min_win_rate: 탐지 기준 승률 (winner_wins / total_hands)
+            max_pair_entries: 윈도우에 유지할 최대 (핸드, 쌍) 기여분 수.
+                메모리 상한이며 핸드당 기여분은 참가자 n명이면 n(n-1)개
+                (9인 핸드 72개). 기여분 하나가 약 150바이트이므로 기본값은
+                약 30MB. 넘으면 가장 오래된 핸드부터 제거
+        """
+        self.window_seconds = window_seconds
+        self.min_hands = min_hands
+        self.min_win_rate = min_win_rate
+        self.max_pair_entries = max_pair_entries
+
+        self._hands: deque[_HandRecord] = deque()
+        self._entry_count = 0  # 윈도우 안 핸드들의 기여분 합계
+        self._pairs: dict[tuple[str, str], PairFlow] = {}
+        # 이미 보고한 쌍 -> 보고 시각 (기준 아래로 내려가면 해제되어 다시 보고 가능)
+        # 보고 시각 순서로 유지하고 윈도우가 지나면 만료 (재조정으로만 표시된
+        # 쌍은 _pairs에 없어 _drop()에서 해제되지 않으므로)
+        self._flagged: OrderedDict[tuple[str, str], float] = OrderedDict()
+
+    @property
+    def hand_count(self) -> int:
+        """윈도우 안의 핸드 수."""
+        return len(self._hands)
+
+    @property
+    def entry_count(self) -> int:
+        """윈도우 안의 (핸드, 쌍) 기여분 수."""
+        return self._entry_count
+
+    @property
+    def pair_count(self) -> int:
+        """집계 중인 (loser, winner) 쌍 수."""
+        return len(self._pairs)
+
+    @property
+    def flagged_count(self) -> int:
+        """보고됨으로 표시된 쌍 수."""
+        return len(self._flagged)
+
+    def get_pair(self, loser_id: str, winner_id: str) -> PairFlow | None:
+        """쌍의 현재 집계 조회."""
+        return self._pairs.get((loser_id, winner_id))
+
+    def record_hand(
+        self,
+        participants: list[dict[str, Any]],
+        timestamp: float | None = None,
+    ) -> list[dict]:
+        """핸드 결과를 매트릭스에 반영하고 새로 기준을 넘은 쌍을 반환.
+
+        Args:
+            participants: 이벤트의 참가자 목록 (user_id, bet_amount, won_amount)
+            timestamp: 핸드 완료 시각 (epoch 초, 생략 시 현재 시각)
+
+        Returns:
+            detect_one_way_chip_flow()와 같은 형식의 의심 패턴 목록
+        """
+        now = time.time() if timestamp is None else timestamp
+        self._evict(now)
+
+        players = [p for p in participants if p.get("user_id")]
+        if len(players) < 2:
+            return []
+
+        contributions = self._hand_contributions(players)
+        for pair, win, chips in contributions:
+            flow = self._pairs.get(pair)
+            if flow is None:
+                flow = self._pairs[pair] = PairFlow()
+            flow.total_hands += 1
+            flow.winner_wins += win
+            flow.chips += chips
+
+        self._hands.append(_HandRecord(timestamp=now, contributions=contributions))
+        self._entry_count += len(contributions)
+        while self._entry_count > self.max_pair_entries and len(self._hands) > 1:
+            self._drop(self._hands.popleft())
+
+        patterns = []
+        for pair, _, _ in contributions:
+            flow = self._pairs.get(pair)
+            if flow is None or not self._is_suspicious(flow):
+                self._flagged.pop(pair, None)
+            elif self.mark_flagged(*pair, timestamp=now):
+                patterns.append(self._to_pattern(pair, flow))
+        return patterns
+
+    def mark_flagged(
+        self,
+        loser_id: str,
+        winner_id: str,
+        timestamp: float | None = None,
+    ) -> bool:
+        """쌍을 보고됨으로 표시. 이미 보고된 쌍이면 False."""
+        pair = (loser_id, winner_id)
+        if pair in self._flagged:
+            return False
+        self._flagged[pair] = time.time() if timestamp is None else timestamp
+        return True
+
+    def _hand_contributions(
+        self,
+        players: list[dict[str, Any]],
+    ) -> list[tuple[tuple[str, str], int, int]]:
+        """핸드 하나가 각 (loser, winner) 쌍에 더하는 값 계산."""
+        net = {
+            p["user_id"]: p.get("won_amount", 0) - p.get("bet_amount", 0)
+            for p in players
+        }
+        total_gain = sum(v for v in net.values() if v > 0)
+
+        contributions = []
+        for loser in players:
+            for winner in players:
+                loser_id = loser["user_id"]
+                winner_id = winner["user_id"]
+                if loser_id == winner_id:
+                    continue
+                win = int(winner.get("won_amount", 0) > loser.get("won_amount", 0))
+                chips = 0
+                if total_gain and net[loser_id] < 0 < net[winner_id]:
+                    chips = -net[loser_id] * net[winner_id] // total_gain
+                contributions.append(((loser_id, winner_id), win, chips))
+        return contributions
+
+    def _evict(self, now: float) -> None:
+        """윈도우를 벗어난 핸드의 기여분 제거."""
+        cutoff = now - self.window_seconds
+        while self._hands and self._hands[0].timestamp < cutoff:
+            self._drop(self._hands.popleft())
+
+        # 보고 후 윈도우가 지난 표시 만료 (윈도우에 남은 쌍은 _drop()이 관리)
+        while self._flagged:
+            pair, flagged_at = next(iter(self._flagged.items()))
+            if flagged_at >= cutoff:
+                break
+            if pair in self._pairs:
+                self._flagged[pair] = now
+                self._flagged.move_to_end(pair)
+            else:
+                del self._flagged[pair]
+
+    def _drop(self, record: _HandRecord) -> None:
+        self._entry_count -= len(record.contributions)
+        for pair, win, chips in record.contributions:
+            flow = self._pairs[pair]
+            flow.total_hands -= 1
+            flow.winner_wins -= win
+            flow.chips -= chips
+            if flow.total_hands <= 0:
+                del self._pairs[pair]
+                self._flagged.pop(pair, None)
+            elif pair in self._flagged and not self._is_suspicious(flow):
+                self._flagged.pop(pair, None)
+
+    def _is_suspicious(self, flow: PairFlow) -> bool:
+        return (
+            flow.total_hands >= self.min_hands
+            and flow.winner_wins / flow.total_hands >= self.min_win_rate
+        )
+
+    @staticmethod
+    def _to_pattern(pair: tuple[str, str], flow: PairFlow) -> dict:
+        return {
+            "loser_id": pair[0],
+            "winner_id": pair[1],
+            "total_hands": flow.total_hands,
+            "winner_wins": flow.winner_wins,
+            "win_rate": round(flow.winner_wins / flow.total_hands, 3),
+            "chips_transferred": flow.chips,
+            "detection_type": "one_way_chip_flow",
+        }
+
+
+def parse_event_timestamp(value: Any) -> float | None:
+    """이벤트의 ISO 8601 timestamp를 epoch 초로 변환 (실패 시 None)."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value)).timestamp()
+    except ValueError:
+        return None
@@ -0,0 +1,240 @@
+"""
+Export Jobs - 대용량 보고서 백그라운드 내보내기
+
+직접 다운로드(export_stream_max_rows 행까지)로 감당하기 어려운 보고서는
+백그라운드 작업으로 파일에 기록하고, 진행률을 조회한 뒤 완료된 파일을
+내려받습니다:
+
+- start(): 작업 등록 후 즉시 반환 (동시 실행 수는 세마포어로 제한)
+- 작업은 ExportService.stream_report()의 청크를 파일에 기록하며
+  누적 행 수를 갱신
+- 완료/실패한 작업과 파일은 ttl_seconds 후 정리 (작업이 남아 있는 동안
+  cleanup_interval 주기로 확인)
+
+작업 상태는 프로세스 메모리에 있으므로 같은 admin 인스턴스에서 조회해야
+합니다.
+"""
+import asyncio
+import logging
+import time
+import uuid
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Optional
+
+from app.config import get_settings
+from app.services.export_service import ExportService, ReportSpec
+
+logger = logging.getLogger(__name__)
+
+
+class ExportJobStatus(str, Enum):
+    """내보내기 작업 상태"""
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class ExportJob:
+    """내보내기 작업"""
+    id: str
+    report: str
+    format: str
+    created_by: str
+    file_path: Path
+    status: ExportJobStatus = ExportJobStatus.PENDING
+    rows_written: int = 0
+    total_rows: Optional[int] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+
+    @property
+    def progress(self) -> Optional[float]:
+        """진행률 (0.0 ~ 1.0, 전체 행 수를 모르면 None)"""
+        if self.status == ExportJobStatus.COMPLETED:
+            return 1.0
+        if not self.total_rows:
+            return None
+        return min(self.rows_written / self.total_rows, 1.0)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (ExportJobStatus.COMPLETED, ExportJobStatus.FAILED)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "report": self.report,
+            "format": self.format,
+            "status": self.status.value,
+            "rows_written": self.rows_written,
+            "total_rows": self.total_rows,
+            "progress": self.progress,
+            "error": self.error,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class ExportJobManager:
+    """백그라운드 내보내기 작업 관리자"""
+
+    def __init__(
+        self,
+        export_dir: str | Path,
+        max_rows: int,
+        ttl_seconds: int = 3600,
+        max_concurrent: int = 2,
+        service: Optional[ExportService] = None,
+        cleanup_interval: float = 60.0,
+    ):
+        self._export_dir = Path(export_dir)
+        self._max_rows = max_rows
+        self._ttl_seconds = ttl_seconds
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._service = service or ExportService()
+        self._jobs: dict[str, ExportJob] = {}
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._cleanup_interval = cleanup_interval
+        self._cleanup_task: Optional[asyncio.Task] = None
+
+    def start(self, spec: ReportSpec, format: str, created_by: str) -> ExportJob:
+        """내보내기 작업 시작
+
+        Args:
+            spec: 보고서 정의
+            format: "csv" 또는 "excel"
+            created_by: 요청한 관리자 ID
+
+        Returns:
+            등록된 작업 (PENDING)
+        """
+        self.cleanup_expired()
+        self._export_dir.mkdir(parents=True, exist_ok=True)
+
+        job_id = uuid.uuid4().hex
+        ext = "csv" if format == "csv" else "xlsx"
+        job = ExportJob(
+            id=job_id,
+            report=spec.name,
+            format=format,
+            created_by=created_by,
+            file_path=self._export_dir / f"{spec.name}_{job_id}.{ext}",
+        )
+        self._jobs[job_id] = job
+        self._tasks[job_id] = asyncio.create_task(self._run(job, spec))
+        if self._cleanup_task is None or self._cleanup_task.done():
+            self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+        return job
+
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        """작업 조회"""
+        return self._jobs.get(job_id)
+
+    async def _run(self, job: ExportJob, spec: ReportSpec) -> None:
+        try:
+            async with self._semaphore:
+                job.status = ExportJobStatus.RUNNING
+                try:
+                    job.total_rows = await self._service.count_rows(spec, self._max_rows)
+                except Exception as e:
+                    # 진행률만 표시하지 못할 뿐 내보내기는 계속
+                    logger.warning(f"내보내기 행 수 조회 실패: job={job.id}, error={e}")
+
+                def on_progress(count: int) -> None:
+                    job.rows_written = count
+
+                partial = job.file_path.with_name(job.file_path.name + ".part")
+                with open(partial, "wb") as f:
+                    async for chunk in self._service.stream_report(
+                        spec, job.format, self._max_rows, on_progress
+                    ):
+                        await asyncio.to_thread(f.write, chunk)
+                partial.rename(job.file_path)
+
+                job.status = ExportJobStatus.COMPLETED
+                logger.info(
+                    f"내보내기 완료: job={job.id}, report={job.report}, rows={job.rows_written}"
+                )
+        except asyncio.CancelledError:
+            job.status = ExportJobStatus.FAILED
+            job.error = "cancelled"
+            raise
+        except Exception as e:
+            logger.error(f"내보내기 실패: job={job.id}, error={e}", exc_info=True)
+            job.status = ExportJobStatus.FAILED
+            job.error = str(e)
+        finally:
+            job.finished_at = time.time()
+            self._tasks.pop(job.id, None)
+            if job.status != ExportJobStatus.COMPLETED:
+                job.file_path.with_name(job.file_path.name + ".part").unlink(missing_ok=True)
+
+    async def _cleanup_loop(self) -> None:
+        """작업이 남아 있는 동안 주기적으로 만료된 작업 정리"""
+        while self._jobs:
+            await asyncio.sleep(self._cleanup_interval)
+            try:
+                self.cleanup_expired()
+            except Exception as e:
+                logger.warning(f"내보내기 작업 정리 실패: error={e}")
+
+    def cleanup_expired(self) -> int:
+        """보관 시간이 지난 작업과 파일 정리
+
+        Returns:
+            정리된 작업 수
+        """
+        now = time.time()
+        expired = [
+            job for job in self._jobs.values()
+            if job.finished and job.finished_at and now - job.finished_at > self._ttl_seconds
+        ]
+        for job in expired:
+            job.file_path.unlink(missing_ok=True)
+            del self._jobs[job.id]
+        return len(expired)
+
+    async def shutdown(self) -> None:
+        """실행 중인 작업 취소 및 파일 정리"""
+        if self._cleanup_task is not None:
+            self._cleanup_task.cancel()
+            await asyncio.gather(self._cleanup_task, return_exceptions=True)
+            self._cleanup_task = None
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        for job in self._jobs.values():
+            job.file_path.unlink(missing_ok=True)
+        self._jobs.clear()
+
+
+# Global instance
+_export_job_manager: Optional[ExportJobManager] = None
+
+
+def get_export_job_manager() -> ExportJobManager:
+    """Get or create the global ExportJobManager instance."""
+    global _export_job_manager
+    if _export_job_manager is None:
+        settings = get_settings()
+        _export_job_manager = ExportJobManager(
+            export_dir=settings.export_job_dir,
+            max_rows=settings.export_job_max_rows,
+            ttl_seconds=settings.export_job_ttl_seconds,
+            max_concurrent=settings.export_job_max_concurrent,
+        )
+    return _export_job_manager
+
+
+async def shutdown_export_job_manager() -> None:
+    """Cancel running exports and remove export files."""
+    global _export_job_manager
+    if _export_job_manager is not None:
+        await _export_job_manager.shutdown()
+        _export_job_manager = None
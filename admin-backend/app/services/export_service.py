@@ -1,19 +1,79 @@
 """보고서 내보내기 서비스.
 
-Excel 및 PDF 형식으로 데이터를 내보냅니다.
+Excel, CSV 및 PDF 형식으로 데이터를 내보냅니다.
+
+대용량 보고서는 메모리에 모으지 않고 스트리밍합니다:
+- DB 행은 서버 사이드 커서(AsyncSession.stream)로 배치 단위로 읽음
+- CSV는 CSV_CHUNK_ROWS 행마다 청크를 내보냄
+- XLSX는 openpyxl write-only 모드로 임시 파일에 쓴 뒤 청크로 읽어 내보냄
+- PDF는 전체 문서를 메모리에서 만들므로 PDF_MAX_ROWS 행까지만 지원
 """
 
+import asyncio
+import csv
 import io
 import logging
+import tempfile
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
 
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
 logger = logging.getLogger(__name__)
 
+# CSV 청크당 행 수
+CSV_CHUNK_ROWS = 1000
+
+# 서버 사이드 커서 배치 크기
+STREAM_BATCH_SIZE = 1000
+
+# XLSX 임시 파일 읽기 크기
+FILE_CHUNK_BYTES = 64 * 1024
+
+# PDF 최대 행 수 (전체 문서를 메모리에서 생성)
+PDF_MAX_ROWS = 10000
+
+SessionFactory = Callable[[], AsyncSession]
+
+
+@dataclass(frozen=True)
+class ReportSpec:
+    """내보내기 보고서 정의.
+
+    query는 :limit 파라미터를 포함해야 합니다 (호출 측에서 최대 행 수 지정).
+    """
+
+    name: str
+    title: str
+    sheet_name: str
+    columns: list[dict[str, str]]
+    query: str
+    params: dict[str, Any] = field(default_factory=dict)
+    transform: Callable[[Any], dict[str, Any]] | None = None
+    database: str = "main"  # "main" 또는 "admin"
+    orientation: str = "landscape"
+
+
+def _cell_value(value: Any) -> Any:
+    """셀 값 변환 (datetime은 문자열, 컬렉션은 repr, None은 빈 문자열)."""
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, (list, dict)):
+        return str(value)
+    if value is None:
+        return ""
+    return value
+
 
 class ExportService:
     """보고서 내보내기 서비스."""
 
+    def __init__(self, session_factories: dict[str, SessionFactory] | None = None):
+        self._session_factories = session_factories
+
     async def export_to_excel(
         self,
         data: list[dict[str, Any]],
@@ -236,130 +296,418 @@ class ExportService:
         return buffer.getvalue()
 
 
-# =============================================================================
-# 보고서 타입별 내보내기 함수
-# =============================================================================
 
+    # =========================================================================
+    # 스트리밍 내보내기
+    # =========================================================================
 
-async def export_users_report(
-    users: list[dict],
-    format: str = "excel",
-) -> bytes:
-    """사용자 보고서 내보내기."""
-    service = ExportService()
-    columns = [
-        {"key": "id", "header": "ID"},
-        {"key": "nickname", "header": "닉네임"},
-        {"key": "email", "header": "이메일"},
-        {"key": "chips", "header": "보유 칩"},
-        {"key": "is_active", "header": "활성"},
-        {"key": "created_at", "header": "가입일"},
-        {"key": "last_login", "header": "마지막 로그인"},
-    ]
-
-    if format == "pdf":
-        return await service.export_to_pdf(
-            data=users,
-            columns=columns,
-            title="사용자 보고서",
-            orientation="landscape",
-        )
-    else:
-        return await service.export_to_excel(
-            data=users,
-            columns=columns,
-            sheet_name="Users",
-            title="사용자 보고서",
-        )
+    def _session_factory(self, database: str) -> SessionFactory:
+        if self._session_factories is None:
+            from app.database import get_admin_db_session, get_main_db_session
 
+            self._session_factories = {
+                "main": get_main_db_session,
+                "admin": get_admin_db_session,
+            }
+        return self._session_factories[database]
 
-async def export_transactions_report(
-    transactions: list[dict],
-    format: str = "excel",
-) -> bytes:
-    """거래 내역 보고서 내보내기."""
-    service = ExportService()
-    columns = [
-        {"key": "id", "header": "ID"},
-        {"key": "user_id", "header": "사용자 ID"},
-        {"key": "type", "header": "유형"},
-        {"key": "amount", "header": "금액"},
-        {"key": "status", "header": "상태"},
-        {"key": "created_at", "header": "일시"},
-    ]
-
-    if format == "pdf":
-        return await service.export_to_pdf(
-            data=transactions,
-            columns=columns,
-            title="거래 내역 보고서",
-            orientation="landscape",
-        )
-    else:
-        return await service.export_to_excel(
-            data=transactions,
-            columns=columns,
-            sheet_name="Transactions",
-            title="거래 내역 보고서",
-        )
+    async def stream_rows(
+        self,
+        spec: ReportSpec,
+        limit: int,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """서버 사이드 커서로 보고서 행을 배치 단위로 읽기.
+
+        Args:
+            spec: 보고서 정의
+            limit: 최대 행 수
+            on_progress: 배치마다 누적 행 수로 호출되는 콜백 (선택)
+        """
+        async with self._session_factory(spec.database)() as db:
+            result = await db.stream(
+                text(spec.query),
+                {**spec.params, "limit": limit},
+                execution_options={"yield_per": STREAM_BATCH_SIZE},
+            )
+            count = 0
+            async for partition in result.partitions(STREAM_BATCH_SIZE):
+                for row in partition:
+                    yield spec.transform(row) if spec.transform else dict(row._mapping)
+                count += len(partition)
+                if on_progress:
+                    on_progress(count)
+
+    async def count_rows(self, spec: ReportSpec, limit: int) -> int:
+        """보고서 행 수 (진행률 표시용)."""
+        async with self._session_factory(spec.database)() as db:
+            result = await db.execute(
+                text(f"SELECT COUNT(*) FROM ({spec.query}) AS report"),
+                {**spec.params, "limit": limit},
+            )
+            return result.scalar() or 0
 
+    async def stream_csv(
+        self,
+        rows: AsyncIterable[dict[str, Any]],
+        columns: list[dict[str, str]],
+    ) -> AsyncIterator[bytes]:
+        """행을 CSV 청크로 변환 (UTF-8 BOM 포함, Excel 한글 호환).
 
-async def export_audit_report(
-    audit_logs: list[dict],
-    format: str = "excel",
-) -> bytes:
-    """감사 로그 보고서 내보내기."""
-    service = ExportService()
-    columns = [
-        {"key": "id", "header": "ID"},
-        {"key": "admin_username", "header": "관리자"},
-        {"key": "action", "header": "액션"},
-        {"key": "target_type", "header": "대상 유형"},
-        {"key": "target_id", "header": "대상 ID"},
-        {"key": "ip_address", "header": "IP 주소"},
-        {"key": "created_at", "header": "일시"},
-    ]
-
-    if format == "pdf":
-        return await service.export_to_pdf(
-            data=audit_logs,
-            columns=columns,
-            title="감사 로그 보고서",
-            orientation="landscape",
-        )
-    else:
-        return await service.export_to_excel(
-            data=audit_logs,
-            columns=columns,
-            sheet_name="AuditLogs",
-            title="감사 로그 보고서",
-        )
+        Args:
+            rows: 행 비동기 이터러블
+            columns: 컬럼 정의 [{"key": "field_name", "header": "Display Name"}]
+
+        Yields:
+            CSV 바이트 청크
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow([col["header"] for col in columns])
+        yield ("\ufeff" + buffer.getvalue()).encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+
+        pending = 0
+        async for row_data in rows:
+            writer.writerow([_cell_value(row_data.get(col["key"])) for col in columns])
+            pending += 1
+            if pending >= CSV_CHUNK_ROWS:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+
+        if pending:
+            yield buffer.getvalue().encode("utf-8")
+
+    async def stream_excel(
+        self,
+        rows: AsyncIterable[dict[str, Any]],
+        columns: list[dict[str, str]],
+        sheet_name: str = "Report",
+        title: str | None = None,
+    ) -> AsyncIterator[bytes]:
+        """행을 openpyxl write-only 모드로 XLSX 파일에 쓰고 청크로 내보내기.
 
+        write-only 워크시트는 행을 바로 임시 파일에 기록하므로 메모리 사용량이
+        행 수와 무관합니다. 열 너비는 헤더 기준으로 고정됩니다.
 
-async def export_revenue_report(
-    revenue_data: list[dict],
-    format: str = "excel",
-) -> bytes:
-    """수익 보고서 내보내기."""
-    service = ExportService()
-    columns = [
-        {"key": "date", "header": "날짜"},
-        {"key": "total_rake", "header": "총 레이크"},
-        {"key": "total_hands", "header": "총 핸드 수"},
-        {"key": "unique_players", "header": "순 플레이어 수"},
-        {"key": "avg_rake_per_hand", "header": "핸드당 평균 레이크"},
-    ]
-
-    if format == "pdf":
-        return await service.export_to_pdf(
-            data=revenue_data,
-            columns=columns,
-            title="수익 보고서",
-        )
-    else:
-        return await service.export_to_excel(
-            data=revenue_data,
-            columns=columns,
-            sheet_name="Revenue",
-            title="수익 보고서",
+        Yields:
+            XLSX 바이트 청크
+        """
+        try:
+            from openpyxl import Workbook
+            from openpyxl.cell import WriteOnlyCell
+            from openpyxl.styles import Alignment, Font, PatternFill
+            from openpyxl.utils import get_column_letter
+        except ImportError:
+            logger.error("openpyxl not installed. Run: pip install openpyxl")
+            raise ImportError("openpyxl 패키지가 필요합니다.")
+
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(sheet_name)
+
+        # write-only 모드에서는 행 추가 전에 열 너비를 지정해야 함
+        for col_idx, col in enumerate(columns, 1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = min(
+                max(len(col["header"]) * 2, 12), 50
+            )
+
+        if title:
+            title_cell = WriteOnlyCell(ws, value=title)
+            title_cell.font = Font(bold=True, size=14)
+            ws.append([title_cell])
+            ws.append([])
+
+        header_fill = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
+        header_font = Font(bold=True, color="FFFFFF")
+        header_alignment = Alignment(horizontal="center", vertical="center")
+        header = []
+        for col in columns:
+            cell = WriteOnlyCell(ws, value=col["header"])
+            cell.fill = header_fill
+            cell.font = header_font
+            cell.alignment = header_alignment
+            header.append(cell)
+        ws.append(header)
+
+        async for row_data in rows:
+            ws.append([_cell_value(row_data.get(col["key"])) for col in columns])
+
+        ws.append([])
+        ws.append([f"생성일시: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')} UTC"])
+
+        with tempfile.TemporaryFile(suffix=".xlsx") as tmp:
+            # zip 압축은 CPU 작업이므로 이벤트 루프 밖에서 실행
+            await asyncio.to_thread(wb.save, tmp)
+            tmp.seek(0)
+            while chunk := tmp.read(FILE_CHUNK_BYTES):
+                yield chunk
+
+    async def stream_report(
+        self,
+        spec: ReportSpec,
+        format: str,
+        limit: int,
+        on_progress: Callable[[int], None] | None = None,
+    ) -> AsyncIterator[bytes]:
+        """보고서를 DB에서 읽으며 CSV/XLSX 청크로 내보내기.
+
+        Args:
+            spec: 보고서 정의
+            format: "csv" 또는 "excel"
+            limit: 최대 행 수
+            on_progress: 누적 행 수 콜백 (선택)
+        """
+        rows = self.stream_rows(spec, limit, on_progress)
+        if format == "csv":
+            chunks = self.stream_csv(rows, spec.columns)
+        else:
+            chunks = self.stream_excel(rows, spec.columns, spec.sheet_name, spec.title)
+        async for chunk in chunks:
+            yield chunk
+
+    async def open_report(
+        self,
+        spec: ReportSpec,
+        format: str,
+        limit: int,
+    ) -> AsyncIterator[bytes]:
+        """쿼리를 실행하고 첫 청크까지 만든 뒤 전체 청크 이터레이터 반환.
+
+        응답 헤더를 보내기 전에 호출하면 SQL 오류가 스트리밍 도중이 아니라
+        여기서 발생하므로 500 응답으로 처리됩니다.
+
+        Raises:
+            Exception: 쿼리 실행 오류
+        """
+        rows = self.stream_rows(spec, limit)
+        first_row = await anext(rows, None)
+        if first_row is not None:
+            rows = _prepend(first_row, rows)
+        if format == "csv":
+            chunks = self.stream_csv(rows, spec.columns)
+        else:
+            chunks = self.stream_excel(rows, spec.columns, spec.sheet_name, spec.title)
+        first_chunk = await anext(chunks, None)
+        if first_chunk is None:
+            return chunks
+        return _prepend(first_chunk, chunks)
+
+    async def export_report_to_pdf(self, spec: ReportSpec) -> bytes:
+        """보고서를 PDF로 내보내기 (최대 PDF_MAX_ROWS 행)."""
+        data = [row async for row in self.stream_rows(spec, PDF_MAX_ROWS)]
+        return await self.export_to_pdf(
+            data=data,
+            columns=spec.columns,
+            title=spec.title,
+            orientation=spec.orientation,
         )
+
+
+# =============================================================================
+# 보고서 정의
+# =============================================================================
+
+
+async def iterate_rows(rows: list[dict[str, Any]]) -> AsyncIterator[dict[str, Any]]:
+    """이미 조회된 행 목록을 스트리밍 writer 입력으로 변환."""
+    for row in rows:
+        yield row
+
+
+async def _prepend(first: Any, rest: AsyncIterator[Any]) -> AsyncIterator[Any]:
+    """미리 읽은 첫 항목을 다시 붙인 이터레이터."""
+    yield first
+    async for item in rest:
+        yield item
+
+
+def _short_id(value: Any) -> str:
+    return str(value)[:8] + "..." if value else ""
+
+
+def users_report(is_active: bool | None = None) -> ReportSpec:
+    """사용자 보고서."""
+    return ReportSpec(
+        name="users",
+        title="사용자 보고서",
+        sheet_name="Users",
+        columns=[
+            {"key": "id", "header": "ID"},
+            {"key": "nickname", "header": "닉네임"},
+            {"key": "email", "header": "이메일"},
+            {"key": "chips", "header": "보유 칩"},
+            {"key": "is_active", "header": "활성"},
+            {"key": "created_at", "header": "가입일"},
+            {"key": "last_login", "header": "마지막 로그인"},
+        ],
+        query="""
+            SELECT id, nickname, email, chips, is_active,
+                   created_at, last_login
+            FROM users
+            WHERE (:is_active IS NULL OR is_active = :is_active)
+            ORDER BY created_at DESC
+            LIMIT :limit
+        """,
+        params={"is_active": is_active},
+        transform=lambda row: {
+            "id": _short_id(row.id),
+            "nickname": row.nickname,
+            "email": row.email,
+            "chips": row.chips,
+            "is_active": "Y" if row.is_active else "N",
+            "created_at": row.created_at,
+            "last_login": row.last_login,
+        },
+    )
+
+
+def transactions_report(
+    transaction_type: str | None = None,
+    status: str | None = None,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+) -> ReportSpec:
+    """거래 내역 보고서."""
+    return ReportSpec(
+        name="transactions",
+        title="거래 내역 보고서",
+        sheet_name="Transactions",
+        columns=[
+            {"key": "id", "header": "ID"},
+            {"key": "user_id", "header": "사용자 ID"},
+            {"key": "type", "header": "유형"},
+            {"key": "amount", "header": "금액"},
+            {"key": "status", "header": "상태"},
+            {"key": "created_at", "header": "일시"},
+        ],
+        query="""
+            SELECT id, user_id, type, amount, status, created_at
+            FROM transactions
+            WHERE (:type IS NULL OR type = :type)
+              AND (:status IS NULL OR status = :status)
+              AND (CAST(:start_date AS timestamptz) IS NULL OR created_at >= :start_date)
+              AND (CAST(:end_date AS timestamptz) IS NULL OR created_at < :end_date)
+            ORDER BY created_at DESC
+            LIMIT :limit
+        """,
+        params={
+            "type": transaction_type,
+            "status": status,
+            "start_date": start_date,
+            "end_date": end_date,
+        },
+        transform=lambda row: {
+            "id": _short_id(row.id),
+            "user_id": _short_id(row.user_id),
+            "type": row.type,
+            "amount": row.amount,
+            "status": row.status,
+            "created_at": row.created_at,
+        },
+    )
+
+
+def audit_report(
+    action: str | None = None,
+    admin_user_id: str | None = None,
+) -> ReportSpec:
+    """감사 로그 보고서."""
+    return ReportSpec(
+        name="audit_logs",
+        title="감사 로그 보고서",
+        sheet_name="AuditLogs",
+        columns=[
+            {"key": "id", "header": "ID"},
+            {"key": "admin_username", "header": "관리자"},
+            {"key": "action", "header": "액션"},
+            {"key": "target_type", "header": "대상 유형"},
+            {"key": "target_id", "header": "대상 ID"},
+            {"key": "ip_address", "header": "IP 주소"},
+            {"key": "created_at", "header": "일시"},
+        ],
+        query="""
+            SELECT id, admin_username, action, target_type, target_id,
+                   ip_address, created_at
+            FROM audit_logs
+            WHERE (:action IS NULL OR action = :action)
+              AND (:admin_user_id IS NULL OR admin_user_id = :admin_user_id)
+            ORDER BY created_at DESC
+            LIMIT :limit
+        """,
+        params={"action": action, "admin_user_id": admin_user_id},
+        transform=lambda row: {
+            "id": _short_id(row.id),
+            "admin_username": row.admin_username,
+            "action": row.action,
+            "target_type": row.target_type,
+            "target_id": _short_id(row.target_id),
+            "ip_address": row.ip_address,
+            "created_at": row.created_at,
+        },
+        database="admin",
+    )
+
+
+def revenue_report(days: int = 30) -> ReportSpec:
+    """수익 보고서 (일별 집계)."""
+    return ReportSpec(
+        name="revenue",
+        title="수익 보고서",
+        sheet_name="Revenue",
+        columns=[
+            {"key": "date", "header": "날짜"},
+            {"key": "total_rake", "header": "총 레이크"},
+            {"key": "total_hands", "header": "총 핸드 수"},
+            {"key": "unique_players", "header": "순 플레이어 수"},
+            {"key": "avg_rake_per_hand", "header": "핸드당 평균 레이크"},
+        ],
+        query="""
+            SELECT
+                DATE(created_at) as date,
+                SUM(rake_amount) as total_rake,
+                COUNT(*) as total_hands,
+                COUNT(DISTINCT player_id) as unique_players
+            FROM hand_results
+            WHERE created_at >= NOW() - make_interval(days => :days)
+            GROUP BY DATE(created_at)
+            ORDER BY date DESC
+            LIMIT :limit
+        """,
+        params={"days": days},
+        transform=lambda row: {
+            "date": row.date.strftime("%Y-%m-%d") if row.date else "",
+            "total_rake": row.total_rake or 0,
+            "total_hands": row.total_hands or 0,
+            "unique_players": row.unique_players or 0,
+            "avg_rake_per_hand": round(
+                (row.total_rake or 0) / (row.total_hands or 1), 2
+            ),
+        },
+        orientation="portrait",
+    )
+
+
+def custom_report(table: str, columns: list[str]) -> ReportSpec:
+    """커스텀 보고서.
+
+    table/columns는 호출 측에서 검증된 식별자여야 합니다.
+    """
+    return ReportSpec(
+        name=table,
+        title=f"{table.upper()} Report",
+        sheet_name=table.capitalize(),
+        columns=[{"key": c, "header": c} for c in columns],
+        query=f"SELECT {', '.join(columns)} FROM {table} LIMIT :limit",
+        transform=lambda row: {
+            col: _custom_value(row[i]) for i, col in enumerate(columns)
+        },
+    )
+
+
+def _custom_value(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    return str(value) if value is not None else ""
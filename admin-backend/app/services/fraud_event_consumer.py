@@ -4,7 +4,8 @@ Redis Pub/Sub 채널을 구독하여 게임 서버에서 발행한 이벤트를
 기존 탐지 서비스들을 호출하여 부정 행위를 분석합니다.
 
 Channels:
-- fraud:hand_completed - 핸드 완료 이벤트 → ChipDumpingDetector
+- fraud:hand_completed - 핸드 완료 이벤트 → ChipFlowTracker
+  (ChipDumpingDetector SQL 스캔은 주기적 재조정 작업으로 실행)
 - fraud:player_action - 플레이어 액션 이벤트 → BotDetector
 - fraud:player_stats - 플레이어 세션 통계 이벤트 → AnomalyDetector
 """
@@ -21,6 +22,8 @@ if TYPE_CHECKING:
     from redis.asyncio import Redis
     from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.services.chip_flow_tracker import ChipFlowTracker, parse_event_timestamp
+
 logger = logging.getLogger(__name__)
 
 # Redis Pub/Sub 채널 이름
@@ -28,6 +31,11 @@ CHANNEL_HAND_COMPLETED = "fraud:hand_completed"
 CHANNEL_PLAYER_ACTION = "fraud:player_action"
 CHANNEL_PLAYER_STATS = "fraud:player_stats"
 
+# 칩 밀어주기 탐지 기준 (실시간 추적 / SQL 재조정 공통)
+CHIP_FLOW_WINDOW_HOURS = 1
+CHIP_FLOW_MIN_HANDS = 3
+CHIP_FLOW_MIN_WIN_RATE = 0.9
+
 
 class FraudEventConsumer:
     """부정 행위 이벤트 소비자 서비스.
@@ -41,6 +49,7 @@ class FraudEventConsumer:
         redis_client: "Redis",
         main_db_factory: Callable[[], "AsyncSession"],
         admin_db_factory: Callable[[], "AsyncSession"],
+        reconcile_interval_seconds: float = 900,
     ):
         """Initialize FraudEventConsumer.
         
@@ -48,6 +57,7 @@ class FraudEventConsumer:
             redis_client: Redis 클라이언트
             main_db_factory: 메인 DB 세션 팩토리
             admin_db_factory: Admin DB 세션 팩토리
+            reconcile_interval_seconds: 칩 흐름 SQL 재조정 주기 (초, 0이면 비활성)
         """
         self.redis = redis_client
         self._main_db_factory = main_db_factory
@@ -60,6 +70,15 @@ class FraudEventConsumer:
         self._action_buffer: dict[str, list[dict]] = {}
         self._action_buffer_size = 20  # 버퍼 크기
 
+        # 쌍별 칩 흐름 매트릭스 (칩 밀어주기 실시간 탐지용)
+        self._chip_flow = ChipFlowTracker(
+            window_seconds=CHIP_FLOW_WINDOW_HOURS * 3600,
+            min_hands=CHIP_FLOW_MIN_HANDS,
+            min_win_rate=CHIP_FLOW_MIN_WIN_RATE,
+        )
+        self._reconcile_interval = reconcile_interval_seconds
+        self._reconcile_task: asyncio.Task | None = None
+
     async def start(self) -> None:
         """이벤트 구독 시작."""
         if self._running:
@@ -81,6 +100,8 @@ class FraudEventConsumer:
         )
         
         self._task = asyncio.create_task(self._listen_loop())
+        if self._reconcile_interval > 0:
+            self._reconcile_task = asyncio.create_task(self._reconcile_loop())
 
     async def stop(self) -> None:
         """이벤트 구독 중지."""
@@ -98,6 +119,14 @@ class FraudEventConsumer:
             except asyncio.CancelledError:
                 pass
             self._task = None
+
+        if self._reconcile_task:
+            self._reconcile_task.cancel()
+            try:
+                await self._reconcile_task
+            except asyncio.CancelledError:
+                pass
+            self._reconcile_task = None
         
         logger.info("FraudEventConsumer stopped")
 
@@ -167,7 +196,8 @@ class FraudEventConsumer:
     async def handle_hand_completed(self, event: dict) -> None:
         """핸드 완료 이벤트 처리.
         
-        ChipDumpingDetector를 호출하여 칩 밀어주기 패턴을 분석합니다.
+        참가자 정보로 쌍별 칩 흐름 매트릭스를 갱신하고, 이번 핸드로
+        기준을 넘은 쌍만 칩 밀어주기로 플래깅합니다 (DB 조회 없음).
         
         Args:
             event: 핸드 완료 이벤트 데이터
@@ -186,44 +216,77 @@ class FraudEventConsumer:
             return
         
         try:
-            # DB 세션 생성
-            main_db = self._main_db_factory()
-            admin_db = self._admin_db_factory()
+            suspicious_patterns = self._chip_flow.record_hand(
+                participants,
+                parse_event_timestamp(event.get("timestamp")),
+            )
             
-            try:
-                from app.services.chip_dumping_detector import ChipDumpingDetector
-                
-                detector = ChipDumpingDetector(main_db, admin_db)
-                
-                # 일방적 칩 흐름 탐지 (최근 핸드 기반)
-                # Note: 실시간 분석을 위해 시간 범위를 짧게 설정
-                suspicious_patterns = await detector.detect_one_way_chip_flow(
-                    time_window_hours=1,
-                    min_hands=3,
-                    min_win_rate=0.9,
+            if suspicious_patterns:
+                logger.warning(
+                    f"Chip dumping patterns detected: {len(suspicious_patterns)} patterns"
                 )
-                
-                if suspicious_patterns:
-                    logger.warning(
-                        f"Chip dumping patterns detected: {len(suspicious_patterns)} patterns"
-                    )
-                    
-                    # 의심 활동 플래깅
-                    for pattern in suspicious_patterns:
-                        await self._flag_suspicious_activity(
-                            detection_type="chip_dumping",
-                            user_ids=[pattern["loser_id"], pattern["winner_id"]],
-                            details=pattern,
-                            severity="high" if pattern["win_rate"] >= 0.95 else "medium",
-                        )
-                        
-            finally:
-                await main_db.close()
-                await admin_db.close()
+                await self._flag_chip_dumping_patterns(suspicious_patterns)
                 
         except Exception as e:
             logger.error(f"Error in handle_hand_completed: {e}")
 
+    async def _reconcile_loop(self) -> None:
+        """칩 흐름 재조정 루프."""
+        while self._running:
+            try:
+                await asyncio.sleep(self._reconcile_interval)
+                await self.reconcile_chip_flow()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in reconcile loop: {e}")
+
+    async def reconcile_chip_flow(self) -> int:
+        """ChipDumpingDetector SQL 스캔으로 실시간 추적 결과 보정.
+        
+        재시작이나 Pub/Sub 유실로 놓친 핸드까지 포함해 같은 기준으로
+        검사하고, 실시간 추적에서 아직 보고하지 않은 쌍만 플래깅합니다.
+        
+        Returns:
+            새로 플래깅한 패턴 수
+        """
+        main_db = self._main_db_factory()
+        admin_db = self._admin_db_factory()
+        
+        try:
+            from app.services.chip_dumping_detector import ChipDumpingDetector
+            
+            detector = ChipDumpingDetector(main_db, admin_db)
+            patterns = await detector.detect_one_way_chip_flow(
+                time_window_hours=CHIP_FLOW_WINDOW_HOURS,
+                min_hands=CHIP_FLOW_MIN_HANDS,
+                min_win_rate=CHIP_FLOW_MIN_WIN_RATE,
+            )
+        finally:
+            await main_db.close()
+            await admin_db.close()
+        
+        missed = [
+            pattern for pattern in patterns
+            if self._chip_flow.mark_flagged(pattern["loser_id"], pattern["winner_id"])
+        ]
+        if missed:
+            logger.warning(
+                f"Chip flow reconciliation found {len(missed)} unreported patterns"
+            )
+            await self._flag_chip_dumping_patterns(missed)
+        return len(missed)
+
+    async def _flag_chip_dumping_patterns(self, patterns: list[dict]) -> None:
+        """칩 밀어주기 패턴 플래깅."""
+        for pattern in patterns:
+            await self._flag_suspicious_activity(
+                detection_type="chip_dumping",
+                user_ids=[pattern["loser_id"], pattern["winner_id"]],
+                details=pattern,
+                severity="high" if pattern["win_rate"] >= 0.95 else "medium",
+            )
+
     async def handle_player_action(self, event: dict) -> None:
         """플레이어 액션 이벤트 처리.
         
@@ -585,6 +648,7 @@ def init_fraud_consumer(
     redis_client: "Redis",
     main_db_factory: Callable[[], "AsyncSession"],
     admin_db_factory: Callable[[], "AsyncSession"],
+    reconcile_interval_seconds: float = 900,
 ) -> FraudEventConsumer:
     """Initialize the global FraudEventConsumer instance.
     
@@ -592,11 +656,17 @@ def init_fraud_consumer(
         redis_client: Redis 클라이언트
         main_db_factory: 메인 DB 세션 팩토리
         admin_db_factory: Admin DB 세션 팩토리
+        reconcile_interval_seconds: 칩 흐름 SQL 재조정 주기 (초)
         
     Returns:
         초기화된 FraudEventConsumer 인스턴스
     """
     global _fraud_consumer
-    _fraud_consumer = FraudEventConsumer(redis_client, main_db_factory, admin_db_factory)
+    _fraud_consumer = FraudEventConsumer(
+        redis_client,
+        main_db_factory,
+        admin_db_factory,
+        reconcile_interval_seconds=reconcile_interval_seconds,
+    )
     logger.info("FraudEventConsumer initialized")
     return _fraud_consumer
@@ -0,0 +1,290 @@
+"""
+Revenue Rollup - 대시보드용 시간별/일별 매출 사전 집계
+
+대시보드가 열릴 때마다 hand_history / hand_participants 원본 전체를
+GROUP BY 하던 것을 관리자 DB의 집계 테이블로 대체합니다:
+
+- refresh(): 워터마크 이후 마감된 UTC 시간 버킷을 메인 DB에서 집계해
+  hourly_revenue_rollups에 upsert하고, 영향받은 날짜의
+  daily_revenue_rollups를 시간별 집계 합으로 다시 계산 (RevenueRollupTask가
+  주기적으로 호출)
+- 조회: 워터마크 이전은 집계 테이블, 이후(진행 중인 버킷)는 원본에서
+  워터마크 이후 행만 집계해 합칩니다. 원본 스캔 범위가 이력 크기와 무관하게
+  최근 몇 분으로 고정됩니다
+- 집계 시작 시각(origin)보다 이전 구간은 집계 테이블에 없으므로 원본에서
+  읽습니다 (백필 기간보다 긴 조회 범위)
+
+버킷은 UTC 기준입니다. 워터마크가 없으면(집계 작업 미실행) 조회 메서드는
+None을 반환하고 호출 측이 원본 쿼리로 폴백합니다.
+"""
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_NAME = "revenue_hourly"
+# 집계 시작 시각 (closed_until 컬럼에 저장, 최초 refresh에서 한 번 기록)
+ORIGIN_NAME = "revenue_hourly_origin"
+
+# 한 번의 refresh에서 처리하는 최대 시간 버킷 수 (백필 시 나눠서 처리)
+MAX_HOURS_PER_REFRESH = 24 * 7
+
+
+def floor_hour(value: datetime) -> datetime:
+    """UTC 시간 단위로 내림"""
+    return value.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def _merge(closed: list, live: list, key: str, fields: tuple[str, ...]) -> dict:
+    """마감 버킷과 진행 중 버킷을 키별로 합산"""
+    merged: dict = {}
+    for row in (*closed, *live):
+        bucket = merged.setdefault(getattr(row, key), dict.fromkeys(fields, 0))
+        for name in fields:
+            bucket[name] += getattr(row, name) or 0
+    return merged
+
+
+class RevenueRollupService:
+    """시간별/일별 매출 집계 관리 및 조회"""
+
+    def __init__(self, main_db: AsyncSession, admin_db: AsyncSession):
+        self.main_db = main_db
+        self.admin_db = admin_db
+
+    async def get_watermark(self) -> Optional[datetime]:
+        """마감된 구간의 끝 (이 시각 이전 버킷은 집계 테이블에 확정됨)"""
+        return await self._read_watermark(WATERMARK_NAME)
+
+    async def get_origin(self) -> Optional[datetime]:
+        """집계 시작 시각 (이 시각 이전 버킷은 집계 테이블에 없음)"""
+        return await self._read_watermark(ORIGIN_NAME)
+
+    async def _read_watermark(self, name: str) -> Optional[datetime]:
+        result = await self.admin_db.execute(
+            text("SELECT closed_until FROM rollup_watermarks WHERE name = :name"),
+            {"name": name},
+        )
+        return result.scalar()
+
+    async def _get_bounds(self) -> Optional[tuple[datetime, datetime]]:
+        """(origin, watermark). 둘 중 하나라도 없으면 None (원본 쿼리로 폴백)"""
+        watermark = await self.get_watermark()
+        if watermark is None:
+            return None
+        origin = await self.get_origin()
+        if origin is None:
+            return None
+        return origin, watermark
+
+    # =========================================================================
+    # 집계 갱신
+    # =========================================================================
+
+    async def refresh(
+        self,
+        now: Optional[datetime] = None,
+        backfill_days: int = 400,
+        settle_seconds: int = 120,
+    ) -> int:
+        """마감된 시간 버킷 집계
+
+        Args:
+            now: 기준 시각 (기본: 현재)
+            backfill_days: 워터마크가 없을 때 집계를 시작할 과거 일수
+            settle_seconds: 늦게 기록되는 핸드를 기다리는 시간. 이 시간이 지난
+                시간 버킷만 마감합니다
+
+        Returns:
+            마감 처리한 시간 버킷 수
+        """
+        now = now or datetime.now(timezone.utc)
+        target = floor_hour(now - timedelta(seconds=settle_seconds))
+
+        watermark = await self.get_watermark()
+        first_run = watermark is None
+        if first_run:
+            watermark = floor_hour(now - timedelta(days=backfill_days))
+        if watermark >= target:
+            return 0
+
+        end = min(target, watermark + timedelta(hours=MAX_HOURS_PER_REFRESH))
+        params = {"start": watermark, "end": end}
+
+        hands = await self.main_db.execute(text("""
+            SELECT
+                date_trunc('hour', created_at, 'UTC') as bucket,
+                COALESCE(SUM(rake_amount), 0) as rake,
+                COUNT(*) as hands
+            FROM hand_history
+            WHERE created_at >= :start AND created_at < :end
+            GROUP BY 1
+        """), params)
+        participants = await self.main_db.execute(text("""
+            SELECT
+                date_trunc('hour', created_at, 'UTC') as bucket,
+                COUNT(*) as participant_hands,
+                COUNT(DISTINCT user_id) as unique_players
+            FROM hand_participants
+            WHERE created_at >= :start AND created_at < :end
+            GROUP BY 1
+        """), params)
+
+        buckets: dict[datetime, dict] = {}
+        empty = {"rake": 0, "hands": 0, "participant_hands": 0, "unique_players": 0}
+        for row in hands.fetchall():
+            bucket = buckets.setdefault(row.bucket, dict(empty))
+            bucket.update(rake=row.rake, hands=row.hands)
+        for row in participants.fetchall():
+            bucket = buckets.setdefault(row.bucket, dict(empty))
+            bucket.update(
+                participant_hands=row.participant_hands,
+                unique_players=row.unique_players,
+            )
+
+        if buckets:
+            await self.admin_db.execute(text("""
+                INSERT INTO hourly_revenue_rollups
+                    (bucket_start, rake, hands, participant_hands, unique_players, updated_at)
+                VALUES (:bucket_start, :rake, :hands, :participant_hands, :unique_players, now())
+                ON CONFLICT (bucket_start) DO UPDATE SET
+                    rake = EXCLUDED.rake,
+                    hands = EXCLUDED.hands,
+                    participant_hands = EXCLUDED.participant_hands,
+                    unique_players = EXCLUDED.unique_players,
+                    updated_at = now()
+            """), [{"bucket_start": key, **values} for key, values in buckets.items()])
+
+            # 영향받은 날짜 전체를 시간별 집계 합으로 다시 계산 (하루 최대 24행)
+            await self.admin_db.execute(text("""
+                INSERT INTO daily_revenue_rollups (day, rake, hands, updated_at)
+                SELECT
+                    (bucket_start AT TIME ZONE 'UTC')::date,
+                    SUM(rake),
+                    SUM(hands),
+                    now()
+                FROM hourly_revenue_rollups
+                WHERE bucket_start >= :day_start AND bucket_start < :end
+                GROUP BY 1
+                ON CONFLICT (day) DO UPDATE SET
+                    rake = EXCLUDED.rake,
+                    hands = EXCLUDED.hands,
+                    updated_at = now()
+            """), {
+                "day_start": floor_hour(watermark).replace(hour=0),
+                "end": end,
+            })
+
+        if first_run:
+            await self.admin_db.execute(text("""
+                INSERT INTO rollup_watermarks (name, closed_until, updated_at)
+                VALUES (:name, :closed_until, now())
+                ON CONFLICT (name) DO NOTHING
+            """), {"name": ORIGIN_NAME, "closed_until": watermark})
+
+        await self.admin_db.execute(text("""
+            INSERT INTO rollup_watermarks (name, closed_until, updated_at)
+            VALUES (:name, :closed_until, now())
+            ON CONFLICT (name) DO UPDATE SET
+                closed_until = EXCLUDED.closed_until,
+                updated_at = now()
+        """), {"name": WATERMARK_NAME, "closed_until": end})
+        await self.admin_db.commit()
+
+        return int((end - watermark) / timedelta(hours=1))
+
+    # =========================================================================
+    # 조회 (마감 버킷 + 진행 중 버킷)
+    # =========================================================================
+
+    async def daily_revenue(self, start: datetime) -> Optional[list[dict]]:
+        """일별 매출 (start 날짜부터, 최신순)"""
+        return await self._revenue_by("day", start)
+
+    async def weekly_revenue(self, start: datetime) -> Optional[list[dict]]:
+        """주별 매출 (start 이후 날짜를 주 시작일로 묶음, 최신순)"""
+        return await self._revenue_by("week", start)
+
+    async def monthly_revenue(self, start: datetime) -> Optional[list[dict]]:
+        """월별 매출 (start 이후 날짜를 월 시작일로 묶음, 최신순)"""
+        return await self._revenue_by("month", start)
+
+    async def _revenue_by(self, unit: str, start: datetime) -> Optional[list[dict]]:
+        bounds = await self._get_bounds()
+        if bounds is None:
+            return None
+        origin, watermark = bounds
+
+        # unit은 내부 상수 (day/week/month)
+        closed = await self.admin_db.execute(text(f"""
+            SELECT
+                date_trunc('{unit}', day)::date as period,
+                SUM(rake) as rake,
+                SUM(hands) as hands
+            FROM daily_revenue_rollups
+            WHERE day >= :start_day
+            GROUP BY 1
+        """), {"start_day": start.astimezone(timezone.utc).date()})
+        live = await self.main_db.execute(text(f"""
+            SELECT
+                date_trunc('{unit}', created_at AT TIME ZONE 'UTC')::date as period,
+                COALESCE(SUM(rake_amount), 0) as rake,
+                COUNT(*) as hands
+            FROM hand_history
+            WHERE created_at >= :start
+              AND (created_at >= :watermark OR created_at < :origin)
+            GROUP BY 1
+        """), {"watermark": watermark, "origin": origin, "start": start})
+
+        merged = _merge(closed.fetchall(), live.fetchall(), "period", ("rake", "hands"))
+        return [
+            {"period": period, "rake": float(values["rake"]), "hands": int(values["hands"])}
+            for period, values in sorted(merged.items(), reverse=True)
+        ]
+
+    async def hourly_activity(self, start: datetime) -> Optional[list[dict]]:
+        """시간별 플레이어 활동 (start가 속한 시간부터, 최신순)
+
+        시간 버킷은 워터마크/origin 경계에서 나뉘지 않으므로 unique_players도
+        정확합니다.
+        """
+        bounds = await self._get_bounds()
+        if bounds is None:
+            return None
+        origin, watermark = bounds
+
+        closed = await self.admin_db.execute(text("""
+            SELECT
+                bucket_start as hour,
+                unique_players,
+                participant_hands as total_hands
+            FROM hourly_revenue_rollups
+            WHERE bucket_start >= :start_hour
+              AND participant_hands > 0
+        """), {"start_hour": floor_hour(start)})
+        live = await self.main_db.execute(text("""
+            SELECT
+                date_trunc('hour', created_at, 'UTC') as hour,
+                COUNT(DISTINCT user_id) as unique_players,
+                COUNT(*) as total_hands
+            FROM hand_participants
+            WHERE created_at > :start
+              AND (created_at >= :watermark OR created_at < :origin)
+            GROUP BY 1
+        """), {"watermark": watermark, "origin": origin, "start": start})
+
+        merged = _merge(
+            closed.fetchall(), live.fetchall(), "hour", ("unique_players", "total_hands")
+        )
+        return [
+            {
+                "hour": hour,
+                "unique_players": int(values["unique_players"]),
+                "total_hands": int(values["total_hands"]),
+            }
+            for hour, values in sorted(merged.items(), reverse=True)
+        ]
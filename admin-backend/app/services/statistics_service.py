@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
 from app.config import get_settings
+from app.services.revenue_rollup import RevenueRollupService
 
 logger = logging.getLogger(__name__)
 
@@ -20,11 +21,17 @@ class StatisticsError(Exception):
 
 
 class StatisticsService:
-    """매출 및 통계 서비스"""
+    """매출 및 통계 서비스
+
+    admin_db를 주면 일/주/월별 매출과 시간별 활동을 사전 집계 테이블
+    (RevenueRollupService)에서 조회하고, 집계가 아직 없으면 원본 쿼리로
+    폴백합니다.
+    """
     
-    def __init__(self, main_db: AsyncSession):
+    def __init__(self, main_db: AsyncSession, admin_db: Optional[AsyncSession] = None):
         self.db = main_db
         self.settings = get_settings()
+        self.rollups = RevenueRollupService(main_db, admin_db) if admin_db is not None else None
     
     async def get_revenue_summary(
         self,
@@ -84,6 +91,14 @@ class StatisticsService:
         start_date = end_date - timedelta(days=days)
         
         try:
+            if self.rollups:
+                rows = await self.rollups.daily_revenue(start_date)
+                if rows is not None:
+                    return [
+                        {"date": str(row["period"]), "rake": row["rake"], "hands": row["hands"]}
+                        for row in rows
+                    ]
+
             query = text("""
                 SELECT 
                     DATE(created_at) as date,
@@ -119,6 +134,14 @@ class StatisticsService:
         start_date = end_date - timedelta(weeks=weeks)
         
         try:
+            if self.rollups:
+                rows = await self.rollups.weekly_revenue(start_date)
+                if rows is not None:
+                    return [
+                        {"week_start": str(row["period"]), "rake": row["rake"], "hands": row["hands"]}
+                        for row in rows
+                    ]
+
             query = text("""
                 SELECT 
                     DATE_TRUNC('week', created_at) as week_start,
@@ -154,6 +177,14 @@ class StatisticsService:
         start_date = end_date - timedelta(days=months * 30)
         
         try:
+            if self.rollups:
+                rows = await self.rollups.monthly_revenue(start_date)
+                if rows is not None:
+                    return [
+                        {"month": row["period"].strftime("%Y-%m"), "rake": row["rake"], "hands": row["hands"]}
+                        for row in rows
+                    ]
+
             query = text("""
                 SELECT 
                     DATE_TRUNC('month', created_at) as month_start,
@@ -379,6 +410,13 @@ class StatisticsService:
             # 입력값 검증 - SQL Injection 방지
             if not isinstance(hours, int) or hours < 1 or hours > 168:
                 hours = 24  # 기본값으로 폴백 (최대 7일)
+
+            if self.rollups:
+                rows = await self.rollups.hourly_activity(
+                    datetime.now(timezone.utc) - timedelta(hours=hours)
+                )
+                if rows is not None:
+                    return [{**row, "hour": row["hour"].isoformat()} for row in rows]
             
             query = text("""
                 SELECT 
@@ -0,0 +1,177 @@
+"""
+User Search - 관리자 사용자 검색 쿼리 빌더
+
+검색어 종류에 따라 인덱스를 탈 수 있는 조건을 만듭니다
+(인덱스: backend/alembic/versions/add_user_search_indexes.py):
+- UUID: id 완전 일치 (PK)
+- 이메일: lower(email) 완전 일치 (ix_users_email_lower_prefix)
+- 3자 미만: nickname/email 접두사 일치 (lower() text_pattern_ops 인덱스)
+- 그 외: nickname/email 부분 일치 (pg_trgm GIN 인덱스)
+
+페이지네이션은 (정렬 컬럼, id) keyset 커서를 사용하고, 전체 개수는
+COUNT_CAP까지만 정확히 세고 그 이상은 플래너 추정치를 사용합니다.
+"""
+import base64
+import json
+import re
+import uuid
+from datetime import datetime
+from enum import Enum
+from typing import Any, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# pg_trgm은 3자 이상이어야 트라이그램 인덱스를 사용할 수 있음
+MIN_TRIGRAM_LENGTH = 3
+
+# 정확히 세는 최대 개수 (초과 시 추정치)
+COUNT_CAP = 10_000
+
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+_DATETIME_SORT_FIELDS = {"created_at", "updated_at"}
+
+
+class SearchKind(str, Enum):
+    """검색어 종류"""
+    NONE = "none"
+    USER_ID = "user_id"
+    EMAIL = "email"
+    PREFIX = "prefix"
+    TRIGRAM = "trigram"
+
+    @property
+    def is_exact(self) -> bool:
+        """최대 1건만 일치하는 검색인지"""
+        return self in (SearchKind.USER_ID, SearchKind.EMAIL)
+
+
+def escape_like(value: str) -> str:
+    """LIKE 패턴 특수문자 이스케이프 (기본 이스케이프 문자 '\\')"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def classify_search(search: Optional[str]) -> SearchKind:
+    """검색어 종류 판별"""
+    term = (search or "").strip()
+    if not term:
+        return SearchKind.NONE
+    try:
+        uuid.UUID(term)
+        return SearchKind.USER_ID
+    except ValueError:
+        pass
+    if _EMAIL_RE.match(term):
+        return SearchKind.EMAIL
+    if len(term) < MIN_TRIGRAM_LENGTH:
+        return SearchKind.PREFIX
+    return SearchKind.TRIGRAM
+
+
+def build_search_filter(search: Optional[str]) -> tuple[SearchKind, Optional[str], dict]:
+    """검색 조건 SQL 생성
+
+    Returns:
+        (검색어 종류, WHERE 조건 또는 None, 바인드 파라미터)
+    """
+    kind = classify_search(search)
+    term = (search or "").strip()
+
+    if kind == SearchKind.USER_ID:
+        return kind, "id = :search_id", {"search_id": str(uuid.UUID(term))}
+
+    if kind == SearchKind.EMAIL:
+        return kind, "lower(email) = :search_email", {"search_email": term.lower()}
+
+    if kind == SearchKind.PREFIX:
+        return kind, """
+            (lower(nickname) LIKE :search_prefix
+            OR lower(email) LIKE :search_prefix)
+        """, {"search_prefix": f"{escape_like(term.lower())}%"}
+
+    if kind == SearchKind.TRIGRAM:
+        return kind, """
+            (nickname ILIKE :search
+            OR email ILIKE :search)
+        """, {"search": f"%{escape_like(term)}%"}
+
+    return kind, None, {}
+
+
+# =============================================================================
+# Keyset 커서
+# =============================================================================
+
+def encode_cursor(sort_by: str, sort_order: str, value: Any, user_id: str) -> str:
+    """마지막 행 기준 다음 페이지 커서 생성"""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps([sort_by, sort_order, value, str(user_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str, sort_order: str) -> tuple[Any, str]:
+    """커서 디코딩
+
+    Returns:
+        (정렬 컬럼 값, 사용자 ID)
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 정렬 조건이 다른 커서
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort_by, cursor_order, value, user_id = json.loads(
+            base64.urlsafe_b64decode(padded.encode())
+        )
+    except (ValueError, TypeError) as e:
+        raise ValueError("잘못된 커서") from e
+
+    if cursor_sort_by != sort_by or cursor_order != sort_order:
+        raise ValueError("커서의 정렬 조건이 요청과 다릅니다")
+    if value is not None and sort_by in _DATETIME_SORT_FIELDS:
+        value = datetime.fromisoformat(value)
+    return value, user_id
+
+
+def keyset_condition(sort_by: str, sort_order: str) -> str:
+    """(정렬 컬럼, id) 기준 커서 다음 행 조건 (sort_by는 검증된 컬럼명)"""
+    op = "<" if sort_order == "DESC" else ">"
+    return f"({sort_by}, id) {op} (:cursor_value, :cursor_id)"
+
+
+# =============================================================================
+# 개수
+# =============================================================================
+
+async def count_users(db: AsyncSession, where_sql: str, params: dict) -> tuple[int, bool]:
+    """조건에 맞는 사용자 수
+
+    COUNT_CAP까지는 정확히 세고, 그 이상이면 플래너 추정치를 반환합니다.
+
+    Returns:
+        (개수, 추정치 여부)
+    """
+    count_query = text(f"""
+        SELECT COUNT(*) AS total
+        FROM (
+            SELECT 1 FROM users
+            WHERE {where_sql}
+            LIMIT :count_cap
+        ) capped
+    """)
+    result = await db.execute(count_query, {**params, "count_cap": COUNT_CAP})
+    total = result.scalar() or 0
+    if total < COUNT_CAP:
+        return total, False
+
+    explain = await db.execute(
+        text(f"EXPLAIN (FORMAT JSON) SELECT 1 FROM users WHERE {where_sql}"),
+        params,
+    )
+    plan = explain.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    estimate = int(plan[0]["Plan"]["Plan Rows"])
+    return max(total, estimate), True
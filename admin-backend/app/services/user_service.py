@@ -12,6 +12,13 @@ from passlib.context import CryptContext
 
 from app.config import get_settings
 from app.models.main_db import User
+from app.services.user_search import (
+    build_search_filter,
+    count_users,
+    decode_cursor,
+    encode_cursor,
+    keyset_condition,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +51,11 @@ class DuplicateNicknameError(UserServiceError):
     pass
 
 
+class InvalidCursorError(UserServiceError):
+    """잘못된 페이지네이션 커서"""
+    pass
+
+
 class UserService:
     """사용자 조회 및 자산 관리 서비스"""
     
@@ -58,22 +70,25 @@ class UserService:
         page_size: int = 20,
         is_banned: Optional[bool] = None,
         sort_by: str = "created_at",
-        sort_order: str = "desc"
+        sort_order: str = "desc",
+        cursor: Optional[str] = None,
     ) -> dict:
-        """사용자 검색 및 목록 조회"""
+        """사용자 검색 및 목록 조회
+
+        검색 조건은 user_search.build_search_filter() 참고.
+        cursor(이전 응답의 next_cursor)를 주면 OFFSET 대신 keyset으로
+        다음 페이지를 조회합니다. total은 COUNT_CAP 초과 시 추정치입니다
+        (total_is_estimate).
+
+        Raises:
+            InvalidCursorError: 잘못된 커서
+            UserServiceError: 조회 실패
+        """
         offset = (page - 1) * page_size
 
         # 기본 쿼리
-        where_clauses = []
-        params = {"limit": page_size, "offset": offset}
-
-        if search:
-            where_clauses.append("""
-                (nickname ILIKE :search
-                OR email ILIKE :search
-                OR id::text ILIKE :search)
-            """)
-            params["search"] = f"%{search}%"
+        kind, search_sql, params = build_search_filter(search)
+        where_clauses = [search_sql] if search_sql else []
 
         if is_banned is not None:
             if is_banned:
@@ -94,29 +109,39 @@ class UserService:
             sort_by = "created_at"
         sort_order = "DESC" if sort_order.lower() == "desc" else "ASC"
 
+        # keyset 페이지네이션
+        list_where_sql = where_sql
+        list_params = {**params, "limit": page_size, "offset": offset}
+        if cursor:
+            try:
+                cursor_value, cursor_id = decode_cursor(cursor, sort_by, sort_order)
+            except ValueError as e:
+                raise InvalidCursorError(str(e)) from e
+            list_where_sql = f"{where_sql} AND {keyset_condition(sort_by, sort_order)}"
+            list_params.update(cursor_value=cursor_value, cursor_id=cursor_id, offset=0)
+
         try:
-            # 총 개수 조회
-            count_query = text(f"""
-                SELECT COUNT(*) as total
-                FROM users
-                WHERE {where_sql}
-            """)
-            count_result = await self.db.execute(count_query, params)
-            total = count_result.scalar() or 0
+            # 총 개수 조회 (UUID/이메일 완전 일치는 목록 결과로 대체)
+            total_is_estimate = False
+            if not kind.is_exact:
+                total, total_is_estimate = await count_users(self.db, where_sql, params)
 
-            # 사용자 목록 조회
+            # 사용자 목록 조회 (id로 동순위 정렬 고정)
             list_query = text(f"""
                 SELECT
                     id, username, nickname, email, balance,
                     created_at, updated_at, status
                 FROM users
-                WHERE {where_sql}
-                ORDER BY {sort_by} {sort_order}
+                WHERE {list_where_sql}
+                ORDER BY {sort_by} {sort_order}, id {sort_order}
                 LIMIT :limit OFFSET :offset
             """)
-            result = await self.db.execute(list_query, params)
+            result = await self.db.execute(list_query, list_params)
             rows = result.fetchall()
 
+            if kind.is_exact:
+                total = len(rows)
+
             users = [
                 {
                     "id": str(row.id),
@@ -131,12 +156,21 @@ class UserService:
                 for row in rows
             ]
 
+            next_cursor = None
+            if len(rows) == page_size and not kind.is_exact:
+                last = rows[-1]
+                next_cursor = encode_cursor(
+                    sort_by, sort_order, getattr(last, sort_by), str(last.id)
+                )
+
             return {
                 "items": users,
                 "total": total,
                 "page": page,
                 "page_size": page_size,
-                "total_pages": (total + page_size - 1) // page_size
+                "total_pages": (total + page_size - 1) // page_size,
+                "next_cursor": next_cursor,
+                "total_is_estimate": total_is_estimate,
             }
         except Exception as e:
             logger.error(f"사용자 검색 실패: search={search}, error={e}", exc_info=True)
@@ -0,0 +1,92 @@
+"""Revenue rollup maintenance task.
+
+Background task that periodically closes finished UTC hours into the
+hourly/daily revenue rollup tables used by the dashboard
+(see app.services.revenue_rollup).
+"""
+
+import asyncio
+import logging
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.revenue_rollup import RevenueRollupService
+
+logger = logging.getLogger(__name__)
+
+
+class RevenueRollupTask:
+    """Background task for maintaining revenue rollups.
+
+    Each run aggregates the hours closed since the stored watermark from
+    the main DB and upserts them into the admin DB. On first start it
+    backfills `backfill_days` of history one week per run.
+    """
+
+    def __init__(
+        self,
+        main_session_factory: Callable[[], AsyncSession],
+        admin_session_factory: Callable[[], AsyncSession],
+        interval: int = 60,
+        backfill_days: int = 400,
+        settle_seconds: int = 120,
+    ):
+        """Initialize revenue rollup task.
+
+        Args:
+            main_session_factory: Factory for main DB sessions (read)
+            admin_session_factory: Factory for admin DB sessions (rollup tables)
+            interval: Seconds between runs once caught up
+            backfill_days: History to aggregate when no watermark exists
+            settle_seconds: Delay before an hour is considered closed
+        """
+        self.main_session_factory = main_session_factory
+        self.admin_session_factory = admin_session_factory
+        self.interval = interval
+        self.backfill_days = backfill_days
+        self.settle_seconds = settle_seconds
+        self._running = False
+
+    async def start(self):
+        """Start the rollup loop.
+
+        Runs continuously until stop() is called. While backfilling, runs
+        back to back until the watermark catches up.
+        """
+        self._running = True
+        logger.info(f"Starting revenue rollup task (interval: {self.interval}s)")
+
+        while self._running:
+            closed = 0
+            try:
+                closed = await self.run_once()
+            except Exception as e:
+                logger.error(f"Error refreshing revenue rollups: {e}")
+
+            if not closed:
+                await asyncio.sleep(self.interval)
+            else:
+                await asyncio.sleep(0)
+
+        logger.info("Revenue rollup task stopped")
+
+    def stop(self):
+        """Stop the rollup loop."""
+        self._running = False
+
+    async def run_once(self) -> int:
+        """Close finished hours once.
+
+        Returns:
+            Number of hourly buckets closed
+        """
+        async with self.main_session_factory() as main_db, \
+                self.admin_session_factory() as admin_db:
+            closed = await RevenueRollupService(main_db, admin_db).refresh(
+                backfill_days=self.backfill_days,
+                settle_seconds=self.settle_seconds,
+            )
+        if closed:
+            logger.debug(f"Closed {closed} hourly revenue buckets")
+        return closed
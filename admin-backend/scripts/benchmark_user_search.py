@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Admin User Search Benchmark.
+
+Seeds a users table to the given size and measures UserService.search_users
+latency for each search path (UUID / email exact match, prefix, trigram,
+ban filter, keyset page).
+
+Run against a scratch database migrated to head (backend: alembic upgrade
+head), never against production: seeding inserts synthetic users.
+
+Usage:
+    DATABASE_URL=postgresql://... python scripts/benchmark_user_search.py --seed 1000000
+
+    # Re-run without seeding
+    DATABASE_URL=postgresql://... python scripts/benchmark_user_search.py
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.services.user_service import UserService
+
+SEED_CHUNK = 100_000
+
+
+async def seed_users(engine, total: int) -> None:
+    """Insert synthetic users up to `total` rows and refresh statistics."""
+    async with engine.connect() as conn:
+        existing = (await conn.execute(text("SELECT COUNT(*) FROM users"))).scalar()
+
+    for start in range(existing, total, SEED_CHUNK):
+        end = min(start + SEED_CHUNK, total)
+        async with engine.begin() as conn:
+            await conn.execute(text("""
+                INSERT INTO users (
+                    id, username, nickname, email, password_hash, status,
+                    is_banned, is_admin, balance, krw_balance,
+                    pending_withdrawal_krw, total_hands, total_winnings,
+                    total_rake_paid_krw, created_at, updated_at
+                )
+                SELECT
+                    gen_random_uuid(),
+                    'bench_' || n,
+                    'player' || n,
+                    'player' || n || '@bench.example.com',
+                    'x',
+                    CASE WHEN n % 100 = 0 THEN 'banned' ELSE 'active' END,
+                    n % 100 = 0,
+                    false,
+                    (n * 7919) % 1000000,
+                    0, 0, 0, 0, 0,
+                    now() - (n || ' seconds')::interval,
+                    now() - ((n % 86400) || ' seconds')::interval
+                FROM generate_series(:start, :end - 1) AS n
+            """), {"start": start, "end": end})
+        print(f"  seeded {end:,} / {total:,}")
+
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("ANALYZE users"))
+
+
+async def timed(session_factory, iterations: int, **kwargs) -> tuple[list[float], dict]:
+    """Run search_users `iterations` times and return latencies (ms)."""
+    latencies = []
+    result = {}
+    for _ in range(iterations):
+        async with session_factory() as session:
+            started = time.perf_counter()
+            result = await UserService(session).search_users(**kwargs)
+            latencies.append((time.perf_counter() - started) * 1000)
+    return latencies, result
+
+
+async def run_benchmark(database_url: str, seed: int, iterations: int) -> None:
+    engine = create_async_engine(database_url, pool_size=2)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    if seed:
+        print(f"Seeding users table to {seed:,} rows...")
+        await seed_users(engine, seed)
+
+    async with engine.connect() as conn:
+        row = (await conn.execute(text(
+            "SELECT id, email FROM users ORDER BY created_at DESC OFFSET 5000 LIMIT 1"
+        ))).fetchone()
+    if row is None:
+        print("ERROR: users table is empty (use --seed)")
+        sys.exit(1)
+
+    async with session_factory() as session:
+        first_page = await UserService(session).search_users(page_size=50)
+
+    cases = [
+        ("list (no filter)", {"page_size": 50}),
+        ("uuid exact", {"search": str(row.id)}),
+        ("email exact", {"search": row.email}),
+        ("prefix (2 chars)", {"search": "pl"}),
+        ("trigram (selective)", {"search": "er12345"}),
+        ("trigram (broad)", {"search": "bench"}),
+        ("ban filter", {"is_banned": True}),
+        ("keyset page 2", {"page_size": 50, "cursor": first_page["next_cursor"]}),
+        ("offset page 1000", {"page": 1000, "page_size": 50}),
+    ]
+
+    print(f"\n{'case':<22}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}{'total':>12}")
+    print("-" * 64)
+    for name, kwargs in cases:
+        latencies, result = await timed(session_factory, iterations, **kwargs)
+        latencies.sort()
+        p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)]
+        total = f"{'~' if result['total_is_estimate'] else ''}{result['total']:,}"
+        print(
+            f"{name:<22}{statistics.median(latencies):>10.2f}"
+            f"{p95:>10.2f}{latencies[-1]:>10.2f}{total:>12}"
+        )
+
+    await engine.dispose()
+
+
+async def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark admin user search")
+    parser.add_argument("--seed", type=int, default=0, help="Seed users table to N rows")
+    parser.add_argument("--iterations", type=int, default=50, help="Runs per case")
+    args = parser.parse_args()
+
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        print("ERROR: DATABASE_URL environment variable not set")
+        print("Usage: DATABASE_URL=postgresql://... python scripts/benchmark_user_search.py")
+        sys.exit(1)
+
+    # Convert to async URL if needed
+    if database_url.startswith("postgresql://"):
+        database_url = database_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+    await run_benchmark(database_url, args.seed, args.iterations)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,182 @@
+"""
+Chip Flow Tracker Tests - 실시간 칩 흐름 매트릭스 테스트
+"""
+import pytest
+
+from app.services.chip_flow_tracker import ChipFlowTracker, parse_event_timestamp
+
+
+def heads_up(winner: str, loser: str, amount: int = 500) -> list[dict]:
+    """winner가 loser의 칩을 모두 가져간 헤즈업 핸드."""
+    return [
+        {"user_id": winner, "bet_amount": amount, "won_amount": amount * 2},
+        {"user_id": loser, "bet_amount": amount, "won_amount": 0},
+    ]
+
+
+class TestRecordHand:
+    """record_hand 메서드 테스트"""
+
+    @pytest.fixture
+    def tracker(self):
+        return ChipFlowTracker(window_seconds=3600, min_hands=3, min_win_rate=0.9)
+
+    def test_counts_both_directions(self, tracker):
+        """같은 핸드의 모든 (loser, winner) 쌍을 집계"""
+        tracker.record_hand(heads_up("user-1", "user-2"), timestamp=0)
+
+        forward = tracker.get_pair("user-2", "user-1")
+        backward = tracker.get_pair("user-1", "user-2")
+        assert (forward.total_hands, forward.winner_wins, forward.chips) == (1, 1, 500)
+        assert (backward.total_hands, backward.winner_wins, backward.chips) == (1, 0, 0)
+
+    def test_chips_split_by_net_gain(self, tracker):
+        """loser의 손실은 winner들의 순이익 비율로 배분"""
+        tracker.record_hand([
+            {"user_id": "a", "bet_amount": 300, "won_amount": 0},
+            {"user_id": "b", "bet_amount": 300, "won_amount": 700},
+            {"user_id": "c", "bet_amount": 300, "won_amount": 500},
+        ], timestamp=0)
+
+        assert tracker.get_pair("a", "b").chips == 200
+        assert tracker.get_pair("a", "c").chips == 100
+
+    def test_detects_one_way_flow(self, tracker):
+        """min_hands 도달 시 일방적 흐름 탐지"""
+        assert tracker.record_hand(heads_up("user-1", "user-2"), timestamp=0) == []
+        assert tracker.record_hand(heads_up("user-1", "user-2"), timestamp=1) == []
+
+        patterns = tracker.record_hand(heads_up("user-1", "user-2"), timestamp=2)
+
+        assert patterns == [{
+            "loser_id": "user-2",
+            "winner_id": "user-1",
+            "total_hands": 3,
+            "winner_wins": 3,
+            "win_rate": 1.0,
+            "chips_transferred": 1500,
+            "detection_type": "one_way_chip_flow",
+        }]
+
+    def test_reports_pair_once(self, tracker):
+        """이미 보고된 쌍은 다시 보고하지 않음"""
+        for i in range(3):
+            tracker.record_hand(heads_up("user-1", "user-2"), timestamp=i)
+
+        assert tracker.record_hand(heads_up("user-1", "user-2"), timestamp=3) == []
+
+    def test_mixed_results_not_flagged(self, tracker):
+        """승패가 섞인 쌍은 탐지되지 않음"""
+        for i in range(5):
+            winner, loser = ("user-1", "user-2") if i % 2 else ("user-2", "user-1")
+            assert tracker.record_hand(heads_up(winner, loser), timestamp=i) == []
+
+    def test_single_participant_ignored(self, tracker):
+        """참가자 1명 핸드는 무시"""
+        tracker.record_hand(heads_up("user-1", "user-2")[:1], timestamp=0)
+
+        assert tracker.hand_count == 0
+        assert tracker.pair_count == 0
+
+
+class TestSlidingWindow:
+    """슬라이딩 윈도우 eviction 테스트"""
+
+    def test_old_hands_are_evicted(self):
+        """윈도우 밖의 핸드는 집계에서 제거"""
+        tracker = ChipFlowTracker(window_seconds=60, min_hands=3, min_win_rate=0.9)
+        tracker.record_hand(heads_up("user-1", "user-2"), timestamp=0)
+        tracker.record_hand(heads_up("user-1", "user-2"), timestamp=30)
+
+        tracker.record_hand(heads_up("user-3", "user-4"), timestamp=70)
+
+        assert tracker.get_pair("user-2", "user-1").total_hands == 1
+        assert tracker.hand_count == 2
+
+    def test_pairs_removed_when_empty(self):
+        """모든 핸드가 빠진 쌍은 매트릭스에서 삭제"""
+        tracker = ChipFlowTracker(window_seconds=60)
+        tracker.record_hand(heads_up("user-1", "user-2"), timestamp=0)
+
+        tracker.record_hand(heads_up("user-3", "user-4"), timestamp=100)
+
+        assert tracker.get_pair("user-2", "user-1") is None
+        assert tracker.pair_count == 2
+
+    def test_evicted_pair_can_be_reported_again(self):
+        """기준 아래로 내려간 쌍은 다시 보고 가능"""
+        tracker = ChipFlowTracker(window_seconds=60, min_hands=2, min_win_rate=0.9)
+        tracker.record_hand(heads_up("user-1", "user-2"), timestamp=0)
+        assert tracker.record_hand(heads_up("user-1", "user-2"), timestamp=1)
+
+        tracker.record_hand(heads_up("user-1", "user-2"), timestamp=100)
+        patterns = tracker.record_hand(heads_up("user-1", "user-2"), timestamp=101)
+
+        assert len(patterns) == 1
+
+    def test_max_pair_entries_bounds_memory(self):
+        """쌍 기여분 수가 상한을 넘으면 가장 오래된 핸드부터 제거"""
+        # 헤즈업 핸드 하나 = 기여분 2개
+        tracker = ChipFlowTracker(window_seconds=3600, max_pair_entries=4)
+        for i in range(3):
+            tracker.record_hand(heads_up("user-1", "user-2"), timestamp=i)
+
+        assert tracker.hand_count == 2
+        assert tracker.entry_count == 4
+        assert tracker.get_pair("user-2", "user-1").total_hands == 2
+
+    def test_large_hands_count_every_pair(self):
+        """참가자가 많은 핸드는 쌍 수만큼 상한을 차지"""
+        tracker = ChipFlowTracker(window_seconds=3600, max_pair_entries=100)
+        table = [
+            {"user_id": f"user-{i}", "bet_amount": 100, "won_amount": 900 if i == 0 else 0}
+            for i in range(9)
+        ]
+        tracker.record_hand(table, timestamp=0)
+        tracker.record_hand(table, timestamp=1)
+
+        assert tracker.hand_count == 1
+        assert tracker.entry_count == 72
+
+
+class TestMarkFlagged:
+    """mark_flagged 메서드 테스트"""
+
+    def test_mark_flagged_is_idempotent(self):
+        tracker = ChipFlowTracker()
+
+        assert tracker.mark_flagged("user-2", "user-1") is True
+        assert tracker.mark_flagged("user-2", "user-1") is False
+
+    def test_reconciled_flags_expire_with_window(self):
+        """윈도우에 없는 쌍의 표시는 윈도우가 지나면 만료"""
+        tracker = ChipFlowTracker(window_seconds=100)
+        tracker.mark_flagged("user-2", "user-1", timestamp=0)
+        tracker.mark_flagged("user-4", "user-3", timestamp=50)
+
+        tracker.record_hand(heads_up("user-5", "user-6"), timestamp=120)
+
+        assert tracker.flagged_count == 1
+        assert tracker.mark_flagged("user-2", "user-1", timestamp=120) is True
+
+    def test_flag_kept_while_pair_in_window(self):
+        """윈도우에 남은 쌍의 표시는 유지 (중복 보고 방지)"""
+        tracker = ChipFlowTracker(window_seconds=100, min_hands=3, min_win_rate=0.9)
+        for ts in (0, 1, 2, 50, 60, 70):
+            tracker.record_hand(heads_up("user-1", "user-2"), timestamp=ts)
+
+        patterns = tracker.record_hand(heads_up("user-1", "user-2"), timestamp=110)
+
+        assert patterns == []
+        assert tracker.mark_flagged("user-2", "user-1") is False
+
+
+class TestParseEventTimestamp:
+    """parse_event_timestamp 테스트"""
+
+    def test_parses_iso_timestamp(self):
+        assert parse_event_timestamp("1970-01-01T00:01:00+00:00") == 60.0
+
+    def test_invalid_timestamp(self):
+        assert parse_event_timestamp("not-a-date") is None
+        assert parse_event_timestamp(None) is None
@@ -0,0 +1,210 @@
+"""
+Export Service Tests - 스트리밍 보고서 내보내기 테스트
+"""
+
+import asyncio
+import csv
+import io
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from openpyxl import load_workbook
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.services import export_service
+from app.services.export_jobs import ExportJobManager, ExportJobStatus
+from app.services.export_service import ExportService, ReportSpec, iterate_rows
+
+COLUMNS = [
+    {"key": "id", "header": "ID"},
+    {"key": "name", "header": "이름"},
+    {"key": "created_at", "header": "일시"},
+]
+
+
+def make_spec(**overrides) -> ReportSpec:
+    fields = dict(
+        name="items",
+        title="항목 보고서",
+        sheet_name="Items",
+        columns=COLUMNS,
+        query="SELECT id, name, created_at FROM items ORDER BY id LIMIT :limit",
+    )
+    fields.update(overrides)
+    return ReportSpec(**fields)
+
+
+@pytest_asyncio.fixture
+async def service():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE items (id INTEGER, name TEXT, created_at TEXT)"))
+        await conn.execute(
+            text("INSERT INTO items VALUES (:id, :name, :created_at)"),
+            [
+                {"id": i, "name": f"item-{i}", "created_at": "2026-01-01 00:00:00"}
+                for i in range(1, 2501)
+            ],
+        )
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    yield ExportService(session_factories={"main": factory})
+    await engine.dispose()
+
+
+async def collect(chunks) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+class TestStreamRows:
+    """서버 사이드 커서 행 스트리밍 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_limit_and_progress(self, service):
+        progress = []
+        rows = [
+            row async for row in service.stream_rows(make_spec(), 1500, progress.append)
+        ]
+
+        assert len(rows) == 1500
+        assert rows[0] == {"id": 1, "name": "item-1", "created_at": "2026-01-01 00:00:00"}
+        assert progress == [1000, 1500]
+
+    @pytest.mark.asyncio
+    async def test_transform_applied(self, service):
+        spec = make_spec(transform=lambda row: {"id": row.id * 10, "name": row.name.upper()})
+        rows = [row async for row in service.stream_rows(spec, 2)]
+
+        assert rows == [{"id": 10, "name": "ITEM-1"}, {"id": 20, "name": "ITEM-2"}]
+
+    @pytest.mark.asyncio
+    async def test_count_rows_respects_limit(self, service):
+        assert await service.count_rows(make_spec(), 100000) == 2500
+        assert await service.count_rows(make_spec(), 10) == 10
+
+
+class TestCsv:
+    """CSV 스트리밍 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_chunked_output(self, service, monkeypatch):
+        monkeypatch.setattr(export_service, "CSV_CHUNK_ROWS", 100)
+        chunks = [chunk async for chunk in service.stream_report(make_spec(), "csv", 1000)]
+
+        # 헤더 1개 + 100행 청크 10개
+        assert len(chunks) == 11
+        content = b"".join(chunks).decode("utf-8-sig")
+        rows = list(csv.reader(io.StringIO(content)))
+        assert rows[0] == ["ID", "이름", "일시"]
+        assert rows[1] == ["1", "item-1", "2026-01-01 00:00:00"]
+        assert len(rows) == 1001
+
+    @pytest.mark.asyncio
+    async def test_open_report_runs_query_before_streaming(self, service):
+        spec = make_spec(query="SELECT * FROM missing LIMIT :limit")
+        with pytest.raises(Exception, match="missing"):
+            await service.open_report(spec, "csv", 10)
+
+        body = await service.open_report(make_spec(), "csv", 10)
+        content = (await collect(body)).decode("utf-8-sig")
+        assert content.splitlines()[0] == "ID,이름,일시"
+        assert len(content.splitlines()) == 11
+
+    @pytest.mark.asyncio
+    async def test_open_report_empty_result(self, service):
+        body = await service.open_report(make_spec(), "csv", 0)
+
+        assert (await collect(body)).decode("utf-8-sig").strip() == "ID,이름,일시"
+
+    @pytest.mark.asyncio
+    async def test_value_formatting(self, service):
+        data = [{"id": None, "name": ["a"], "created_at": datetime(2026, 1, 15, 10, 30)}]
+        content = (await collect(service.stream_csv(iterate_rows(data), COLUMNS))).decode("utf-8-sig")
+
+        assert content.splitlines()[1] == ",['a'],2026-01-15 10:30:00"
+
+
+class TestExcel:
+    """XLSX write-only 스트리밍 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_workbook_contents(self, service):
+        data = await collect(service.stream_report(make_spec(), "excel", 2500))
+
+        wb = load_workbook(io.BytesIO(data), read_only=True)
+        ws = wb["Items"]
+        values = [row for row in ws.iter_rows(values_only=True)]
+
+        assert values[0][0] == "항목 보고서"
+        assert values[2] == ("ID", "이름", "일시")
+        assert values[3] == (1, "item-1", "2026-01-01 00:00:00")
+        assert values[2502] == (2500, "item-2500", "2026-01-01 00:00:00")
+        assert values[-1][0].startswith("생성일시")
+
+
+class TestExportJobs:
+    """백그라운드 내보내기 작업 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_job_completes_with_progress(self, service, tmp_path):
+        manager = ExportJobManager(tmp_path, max_rows=100000, service=service)
+        job = manager.start(make_spec(), "csv", created_by="admin-1")
+        assert job.status == ExportJobStatus.PENDING
+
+        for _ in range(100):
+            if job.finished:
+                break
+            await asyncio.sleep(0.01)
+
+        assert job.status == ExportJobStatus.COMPLETED
+        assert job.total_rows == 2500
+        assert job.rows_written == 2500
+        assert job.progress == 1.0
+        assert job.file_path.read_bytes().decode("utf-8-sig").count("\n") == 2501
+        assert manager.get(job.id) is job
+
+    @pytest.mark.asyncio
+    async def test_failed_job_leaves_no_file(self, service, tmp_path):
+        manager = ExportJobManager(tmp_path, max_rows=100, service=service)
+        job = manager.start(make_spec(query="SELECT * FROM missing LIMIT :limit"), "csv", "admin-1")
+
+        for _ in range(100):
+            if job.finished:
+                break
+            await asyncio.sleep(0.01)
+
+        assert job.status == ExportJobStatus.FAILED
+        assert job.error
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_expired_jobs_cleaned_up(self, service, tmp_path):
+        manager = ExportJobManager(tmp_path, max_rows=10, ttl_seconds=0, service=service)
+        job = manager.start(make_spec(), "excel", "admin-1")
+        for _ in range(100):
+            if job.finished:
+                break
+            await asyncio.sleep(0.01)
+        assert job.file_path.exists()
+
+        job.finished_at -= 1
+        assert manager.cleanup_expired() == 1
+        assert manager.get(job.id) is None
+        assert not job.file_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_expired_jobs_cleaned_up_on_timer(self, service, tmp_path):
+        manager = ExportJobManager(
+            tmp_path, max_rows=10, ttl_seconds=0, service=service, cleanup_interval=0.01
+        )
+        job = manager.start(make_spec(), "csv", "admin-1")
+
+        for _ in range(200):
+            if manager.get(job.id) is None:
+                break
+            await asyncio.sleep(0.01)
+
+        assert manager.get(job.id) is None
+        assert not job.file_path.exists()
+        await manager.shutdown()
@@ -134,14 +134,13 @@ class TestHandleHandCompleted:
             lambda: mock_admin_db,
         )
 
-    @pytest.mark.asyncio
-    async def test_handle_hand_completed_calls_detector(self, consumer):
-        """핸드 완료 이벤트 시 ChipDumpingDetector 호출."""
-        event = {
+    @staticmethod
+    def _hand_event(hand_number: int) -> dict:
+        return {
             "event_type": "hand_completed",
-            "hand_id": "hand-123",
+            "hand_id": f"hand-{hand_number}",
             "room_id": "room-456",
-            "hand_number": 42,
+            "hand_number": hand_number,
             "pot_size": 1500,
             "community_cards": ["Ah", "Kd", "Qc", "Js", "Th"],
             "participants": [
@@ -149,17 +148,69 @@ class TestHandleHandCompleted:
                 {"user_id": "user-2", "seat": 1, "bet_amount": 500, "won_amount": 0},
             ],
         }
+
+    @pytest.mark.asyncio
+    async def test_handle_hand_completed_updates_chip_flow(self, consumer):
+        """핸드 완료 이벤트는 DB 조회 없이 칩 흐름 매트릭스를 갱신."""
+        import app.services.chip_dumping_detector as cdd_module
+        original_class = cdd_module.ChipDumpingDetector
+        cdd_module.ChipDumpingDetector = MagicMock()
+        consumer._flag_suspicious_activity = AsyncMock()
+        
+        try:
+            await consumer.handle_hand_completed(self._hand_event(1))
+            
+            cdd_module.ChipDumpingDetector.assert_not_called()
+            flow = consumer._chip_flow.get_pair("user-2", "user-1")
+            assert flow.total_hands == 1
+            assert flow.winner_wins == 1
+            consumer._flag_suspicious_activity.assert_not_called()
+        finally:
+            cdd_module.ChipDumpingDetector = original_class
+
+    @pytest.mark.asyncio
+    async def test_handle_hand_completed_flags_pair_once(self, consumer):
+        """기준을 넘은 쌍은 한 번만 플래깅."""
+        consumer._flag_suspicious_activity = AsyncMock()
+        
+        for hand_number in range(5):
+            await consumer.handle_hand_completed(self._hand_event(hand_number))
+        
+        consumer._flag_suspicious_activity.assert_called_once()
+        kwargs = consumer._flag_suspicious_activity.call_args.kwargs
+        assert kwargs["detection_type"] == "chip_dumping"
+        assert kwargs["user_ids"] == ["user-2", "user-1"]
+        assert kwargs["severity"] == "high"
+
+    @pytest.mark.asyncio
+    async def test_reconcile_flags_only_missed_patterns(self, consumer):
+        """재조정은 실시간 추적이 놓친 쌍만 플래깅."""
+        consumer._flag_suspicious_activity = AsyncMock()
+        for hand_number in range(3):
+            await consumer.handle_hand_completed(self._hand_event(hand_number))
+        consumer._flag_suspicious_activity.reset_mock()
         
         mock_detector = MagicMock()
-        mock_detector.detect_one_way_chip_flow = AsyncMock(return_value=[])
+        mock_detector.detect_one_way_chip_flow = AsyncMock(return_value=[
+            {"loser_id": "user-2", "winner_id": "user-1", "total_hands": 3,
+             "winner_wins": 3, "win_rate": 1.0, "detection_type": "one_way_chip_flow"},
+            {"loser_id": "user-3", "winner_id": "user-4", "total_hands": 4,
+             "winner_wins": 4, "win_rate": 1.0, "detection_type": "one_way_chip_flow"},
+        ])
         
         import app.services.chip_dumping_detector as cdd_module
         original_class = cdd_module.ChipDumpingDetector
         cdd_module.ChipDumpingDetector = MagicMock(return_value=mock_detector)
         
         try:
-            await consumer.handle_hand_completed(event)
+            flagged = await consumer.reconcile_chip_flow()
+            
             mock_detector.detect_one_way_chip_flow.assert_called_once()
+            assert flagged == 1
+            consumer._flag_suspicious_activity.assert_called_once()
+            assert consumer._flag_suspicious_activity.call_args.kwargs["user_ids"] == [
+                "user-3", "user-4",
+            ]
         finally:
             cdd_module.ChipDumpingDetector = original_class
 
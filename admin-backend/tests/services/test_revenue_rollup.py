@@ -0,0 +1,234 @@
+"""
+Revenue Rollup Tests - 대시보드 매출 사전 집계 테스트
+"""
+
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.revenue_rollup import (
+    MAX_HOURS_PER_REFRESH,
+    ORIGIN_NAME,
+    RevenueRollupService,
+    floor_hour,
+)
+from app.services.statistics_service import StatisticsService
+from app.tasks.revenue_rollup import RevenueRollupTask
+
+
+def result(rows=None, scalar=None):
+    res = MagicMock()
+    res.fetchall.return_value = rows or []
+    res.scalar.return_value = scalar
+    return res
+
+
+def row(**fields):
+    r = MagicMock()
+    for name, value in fields.items():
+        setattr(r, name, value)
+    return r
+
+
+NOW = datetime(2026, 3, 10, 12, 30, tzinfo=timezone.utc)
+
+
+class TestRefresh:
+    """집계 갱신 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_up_to_date_does_nothing(self):
+        main_db, admin_db = AsyncMock(), AsyncMock()
+        admin_db.execute.return_value = result(scalar=floor_hour(NOW))
+
+        closed = await RevenueRollupService(main_db, admin_db).refresh(now=NOW)
+
+        assert closed == 0
+        main_db.execute.assert_not_awaited()
+        admin_db.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_closes_hours_since_watermark(self):
+        """워터마크부터 마감된 시간까지 집계하고 워터마크를 전진"""
+        watermark = datetime(2026, 3, 10, 9, tzinfo=timezone.utc)
+        main_db, admin_db = AsyncMock(), AsyncMock()
+        admin_db.execute.return_value = result(scalar=watermark)
+        main_db.execute.side_effect = [
+            result([row(bucket=watermark, rake=Decimal("12.5"), hands=10)]),
+            result([
+                row(bucket=watermark, participant_hands=40, unique_players=7),
+                row(bucket=watermark + timedelta(hours=1), participant_hands=3, unique_players=2),
+            ]),
+        ]
+
+        closed = await RevenueRollupService(main_db, admin_db).refresh(now=NOW)
+
+        assert closed == 3
+        hourly_params = admin_db.execute.await_args_list[1].args[1]
+        assert hourly_params == [
+            {"bucket_start": watermark, "rake": Decimal("12.5"), "hands": 10,
+             "participant_hands": 40, "unique_players": 7},
+            {"bucket_start": watermark + timedelta(hours=1), "rake": 0, "hands": 0,
+             "participant_hands": 3, "unique_players": 2},
+        ]
+        watermark_params = admin_db.execute.await_args_list[-1].args[1]
+        assert watermark_params["closed_until"] == datetime(2026, 3, 10, 12, tzinfo=timezone.utc)
+        admin_db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_settle_delay_keeps_hour_open(self):
+        """정각 직후에는 직전 시간을 아직 마감하지 않음"""
+        main_db, admin_db = AsyncMock(), AsyncMock()
+        admin_db.execute.return_value = result(scalar=datetime(2026, 3, 10, 11, tzinfo=timezone.utc))
+        main_db.execute.return_value = result()
+
+        now = datetime(2026, 3, 10, 12, 1, tzinfo=timezone.utc)
+        assert await RevenueRollupService(main_db, admin_db).refresh(now=now) == 0
+
+    @pytest.mark.asyncio
+    async def test_backfill_is_chunked(self):
+        """워터마크가 없으면 backfill_days 전부터 한 번에 최대 일주일씩 집계"""
+        main_db, admin_db = AsyncMock(), AsyncMock()
+        admin_db.execute.return_value = result(scalar=None)
+        main_db.execute.return_value = result()
+
+        closed = await RevenueRollupService(main_db, admin_db).refresh(now=NOW, backfill_days=30)
+
+        assert closed == MAX_HOURS_PER_REFRESH
+        params = main_db.execute.await_args_list[0].args[1]
+        assert params["start"] == floor_hour(NOW - timedelta(days=30))
+        assert params["end"] - params["start"] == timedelta(hours=MAX_HOURS_PER_REFRESH)
+        # 최초 실행은 집계 시작 시각(origin)을 기록
+        origin_params = admin_db.execute.await_args_list[-2].args[1]
+        assert origin_params == {"name": ORIGIN_NAME, "closed_until": params["start"]}
+
+
+class TestQueries:
+    """마감 버킷 + 진행 중 버킷 조회 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_no_watermark_returns_none(self):
+        main_db, admin_db = AsyncMock(), AsyncMock()
+        admin_db.execute.return_value = result(scalar=None)
+        service = RevenueRollupService(main_db, admin_db)
+
+        assert await service.daily_revenue(NOW) is None
+        assert await service.hourly_activity(NOW) is None
+        main_db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_daily_merges_closed_and_live(self):
+        watermark = floor_hour(NOW)
+        main_db, admin_db = AsyncMock(), AsyncMock()
+        admin_db.execute.side_effect = [
+            result(scalar=watermark),
+            result(scalar=watermark - timedelta(days=400)),
+            result([
+                row(period=date(2026, 3, 9), rake=Decimal("100"), hands=50),
+                row(period=date(2026, 3, 10), rake=Decimal("30"), hands=12),
+            ]),
+        ]
+        main_db.execute.return_value = result([
+            row(period=date(2026, 3, 10), rake=Decimal("5.5"), hands=3),
+        ])
+
+        rows = await RevenueRollupService(main_db, admin_db).daily_revenue(NOW - timedelta(days=7))
+
+        assert rows == [
+            {"period": date(2026, 3, 10), "rake": 35.5, "hands": 15},
+            {"period": date(2026, 3, 9), "rake": 100.0, "hands": 50},
+        ]
+        assert main_db.execute.await_args.args[1]["watermark"] == watermark
+
+    @pytest.mark.asyncio
+    async def test_range_before_origin_reads_raw(self):
+        """집계 시작 시각 이전 구간은 원본에서 읽어 합산 (0으로 빠지지 않음)"""
+        watermark = floor_hour(NOW)
+        origin = datetime(2025, 3, 1, 12, tzinfo=timezone.utc)
+        main_db, admin_db = AsyncMock(), AsyncMock()
+        admin_db.execute.side_effect = [
+            result(scalar=watermark),
+            result(scalar=origin),
+            result([row(period=date(2025, 3, 1), rake=Decimal("40"), hands=20)]),
+        ]
+        main_db.execute.return_value = result([
+            row(period=date(2024, 6, 1), rake=Decimal("700"), hands=300),
+            row(period=date(2025, 3, 1), rake=Decimal("10"), hands=5),
+        ])
+
+        start = NOW - timedelta(days=730)
+        rows = await RevenueRollupService(main_db, admin_db).monthly_revenue(start)
+
+        assert rows == [
+            {"period": date(2025, 3, 1), "rake": 50.0, "hands": 25},
+            {"period": date(2024, 6, 1), "rake": 700.0, "hands": 300},
+        ]
+        params = main_db.execute.await_args.args[1]
+        assert params == {"watermark": watermark, "origin": origin, "start": start}
+
+    @pytest.mark.asyncio
+    async def test_missing_origin_falls_back(self):
+        main_db, admin_db = AsyncMock(), AsyncMock()
+        admin_db.execute.side_effect = [result(scalar=floor_hour(NOW)), result(scalar=None)]
+
+        assert await RevenueRollupService(main_db, admin_db).daily_revenue(NOW) is None
+        main_db.execute.assert_not_awaited()
+
+
+class TestStatisticsServiceRollups:
+    """StatisticsService 집계 경로 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_daily_revenue_uses_rollups(self):
+        main_db, admin_db = AsyncMock(), AsyncMock()
+        service = StatisticsService(main_db, admin_db=admin_db)
+        service.rollups = MagicMock()
+        service.rollups.daily_revenue = AsyncMock(return_value=[
+            {"period": date(2026, 3, 10), "rake": 35.5, "hands": 15},
+        ])
+
+        revenue = await service.get_daily_revenue(days=7)
+
+        assert revenue == [{"date": "2026-03-10", "rake": 35.5, "hands": 15}]
+        main_db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_without_watermark(self):
+        main_db, admin_db = AsyncMock(), AsyncMock()
+        main_db.execute.return_value = result([
+            row(date=date(2026, 3, 10), rake=Decimal("1"), hands=1),
+        ])
+        service = StatisticsService(main_db, admin_db=admin_db)
+        service.rollups = MagicMock()
+        service.rollups.daily_revenue = AsyncMock(return_value=None)
+
+        revenue = await service.get_daily_revenue(days=7)
+
+        assert len(revenue) == 1
+        main_db.execute.assert_awaited_once()
+
+
+class TestRevenueRollupTask:
+    """집계 작업 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_run_once_uses_session_factories(self, monkeypatch):
+        sessions = []
+
+        class Session:
+            async def __aenter__(self):
+                sessions.append(self)
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+        refresh = AsyncMock(return_value=4)
+        monkeypatch.setattr(RevenueRollupService, "refresh", refresh)
+
+        task = RevenueRollupTask(Session, Session, backfill_days=10, settle_seconds=30)
+
+        assert await task.run_once() == 4
+        assert len(sessions) == 2
+        refresh.assert_awaited_once_with(backfill_days=10, settle_seconds=30)
@@ -0,0 +1,120 @@
+"""
+User Search Tests - 관리자 사용자 검색 쿼리 빌더 테스트
+"""
+
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+from app.services.user_search import (
+    COUNT_CAP,
+    SearchKind,
+    build_search_filter,
+    classify_search,
+    count_users,
+    decode_cursor,
+    encode_cursor,
+    escape_like,
+    keyset_condition,
+)
+
+
+class TestClassifySearch:
+    """검색어 종류 판별 테스트"""
+
+    @pytest.mark.parametrize("search,kind", [
+        (None, SearchKind.NONE),
+        ("   ", SearchKind.NONE),
+        ("0b6f1c9e-3d0a-4f57-9a8e-2c1b7e4d5f60", SearchKind.USER_ID),
+        ("Player@Example.com", SearchKind.EMAIL),
+        ("ab", SearchKind.PREFIX),
+        ("player", SearchKind.TRIGRAM),
+        ("player@exam", SearchKind.TRIGRAM),  # 입력 중인 이메일은 부분 일치
+    ])
+    def test_classify(self, search, kind):
+        assert classify_search(search) == kind
+
+    def test_uuid_is_normalized(self):
+        """UUID는 정규화된 소문자 형식으로 바인드되어야 함"""
+        kind, sql, params = build_search_filter("0B6F1C9E-3D0A-4F57-9A8E-2C1B7E4D5F60")
+
+        assert kind.is_exact
+        assert sql == "id = :search_id"
+        assert params["search_id"] == "0b6f1c9e-3d0a-4f57-9a8e-2c1b7e4d5f60"
+
+    def test_email_lowercased(self):
+        _, sql, params = build_search_filter(" Player@Example.com ")
+
+        assert "lower(email)" in sql
+        assert params["search_email"] == "player@example.com"
+
+    def test_like_wildcards_escaped(self):
+        """사용자 입력의 %, _는 와일드카드로 해석되지 않아야 함"""
+        assert escape_like("50%_off\\") == "50\\%\\_off\\\\"
+
+        _, _, params = build_search_filter("a_")
+        assert params["search_prefix"] == "a\\_%"
+
+        _, _, params = build_search_filter("100%")
+        assert params["search"] == "%100\\%%"
+
+    def test_no_search(self):
+        assert build_search_filter(None) == (SearchKind.NONE, None, {})
+
+
+class TestCursor:
+    """keyset 커서 테스트"""
+
+    def test_round_trip_datetime(self):
+        created_at = datetime(2026, 1, 15, 10, 30, tzinfo=timezone.utc)
+        cursor = encode_cursor("created_at", "DESC", created_at, "user-1")
+
+        assert decode_cursor(cursor, "created_at", "DESC") == (created_at, "user-1")
+
+    def test_round_trip_scalar(self):
+        cursor = encode_cursor("balance", "ASC", 1500, "user-2")
+
+        assert decode_cursor(cursor, "balance", "ASC") == (1500, "user-2")
+
+    def test_sort_mismatch_rejected(self):
+        cursor = encode_cursor("balance", "ASC", 1500, "user-2")
+
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, "balance", "DESC")
+
+    def test_garbage_rejected(self):
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor", "created_at", "DESC")
+
+    def test_keyset_condition_direction(self):
+        assert keyset_condition("created_at", "DESC") == (
+            "(created_at, id) < (:cursor_value, :cursor_id)"
+        )
+        assert "> (" in keyset_condition("nickname", "ASC")
+
+
+class TestCountUsers:
+    """개수 조회 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_exact_below_cap(self):
+        db = AsyncMock()
+        result = MagicMock()
+        result.scalar.return_value = 42
+        db.execute.return_value = result
+
+        assert await count_users(db, "1=1", {}) == (42, False)
+        assert db.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_estimate_above_cap(self):
+        """상한에 도달하면 플래너 추정치를 사용해야 함"""
+        db = AsyncMock()
+        capped = MagicMock()
+        capped.scalar.return_value = COUNT_CAP
+        explain = MagicMock()
+        explain.scalar.return_value = [{"Plan": {"Plan Rows": 987654}}]
+        db.execute.side_effect = [capped, explain]
+
+        assert await count_users(db, "1=1", {}) == (987654, True)
+        assert "EXPLAIN" in str(db.execute.await_args_list[1].args[0])
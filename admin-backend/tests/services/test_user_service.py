@@ -11,6 +11,7 @@ from app.services.user_service import (
     UserServiceError,
     UserNotFoundError,
     InsufficientBalanceError,
+    InvalidCursorError,
 )
 
 
@@ -180,6 +181,80 @@ class TestUserServiceSearchUsers:
         )  # Service maps updated_at to last_login
 
 
+class TestUserServiceSearchPaths:
+    """search_users 인덱스 검색 경로 / keyset 페이지네이션 테스트"""
+
+    @pytest.fixture
+    def mock_db(self):
+        return AsyncMock()
+
+    @pytest.fixture
+    def service(self, mock_db):
+        return UserService(mock_db)
+
+    @staticmethod
+    def _row(user_id: str, created_at: datetime):
+        row = MagicMock()
+        row.id = user_id
+        row.username = user_id
+        row.nickname = user_id
+        row.email = f"{user_id}@example.com"
+        row.balance = 0
+        row.created_at = created_at
+        row.updated_at = None
+        row.status = "active"
+        return row
+
+    @pytest.mark.asyncio
+    async def test_uuid_search_skips_count(self, service, mock_db):
+        """UUID 검색은 개수 쿼리 없이 PK 조회만 해야 함"""
+        user_id = "0b6f1c9e-3d0a-4f57-9a8e-2c1b7e4d5f60"
+        list_result = MagicMock()
+        list_result.fetchall.return_value = [self._row(user_id, datetime(2026, 1, 1))]
+        mock_db.execute.return_value = list_result
+
+        result = await service.search_users(search=user_id)
+
+        assert mock_db.execute.await_count == 1
+        query, params = mock_db.execute.await_args.args
+        assert "id = :search_id" in str(query)
+        assert params["search_id"] == user_id
+        assert result["total"] == 1
+        assert result["next_cursor"] is None
+        assert result["total_is_estimate"] is False
+
+    @pytest.mark.asyncio
+    async def test_full_page_returns_next_cursor(self, service, mock_db):
+        """페이지가 가득 차면 다음 페이지 커서를 반환해야 함"""
+        count_result = MagicMock()
+        count_result.scalar.return_value = 3
+        list_result = MagicMock()
+        list_result.fetchall.return_value = [
+            self._row("user-2", datetime(2026, 1, 2)),
+            self._row("user-1", datetime(2026, 1, 1)),
+        ]
+        mock_db.execute.side_effect = [count_result, list_result, count_result, list_result]
+
+        result = await service.search_users(page_size=2)
+        assert result["next_cursor"]
+
+        await service.search_users(page_size=2, cursor=result["next_cursor"])
+
+        query, params = mock_db.execute.await_args.args
+        assert "(created_at, id) < (:cursor_value, :cursor_id)" in str(query)
+        assert params["cursor_value"] == datetime(2026, 1, 1)
+        assert params["cursor_id"] == "user-1"
+        assert params["offset"] == 0
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor(self, service, mock_db):
+        """잘못된 커서는 조회 없이 InvalidCursorError가 발생해야 함"""
+        with pytest.raises(InvalidCursorError):
+            await service.search_users(cursor="garbage")
+
+        mock_db.execute.assert_not_awaited()
+
+
 class TestUserServiceGetUserDetail:
     """get_user_detail 메서드 테스트"""
 
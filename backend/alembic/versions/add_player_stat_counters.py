@@ -0,0 +1,70 @@
+"""Add player_stat_counters table for materialized player statistics.
+
+Revision ID: add_player_stat_counters_001
+Revises: merge_ban_and_partner_stats_001
+Create Date: 2026-02-02
+
+This migration adds:
+- player_stat_counters table (one row per user, updated on hand completion)
+
+Existing data is loaded by the backfill task
+(app.tasks.player_stats.backfill_player_stats_task).
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "add_player_stat_counters_001"
+down_revision: Union[str, Sequence[str], None] = "merge_ban_and_partner_stats_001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTER_COLUMNS = (
+    "total_hands",
+    "hands_won",
+    "total_winnings",
+    "biggest_pot",
+    "vpip_hands",
+    "pfr_hands",
+    "three_bet_hands",
+    "bets",
+    "raises",
+    "calls",
+    "checks",
+    "total_actions",
+    "showdown_hands",
+    "won_showdowns",
+)
+
+
+def upgrade() -> None:
+    """Create player_stat_counters table."""
+    op.create_table(
+        "player_stat_counters",
+        sa.Column(
+            "user_id",
+            postgresql.UUID(as_uuid=False),
+            sa.ForeignKey("users.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        *[
+            sa.Column(name, sa.BigInteger(), nullable=False, server_default="0")
+            for name in COUNTER_COLUMNS
+        ],
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        comment="Materialized per-user poker statistic counters",
+    )
+
+
+def downgrade() -> None:
+    """Drop player_stat_counters table."""
+    op.drop_table("player_stat_counters")
@@ -0,0 +1,51 @@
+"""Add trigram/prefix indexes for admin user search.
+
+Revision ID: add_user_search_indexes_001
+Revises: add_player_stat_counters_001
+Create Date: 2026-02-03
+
+관리자 사용자 검색(admin-backend UserService.search_users)용 인덱스:
+- pg_trgm GIN 인덱스 (nickname, email): 부분 일치 ILIKE '%x%' 검색
+- lower() text_pattern_ops 인덱스 (nickname, email): 3자 미만 접두사 검색 및
+  이메일 대소문자 무시 완전 일치
+- users(created_at, id): 기본 정렬의 keyset 페이지네이션
+
+대형 users 테이블에서 쓰기를 막지 않도록 CONCURRENTLY로 생성합니다.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_user_search_indexes_001"
+down_revision: Union[str, Sequence[str], None] = "add_player_stat_counters_001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ("ix_users_nickname_trgm", "USING gin (nickname gin_trgm_ops)"),
+    ("ix_users_email_trgm", "USING gin (email gin_trgm_ops)"),
+    ("ix_users_nickname_lower_prefix", "(lower(nickname) text_pattern_ops)"),
+    ("ix_users_email_lower_prefix", "(lower(email) text_pattern_ops)"),
+    ("ix_users_created_at_id", "(created_at, id)"),
+)
+
+
+def upgrade() -> None:
+    """Create pg_trgm extension and user search indexes."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # CREATE INDEX CONCURRENTLY는 트랜잭션 밖에서만 실행 가능
+    with op.get_context().autocommit_block():
+        for name, definition in INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON users {definition}"
+            )
+
+
+def downgrade() -> None:
+    """Drop user search indexes (pg_trgm extension is kept)."""
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
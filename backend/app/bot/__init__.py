@@ -10,9 +10,19 @@ Key components:
 - RoomMatcher: Selects appropriate rooms for bots based on stack size
 - Profile: Generates bot nicknames and behavioral parameters
 - Strategy: Different playing styles (TAG, LAG, etc.)
+- HeadlessSimulator: Fast-forward play for unwatched all-bot tables
 """
 
 from app.bot.orchestrator import BotOrchestrator, get_bot_orchestrator
 from app.bot.game_loop import BotGameLoop, get_bot_game_loop
+from app.bot.simulator import HeadlessSimulator, SimulationConfig, run_simulation
 
-__all__ = ["BotOrchestrator", "get_bot_orchestrator", "BotGameLoop", "get_bot_game_loop"]
+__all__ = [
+    "BotOrchestrator",
+    "get_bot_orchestrator",
+    "BotGameLoop",
+    "get_bot_game_loop",
+    "HeadlessSimulator",
+    "SimulationConfig",
+    "run_simulation",
+]
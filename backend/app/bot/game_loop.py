@@ -2,6 +2,11 @@
 
 This service handles game start and turn processing when bots are involved,
 independent of WebSocket connections.
+
+Tables with only bots seated and no human subscribers can be run in
+headless fast-forward mode (bot_fast_forward_enabled): hands run
+back-to-back through HeadlessSimulator with no think time and no
+per-action broadcasts, while hand history and bot stats are still emitted.
 """
 
 import asyncio
@@ -10,12 +15,14 @@ import random
 from datetime import datetime, timezone
 from typing import Optional, Any
 
+from app.bot.simulator import HeadlessSimulator, SimulatedHand
 from app.bot.strategy import get_strategy
 from app.bot.strategy.base import GameContext
 from app.config import get_settings
 from app.game.manager import game_manager
-from app.game.poker_table import PokerTable, GamePhase
-from app.game.types import ActionResult, HandResult
+from app.game.poker_table import PokerTable, GamePhase, Player
+from app.game.types import ActionResult, AvailableActions, HandResult
+from app.services.hand_history_queue import get_hand_history_queue
 from app.ws.events import EventType
 from app.ws.messages import MessageEnvelope
 
@@ -53,6 +60,7 @@ class BotGameLoop:
     - Processes bot turns without WebSocket dependency
     - Auto-starts next hand after completion
     - Broadcasts game events via ConnectionManager
+    - Fast-forwards unwatched all-bot tables (no delays, no broadcasts)
     """
 
     def __init__(self):
@@ -100,6 +108,14 @@ class BotGameLoop:
             logger.debug(f"[BOT_GAME_LOOP] Table {room_id} already being processed")
             return False
 
+        # 사람이 없는 봇 전용 테이블은 헤드리스로 빨리 감기
+        if self._settings.bot_fast_forward_enabled and await self._is_unwatched(room_id):
+            self._processing_tables.add(room_id)
+            try:
+                return await self.fast_forward(room_id) > 0
+            finally:
+                self._processing_tables.discard(room_id)
+
         table_lock = self._get_table_lock(room_id)
 
         async with table_lock:
@@ -248,7 +264,9 @@ class BotGameLoop:
 
                 # 봇 액션 결정
                 if is_livebot_player(current_player):
-                    action, amount = self._decide_livebot_action(
+                    # 전략 결정은 에퀴티 계산(CPU)을 포함하므로 워커 스레드에서 실행
+                    action, amount = await asyncio.to_thread(
+                        self._decide_livebot_action,
                         user_id=current_player.user_id,
                         actions=actions,
                         call_amount=call_amount,
@@ -320,6 +338,141 @@ class BotGameLoop:
         except Exception as e:
             logger.error(f"[BOT_GAME_LOOP] Exception in process_bot_turns: {e}", exc_info=True)
 
+    # =========================================================================
+    # Headless fast-forward
+    # =========================================================================
+
+    async def _is_unwatched(self, room_id: str) -> bool:
+        """Only bots seated and no human subscribed to the table channel.
+
+        구독자는 이 노드 기준 (다른 게이트웨이 노드의 관전자는 빨리 감기
+        한 번이 끝난 뒤 일반 흐름의 다음 핸드부터 이벤트를 받음).
+        """
+        table = game_manager.get_table(room_id)
+        if not table:
+            return False
+        if any(not is_bot_player(p) for _, p in table.get_all_seated_players()):
+            return False
+
+        manager = await self._get_connection_manager()
+        if manager:
+            for conn in manager.get_channel_connections(f"table:{room_id}"):
+                if not is_bot_player(conn):
+                    return False
+        return True
+
+    async def fast_forward(self, room_id: str, max_hands: int | None = None) -> int:
+        """Run hands back-to-back on an unwatched all-bot table.
+
+        No think time and no per-action broadcasts; each completed hand
+        still goes to hand history and bot session stats. Stops when a
+        human sits down or subscribes, no hand can start, or max_hands
+        (default: bot_fast_forward_max_hands) is reached, then hands the
+        table back to the normal next-hand flow.
+
+        Args:
+            room_id: The room/table ID
+            max_hands: Hands to play before yielding
+
+        Returns:
+            Number of hands played
+        """
+        max_hands = max_hands or self._settings.bot_fast_forward_max_hands
+        table_lock = self._get_table_lock(room_id)
+        simulator: HeadlessSimulator | None = None
+        played = 0
+
+        try:
+            while self._running and played < max_hands:
+                async with table_lock:
+                    table = game_manager.get_table(room_id)
+                    if not table:
+                        return played
+                    if simulator is None or simulator.table is not table:
+                        simulator = HeadlessSimulator(table, decide=self._decide_action)
+                    # 결정은 워커 스레드에서 (이벤트 루프를 막지 않음)
+                    hand = await simulator.play_hand_async()
+                if hand is None:
+                    break
+
+                played += 1
+                await self._record_headless_hand(room_id, table, hand)
+
+                # 다른 태스크에 이벤트 루프 양보 후 관전자 재확인
+                await asyncio.sleep(0)
+                if not await self._is_unwatched(room_id):
+                    break
+        except Exception as e:
+            logger.error(f"[BOT_GAME_LOOP] Exception in fast_forward: {e}", exc_info=True)
+
+        if simulator is not None:
+            logger.info(
+                f"[BOT_GAME_LOOP] Fast-forwarded {played} hands on {room_id}: "
+                f"{simulator.stats.to_dict()}"
+            )
+
+        table = game_manager.get_table(room_id)
+        if played and table:
+            # 최종 상태 1회 전송 후 일반 흐름으로 복귀
+            await self._broadcast_personalized_states(room_id, table)
+            asyncio.create_task(self._auto_start_next_hand(room_id))
+        return played
+
+    async def _record_headless_hand(
+        self,
+        room_id: str,
+        table: PokerTable,
+        hand: SimulatedHand,
+    ) -> None:
+        """Emit hand history and bot stats for a fast-forwarded hand.
+
+        일반 경로와 같이 모든 핸드를 hand_history_queue에 적재합니다
+        (큐가 없으면 테이블 최근 기록에만 보관).
+        """
+        queue = get_hand_history_queue()
+        if queue is not None:
+            await queue.enqueue(hand.history)
+        else:
+            game_manager.save_hand_history(room_id, hand.history)
+
+        from app.bot.orchestrator import get_bot_orchestrator
+
+        orchestrator = get_bot_orchestrator()
+        for result in hand.bot_results:
+            await orchestrator.notify_hand_complete(
+                room_id=room_id,
+                user_id=result.user_id,
+                new_stack=result.new_stack,
+                won_amount=result.won_amount,
+            )
+
+    def _decide_action(
+        self,
+        table: PokerTable,
+        player: Player,
+        available: AvailableActions,
+    ) -> tuple[str, int]:
+        """Bot decision for the current player (same logic as live play)."""
+        actions = available.get("actions", [])
+        call_amount = available.get("call_amount", 0)
+        if not is_livebot_player(player):
+            return self._decide_simple_bot_action(actions, call_amount)
+        return self._decide_livebot_action(
+            user_id=player.user_id,
+            actions=actions,
+            call_amount=call_amount,
+            stack=player.stack,
+            available=available,
+            hole_cards=player.hole_cards or [],
+            community_cards=table.community_cards or [],
+            pot=table.pot,
+            big_blind=table.big_blind,
+            phase=table.phase.value,
+            position=table.current_player_seat,
+            num_players=table.max_players,
+            num_active=len([p for p in table.players.values() if p and p.status == "active"]),
+        )
+
     async def _auto_start_next_hand(self, room_id: str) -> None:
         """Auto-start next hand after delay."""
         await asyncio.sleep(self._settings.hand_result_display_seconds + 2.0)
@@ -469,11 +622,7 @@ class BotGameLoop:
         for seat, player in table.players.items():
             if player:
                 state = table.get_state_for_player(player.user_id)
-                message = MessageEnvelope.create(
-                    event_type=EventType.TABLE_SNAPSHOT,
-                    payload={"tableId": room_id, "state": state},
-                )
-                await manager.send_to_user(player.user_id, message.to_dict())
+                await manager.send_table_state(player.user_id, room_id, state)
 
     async def _broadcast_action(self, room_id: str, result: ActionResult) -> None:
         """Broadcast action result."""
@@ -15,6 +15,7 @@ from typing import Optional
 from app.bot.session import BotSession, BotState, create_bot_session
 from app.bot.room_matcher import calculate_buy_in_for_room
 from app.config import get_settings
+from app.game.equity import warm_tables
 from app.game.manager import game_manager
 from app.game.poker_table import Player
 
@@ -84,6 +85,9 @@ class BotOrchestrator:
         # Load target count from settings
         self._target_count = self._settings.livebot_target_count
 
+        # Build hand evaluator / equity lookup tables off the event loop
+        await asyncio.to_thread(warm_tables)
+
         # Start main loop
         self._main_loop_task = asyncio.create_task(self._main_loop())
 
@@ -563,7 +567,7 @@ class BotOrchestrator:
         if player and player.user_id == session.user_id:
             room_id = session.room_id  # Capture before clearing
             # Remove from table
-            table.players[session.seat] = None
+            table.remove_player(session.seat)
             logger.info(
                 f"[BOT_ORCH] Bot {session.nickname} removed from "
                 f"{room_id} seat {session.seat}"
@@ -4,10 +4,15 @@ Selects appropriate rooms for bots based on:
 - Bot's stack size relative to blinds
 - Room size and current occupancy
 - Even distribution across all rooms
+
+Room selection is a lookup in GameManager's SeatAvailabilityIndex (kept
+current by PokerTable seat hooks). The DB is only consulted periodically,
+or when no loaded room fits, to load rooms that aren't in memory yet.
 """
 
 import random
 import logging
+import time
 from typing import Optional
 
 from app.game.manager import game_manager
@@ -116,6 +121,46 @@ async def get_available_rooms_from_db() -> list[dict]:
         return []
 
 
+# 아직 로드되지 않은 방 확인 주기 (초)
+DB_ROOM_SYNC_INTERVAL_SECONDS = 60.0
+
+_last_db_room_sync = 0.0
+
+
+async def load_unloaded_rooms(exclude_room_ids: set[str] | None = None) -> int:
+    """Create tables for open DB rooms that aren't loaded in GameManager.
+
+    Args:
+        exclude_room_ids: Room IDs to skip
+
+    Returns:
+        Number of tables created
+    """
+    global _last_db_room_sync
+    _last_db_room_sync = time.monotonic()
+
+    exclude_room_ids = exclude_room_ids or set()
+    created = 0
+    for room_data in await get_available_rooms_from_db():
+        room_id = room_data["id"]
+        if room_id in exclude_room_ids or game_manager.has_table(room_id):
+            continue
+
+        # DB 목록에 필요한 값이 모두 있으므로 방별 재조회 없이 생성
+        game_manager.get_or_create_table(
+            room_id=room_id,
+            name=room_data["name"],
+            small_blind=room_data["small_blind"],
+            big_blind=room_data["big_blind"],
+            max_players=room_data["max_seats"],
+            min_buy_in=room_data["buy_in_min"],
+            max_buy_in=room_data["buy_in_max"],
+        )
+        created += 1
+        logger.debug(f"[ROOM_MATCHER] Created table from DB: {room_id[:8]}")
+    return created
+
+
 # Bot stack sizing preferences (bots have infinite funds, so use buy-in based calculation)
 # These are now used for scoring, not filtering
 MIN_BB_FOR_PLAY = 40   # Minimum big blinds considered playable
@@ -301,6 +346,11 @@ async def select_room_for_bot(
 ) -> Optional[tuple[PokerTable, int]]:
     """Select the best room for a bot to join.
 
+    Same policy as calculate_room_score() > 0 with fewest bots first:
+    blinds within MIN/MAX_BB_FOR_PLAY of the stack, an empty seat, bots
+    below get_max_bots_for_table(), random among the rooms with the
+    fewest bots.
+
     Args:
         bot_stack: The bot's stack size
         exclude_room_ids: Room IDs to exclude from selection
@@ -308,66 +358,32 @@ async def select_room_for_bot(
     Returns:
         Tuple of (table, seat_position) or None if no suitable room
     """
-    exclude_room_ids = exclude_room_ids or []
-
-    # First try existing tables in GameManager
-    rooms = get_available_rooms()
+    exclude = set(exclude_room_ids or ())
+    index = game_manager.seat_index
 
-    logger.debug(f"[ROOM_MATCHER] GameManager has {len(rooms)} tables, bot_stack={bot_stack}")
+    # 블라인드 범위: MIN_BB_FOR_PLAY <= bot_stack / bb <= MAX_BB_FOR_PLAY
+    min_bb = bot_stack / MAX_BB_FOR_PLAY
+    max_bb = bot_stack / MIN_BB_FOR_PLAY
 
-    # Always check DB for additional rooms not yet in GameManager
-    # This ensures bots can join suitable rooms even if only unsuitable ones are loaded
-    db_rooms = await get_available_rooms_from_db()
-    existing_room_ids = {t.room_id for t in rooms}
-
-    for room_data in db_rooms:
-        if room_data["id"] in exclude_room_ids:
-            continue
-        if room_data["id"] in existing_room_ids:
-            continue  # Already loaded
-
-        # Create table in GameManager
-        table = await ensure_table_exists(room_data["id"])
-        if table:
-            rooms.append(table)
-            logger.debug(f"[ROOM_MATCHER] Created table from DB: {room_data['id'][:8]}")
-
-    if not rooms:
-        logger.debug("[ROOM_MATCHER] No rooms available")
-        return None
+    candidates = index.find_rooms(min_bb, max_bb, get_max_bots_for_table, exclude)
 
-    # Score each room and sort by bot count (fewest first for even distribution)
-    scored_rooms: list[tuple[PokerTable, float, int]] = []
-    for table in rooms:
-        if table.room_id in exclude_room_ids:
-            continue
-
-        empty_seats = get_empty_seats(table)
-        if not empty_seats:
-            continue
-
-        score = calculate_room_score(table, bot_stack)
-        if score > 0:
-            bot_count = count_bots_at_table(table)
-            scored_rooms.append((table, score, bot_count))
+    # 새 방(봇 0명)이 생겼을 수 있으므로 주기적으로, 또는 후보가 없을 때 DB 확인
+    db_sync_due = time.monotonic() - _last_db_room_sync >= DB_ROOM_SYNC_INTERVAL_SECONDS
+    if db_sync_due or not candidates:
+        if await load_unloaded_rooms(exclude):
+            candidates = index.find_rooms(
+                min_bb, max_bb, get_max_bots_for_table, exclude
+            )
 
-    if not scored_rooms:
-        logger.debug("[ROOM_MATCHER] No suitable rooms found")
+    if not candidates:
+        logger.debug(f"[ROOM_MATCHER] No suitable rooms found (bot_stack={bot_stack})")
         return None
 
-    # 1차 정렬: 봇 수 오름차순 (적은 방 우선)
-    # 2차 정렬: 점수 내림차순
-    scored_rooms.sort(key=lambda x: (x[2], -x[1]))
-
     # 같은 봇 수를 가진 방들 중에서 랜덤 선택 (자연스러운 분배)
-    min_bot_count = scored_rooms[0][2]
-    same_count_rooms = [r for r in scored_rooms if r[2] == min_bot_count]
-    selected_entry = random.choice(same_count_rooms)
-    selected_table = selected_entry[0]
-
-    # Select a random empty seat
-    empty_seats = get_empty_seats(selected_table)
-    if not empty_seats:
+    room_id = random.choice(candidates)
+    selected_table = game_manager.get_table(room_id)
+    empty_seats = index.empty_seats(room_id)
+    if not selected_table or not empty_seats:
         return None
 
     selected_seat = random.choice(empty_seats)
@@ -375,7 +391,7 @@ async def select_room_for_bot(
     logger.info(
         f"[ROOM_MATCHER] Selected room {selected_table.room_id} "
         f"(seat {selected_seat}, blinds {selected_table.small_blind}/{selected_table.big_blind}, "
-        f"players {sum(1 for p in selected_table.players.values() if p)})"
+        f"bots {index.bot_count(room_id)})"
     )
 
     return (selected_table, selected_seat)
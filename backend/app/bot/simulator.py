@@ -0,0 +1,483 @@
+"""Headless Simulator - fast-forward play for all-bot tables.
+
+BotGameLoop plays at human speed: 1-5 seconds of think time per bot
+action and a broadcast for every intermediate event. Tables nobody is
+seated at or watching need neither, so HeadlessSimulator drives
+PokerTable directly:
+
+- Hands run back-to-back with no artificial delays and no broadcasts
+- Every completed hand still yields a hand history record (same shape
+  the action handler writes) and per-bot results for session statistics
+- run_simulation() builds its own table and is a plain top-level
+  function, so it can run in a ProcessPoolExecutor worker
+
+Used to warm tables, soak-test the engine and benchmark hands/sec per core.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generator, Optional
+
+from app.bot.strategy import get_strategy
+from app.bot.strategy.base import BaseStrategy, GameContext
+from app.game.poker_table import GamePhase, Player, PokerTable
+from app.game.types import AvailableActions
+
+logger = logging.getLogger(__name__)
+
+# (table, current player, available actions) -> (action, amount)
+Decider = Callable[[PokerTable, Player, AvailableActions], tuple[str, int]]
+
+# _hand_steps(): yields decision requests, receives (action, amount)
+HandSteps = Generator[
+    tuple[PokerTable, Player, AvailableActions], tuple[str, int], Optional["SimulatedHand"]
+]
+
+# 한 핸드 최대 액션 수 (BotGameLoop의 MAX_ITERATIONS와 같은 역할)
+MAX_ACTIONS_PER_HAND = 200
+
+
+def simple_decision(
+    table: PokerTable,
+    player: Player,
+    available: AvailableActions,
+) -> tuple[str, int]:
+    """Dev bot logic (check > call 70% > fold)."""
+    actions = available.get("actions", [])
+    if "check" in actions:
+        return "check", 0
+    if "call" in actions and random.random() < 0.7:
+        return "call", available.get("call_amount", 0)
+    if "fold" in actions:
+        return "fold", 0
+    return actions[0], 0
+
+
+def build_game_context(
+    table: PokerTable,
+    player: Player,
+    available: AvailableActions,
+) -> GameContext:
+    """Build strategy context for the current player."""
+    call_amount = available.get("call_amount", 0)
+    return GameContext(
+        actions=available.get("actions", []),
+        call_amount=call_amount,
+        min_raise=available.get("min_raise", call_amount * 2),
+        max_raise=available.get("max_raise", player.stack),
+        stack=player.stack,
+        current_bet=available.get("current_bet", 0),
+        position=table.current_player_seat,
+        hole_cards=player.hole_cards or [],
+        community_cards=table.community_cards or [],
+        pot=table.pot,
+        phase=table.phase.value,
+        big_blind=table.big_blind,
+        num_players=table.max_players,
+        num_active=len(
+            [p for p in table.players.values() if p and p.status == "active"]
+        ),
+    )
+
+
+class StrategyDecider:
+    """Strategy-system decisions without the bot orchestrator.
+
+    Args:
+        strategies: user_id -> strategy name (others use default)
+        default: Strategy for users not in strategies
+    """
+
+    def __init__(
+        self,
+        strategies: Optional[dict[str, str]] = None,
+        default: str = "balanced",
+    ):
+        self._strategies = dict(strategies or {})
+        self._default = default
+        self._instances: dict[str, BaseStrategy] = {}
+
+    def __call__(
+        self,
+        table: PokerTable,
+        player: Player,
+        available: AvailableActions,
+    ) -> tuple[str, int]:
+        name = self._strategies.get(player.user_id, self._default)
+        strategy = self._instances.get(name)
+        if strategy is None:
+            strategy = self._instances[name] = get_strategy(name)
+        return strategy.decide(build_game_context(table, player, available)).to_tuple()
+
+
+@dataclass
+class BotHandResult:
+    """One bot's outcome of a simulated hand (for session statistics)."""
+
+    user_id: str
+    new_stack: int
+    won_amount: int
+
+
+@dataclass
+class SimulatedHand:
+    """A completed headless hand."""
+
+    hand_number: int
+    history: dict[str, Any]  # HandHistoryService / HandHistoryQueue record
+    bot_results: list[BotHandResult]
+    actions: int
+
+
+@dataclass
+class SimulationStats:
+    """Aggregate counters of a simulation run."""
+
+    hands: int = 0
+    actions: int = 0
+    failed_actions: int = 0
+    aborted_hands: int = 0
+    elapsed_seconds: float = 0.0
+    histories: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def hands_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.hands / self.elapsed_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "hands": self.hands,
+            "actions": self.actions,
+            "failedActions": self.failed_actions,
+            "abortedHands": self.aborted_hands,
+            "elapsedSeconds": round(self.elapsed_seconds, 3),
+            "handsPerSecond": round(self.hands_per_second, 1),
+        }
+
+
+class HeadlessSimulator:
+    """Runs hands on a PokerTable with no delays and no broadcasts.
+
+    Usage:
+        simulator = HeadlessSimulator(table, decide=StrategyDecider())
+        while (hand := simulator.play_hand()) is not None:
+            stats.histories.append(hand.history)
+
+        # 이벤트 루프 위 (라이브 테이블): 결정은 워커 스레드, 액션마다 양보
+        hand = await simulator.play_hand_async()
+
+    Args:
+        table: Table to play on (every seated player must be a bot)
+        decide: Action decision function
+        refill_stack: Busted players are topped back up to this stack and
+            sat back in (soak tests / benchmarks). None leaves them out.
+    """
+
+    def __init__(
+        self,
+        table: PokerTable,
+        decide: Decider = simple_decision,
+        refill_stack: Optional[int] = None,
+    ):
+        self.table = table
+        self.decide = decide
+        self.refill_stack = refill_stack
+        self.stats = SimulationStats()
+
+    def play_hand(self) -> Optional[SimulatedHand]:
+        """Play one full hand.
+
+        Returns:
+            Completed hand, or None if no hand could be started or the
+            hand stalled (counted in stats.aborted_hands)
+        """
+        steps = self._hand_steps()
+        try:
+            request = next(steps)
+            while True:
+                request = steps.send(self.decide(*request))
+        except StopIteration as done:
+            return done.value
+
+    async def play_hand_async(self) -> Optional[SimulatedHand]:
+        """Play one full hand without blocking the event loop.
+
+        play_hand()와 같지만 결정(에퀴티 계산 포함)은 asyncio.to_thread로
+        실행하고, 테이블 변경은 이벤트 루프 스레드에서만 수행합니다.
+        액션마다 이벤트 루프에 양보합니다.
+        """
+        steps = self._hand_steps()
+        try:
+            request = next(steps)
+            while True:
+                decision = await asyncio.to_thread(self.decide, *request)
+                request = steps.send(decision)
+        except StopIteration as done:
+            return done.value
+
+    def _hand_steps(self) -> HandSteps:
+        """Hand driver: yields (table, player, available) per decision."""
+        table = self.table
+        if self.refill_stack:
+            self._refill_busted()
+
+        table.try_activate_bb_waiter_for_next_hand()
+        if not table.can_start_hand():
+            return None
+
+        started = time.perf_counter()
+        result = table.start_new_hand()
+        if not result.get("success"):
+            return None
+
+        # 핸드 종료 시 초기화되는 값은 시작 시점에 보관
+        starting_stacks = dict(table._hand_starting_stacks)
+        hole_cards = {
+            seat: list(p.hole_cards)
+            for seat, p in table.players.items()
+            if p and p.hole_cards
+        }
+        bets: dict[int, int] = {}
+        statuses: dict[int, str] = {}
+        actions = 0
+
+        while actions < MAX_ACTIONS_PER_HAND:
+            if table.phase == GamePhase.WAITING:
+                break
+
+            if table.current_player_seat is None:
+                table._update_current_player()
+                if table.current_player_seat is None:
+                    break
+
+            player = table.players.get(table.current_player_seat)
+            available = table.get_available_actions(player.user_id) if player else None
+            if not available or not available.get("actions"):
+                break
+
+            action, amount = yield table, player, available
+            stack_before = player.stack
+            for seat, p in table.players.items():
+                if p and seat in hole_cards:
+                    bets[seat] = p.total_bet_this_hand
+                    statuses[seat] = p.status
+
+            action_result = table.process_action(player.user_id, action, amount)
+            actions += 1
+
+            if not action_result.get("success"):
+                self.stats.failed_actions += 1
+                if action_result.get("should_refresh"):
+                    table._update_current_player()
+                    continue
+                break
+
+            if action_result.get("hand_complete"):
+                # 마지막 액션의 베팅은 초기화 전에 읽을 수 없으므로 직접 반영
+                seat = player.seat
+                if action == "call":
+                    bets[seat] = bets.get(seat, 0) + min(
+                        available.get("call_amount", 0), stack_before
+                    )
+                elif action == "all_in":
+                    bets[seat] = bets.get(seat, 0) + stack_before
+                if action == "fold":
+                    statuses[seat] = "folded"
+                elif stack_before and bets.get(seat, 0) >= starting_stacks.get(seat, 0):
+                    statuses[seat] = "all_in"
+
+                self.stats.actions += actions
+                self.stats.hands += 1
+                self.stats.elapsed_seconds += time.perf_counter() - started
+                return self._build_hand(
+                    action_result.get("hand_result") or {},
+                    starting_stacks,
+                    hole_cards,
+                    bets,
+                    statuses,
+                    actions,
+                )
+
+            if action_result.get("phase_changed"):
+                table._update_current_player()
+
+        # 진행 불가 (BotGameLoop은 여기서 재시도 후 포기)
+        self.stats.actions += actions
+        self.stats.aborted_hands += 1
+        self.stats.elapsed_seconds += time.perf_counter() - started
+        logger.warning(
+            f"[HEADLESS] Hand {table.hand_number} stalled on {table.room_id} "
+            f"after {actions} actions (phase={table.phase.value})"
+        )
+        return None
+
+    def run(
+        self,
+        max_hands: int,
+        max_seconds: Optional[float] = None,
+        keep_history: bool = False,
+    ) -> SimulationStats:
+        """Play hands back-to-back until a limit is hit or no hand can start.
+
+        Args:
+            max_hands: Hands to attempt
+            max_seconds: Wall-clock limit
+            keep_history: Collect hand history records in stats.histories
+        """
+        deadline = time.perf_counter() + max_seconds if max_seconds else None
+        for _ in range(max_hands):
+            if deadline and time.perf_counter() >= deadline:
+                break
+            hand = self.play_hand()
+            if hand is None:
+                if not self.table.can_start_hand():
+                    break
+                continue
+            if keep_history:
+                self.stats.histories.append(hand.history)
+        return self.stats
+
+    def _build_hand(
+        self,
+        hand_result: dict[str, Any],
+        starting_stacks: dict[int, int],
+        hole_cards: dict[int, list[str]],
+        bets: dict[int, int],
+        statuses: dict[int, str],
+        actions: int,
+    ) -> SimulatedHand:
+        table = self.table
+
+        won: dict[str, int] = {}
+        for winner in hand_result.get("winners", []):
+            user_id = winner.get("userId", "")
+            if user_id:
+                won[user_id] = won.get(user_id, 0) + winner.get("amount", 0)
+
+        participants = []
+        bot_results = []
+        for seat in starting_stacks:
+            player = table.players.get(seat)
+            if not player:
+                continue
+            participants.append({
+                "user_id": player.user_id,
+                "seat": seat,
+                "hole_cards": hole_cards.get(seat),
+                "bet_amount": bets.get(seat, 0),
+                "won_amount": won.get(player.user_id, 0),
+                "final_action": statuses.get(seat, "active"),
+            })
+            bot_results.append(BotHandResult(
+                user_id=player.user_id,
+                new_stack=player.stack,
+                won_amount=won.get(player.user_id, 0),
+            ))
+
+        history = {
+            "table_id": table.room_id,
+            "hand_number": table.hand_number,
+            "pot_size": hand_result.get("pot", 0),
+            "community_cards": hand_result.get("communityCards", []),
+            "participants": participants,
+            "actions": hand_result.get("actions", []),
+        }
+        return SimulatedHand(
+            hand_number=table.hand_number,
+            history=history,
+            bot_results=bot_results,
+            actions=actions,
+        )
+
+    def _refill_busted(self) -> None:
+        for seat, player in self.table.players.items():
+            if player and player.stack == 0:
+                player.stack = self.refill_stack
+                self.table.sit_in(seat)
+
+
+# =============================================================================
+# Worker process entry point
+# =============================================================================
+
+
+@dataclass
+class SimulationConfig:
+    """Standalone simulation table (picklable for worker processes)."""
+
+    hands: int = 1000
+    num_players: int = 6
+    max_players: int = 9
+    small_blind: int = 10
+    big_blind: int = 20
+    starting_stack: int = 2000
+    strategies: Optional[list[str]] = None  # per seat, None = dev bot logic
+    max_seconds: Optional[float] = None
+    seed: Optional[int] = None
+    keep_history: bool = False
+    room_id: str = "headless"
+
+
+def build_table(config: SimulationConfig) -> PokerTable:
+    """Create a table seated with bots for a standalone simulation."""
+    table = PokerTable(
+        room_id=config.room_id,
+        name=f"Headless {config.room_id}",
+        small_blind=config.small_blind,
+        big_blind=config.big_blind,
+        min_buy_in=config.starting_stack,
+        max_buy_in=config.starting_stack,
+        max_players=config.max_players,
+    )
+    for seat in range(min(config.num_players, config.max_players)):
+        table.seat_player(seat, Player(
+            user_id=f"bot_sim_{seat}",
+            username=f"SimBot{seat}",
+            seat=seat,
+            stack=config.starting_stack,
+            is_bot=True,
+        ))
+        table.sit_in(seat)
+    return table
+
+
+def run_simulation(config: SimulationConfig) -> SimulationStats:
+    """Run a standalone headless simulation (worker-process safe)."""
+    if config.seed is not None:
+        random.seed(config.seed)
+
+    table = build_table(config)
+    decide: Decider = simple_decision
+    if config.strategies:
+        decide = StrategyDecider({
+            f"bot_sim_{seat}": name
+            for seat, name in enumerate(config.strategies)
+        })
+
+    simulator = HeadlessSimulator(
+        table, decide=decide, refill_stack=config.starting_stack
+    )
+    return simulator.run(
+        config.hands,
+        max_seconds=config.max_seconds,
+        keep_history=config.keep_history,
+    )
+
+
+async def run_simulation_in_executor(
+    config: SimulationConfig,
+    executor: Optional[Executor] = None,
+) -> SimulationStats:
+    """Run run_simulation() off the event loop.
+
+    Pass a ProcessPoolExecutor to use a separate core; None uses the
+    loop's default (thread) executor.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, run_simulation, config)
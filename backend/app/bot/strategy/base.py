@@ -3,8 +3,9 @@
 import random
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Literal
+from typing import Literal, Optional
 
+from app.game.equity import DEFAULT_TIME_BUDGET, EquityResult, calculate_equity
 from app.game.hand_evaluator import evaluate_hand_for_bot
 
 
@@ -60,12 +61,14 @@ class BaseStrategy(ABC):
     vpip: float = 0.25  # Voluntarily Put money In Pot %
     pfr: float = 0.18   # Pre-Flop Raise %
     aggression_factor: float = 2.0  # Bet+Raise / Call ratio
+    equity_time_budget: float = DEFAULT_TIME_BUDGET  # Seconds per equity call
 
     def decide(self, context: GameContext) -> Decision:
         """Make a decision based on the game context.
 
         This method evaluates hand strength and delegates to
-        phase-specific methods.
+        phase-specific methods. It is CPU-bound (postflop equity), so async
+        callers should run it in a worker thread (asyncio.to_thread).
 
         Args:
             context: Current game context
@@ -98,8 +101,41 @@ class BaseStrategy(ABC):
         if decision.action == "fold" and "check" in context.actions:
             return self._check()
 
+        # Postflop: don't fold when equity beats the pot odds
+        if (
+            decision.action == "fold"
+            and context.phase != "preflop"
+            and "call" in context.actions
+        ):
+            equity = self._estimate_equity(context)
+            pot_odds = eval_result["pot_odds"]
+            if equity is not None and equity.equity >= pot_odds:
+                return self._call(context.call_amount)
+
         return decision
 
+    def _estimate_equity(self, context: GameContext) -> Optional[EquityResult]:
+        """Estimate equity against the remaining active opponents.
+
+        Bounded by equity_time_budget so it fits within the turn timer.
+
+        Args:
+            context: Game context
+
+        Returns:
+            EquityResult, or None if the cards can't be evaluated
+        """
+        num_opponents = max(1, min(9, context.num_active - 1))
+        try:
+            return calculate_equity(
+                context.hole_cards,
+                context.community_cards,
+                num_opponents,
+                time_budget=self.equity_time_budget,
+            )
+        except ValueError:
+            return None
+
     @abstractmethod
     def _decide_preflop(
         self,
@@ -1,6 +1,6 @@
 """Application configuration."""
 from functools import lru_cache
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings
@@ -140,6 +140,16 @@ class Settings(BaseSettings):
         description="Mode (most likely) bot thinking time for triangular distribution",
     )
 
+    # Headless fast-forward (사람이 앉지도 구독하지도 않는 봇 전용 테이블)
+    bot_fast_forward_enabled: bool = Field(
+        default=False,
+        description="Run unwatched all-bot tables without delays or per-action broadcasts",
+    )
+    bot_fast_forward_max_hands: int = Field(
+        default=200,
+        description="Max hands per fast-forward run before the normal next-hand pause",
+    )
+
     # WebSocket Connection Limits (300-500명 동시 접속 대응)
     ws_max_connections: int = Field(
         default=600,
@@ -149,6 +159,53 @@ class Settings(BaseSettings):
         default=3,
         description="Maximum WebSocket connections per user (멀티 디바이스, 기본: 3)",
     )
+    ws_broadcast_send_timeout: float = Field(
+        default=2.0,
+        description="Per-connection send deadline for channel broadcasts in seconds (기본: 2초)",
+    )
+    ws_outbound_queue_size: int = Field(
+        default=256,
+        description="Maximum queued outbound messages per connection (기본: 256)",
+    )
+    ws_outbound_overflow_policy: Literal["drop_oldest", "disconnect"] = Field(
+        default="disconnect",
+        description="Outbound queue overflow policy: drop_oldest | disconnect",
+    )
+    ws_pubsub_flush_interval: float = Field(
+        default=0.005,
+        description="Window for batching cross-instance broadcast publishes in seconds (기본: 5ms)",
+    )
+    ws_pubsub_max_batch: int = Field(
+        default=256,
+        description="Buffered broadcast messages that trigger an immediate publish flush",
+    )
+
+    ws_rate_limit_per_second: float = Field(
+        default=10.0,
+        description="Sustained inbound messages per second per connection (토큰 충전 속도)",
+    )
+    ws_rate_limit_burst: int = Field(
+        default=20,
+        description="Inbound message burst per connection (토큰 버킷 크기)",
+    )
+    ws_rate_limit_reconcile_interval: float = Field(
+        default=10.0,
+        description="Interval for pruning idle rate limit slots and reporting to Redis in seconds",
+    )
+
+    # Hand History Write-Behind
+    hand_history_spool_dir: str = Field(
+        default="var/hand_history_spool",
+        description="Local spool directory for unflushed hand histories (워커별 하위 디렉토리)",
+    )
+    hand_history_flush_interval: float = Field(
+        default=1.0,
+        description="Hand history flush interval in seconds (기본: 1초)",
+    )
+    hand_history_flush_batch: int = Field(
+        default=200,
+        description="Spooled hands that trigger an immediate flush / hands per INSERT batch",
+    )
 
     # Bot Manager Settings
     bot_ws_url: str = Field(
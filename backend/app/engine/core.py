@@ -6,16 +6,15 @@ This module wraps the PokerKit library to provide:
 - State serialization/deserialization with HMAC integrity verification
 
 Security Notes:
-- pickle is required for PokerKit state serialization (complex object graph not JSON-serializable)
+- PokerKit state is stored as a binary event-log snapshot (see pk_snapshot),
+  never pickled, so a snapshot can't execute code when loaded
 - HMAC-SHA256 signature verifies data integrity before deserialization
 - Only server-generated snapshots are deserialized (never external input)
-- Tampering detection prevents RCE attacks via malicious pickle payloads
 """
 
 import hashlib
 import hmac
 import logging
-import pickle  # noqa: S301 - Required for PokerKit State; secured with HMAC verification
 import uuid
 
 from app.config import get_settings
@@ -25,10 +24,12 @@ from dataclasses import replace
 from datetime import datetime, timezone
 from typing import Any
 
-from pokerkit import Automation, NoLimitTexasHoldem
 from pokerkit.state import State as PKState
 from pokerkit.utilities import Card as PKCard
 
+from app.engine import pk_snapshot
+from app.engine.pk_snapshot import PKOp, PKStateCache, create_pk_state
+
 from app.engine.state import (
     ActionRequest,
     ActionType,
@@ -143,6 +144,9 @@ class PokerKitWrapper:
     4. Evaluate hand results at showdown
     """
 
+    # Decoded PokerKit states shared by all wrappers, keyed by snapshot digest
+    _pk_state_cache = PKStateCache()
+
     def __init__(self) -> None:
         """Initialize wrapper (stateless)."""
         pass
@@ -186,36 +190,14 @@ class PokerKitWrapper:
 
         # Build starting stacks
         starting_stacks = tuple(seat.stack for seat in active_seats)
-        player_count = len(active_seats)
 
         # Create PokerKit state with automations
-        # PokerKit 0.7.2 API changes:
-        # - Uses raw_blinds_or_straddles instead of blinds_or_straddles
-        # - dealer_index parameter removed (PokerKit handles dealer internally)
-        # - CARD_BURNING required for proper board dealing sequence
-        # - HAND_KILLING required for mucking/showing at showdown
-        pk_state = NoLimitTexasHoldem.create_state(
-            automations=(
-                Automation.ANTE_POSTING,
-                Automation.BET_COLLECTION,
-                Automation.BLIND_OR_STRADDLE_POSTING,
-                Automation.CARD_BURNING,
-                Automation.HOLE_DEALING,
-                Automation.BOARD_DEALING,
-                Automation.HOLE_CARDS_SHOWING_OR_MUCKING,
-                Automation.HAND_KILLING,
-                Automation.CHIPS_PUSHING,
-                Automation.CHIPS_PULLING,
-            ),
-            ante_trimming_status=True,
-            raw_antes={-1: table_state.config.ante},  # -1 means everyone
-            raw_blinds_or_straddles=(
-                table_state.config.small_blind,
-                table_state.config.big_blind,
-            ),
-            min_bet=table_state.config.big_blind,
-            raw_starting_stacks=starting_stacks,
-            player_count=player_count,
+        config = table_state.config
+        pk_state = create_pk_state(
+            starting_stacks,
+            config.small_blind,
+            config.big_blind,
+            config.ante,
         )
 
         # Extract initial hand state
@@ -228,7 +210,12 @@ class PokerKitWrapper:
         )
 
         # Serialize PokerKit state (internal server use only)
-        pk_snapshot = self._serialize_pk_state(pk_state)
+        snapshot = self._serialize_pk_state(
+            pk_state,
+            pk_snapshot.encode_initial(
+                pk_state, config.small_blind, config.big_blind, config.ante
+            ),
+        )
 
         # Create new table state
         return replace(
@@ -236,7 +223,7 @@ class PokerKitWrapper:
             hand=hand_state,
             state_version=table_state.state_version + 1,
             updated_at=datetime.now(timezone.utc),
-            _pk_snapshot=pk_snapshot,
+            _pk_snapshot=snapshot,
         )
 
     # =========================================================================
@@ -269,9 +256,6 @@ class PokerKitWrapper:
         if table_state._pk_snapshot is None:
             raise GameStateError("No PokerKit state snapshot")
 
-        # Restore PokerKit state (from our own serialized data)
-        pk_state = self._deserialize_pk_state(table_state._pk_snapshot)
-
         # Get active seats for position mapping
         active_seats = list(table_state.get_active_seats())
         active_seats.sort(key=lambda s: s.position)
@@ -279,14 +263,19 @@ class PokerKitWrapper:
         # Map position to PokerKit player index
         pk_index = self._position_to_pk_index(position, active_seats)
 
-        # Validate turn
-        if pk_state.actor_index is None:
+        # Validate turn from the snapshot header (no replay)
+        actor_index = self._read_snapshot_status(table_state._pk_snapshot).actor_index
+        if actor_index is None:
             raise InvalidActionError("No player to act")
-        if pk_state.actor_index != pk_index:
+        if actor_index != pk_index:
             raise NotYourTurnError(
-                f"Not your turn (current actor: seat {active_seats[pk_state.actor_index].position})"
+                f"Not your turn (current actor: seat {active_seats[actor_index].position})"
             )
 
+        # Restore PokerKit state (from our own serialized data).
+        # Owned: it is mutated below and re-cached under the new digest.
+        pk_state = self._deserialize_pk_state(table_state._pk_snapshot, owned=True)
+
         # Execute action (mutates pk_state)
         # Returns (amount, actual_action_type) - action type may differ from request
         # e.g., FOLD -> CHECK when no bet to face, CALL -> CHECK when amount is 0
@@ -309,13 +298,27 @@ class PokerKitWrapper:
             started_at=table_state.hand.started_at,
         )
 
+        # Append the executed operation to the snapshot's event log
+        if actual_action_type == ActionType.FOLD:
+            op = PKOp.FOLD
+        elif actual_action_type in (ActionType.CHECK, ActionType.CALL):
+            op = PKOp.CHECK_OR_CALL
+        else:
+            op = PKOp.COMPLETE_BET_OR_RAISE_TO
+        snapshot_data = pk_snapshot.append_action(
+            table_state._pk_snapshot[32:],
+            pk_state,
+            op,
+            executed_amount if op == PKOp.COMPLETE_BET_OR_RAISE_TO else 0,
+        )
+
         # Create new table state
         new_table = replace(
             table_state,
             hand=new_hand,
             state_version=table_state.state_version + 1,
             updated_at=datetime.now(timezone.utc),
-            _pk_snapshot=self._serialize_pk_state(pk_state),
+            _pk_snapshot=self._serialize_pk_state(pk_state, snapshot_data),
         )
 
         return new_table, player_action
@@ -341,9 +344,9 @@ class PokerKitWrapper:
         if table_state.hand is None or table_state._pk_snapshot is None:
             return ()
 
-        pk_state = self._deserialize_pk_state(table_state._pk_snapshot)
-
-        if pk_state.actor_index is None:
+        # Turn check from the snapshot header (no replay)
+        status = self._read_snapshot_status(table_state._pk_snapshot)
+        if status.actor_index is None:
             return ()
 
         # Map position to PK index
@@ -355,9 +358,11 @@ class PokerKitWrapper:
         except ValueError:
             return ()
 
-        if pk_state.actor_index != pk_index:
+        if status.actor_index != pk_index:
             return ()
 
+        pk_state = self._deserialize_pk_state(table_state._pk_snapshot)
+
         valid = []
 
         # Check fold
@@ -539,56 +544,103 @@ class PokerKitWrapper:
         if table_state.hand is None or table_state._pk_snapshot is None:
             return True
 
-        pk_state = self._deserialize_pk_state(table_state._pk_snapshot)
-        return not pk_state.status
+        return not self._read_snapshot_status(table_state._pk_snapshot).active
 
     # =========================================================================
     # Private Helpers
     # =========================================================================
 
-    def _serialize_pk_state(self, pk_state: PKState) -> bytes:
-        """Serialize PokerKit state to bytes with HMAC signature.
+    def _serialize_pk_state(self, pk_state: PKState, data: bytes) -> bytes:
+        """Sign snapshot data with HMAC and cache the decoded state.
 
         Security:
-        - Prepends HMAC-SHA256 signature (32 bytes) to serialized data
+        - Prepends HMAC-SHA256 signature (32 bytes) to the snapshot data
         - Only server-generated data is serialized
         - Signature prevents tampering and validates integrity on load
+
+        Args:
+            pk_state: PokerKit state the data describes (cached for reuse)
+            data: Binary snapshot from pk_snapshot.encode_initial/append_action
         """
-        settings = get_settings()
-        data = pickle.dumps(pk_state)
-        signature = hmac.new(
-            settings.serialization_hmac_key.encode(),
-            data,
-            hashlib.sha256,
-        ).digest()
+        signature = self._sign(data)
+        self._pk_state_cache.put(signature, data, pk_state)
         return signature + data
 
-    def _deserialize_pk_state(self, snapshot: bytes) -> PKState:
-        """Deserialize PokerKit state from bytes with HMAC verification.
+    def _deserialize_pk_state(self, snapshot: bytes, owned: bool = False) -> PKState:
+        """Restore PokerKit state from a signed snapshot.
+
+        Uses the decoded-state cache when possible and otherwise verifies the
+        HMAC and replays the snapshot's event log.
 
         Security:
-        - Verifies HMAC-SHA256 signature before deserializing
+        - Verifies HMAC-SHA256 signature before decoding
         - Raises GameStateError if signature is invalid (tampering detected)
         - Only our own generated snapshots pass verification
+
+        Args:
+            snapshot: Signed snapshot bytes
+            owned: Return a state the caller may mutate (removed from the
+                cache). Otherwise the returned state is shared and read-only.
+        """
+        signature, data = self._verify_snapshot(snapshot, use_cache=True)
+
+        if owned:
+            pk_state = self._pk_state_cache.pop(signature, data)
+        else:
+            pk_state = self._pk_state_cache.get(signature, data)
+        if pk_state is not None:
+            return pk_state
+
+        try:
+            pk_state = pk_snapshot.decode(data)
+        except ValueError as e:
+            raise GameStateError(f"Invalid snapshot: {e}") from e
+
+        if not owned:
+            self._pk_state_cache.put(signature, data, pk_state)
+        return pk_state
+
+    def _read_snapshot_status(self, snapshot: bytes) -> pk_snapshot.SnapshotStatus:
+        """Read hand status from a signed snapshot without replaying it."""
+        _, data = self._verify_snapshot(snapshot, use_cache=True)
+        try:
+            return pk_snapshot.read_status(data)
+        except ValueError as e:
+            raise GameStateError(f"Invalid snapshot: {e}") from e
+
+    def _verify_snapshot(
+        self,
+        snapshot: bytes,
+        use_cache: bool = False,
+    ) -> tuple[bytes, bytes]:
+        """Split a snapshot into (signature, data) after verifying the HMAC.
+
+        Snapshots whose exact bytes are in the decoded-state cache were
+        signed or verified by this process already and skip the HMAC.
         """
         if len(snapshot) < 32:
             raise GameStateError("Invalid snapshot: too short")
 
-        settings = get_settings()
         signature = snapshot[:32]
         data = snapshot[32:]
 
-        expected_signature = hmac.new(
-            settings.serialization_hmac_key.encode(),
-            data,
-            hashlib.sha256,
-        ).digest()
+        if use_cache and self._pk_state_cache.get(signature, data) is not None:
+            return signature, data
 
-        if not hmac.compare_digest(signature, expected_signature):
+        if not hmac.compare_digest(signature, self._sign(data)):
             logger.error("HMAC verification failed - possible data tampering")
             raise GameStateError("Invalid snapshot: signature verification failed")
 
-        return pickle.loads(data)  # noqa: S301 - Safe after HMAC verification
+        return signature, data
+
+    def _sign(self, data: bytes) -> bytes:
+        """HMAC-SHA256 signature of snapshot data."""
+        settings = get_settings()
+        return hmac.new(
+            settings.serialization_hmac_key.encode(),
+            data,
+            hashlib.sha256,
+        ).digest()
 
     def _position_to_pk_index(
         self,
@@ -0,0 +1,316 @@
+"""Binary PokerKit hand snapshots.
+
+A PokerKit ``State`` is a large mutable object graph. Instead of pickling it,
+a snapshot records what is needed to rebuild it:
+
+- Blinds, ante and starting stacks
+- Hole cards and the remaining deck order, one byte per card
+- The betting actions taken so far, as fixed-size event records
+
+Restoring replays the event log on a freshly created state. Decoded states
+are kept in an in-process LRU cache keyed by the snapshot digest, so the
+common path (restore the snapshot that was just written) skips the replay.
+
+Layout (version 1, big-endian):
+
+    magic "PKS"  B version  B player_count  B flags  B actor_index
+    Q small_blind  Q big_blind  Q ante
+    Q starting_stack * player_count
+    B hole_card * (2 * player_count)
+    B deck_len  B deck_card * deck_len
+    (B op  Q amount) * action_count      # until end of data
+
+``flags`` bit 0 is set while the hand is still running. ``actor_index``
+is 0xFF when nobody is to act. Both are rewritten on every append, so
+simple checks don't need a replay.
+"""
+
+import struct
+from collections import OrderedDict, deque
+from dataclasses import dataclass, replace
+from enum import IntEnum
+
+from pokerkit import Automation, NoLimitTexasHoldem
+from pokerkit.state import HoleDealing
+from pokerkit.state import State as PKState
+from pokerkit.utilities import Card as PKCard
+
+SNAPSHOT_MAGIC = b"PKS"
+SNAPSHOT_VERSION = 1
+
+# Decoded PokerKit states kept in memory (roughly one per active table)
+PK_STATE_CACHE_SIZE = 4096
+
+_PREFIX = struct.Struct(">3sBB")  # magic, version, player_count
+_BLINDS = struct.Struct(">QQQ")  # small_blind, big_blind, ante
+_ACTION = struct.Struct(">BQ")  # op, amount
+
+_FLAG_ACTIVE = 0x01
+_NO_ACTOR = 0xFF
+_STATUS_OFFSET = _PREFIX.size  # flags, actor_index
+_HEADER_SIZE = _STATUS_OFFSET + 2
+
+# Card byte = rank_index * 4 + suit_index
+_CARD_RANKS = "23456789TJQKA"
+_CARD_SUITS = "shdc"
+_PK_CARDS: tuple[PKCard, ...] = tuple(
+    next(iter(PKCard.parse(rank + suit)))
+    for rank in _CARD_RANKS
+    for suit in _CARD_SUITS
+)
+_CARD_BYTES: dict[PKCard, int] = {card: i for i, card in enumerate(_PK_CARDS)}
+
+
+class PKOp(IntEnum):
+    """PokerKit operation recorded in the event log."""
+
+    FOLD = 0
+    CHECK_OR_CALL = 1
+    COMPLETE_BET_OR_RAISE_TO = 2
+
+
+@dataclass(frozen=True)
+class SnapshotStatus:
+    """Hand status read from the snapshot header without replaying."""
+
+    active: bool
+    actor_index: int | None
+
+
+def create_pk_state(
+    starting_stacks: tuple[int, ...],
+    small_blind: int,
+    big_blind: int,
+    ante: int,
+) -> PKState:
+    """Create a No-Limit Hold'em PokerKit state with our automations.
+
+    PokerKit 0.7.2 API changes:
+    - Uses raw_blinds_or_straddles instead of blinds_or_straddles
+    - dealer_index parameter removed (PokerKit handles dealer internally)
+    - CARD_BURNING required for proper board dealing sequence
+    - HAND_KILLING required for mucking/showing at showdown
+    """
+    return NoLimitTexasHoldem.create_state(
+        automations=(
+            Automation.ANTE_POSTING,
+            Automation.BET_COLLECTION,
+            Automation.BLIND_OR_STRADDLE_POSTING,
+            Automation.CARD_BURNING,
+            Automation.HOLE_DEALING,
+            Automation.BOARD_DEALING,
+            Automation.HOLE_CARDS_SHOWING_OR_MUCKING,
+            Automation.HAND_KILLING,
+            Automation.CHIPS_PUSHING,
+            Automation.CHIPS_PULLING,
+        ),
+        ante_trimming_status=True,
+        raw_antes={-1: ante},  # -1 means everyone
+        raw_blinds_or_straddles=(small_blind, big_blind),
+        min_bet=big_blind,
+        raw_starting_stacks=starting_stacks,
+        player_count=len(starting_stacks),
+    )
+
+
+# =============================================================================
+# Encoding
+# =============================================================================
+
+
+def _status_bytes(pk_state: PKState) -> bytes:
+    flags = _FLAG_ACTIVE if pk_state.status else 0
+    actor = pk_state.actor_index if pk_state.actor_index is not None else _NO_ACTOR
+    return bytes((flags, actor))
+
+
+def encode_initial(
+    pk_state: PKState,
+    small_blind: int,
+    big_blind: int,
+    ante: int,
+) -> bytes:
+    """Encode a freshly created state (no betting actions yet).
+
+    Args:
+        pk_state: State returned by create_pk_state()
+        small_blind: Small blind passed to create_pk_state()
+        big_blind: Big blind passed to create_pk_state()
+        ante: Ante passed to create_pk_state()
+
+    Returns:
+        Snapshot data (unsigned)
+    """
+    player_count = pk_state.player_count
+    hole = bytes(_CARD_BYTES[card] for cards in pk_state.hole_cards for card in cards)
+    deck = bytes(_CARD_BYTES[card] for card in pk_state.deck_cards)
+
+    return b"".join((
+        _PREFIX.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, player_count),
+        _status_bytes(pk_state),
+        _BLINDS.pack(small_blind, big_blind, ante),
+        struct.pack(f">{player_count}Q", *pk_state.starting_stacks),
+        hole,
+        bytes((len(deck),)),
+        deck,
+    ))
+
+
+def append_action(data: bytes, pk_state: PKState, op: PKOp, amount: int = 0) -> bytes:
+    """Append one betting action to an existing snapshot.
+
+    Args:
+        data: Previous snapshot data (unsigned)
+        pk_state: State after the action was applied
+        op: Operation that was applied
+        amount: Bet/raise-to amount (COMPLETE_BET_OR_RAISE_TO only)
+
+    Returns:
+        New snapshot data (unsigned)
+    """
+    return b"".join((
+        data[:_STATUS_OFFSET],
+        _status_bytes(pk_state),
+        data[_HEADER_SIZE:],
+        _ACTION.pack(op, amount),
+    ))
+
+
+# =============================================================================
+# Decoding
+# =============================================================================
+
+
+def _check_header(data: bytes) -> tuple[int, int]:
+    if len(data) < _HEADER_SIZE:
+        raise ValueError("Snapshot too short")
+    magic, version, player_count = _PREFIX.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError("Not a PokerKit snapshot")
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version: {version}")
+    return version, player_count
+
+
+def read_status(data: bytes) -> SnapshotStatus:
+    """Read hand status from the header (no replay).
+
+    Raises:
+        ValueError: Malformed or unsupported snapshot
+    """
+    _check_header(data)
+    flags, actor = data[_STATUS_OFFSET], data[_STATUS_OFFSET + 1]
+    return SnapshotStatus(
+        active=bool(flags & _FLAG_ACTIVE),
+        actor_index=None if actor == _NO_ACTOR else actor,
+    )
+
+
+def decode(data: bytes) -> PKState:
+    """Rebuild the PokerKit state by replaying the event log.
+
+    Raises:
+        ValueError: Malformed or unsupported snapshot
+    """
+    _, player_count = _check_header(data)
+    try:
+        offset = _HEADER_SIZE
+        small_blind, big_blind, ante = _BLINDS.unpack_from(data, offset)
+        offset += _BLINDS.size
+        starting_stacks = struct.unpack_from(f">{player_count}Q", data, offset)
+        offset += 8 * player_count
+        hole = data[offset:offset + 2 * player_count]
+        offset += 2 * player_count
+        deck_len = data[offset]
+        deck = data[offset + 1:offset + 1 + deck_len]
+        offset += 1 + deck_len
+        if len(hole) != 2 * player_count or len(deck) != deck_len:
+            raise ValueError("Truncated snapshot")
+        if (len(data) - offset) % _ACTION.size:
+            raise ValueError("Truncated action log")
+
+        pk_state = create_pk_state(starting_stacks, small_blind, big_blind, ante)
+        _restore_cards(pk_state, hole, deck)
+
+        for op, amount in _ACTION.iter_unpack(data[offset:]):
+            if op == PKOp.FOLD:
+                pk_state.fold()
+            elif op == PKOp.CHECK_OR_CALL:
+                pk_state.check_or_call()
+            elif op == PKOp.COMPLETE_BET_OR_RAISE_TO:
+                pk_state.complete_bet_or_raise_to(amount)
+            else:
+                raise ValueError(f"Unknown snapshot op: {op}")
+    except (struct.error, IndexError) as e:
+        raise ValueError(f"Malformed snapshot: {e}") from e
+
+    return pk_state
+
+
+def _restore_cards(pk_state: PKState, hole: bytes, deck: bytes) -> None:
+    """Replace the randomly dealt hole cards and deck with the recorded ones."""
+    player_count = pk_state.player_count
+    hole_cards = [
+        [_PK_CARDS[hole[i * 2]], _PK_CARDS[hole[i * 2 + 1]]]
+        for i in range(player_count)
+    ]
+    for i, cards in enumerate(hole_cards):
+        pk_state.hole_cards[i][:] = cards
+    pk_state.deck_cards = deque(_PK_CARDS[b] for b in deck)
+
+    # Keep the dealing operations consistent with the restored cards
+    dealt = [0] * player_count
+    for i, operation in enumerate(pk_state.operations):
+        if isinstance(operation, HoleDealing):
+            p = operation.player_index
+            count = len(operation.cards)
+            cards = tuple(hole_cards[p][dealt[p]:dealt[p] + count])
+            pk_state.operations[i] = replace(operation, cards=cards)
+            dealt[p] += count
+
+
+# =============================================================================
+# Decoded State Cache
+# =============================================================================
+
+
+class PKStateCache:
+    """LRU cache of decoded PokerKit states keyed by snapshot digest.
+
+    Entries store the snapshot data alongside the state so a digest
+    collision can never return the wrong state.
+    """
+
+    def __init__(self, maxsize: int = PK_STATE_CACHE_SIZE) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[bytes, tuple[bytes, PKState]] = OrderedDict()
+
+    def get(self, digest: bytes, data: bytes) -> PKState | None:
+        """Return the cached state (shared, must not be mutated)."""
+        entry = self._entries.get(digest)
+        if entry is None or entry[0] != data:
+            return None
+        self._entries.move_to_end(digest)
+        return entry[1]
+
+    def pop(self, digest: bytes, data: bytes) -> PKState | None:
+        """Remove and return the cached state (caller takes ownership)."""
+        entry = self._entries.get(digest)
+        if entry is None or entry[0] != data:
+            return None
+        del self._entries[digest]
+        return entry[1]
+
+    def put(self, digest: bytes, data: bytes, pk_state: PKState) -> None:
+        """Cache a decoded state."""
+        self._entries[digest] = (data, pk_state)
+        self._entries.move_to_end(digest)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached states."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
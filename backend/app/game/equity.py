@@ -0,0 +1,441 @@
+"""
+봇용 에퀴티 계산기
+홀카드/보드/상대 수로 승리·무승부 확률(에퀴티)을 계산하여 봇 결정에 사용
+
+- 헤즈업 턴/리버: 모든 런아웃 x 상대 핸드 정확 열거 (별도 시간 예산)
+- 그 외: 몬테카를로 샘플링 (NumPy 벡터화, 없으면 순수 파이썬)
+- 호출당 시간 예산 + (핸드, 보드 텍스처) LRU 캐시
+- 동기 함수이므로 async 코드에서는 calculate_equity_async (to_thread) 사용
+"""
+
+import asyncio
+import random
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cache
+from itertools import combinations, permutations
+from math import comb
+from typing import Optional, Sequence
+
+from app.game.hand_evaluator import (
+    _RANK_PRIMES,
+    _flush_table,
+    _rank_table,
+    encode_cards,
+    evaluate_batch,
+)
+
+try:
+    import numpy as np
+except ImportError:  # 순수 파이썬 경로로 동작
+    np = None
+
+
+# 호출당 기본 시간 예산 (초) - 턴 타이머 안에서 이벤트 루프를 오래 막지 않도록
+DEFAULT_TIME_BUDGET = 0.02
+# 정확 열거 시간 예산 (초) - 헤즈업 턴 45,540경우: NumPy ~40ms, 순수 파이썬 ~300ms
+# 결과는 캐시되고 봇 결정은 워커 스레드에서 실행되므로 샘플링보다 넉넉하게 둠
+EXACT_TIME_BUDGET = 0.5
+# 몬테카를로 최대 샘플 수
+DEFAULT_MAX_SAMPLES = 20_000
+# 정확 열거 최대 경우의 수 (헤즈업 턴 = 46 x C(45,2) = 45,540)
+EXACT_ENUMERATION_LIMIT = 50_000
+# 샘플링 청크 크기 (청크마다 시간 예산 확인)
+_NUMPY_CHUNK = 2_000
+_PYTHON_CHUNK = 200
+# 정확 열거 청크 크기 (경우의 수 기준, 청크마다 시간 예산 확인)
+_NUMPY_ENUMERATION_CHUNK = 10_000
+
+EQUITY_CACHE_SIZE = 4_096
+
+_SUIT_PERMUTATIONS = tuple(permutations(range(4)))
+
+
+@dataclass(frozen=True)
+class EquityResult:
+    """에퀴티 계산 결과"""
+    win: float  # 단독 승리 확률
+    tie: float  # 공동 1위 확률
+    equity: float  # 승리 + 무승부 지분 (팟 기대 점유율)
+    samples: int  # 평가한 경우의 수
+    exact: bool  # 정확 열거 여부
+
+
+class _EquityCache:
+    """(정규화된 핸드, 보드, 상대 수) -> EquityResult LRU 캐시"""
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._data: OrderedDict[tuple, EquityResult] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[EquityResult]:
+        with self._lock:
+            result = self._data.get(key)
+            if result is not None:
+                self._data.move_to_end(key)
+            return result
+
+    def put(self, key: tuple, result: EquityResult) -> None:
+        with self._lock:
+            self._data[key] = result
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_cache = _EquityCache(EQUITY_CACHE_SIZE)
+
+
+def clear_equity_cache() -> None:
+    """에퀴티 캐시 비우기 (테스트용)"""
+    _cache.clear()
+
+
+def _canonicalize(hole: Sequence[int], board: Sequence[int]) -> tuple[tuple, tuple]:
+    """슈트 치환에 대해 정규화 (동형 핸드/보드는 같은 키)
+
+    에퀴티는 슈트 이름과 무관하므로 24개 슈트 치환 중 사전순 최소를 사용합니다.
+    """
+    best = None
+    for perm in _SUIT_PERMUTATIONS:
+        key = (
+            tuple(sorted((c & ~3) | perm[c & 3] for c in hole)),
+            tuple(sorted((c & ~3) | perm[c & 3] for c in board)),
+        )
+        if best is None or key < best:
+            best = key
+    return best
+
+
+def calculate_equity(
+    hole_cards: list[str],
+    community_cards: list[str],
+    num_opponents: int = 1,
+    time_budget: float = DEFAULT_TIME_BUDGET,
+    max_samples: int = DEFAULT_MAX_SAMPLES,
+    rng: Optional[random.Random] = None,
+    exact_time_budget: float = EXACT_TIME_BUDGET,
+) -> EquityResult:
+    """
+    랜덤 핸드 상대로의 에퀴티 계산
+
+    Args:
+        hole_cards: 홀카드 2장
+        community_cards: 커뮤니티 카드 0/3/4/5장
+        num_opponents: 상대 수 (1~9)
+        time_budget: 샘플링 시간 예산 (초, 최소 한 청크는 평가)
+        max_samples: 몬테카를로 최대 샘플 수
+        rng: 난수 생성기 (테스트 재현용, 지정 시 캐시 사용 안 함)
+        exact_time_budget: 헤즈업 턴/리버 정확 열거 시간 예산 (초). 넘기면
+            평가한 런아웃으로 추정 (exact=False)
+
+    Returns:
+        EquityResult
+
+    Raises:
+        ValueError: 잘못된 카드 수, 중복 카드, 상대 수
+    """
+    hole = encode_cards(hole_cards)
+    board = encode_cards(community_cards)
+
+    if len(hole) != 2:
+        raise ValueError("Equity requires exactly 2 hole cards")
+    if len(board) not in (0, 3, 4, 5):
+        raise ValueError(f"Invalid board size: {len(board)}")
+    if not 1 <= num_opponents <= 9:
+        raise ValueError(f"Invalid number of opponents: {num_opponents}")
+    if len(set(hole + board)) != len(hole) + len(board):
+        raise ValueError("Duplicate cards")
+
+    canon_hole, canon_board = _canonicalize(hole, board)
+    key = (canon_hole, canon_board, num_opponents)
+    if rng is None:
+        cached = _cache.get(key)
+        if cached is not None:
+            return cached
+
+    deck = _deck_of(canon_hole, canon_board)
+    runout = 5 - len(board)
+    outcomes = comb(len(deck), runout)
+    remaining = len(deck) - runout
+    for i in range(num_opponents):
+        outcomes *= comb(remaining - 2 * i, 2)
+
+    if num_opponents == 1 and outcomes <= EXACT_ENUMERATION_LIMIT:
+        result = _enumerate(
+            list(canon_hole),
+            list(canon_board),
+            deck,
+            max(time_budget, exact_time_budget),
+            rng or random.Random(),
+        )
+    else:
+        result = _sample(
+            list(canon_hole),
+            list(canon_board),
+            deck,
+            num_opponents,
+            time_budget,
+            max_samples,
+            rng or random.Random(),
+        )
+
+    if rng is None:
+        _cache.put(key, result)
+    return result
+
+
+async def calculate_equity_async(
+    hole_cards: list[str],
+    community_cards: list[str],
+    num_opponents: int = 1,
+    time_budget: float = DEFAULT_TIME_BUDGET,
+    max_samples: int = DEFAULT_MAX_SAMPLES,
+    exact_time_budget: float = EXACT_TIME_BUDGET,
+) -> EquityResult:
+    """calculate_equity를 워커 스레드에서 실행 (이벤트 루프 비차단)"""
+    return await asyncio.to_thread(
+        calculate_equity,
+        hole_cards,
+        community_cards,
+        num_opponents,
+        time_budget,
+        max_samples,
+        exact_time_budget=exact_time_budget,
+    )
+
+
+def warm_tables() -> None:
+    """룩업 테이블 미리 생성 (첫 봇 결정 지연 방지, 워커 스레드에서 호출 권장)"""
+    _rank_table()
+    _flush_table()
+    if np is not None:
+        _array_tables()
+
+
+def _deck_of(hole: Sequence[int], board: Sequence[int]) -> list[int]:
+    """홀카드/보드를 제외한 남은 덱"""
+    used = set(hole) | set(board)
+    return [c for c in range(52) if c not in used]
+
+
+# ============================================
+# 정확 열거 (헤즈업 턴/리버)
+# ============================================
+
+def _enumerate(
+    hole: list[int],
+    board: list[int],
+    deck: list[int],
+    time_budget: float,
+    rng: random.Random,
+) -> EquityResult:
+    """모든 런아웃 x 상대 홀카드 조합 열거
+
+    런아웃을 무작위 순서로 청크 단위 평가하며 청크마다 시간 예산을 확인합니다.
+    예산을 넘기면 중단하고 평가한 런아웃들로 추정합니다 (런아웃마다 상대
+    조합 수가 같으므로 무작위 런아웃 표본의 평균은 비편향, exact=False).
+    """
+    need = 5 - len(board)
+    deadline = time.perf_counter() + time_budget
+    runouts = list(combinations(deck, need))
+    rng.shuffle(runouts)
+
+    per_runout = comb(len(deck) - need, 2)
+    chunk = _NUMPY_ENUMERATION_CHUNK if np is not None else _PYTHON_CHUNK
+    step = max(1, chunk // per_runout)
+
+    total = wins = ties = 0
+    share = 0.0
+    done = 0
+    while done < len(runouts):
+        batch = runouts[done:done + step]
+        boards, opponents = _enumeration_cases(board, deck, batch)
+        w, t, s = _showdown(hole, boards, opponents)
+        wins += w
+        ties += t
+        share += s
+        total += len(boards)
+        done += len(batch)
+        if time.perf_counter() >= deadline:
+            break
+
+    return EquityResult(
+        win=wins / total,
+        tie=ties / total,
+        equity=share / total,
+        samples=total,
+        exact=done == len(runouts),
+    )
+
+
+def _enumeration_cases(board: list[int], deck: list[int], runouts: list[tuple]):
+    """런아웃 목록 x 겹치지 않는 상대 홀카드 조합 (보드, 상대 핸드)"""
+    if np is not None:
+        runout_array = np.asarray(runouts, dtype=np.int64).reshape(len(runouts), -1)
+        pairs = np.asarray(list(combinations(deck, 2)), dtype=np.int64)
+        # 런아웃 카드와 겹치지 않는 (런아웃, 상대 핸드) 조합만
+        overlap = (pairs[None, :, :, None] == runout_array[:, None, None, :]).any(axis=(2, 3))
+        runout_idx, pair_idx = np.nonzero(~overlap)
+        boards = np.concatenate(
+            [np.broadcast_to(np.asarray(board, dtype=np.int64), (len(runout_idx), len(board))),
+             runout_array[runout_idx]],
+            axis=1,
+        )
+        return boards, pairs[pair_idx][:, None, :]
+
+    boards = []
+    opponents = []
+    for runout in runouts:
+        full_board = board + list(runout)
+        rest = [c for c in deck if c not in runout]
+        for opp in combinations(rest, 2):
+            boards.append(full_board)
+            opponents.append([opp])
+    return boards, opponents
+
+
+# ============================================
+# 몬테카를로 샘플링
+# ============================================
+
+def _sample(
+    hole: list[int],
+    board: list[int],
+    deck: list[int],
+    num_opponents: int,
+    time_budget: float,
+    max_samples: int,
+    rng: random.Random,
+) -> EquityResult:
+    """시간 예산 또는 최대 샘플 수에 도달할 때까지 청크 단위로 샘플링"""
+    need = 5 - len(board)
+    draw = need + 2 * num_opponents
+    deadline = time.perf_counter() + time_budget
+    chunk = _NUMPY_CHUNK if np is not None else _PYTHON_CHUNK
+    np_rng = np.random.default_rng(rng.getrandbits(64)) if np is not None else None
+
+    samples = wins = ties = 0
+    share = 0.0
+    while samples < max_samples:
+        size = min(chunk, max_samples - samples)
+        if np_rng is not None:
+            deck_array = np.asarray(deck, dtype=np.int64)
+            picks = np_rng.random((size, len(deck))).argpartition(draw, axis=1)[:, :draw]
+            drawn = deck_array[picks]
+            boards = np.concatenate(
+                [np.broadcast_to(np.asarray(board, dtype=np.int64), (size, len(board))),
+                 drawn[:, :need]],
+                axis=1,
+            )
+            opponents = drawn[:, need:].reshape(size, num_opponents, 2)
+        else:
+            boards = []
+            opponents = []
+            for _ in range(size):
+                drawn = rng.sample(deck, draw)
+                boards.append(board + drawn[:need])
+                rest = drawn[need:]
+                opponents.append([rest[i:i + 2] for i in range(0, len(rest), 2)])
+
+        w, t, s = _showdown(hole, boards, opponents)
+        wins += w
+        ties += t
+        share += s
+        samples += size
+        if time.perf_counter() >= deadline:
+            break
+
+    return EquityResult(
+        win=wins / samples,
+        tie=ties / samples,
+        equity=share / samples,
+        samples=samples,
+        exact=False,
+    )
+
+
+# ============================================
+# 쇼다운 판정
+# ============================================
+
+def _showdown(hole: list[int], boards, opponents) -> tuple[int, int, float]:
+    """보드/상대 홀카드 목록에 대한 승리 수, 무승부 수, 팟 지분 합계
+
+    Args:
+        hole: 내 홀카드
+        boards: 경우별 보드 5장 (M x 5)
+        opponents: 경우별 상대 홀카드 (M x O x 2)
+    """
+    if np is not None:
+        boards = np.asarray(boards, dtype=np.int64)
+        opponents = np.asarray(opponents, dtype=np.int64)
+        m, o = opponents.shape[0], opponents.shape[1]
+        hero_cards = np.concatenate(
+            [np.broadcast_to(np.asarray(hole, dtype=np.int64), (m, 2)), boards], axis=1
+        )
+        opp_cards = np.concatenate(
+            [opponents, np.broadcast_to(boards[:, None, :], (m, o, 5))], axis=2
+        ).reshape(m * o, 7)
+
+        hero = _evaluate_array(hero_cards)
+        opp = _evaluate_array(opp_cards).reshape(m, o)
+        best_opp = opp.max(axis=1)
+        win = hero > best_opp
+        tie = hero == best_opp
+        tied = (opp == hero[:, None]).sum(axis=1)
+        share = win.sum() + (tie / (tied + 1)).sum()
+        return int(win.sum()), int(tie.sum()), float(share)
+
+    wins = ties = 0
+    share = 0.0
+    for full_board, opps in zip(boards, opponents):
+        hero, *opp = evaluate_batch(
+            [hole + list(full_board)] + [list(h) + list(full_board) for h in opps]
+        )
+        best_opp = max(opp)
+        if hero > best_opp:
+            wins += 1
+            share += 1.0
+        elif hero == best_opp:
+            ties += 1
+            share += 1.0 / (opp.count(hero) + 1)
+    return wins, ties, share
+
+
+@cache
+def _array_tables():
+    """hand_evaluator 룩업 테이블의 NumPy 버전"""
+    rank_table = _rank_table()
+    keys = np.fromiter(sorted(rank_table), dtype=np.int64, count=len(rank_table))
+    values = np.fromiter(
+        (rank_table[k] for k in keys.tolist()), dtype=np.int64, count=len(keys)
+    )
+    flush = np.asarray(_flush_table(), dtype=np.int64)
+    primes = np.asarray(_RANK_PRIMES, dtype=np.int64)
+    return keys, values, flush, primes
+
+
+def _evaluate_array(cards):
+    """정수 카드 행렬 (N x 5~7, 중복 없음)의 핸드 값 벡터"""
+    keys, values, flush, primes = _array_tables()
+    ranks = cards >> 2
+    suits = cards & 3
+    bits = np.left_shift(1, ranks)
+
+    rank_values = values[np.searchsorted(keys, primes[ranks].prod(axis=1))]
+    flush_values = np.zeros(len(cards), dtype=np.int64)
+    for suit in range(4):
+        mask = np.where(suits == suit, bits, 0).sum(axis=1)
+        flush_values = np.maximum(flush_values, flush[mask])
+    return np.where(flush_values > 0, flush_values, rank_values)
@@ -3,10 +3,11 @@
 텍사스 홀덤 핸드 강도를 평가하여 봇 결정에 사용
 """
 
-from typing import Optional
-from collections import Counter
+from typing import Iterable, Optional, Sequence
 from dataclasses import dataclass
 from enum import IntEnum
+from functools import cache
+from itertools import combinations_with_replacement
 
 
 # 랭크 값 매핑 (2=2, ..., A=14)
@@ -55,6 +56,208 @@ def get_rank_value(rank: str) -> int:
     return RANK_VALUES.get(rank.upper(), 0)
 
 
+# ============================================
+# 정수 카드 인코딩 + 룩업 테이블 평가기
+# ============================================
+#
+# 카드 = rank_index * 4 + suit_index (0~51, rank_index 0=2 ... 12=A)
+# 핸드 값 = (HandRank << 20) | 키커 랭크 5개 (각 4비트, 2~14)
+#   -> 정수 비교만으로 승패 판정, value >> 20 이 HandRank
+#
+# 플러시: 슈트별 13비트 랭크 마스크 -> _flush_table (8192개)
+# 그 외: 랭크 소수 곱 (Cactus-Kev) -> _rank_table (카드 1~7장 전 조합)
+
+CARD_RANKS = "23456789TJQKA"
+CARD_SUITS = "shdc"
+
+_RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_CATEGORY_SHIFT = 20
+_WHEEL_MASK = 0b1000000001111  # A-2-3-4-5
+
+_CARD_INDEX = {
+    rank + suit: i * 4 + j
+    for i, rank in enumerate(CARD_RANKS)
+    for j, suit in enumerate(CARD_SUITS)
+}
+
+
+def encode_card(card_str: str) -> int:
+    """카드 문자열을 정수로 인코딩 ("As" -> 48)
+
+    Raises:
+        ValueError: 알 수 없는 카드
+    """
+    card = _CARD_INDEX.get(card_str)
+    if card is None:
+        rank, suit = parse_card(card_str)
+        card = _CARD_INDEX.get(rank + suit)
+        if card is None:
+            raise ValueError(f"Invalid card: {card_str!r}")
+    return card
+
+
+def encode_cards(cards: Iterable[str]) -> list[int]:
+    """카드 문자열 목록을 정수 목록으로 인코딩"""
+    return [encode_card(c) for c in cards]
+
+
+def hand_rank_of(value: int) -> HandRank:
+    """핸드 값에서 족보 랭크 추출"""
+    return HandRank(value >> _CATEGORY_SHIFT)
+
+
+def _hand_kickers(value: int) -> list[int]:
+    """핸드 값에서 키커 랭크 값 5개 추출 (2~14, 없으면 0)"""
+    return [(value >> shift) & 0xF for shift in (16, 12, 8, 4, 0)]
+
+
+def _pack_value(rank: HandRank, kickers: Sequence[int]) -> int:
+    value = int(rank)
+    for i in range(5):
+        value = (value << 4) | (kickers[i] if i < len(kickers) else 0)
+    return value
+
+
+def _mask_values(mask: int) -> list[int]:
+    """13비트 랭크 마스크 -> 랭크 값 목록 (내림차순)"""
+    return [i + 2 for i in range(12, -1, -1) if mask >> i & 1]
+
+
+def _straight_high_of_mask(mask: int) -> int:
+    """랭크 마스크의 최고 스트레이트 하이 카드 (없으면 0)"""
+    for high in range(12, 3, -1):
+        window = 0b11111 << (high - 4)
+        if mask & window == window:
+            return high + 2
+    if mask & _WHEEL_MASK == _WHEEL_MASK:
+        return 5
+    return 0
+
+
+def _rank_counts_value(counts: Sequence[int]) -> int:
+    """플러시가 아닌 핸드의 값 (랭크별 장수 기준)"""
+    by_count: dict[int, list[int]] = {1: [], 2: [], 3: [], 4: []}
+    mask = 0
+    for i in range(12, -1, -1):
+        if counts[i]:
+            by_count[counts[i]].append(i + 2)
+            mask |= 1 << i
+
+    quads, trips, pairs, singles = by_count[4], by_count[3], by_count[2], by_count[1]
+
+    if quads:
+        rest = sorted(trips + pairs + singles + quads[1:], reverse=True)
+        return _pack_value(HandRank.FOUR_OF_A_KIND, [quads[0]] + rest[:1])
+    if trips and (len(trips) >= 2 or pairs):
+        return _pack_value(HandRank.FULL_HOUSE, [trips[0], max(trips[1:] + pairs)])
+
+    straight_high = _straight_high_of_mask(mask)
+    if straight_high:
+        return _pack_value(HandRank.STRAIGHT, [straight_high])
+    if trips:
+        return _pack_value(HandRank.THREE_OF_A_KIND, [trips[0]] + singles[:2])
+    if len(pairs) >= 2:
+        rest = sorted(pairs[2:] + singles, reverse=True)
+        return _pack_value(HandRank.TWO_PAIR, pairs[:2] + rest[:1])
+    if pairs:
+        return _pack_value(HandRank.ONE_PAIR, [pairs[0]] + singles[:3])
+    return _pack_value(HandRank.HIGH_CARD, singles[:5])
+
+
+@cache
+def _flush_table() -> list[int]:
+    """슈트 랭크 마스크 -> 플러시/스트레이트 플러시 값 (5장 미만이면 0)"""
+    table = [0] * 8192
+    for mask in range(8192):
+        if mask.bit_count() < 5:
+            continue
+        straight_high = _straight_high_of_mask(mask)
+        if straight_high == 14:
+            table[mask] = _pack_value(HandRank.ROYAL_FLUSH, [14])
+        elif straight_high:
+            table[mask] = _pack_value(HandRank.STRAIGHT_FLUSH, [straight_high])
+        else:
+            table[mask] = _pack_value(HandRank.FLUSH, _mask_values(mask)[:5])
+    return table
+
+
+@cache
+def _rank_table() -> dict[int, int]:
+    """랭크 소수 곱 -> 핸드 값 (카드 1~7장, 랭크당 최대 4장)"""
+    table: dict[int, int] = {}
+    for n in range(1, 8):
+        for ranks in combinations_with_replacement(range(13), n):
+            counts = [0] * 13
+            for r in ranks:
+                counts[r] += 1
+            if max(counts) > 4:
+                continue
+            product = 1
+            for r in ranks:
+                product *= _RANK_PRIMES[r]
+            table[product] = _rank_counts_value(counts)
+    return table
+
+
+@cache
+def _straight_draw_table() -> list[bool]:
+    """랭크 마스크 -> 스트레이트 드로우 여부"""
+    return [_check_straight_draw(_mask_values(mask)) for mask in range(8192)]
+
+
+def evaluate_cards(cards: Sequence[int]) -> int:
+    """정수 카드 1~7장의 핸드 값 (높을수록 강함)
+
+    Args:
+        cards: encode_card()로 인코딩된 카드
+
+    Returns:
+        핸드 값 (hand_rank_of()로 족보 추출)
+    """
+    return evaluate_batch((cards,))[0]
+
+
+def evaluate_batch(hands: Iterable[Sequence[int]]) -> list[int]:
+    """여러 핸드를 한 번에 평가 (봇/에퀴티 계산용)
+
+    테이블 조회를 루프 밖으로 빼서 핸드당 호출 오버헤드를 줄입니다.
+
+    Args:
+        hands: 정수 카드 1~7장 목록의 반복자
+
+    Returns:
+        핸드별 값 목록 (입력 순서)
+    """
+    flush_table = _flush_table()
+    rank_table = _rank_table()
+    primes = _RANK_PRIMES
+
+    values = []
+    for cards in hands:
+        suit_masks = [0, 0, 0, 0]
+        product = 1
+        for card in cards:
+            rank = card >> 2
+            suit_masks[card & 3] |= 1 << rank
+            product *= primes[rank]
+
+        value = (
+            flush_table[suit_masks[0]]
+            or flush_table[suit_masks[1]]
+            or flush_table[suit_masks[2]]
+            or flush_table[suit_masks[3]]
+        )
+        if not value:
+            value = rank_table.get(product)
+            if value is None:  # 중복 카드 등 비정상 입력
+                counts = [0] * 13
+                for card in cards:
+                    counts[card >> 2] = min(counts[card >> 2] + 1, 4)
+                value = _rank_counts_value(counts)
+        values.append(value)
+    return values
+
+
 # ============================================
 # 프리플롭 핸드 강도 평가
 # ============================================
@@ -165,152 +368,117 @@ def evaluate_postflop_strength(
             description="No cards"
         )
 
-    all_cards = hole_cards + community_cards
-    parsed = [parse_card(c) for c in all_cards]
-
-    # 랭크와 슈트 분리
-    ranks = [p[0] for p in parsed]
-    suits = [p[1] for p in parsed]
-    values = [get_rank_value(r) for r in ranks]
-
-    # 랭크별 카운트
-    rank_counts = Counter(ranks)
-    suit_counts = Counter(suits)
-
-    # 드로우 체크
-    has_flush_draw = max(suit_counts.values()) == 4
-    has_straight_draw = _check_straight_draw(values)
-
-    # 플러시 체크
-    flush_suit = None
-    for suit, count in suit_counts.items():
-        if count >= 5:
-            flush_suit = suit
-            break
-
-    # 스트레이트 체크
-    straight_high = _find_straight(values)
-
-    # 스트레이트 플러시 체크
-    if flush_suit and straight_high:
-        flush_values = [v for (r, s), v in zip(parsed, values) if s == flush_suit]
-        sf_high = _find_straight(flush_values)
-        if sf_high:
-            if sf_high == 14:  # 로얄 플러시
-                return HandStrength(
-                    rank=HandRank.ROYAL_FLUSH,
-                    strength=1.0,
-                    description="로얄 플러시"
-                )
-            return HandStrength(
-                rank=HandRank.STRAIGHT_FLUSH,
-                strength=0.98,
-                description=f"스트레이트 플러시 {sf_high} 하이"
-            )
-
-    # 포카드 체크
-    quads = [r for r, c in rank_counts.items() if c >= 4]
-    if quads:
+    cards = []
+    for c in hole_cards + community_cards:
+        try:
+            cards.append(encode_card(c))
+        except ValueError:
+            continue  # 알 수 없는 카드는 무시
+
+    value = evaluate_cards(cards)
+    rank = hand_rank_of(value)
+    top, second = _hand_kickers(value)[:2]
+
+    # 드로우 체크 (완성된 플러시/스트레이트 이상이면 표시 안 함)
+    suit_counts = [0, 0, 0, 0]
+    rank_mask = 0
+    for card in cards:
+        suit_counts[card & 3] += 1
+        rank_mask |= 1 << (card >> 2)
+    has_flush_draw = max(suit_counts) == 4
+    has_straight_draw = _straight_draw_table()[rank_mask]
+
+    if rank == HandRank.ROYAL_FLUSH:
+        return HandStrength(rank=rank, strength=1.0, description="로얄 플러시")
+
+    if rank == HandRank.STRAIGHT_FLUSH:
         return HandStrength(
-            rank=HandRank.FOUR_OF_A_KIND,
-            strength=0.95 + get_rank_value(quads[0]) / 140,
-            description=f"{quads[0]} 포카드"
+            rank=rank,
+            strength=0.98,
+            description=f"스트레이트 플러시 {top} 하이"
         )
 
-    # 트리플 및 페어 체크
-    trips = [r for r, c in rank_counts.items() if c >= 3]
-    pairs = [r for r, c in rank_counts.items() if c == 2]
-
-    # 풀하우스 체크
-    if trips and pairs:
+    if rank == HandRank.FOUR_OF_A_KIND:
         return HandStrength(
-            rank=HandRank.FULL_HOUSE,
-            strength=0.90 + get_rank_value(trips[0]) / 140,
-            description=f"{trips[0]} 풀하우스"
+            rank=rank,
+            strength=0.95 + top / 140,
+            description=f"{_rank_char(top)} 포카드"
         )
-    if len(trips) >= 2:  # 트리플 2개 -> 풀하우스
-        sorted_trips = sorted(trips, key=get_rank_value, reverse=True)
+
+    if rank == HandRank.FULL_HOUSE:
         return HandStrength(
-            rank=HandRank.FULL_HOUSE,
-            strength=0.90 + get_rank_value(sorted_trips[0]) / 140,
-            description=f"{sorted_trips[0]} 풀하우스"
+            rank=rank,
+            strength=0.90 + top / 140,
+            description=f"{_rank_char(top)} 풀하우스"
         )
 
-    # 플러시 체크
-    if flush_suit:
-        flush_values = sorted(
-            [v for (r, s), v in zip(parsed, values) if s == flush_suit],
-            reverse=True
-        )
+    if rank == HandRank.FLUSH:
         return HandStrength(
-            rank=HandRank.FLUSH,
-            strength=0.82 + flush_values[0] / 140,
+            rank=rank,
+            strength=0.82 + top / 140,
             has_flush_draw=False,
-            description=f"플러시 {flush_values[0]} 하이"
+            description=f"플러시 {top} 하이"
         )
 
-    # 스트레이트 체크
-    if straight_high:
+    if rank == HandRank.STRAIGHT:
         return HandStrength(
-            rank=HandRank.STRAIGHT,
-            strength=0.75 + straight_high / 140,
+            rank=rank,
+            strength=0.75 + top / 140,
             has_flush_draw=has_flush_draw,
             has_straight_draw=False,
-            description=f"스트레이트 {straight_high} 하이"
+            description=f"스트레이트 {top} 하이"
         )
 
-    # 트리플 체크
-    if trips:
+    if rank == HandRank.THREE_OF_A_KIND:
         return HandStrength(
-            rank=HandRank.THREE_OF_A_KIND,
-            strength=0.65 + get_rank_value(trips[0]) / 140,
+            rank=rank,
+            strength=0.65 + top / 140,
             has_flush_draw=has_flush_draw,
             has_straight_draw=has_straight_draw,
-            description=f"{trips[0]} 트리플"
+            description=f"{_rank_char(top)} 트리플"
         )
 
-    # 투페어 체크
-    if len(pairs) >= 2:
-        sorted_pairs = sorted(pairs, key=get_rank_value, reverse=True)
-        strength = 0.50 + (get_rank_value(sorted_pairs[0]) + get_rank_value(sorted_pairs[1])) / 280
+    if rank == HandRank.TWO_PAIR:
         return HandStrength(
-            rank=HandRank.TWO_PAIR,
-            strength=strength,
+            rank=rank,
+            strength=0.50 + (top + second) / 280,
             has_flush_draw=has_flush_draw,
             has_straight_draw=has_straight_draw,
-            description=f"{sorted_pairs[0]}-{sorted_pairs[1]} 투페어"
+            description=f"{_rank_char(top)}-{_rank_char(second)} 투페어"
         )
 
-    # 원페어 체크
-    if pairs:
-        pair_value = get_rank_value(pairs[0])
+    if rank == HandRank.ONE_PAIR:
         # 탑 페어인지 확인 (커뮤니티 카드의 가장 높은 카드와 페어)
         community_values = [get_rank_value(parse_card(c)[0]) for c in community_cards]
-        is_top_pair = pair_value >= max(community_values) if community_values else False
+        is_top_pair = top >= max(community_values) if community_values else False
 
-        base_strength = 0.35 + pair_value / 140
+        base_strength = 0.35 + top / 140
         if is_top_pair:
             base_strength += 0.1
 
         return HandStrength(
-            rank=HandRank.ONE_PAIR,
+            rank=rank,
             strength=base_strength,
             has_flush_draw=has_flush_draw,
             has_straight_draw=has_straight_draw,
-            description=f"{pairs[0]} 원페어" + (" (탑 페어)" if is_top_pair else "")
+            description=f"{_rank_char(top)} 원페어" + (" (탑 페어)" if is_top_pair else "")
         )
 
     # 하이카드
-    sorted_values = sorted(values, reverse=True)
     return HandStrength(
         rank=HandRank.HIGH_CARD,
-        strength=0.15 + sorted_values[0] / 140,
+        strength=0.15 + top / 140,
         has_flush_draw=has_flush_draw,
         has_straight_draw=has_straight_draw,
-        description=f"{sorted_values[0]} 하이카드"
+        description=f"{top} 하이카드"
     )
 
 
+def _rank_char(value: int) -> str:
+    """랭크 값 -> 랭크 문자 (14 -> "A")"""
+    return CARD_RANKS[value - 2]
+
+
 def _find_straight(values: list[int]) -> Optional[int]:
     """스트레이트 찾기, 하이 카드 값 반환"""
     unique = sorted(set(values), reverse=True)
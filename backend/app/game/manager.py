@@ -17,6 +17,8 @@ import sys
 from datetime import datetime, timedelta, timezone
 
 from app.game.poker_table import PokerTable, GamePhase
+from app.game.seat_index import SeatAvailabilityIndex
+from app.game.table_persistence import get_table_persistence
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -42,6 +44,9 @@ class GameManager:
         self._lock = asyncio.Lock()
         self._cleanup_callbacks: List[Callable[[str], Awaitable[None]]] = []
 
+        # 봇 방 매칭용 빈 좌석 인덱스 (좌석 훅으로 갱신)
+        self.seat_index = SeatAvailabilityIndex()
+
         # 메모리 정리 관련
         self._table_last_activity: Dict[str, datetime] = {}  # 테이블별 마지막 활동 시간
         self._table_hand_history: Dict[str, List[Dict]] = {}  # 테이블별 핸드 히스토리
@@ -69,6 +74,8 @@ class GameManager:
             max_players=max_players,
         )
         self._tables[room_id] = table
+        self.seat_index.track(table)
+        table._change_listener = self._mark_table_dirty
         return table
 
     async def create_table(
@@ -137,9 +144,13 @@ class GameManager:
                 except Exception as e:
                     logger.error(f"Cleanup callback failed for room {room_id}: {e}")
             
-            del self._tables[room_id]
+            table = self._tables.pop(room_id)
+            self.seat_index.untrack(room_id)
             logger.info(f"[CLEANUP] Table {room_id} removed")
-            return True
+
+        # 대기 중인 write-behind 저장을 버리고 Redis 상태 삭제
+        await self.delete_table_state(room_id, table)
+        return True
 
     def get_all_tables(self) -> List[PokerTable]:
         """Get all active tables."""
@@ -160,6 +171,7 @@ class GameManager:
     def clear_all(self) -> None:
         """Clear all tables (for testing)."""
         self._tables.clear()
+        self.seat_index.clear()
 
     def reset_table(self, room_id: str) -> Optional[PokerTable]:
         """Reset a table - remove all players/bots and reset game state."""
@@ -169,7 +181,7 @@ class GameManager:
 
         # 모든 플레이어 제거
         for seat in range(table.max_players):
-            table.players[seat] = None
+            table.remove_player(seat)
 
         # 게임 상태 초기화
         table.dealer_seat = -1
@@ -198,7 +210,7 @@ class GameManager:
         for seat in range(table.max_players):
             player = table.players.get(seat)
             if player and player.is_bot:
-                table.players[seat] = None
+                table.remove_player(seat)
                 removed += 1
 
         return removed
@@ -934,52 +946,34 @@ class GameManager:
     # P0-4: Redis 영속성 기능
     # =========================================================================
 
-    async def save_table_state(self, room_id: str) -> bool:
-        """테이블 상태를 Redis에 저장.
-
-        플레이어 착석/이탈, 핸드 완료 시 호출됩니다.
-
-        Args:
-            room_id: 테이블 ID
-
-        Returns:
-            저장 성공 여부
-        """
-        try:
-            from app.game.table_persistence import get_table_persistence_service
-
-            persistence = await get_table_persistence_service()
-            if not persistence:
-                return False
-
-            table = self._tables.get(room_id)
-            if not table:
-                return False
-
-            return await persistence.save_table(table)
-
-        except Exception as e:
-            logger.error(f"[PERSISTENCE] 테이블 저장 실패: {room_id}, {e}")
-            return False
+    def _mark_table_dirty(self, table: PokerTable) -> None:
+        """좌석 변경/핸드 완료 시 테이블을 다음 write-behind 플러시 대상으로 표시."""
+        persistence = get_table_persistence()
+        if persistence is not None:
+            persistence.mark_dirty(table)
 
-    async def delete_table_state(self, room_id: str) -> bool:
+    async def delete_table_state(
+        self, room_id: str, table: Optional[PokerTable] = None
+    ) -> bool:
         """테이블 상태를 Redis에서 삭제.
 
+        테이블 제거 시 호출됩니다. 아직 플러시되지 않은 dirty 저장도 버립니다.
+
         Args:
             room_id: 테이블 ID
+            table: 제거되는 테이블 (없으면 현재 등록된 테이블)
 
         Returns:
             삭제 성공 여부
         """
-        try:
-            from app.game.table_persistence import get_table_persistence_service
-
-            persistence = await get_table_persistence_service()
-            if not persistence:
-                return False
-
-            return await persistence.delete_table(room_id)
+        persistence = get_table_persistence()
+        if not persistence:
+            return False
 
+        try:
+            return await persistence.delete_table(
+                room_id, table if table is not None else self._tables.get(room_id)
+            )
         except Exception as e:
             logger.error(f"[PERSISTENCE] 테이블 상태 삭제 실패: {room_id}, {e}")
             return False
@@ -992,14 +986,12 @@ class GameManager:
         Returns:
             복원된 테이블 수
         """
-        try:
-            from app.game.table_persistence import get_table_persistence_service
-
-            persistence = await get_table_persistence_service()
-            if not persistence:
-                logger.warning("[PERSISTENCE] Redis 연결 없음, 복원 스킵")
-                return 0
+        persistence = get_table_persistence()
+        if not persistence:
+            logger.warning("[PERSISTENCE] Redis 연결 없음, 복원 스킵")
+            return 0
 
+        try:
             restored = await persistence.restore_to_manager(self)
             logger.info(f"[PERSISTENCE] {restored}개 테이블 복원 완료")
             return restored
@@ -1009,17 +1001,18 @@ class GameManager:
             return 0
 
     async def save_all_tables(self) -> int:
-        """모든 테이블 상태를 Redis에 저장.
+        """모든 테이블 상태를 한 번의 배치로 Redis에 저장.
 
         Graceful shutdown 시 호출됩니다.
 
         Returns:
             저장된 테이블 수
         """
-        saved = 0
-        for room_id in list(self._tables.keys()):
-            if await self.save_table_state(room_id):
-                saved += 1
+        persistence = get_table_persistence()
+        if not persistence:
+            return 0
+
+        saved = await persistence.save_tables(self.get_all_tables())
         logger.info(f"[PERSISTENCE] {saved}개 테이블 저장 완료")
         return saved
 
@@ -5,7 +5,7 @@ Key difference: State is managed in memory, no DB serialization.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Callable, Optional, Dict, Any, List, Tuple
 from enum import Enum
 from datetime import datetime, timezone, timedelta
 import asyncio
@@ -123,6 +123,7 @@ class PokerTable:
     community_cards: List[str] = field(default_factory=list)
     current_player_seat: Optional[int] = None
     current_bet: int = 0  # Current bet to call
+    state_version: int = 0  # Incremented on every state change sent to clients
 
     _state: Optional[State] = field(default=None, repr=False)
     _seat_to_index: Dict[int, int] = field(default_factory=dict)
@@ -139,6 +140,15 @@ class PokerTable:
     # Turn timer tracking
     _turn_started_at: Optional[datetime] = field(default=None, repr=False)
 
+    # 좌석 변경 훅 (GameManager의 SeatAvailabilityIndex가 연결)
+    _seat_listener: Optional[Callable[["PokerTable", int], None]] = field(
+        default=None, repr=False, compare=False
+    )
+    # 상태 변경 훅 (좌석 변경/핸드 완료, GameManager가 write-behind 영속성에 연결)
+    _change_listener: Optional[Callable[["PokerTable"], None]] = field(
+        default=None, repr=False, compare=False
+    )
+
     # Under-raise tracking (WSOP 규칙)
     # 마지막 풀 레이즈 금액 (레이즈 차액, 예: 100→300이면 200)
     _last_full_raise: int = field(default=0)
@@ -172,12 +182,22 @@ class PokerTable:
         player.status = "sitting_out"
 
         self.players[seat] = player
+        self.state_version += 1
+        if self._seat_listener:
+            self._seat_listener(self, seat)
+        if self._change_listener:
+            self._change_listener(self)
         return True
 
     def remove_player(self, seat: int) -> Optional[Player]:
         """Remove a player from the table."""
         player = self.players.get(seat)
         self.players[seat] = None
+        self.state_version += 1
+        if self._seat_listener:
+            self._seat_listener(self, seat)
+        if self._change_listener:
+            self._change_listener(self)
         return player
 
     def sit_out(self, seat: int) -> bool:
@@ -201,6 +221,7 @@ class PokerTable:
         # If in a hand and not folded, mark for auto-fold (handled by action handler)
         # For now, just mark as sitting_out
         player.status = "sitting_out"
+        self.state_version += 1
         logger.info(f"Player {player.username} (seat {seat}) is now sitting out")
         return True
 
@@ -222,6 +243,7 @@ class PokerTable:
             return False
         
         player.status = "active"
+        self.state_version += 1
         logger.info(f"Player {player.username} (seat {seat}) is now active")
         return True
 
@@ -560,6 +582,8 @@ class PokerTable:
             f"seat_to_index={self._seat_to_index}"
         )
 
+        self.state_version += 1
+
         return {
             "success": True,
             "hand_number": self.hand_number,
@@ -752,6 +776,8 @@ class PokerTable:
                     "status": p.status,
                 })
 
+        self.state_version += 1
+
         return {
             "success": True,
             "action": action,
@@ -892,6 +918,7 @@ class PokerTable:
             "roomId": self.room_id,
             "tableName": self.name,
             "handNumber": self.hand_number,
+            "stateVersion": self.state_version,
             "phase": self.phase.value,
             "pot": self.pot,
             "communityCards": self.community_cards,
@@ -1179,6 +1206,7 @@ class PokerTable:
 
         # HAND_RESULT 반환 데이터 (초기화 전에 저장)
         result_community_cards = self.community_cards.copy()
+        result_actions = list(self._hand_actions)
         seat_to_index_copy = dict(self._seat_to_index)
 
         # Reset for next hand - 완전 초기화
@@ -1223,6 +1251,9 @@ class PokerTable:
         self._players_acted_on_full_raise = set()
         self._is_under_raise_active = False
 
+        if self._change_listener:
+            self._change_listener(self)
+
         return {
             "winners": winners,
             "showdown": showdown_cards,
@@ -1230,4 +1261,5 @@ class PokerTable:
             "communityCards": result_community_cards,  # 초기화 전 값 반환
             "zeroStackPlayers": zero_stack_players,  # 스택 0인 플레이어 (리바이 모달용)
             "refund": refund_info,  # 환불 정보 (Uncalled bet 반환)
+            "actions": result_actions,  # 핸드 액션 기록 (히스토리/통계 저장용)
         }
@@ -0,0 +1,188 @@
+"""
+SeatAvailabilityIndex - live index of tables a bot can join.
+
+Bot room matching used to query every open room from the DB and rescore
+every loaded table on each spawn (O(tables × seats) per spawn). The index
+is kept current by PokerTable.seat_player / remove_player hooks instead:
+
+- 테이블별 빈 좌석 집합 / 봇 좌석 집합을 유지 (좌석 변경당 O(1))
+- 빈 좌석이 있는 테이블을 (big blind, 테이블 크기) → 봇 수 → room_id
+  집합으로 버킷팅
+- find_rooms(): 블라인드 범위 안에서 봇 수 상한 미만이면서 봇이 가장
+  적은 테이블 목록 (블라인드 레벨 × 봇 수 버킷만 확인, 테이블 스캔 없음)
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.game.poker_table import Player, PokerTable
+
+BOT_USER_ID_PREFIXES = ("bot_", "livebot_", "test_player_")
+
+
+def is_bot_user_id(user_id: str) -> bool:
+    """Check if a user ID belongs to a bot."""
+    return (user_id or "").startswith(BOT_USER_ID_PREFIXES)
+
+
+@dataclass
+class _TableEntry:
+    big_blind: int
+    max_players: int
+    empty_seats: Set[int] = field(default_factory=set)
+    bot_seats: Set[int] = field(default_factory=set)
+    bucket: Optional[int] = None  # 현재 들어있는 봇 수 버킷 (None = 빈 좌석 없음)
+
+    @property
+    def key(self) -> Tuple[int, int]:
+        return (self.big_blind, self.max_players)
+
+
+class SeatAvailabilityIndex:
+    """Tables with open seats, bucketed by big blind and bot count.
+
+    Usage:
+        index.track(table)                # 테이블 생성 시 (좌석 훅 연결)
+        room_ids = index.find_rooms(50, 250, max_bots_for, exclude={"room-1"})
+        seats = index.empty_seats(room_ids[0])
+        index.untrack(room_id)            # 테이블 제거 시
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, _TableEntry] = {}
+        # (big_blind, max_players) -> bot count -> room_ids
+        self._buckets: Dict[Tuple[int, int], Dict[int, Set[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, room_id: str) -> bool:
+        return room_id in self._entries
+
+    # =========================================================================
+    # Tracking
+    # =========================================================================
+
+    def track(self, table: PokerTable) -> None:
+        """Index a table (or rebuild its entry) and hook its seat changes."""
+        self.untrack(table.room_id)
+
+        entry = _TableEntry(big_blind=table.big_blind, max_players=table.max_players)
+        for seat in range(table.max_players):
+            player = table.players.get(seat)
+            if player is None:
+                entry.empty_seats.add(seat)
+            elif is_bot_user_id(player.user_id):
+                entry.bot_seats.add(seat)
+
+        self._entries[table.room_id] = entry
+        self._rebucket(table.room_id, entry)
+        table._seat_listener = self.on_seat_changed
+
+    def untrack(self, room_id: str) -> None:
+        """Remove a table from the index."""
+        entry = self._entries.pop(room_id, None)
+        if entry is not None:
+            self._remove_from_bucket(room_id, entry)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._buckets.clear()
+
+    def on_seat_changed(self, table: PokerTable, seat: int) -> None:
+        """PokerTable hook: a seat was taken or vacated."""
+        entry = self._entries.get(table.room_id)
+        if entry is None:
+            return
+
+        player: Optional[Player] = table.players.get(seat)
+        if player is None:
+            entry.empty_seats.add(seat)
+            entry.bot_seats.discard(seat)
+        else:
+            entry.empty_seats.discard(seat)
+            if is_bot_user_id(player.user_id):
+                entry.bot_seats.add(seat)
+            else:
+                entry.bot_seats.discard(seat)
+        self._rebucket(table.room_id, entry)
+
+    # =========================================================================
+    # Lookup
+    # =========================================================================
+
+    def find_rooms(
+        self,
+        min_big_blind: float,
+        max_big_blind: float,
+        max_bots_for: Callable[[int], int],
+        exclude: Iterable[str] = (),
+    ) -> List[str]:
+        """Rooms in the blind range a bot can join, with the fewest bots.
+
+        Args:
+            min_big_blind: Lowest acceptable big blind
+            max_big_blind: Highest acceptable big blind
+            max_bots_for: Table size -> bot cap (tables at the cap are skipped)
+            exclude: Room IDs to skip
+
+        Returns:
+            Room IDs sharing the lowest bot count (empty if none)
+        """
+        exclude = set(exclude)
+        best: Optional[int] = None
+        rooms: List[str] = []
+
+        for (big_blind, max_players), by_bots in self._buckets.items():
+            if not min_big_blind <= big_blind <= max_big_blind:
+                continue
+            max_bots = max_bots_for(max_players)
+            for bot_count, room_ids in by_bots.items():
+                if bot_count >= max_bots:
+                    continue
+                if best is not None and bot_count > best:
+                    continue
+                candidates = room_ids - exclude if exclude else room_ids
+                if not candidates:
+                    continue
+                if best is None or bot_count < best:
+                    best = bot_count
+                    rooms = list(candidates)
+                else:
+                    rooms.extend(candidates)
+        return rooms
+
+    def empty_seats(self, room_id: str) -> List[int]:
+        entry = self._entries.get(room_id)
+        return sorted(entry.empty_seats) if entry else []
+
+    def bot_count(self, room_id: str) -> int:
+        entry = self._entries.get(room_id)
+        return len(entry.bot_seats) if entry else 0
+
+    # =========================================================================
+    # Buckets
+    # =========================================================================
+
+    def _rebucket(self, room_id: str, entry: _TableEntry) -> None:
+        target = len(entry.bot_seats) if entry.empty_seats else None
+        if target == entry.bucket:
+            return
+
+        self._remove_from_bucket(room_id, entry)
+        if target is not None:
+            self._buckets.setdefault(entry.key, {}).setdefault(target, set()).add(room_id)
+        entry.bucket = target
+
+    def _remove_from_bucket(self, room_id: str, entry: _TableEntry) -> None:
+        if entry.bucket is None:
+            return
+        by_bots = self._buckets.get(entry.key, {})
+        room_ids = by_bots.get(entry.bucket)
+        if room_ids is not None:
+            room_ids.discard(room_id)
+            if not room_ids:
+                del by_bots[entry.bucket]
+                if not by_bots:
+                    self._buckets.pop(entry.key, None)
+        entry.bucket = None
@@ -6,19 +6,41 @@ CLAUDE.md 아키텍처 방향성:
 - GameManager → Redis (주 저장소) → DB (영구 백업)
 - 상태 변경 시 Redis에 저장 (플레이어 착석, 스택 변경, 핸드 진행)
 - 서버 재시작 시 Redis에서 복구
+
+Write-behind 저장:
+- 좌석 변경/핸드 완료 시 GameManager가 mark_dirty()로 테이블만 표시하고
+  즉시 반환 (Redis 왕복 없음)
+- 백그라운드 플러셔가 짧은 주기로 dirty 테이블을 모아 하나의 파이프라인으로 저장
+- 직전에 저장한 인코딩과 같은 테이블은 건너뜀 (다이제스트 비교)
+- 인코딩은 위치 기반 JSON 배열 (키 이름/gzip 없음). 기존 gzip JSON 스냅샷도 읽을 수 있음
 """
 
+import asyncio
 import gzip
 import hashlib
 import hmac
 import json
 import logging
+import weakref
+from collections.abc import Iterable
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from typing import Any
 
+from app.utils.async_utils import cancel_task_safe, create_safe_task
+from app.utils.json_utils import json_dumps_bytes, json_loads
+
 logger = logging.getLogger(__name__)
 
+# 컴팩트 인코딩 버전 (배열의 첫 번째 원소)
+COMPACT_SNAPSHOT_VERSION = 2
+
+# gzip 매직 바이트 (레거시 JSON 스냅샷 판별)
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# 기본 플러시 주기 (초)
+DEFAULT_FLUSH_INTERVAL = 0.5
+
 
 @dataclass
 class PlayerSnapshot:
@@ -103,6 +125,74 @@ class TableSnapshot:
             snapshot_version=data.get("snapshot_version", 1),
         )
 
+    @classmethod
+    def from_compact(cls, data: bytes, updated_at: str = "") -> "TableSnapshot":
+        """컴팩트 인코딩에서 생성 (encode_table의 역변환)."""
+        (
+            version, room_id, name, small_blind, big_blind, min_buy_in,
+            max_buy_in, max_players, dealer_seat, hand_number, phase, players,
+        ) = json_loads(data)
+        if version != COMPACT_SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported table snapshot version: {version}")
+
+        return cls(
+            room_id=room_id,
+            name=name,
+            small_blind=small_blind,
+            big_blind=big_blind,
+            min_buy_in=min_buy_in,
+            max_buy_in=max_buy_in,
+            max_players=max_players,
+            dealer_seat=dealer_seat,
+            hand_number=hand_number,
+            phase=phase,
+            players={
+                seat: PlayerSnapshot(
+                    user_id=user_id,
+                    username=username,
+                    seat=seat,
+                    stack=stack,
+                    status=status,
+                    is_bot=is_bot,
+                )
+                for seat, user_id, username, stack, status, is_bot in players
+            },
+            updated_at=updated_at,
+            snapshot_version=version,
+        )
+
+
+def encode_table(table) -> bytes:
+    """PokerTable을 컴팩트 인코딩으로 변환.
+
+    updated_at은 포함하지 않으므로 상태가 같으면 인코딩도 같습니다
+    (변경 없는 테이블 저장 생략에 사용).
+
+    Layout:
+        [version, room_id, name, small_blind, big_blind, min_buy_in,
+         max_buy_in, max_players, dealer_seat, hand_number, phase,
+         [[seat, user_id, username, stack, status, is_bot], ...]]
+    """
+    players = [
+        [seat, p.user_id, p.username, p.stack, p.status, p.is_bot]
+        for seat, p in sorted(table.players.items())
+        if p
+    ]
+    return json_dumps_bytes([
+        COMPACT_SNAPSHOT_VERSION,
+        table.room_id,
+        table.name,
+        table.small_blind,
+        table.big_blind,
+        table.min_buy_in,
+        table.max_buy_in,
+        table.max_players,
+        table.dealer_seat,
+        table.hand_number,
+        table.phase.value,
+        players,
+    ])
+
 
 class TablePersistenceService:
     """캐시 게임 테이블 영속성 서비스.
@@ -110,22 +200,44 @@ class TablePersistenceService:
     테이블 상태를 Redis에 저장하고 복구합니다.
 
     키 패턴:
-    - game:table:{room_id} - 테이블 상태 (JSON)
+    - game:table:{room_id} - 테이블 상태 (컴팩트 인코딩)
+    - game:table:{room_id}:meta - 체크섬, 저장 시각 (HASH)
     - game:table:list - 활성 테이블 ID 목록 (SET)
+
+    사용법:
+        persistence.mark_dirty(table)       # 상태 변경 시 (즉시 반환)
+        await persistence.save_tables(all)  # 종료 시 한 번의 배치로 저장
+        await persistence.delete_table(room_id, table)  # 테이블 제거 시
     """
 
     KEY_PREFIX = "game:table"
     TABLE_LIST_KEY = "game:table:list"
 
-    def __init__(self, redis_client, hmac_key: str = "table-persistence-key"):
+    def __init__(
+        self,
+        redis_client,
+        hmac_key: str = "table-persistence-key",
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
         """Initialize table persistence service.
 
         Args:
             redis_client: Redis 클라이언트
             hmac_key: HMAC 서명 키
+            flush_interval: dirty 테이블 플러시 주기 (초)
         """
         self.redis = redis_client
         self._hmac_key = hmac_key.encode()
+        self._flush_interval = flush_interval
+
+        # room_id -> PokerTable (다음 플러시에 저장할 테이블)
+        self._dirty: dict[str, Any] = {}
+        # room_id -> 마지막으로 저장한 인코딩의 다이제스트
+        self._saved_digests: dict[str, bytes] = {}
+        # room_id -> 삭제된 PokerTable (늦게 도착한 mark_dirty가 되살리지 않도록)
+        self._deleted: weakref.WeakValueDictionary[str, Any] = weakref.WeakValueDictionary()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
 
     def _table_key(self, room_id: str) -> str:
         """테이블 키 생성."""
@@ -140,8 +252,102 @@ class TablePersistenceService:
         computed = self._compute_checksum(data)
         return hmac.compare_digest(computed, checksum)
 
+    # =========================================================================
+    # Write-Behind 저장
+    # =========================================================================
+
+    @property
+    def dirty_count(self) -> int:
+        """다음 플러시를 기다리는 테이블 수."""
+        return len(self._dirty)
+
+    def mark_dirty(self, table) -> None:
+        """테이블을 dirty로 표시 (다음 플러시에 저장).
+
+        같은 테이블이 플러시 전에 여러 번 변경되어도 한 번만 저장됩니다.
+
+        삭제된 테이블 객체는 무시합니다. 같은 room_id의 새 테이블이면
+        삭제 표시를 지웁니다.
+
+        Args:
+            table: PokerTable 인스턴스
+        """
+        deleted = self._deleted.get(table.room_id)
+        if deleted is table:
+            return
+        if deleted is not None:
+            del self._deleted[table.room_id]
+        self._dirty[table.room_id] = table
+        if self._task is None or self._task.done():
+            self._task = create_safe_task(self._run(), name="table_persistence_flush")
+
+    async def _run(self) -> None:
+        while self._dirty:
+            await asyncio.sleep(self._flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                # 실패한 테이블은 dirty로 남아 다음 주기에 재시도
+                logger.error(f"[PERSISTENCE] 테이블 플러시 실패: {e}")
+
+    async def flush(self) -> int:
+        """dirty 테이블을 한 번의 파이프라인으로 저장.
+
+        Returns:
+            Redis에 기록한 테이블 수 (변경 없는 테이블 제외)
+
+        Raises:
+            Exception: Redis 오류 (해당 테이블은 dirty로 유지)
+        """
+        async with self._flush_lock:
+            if not self._dirty:
+                return 0
+            tables, self._dirty = self._dirty, {}
+            try:
+                return await self._write_tables(tables.values())
+            except Exception:
+                # 플러시 중 다시 표시된 테이블은 최신 객체 유지
+                for room_id, table in tables.items():
+                    self._dirty.setdefault(room_id, table)
+                raise
+
+    async def stop(self) -> None:
+        """플러셔 중지 후 남은 dirty 테이블 저장."""
+        await cancel_task_safe(self._task)
+        self._task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"[PERSISTENCE] 최종 테이블 플러시 실패: {e}")
+
+    async def save_tables(self, tables: Iterable[Any]) -> int:
+        """여러 테이블을 한 번의 배치로 즉시 저장.
+
+        Graceful shutdown 시 사용합니다. 전달된 테이블은 dirty 목록에서 제거되고,
+        명시적으로 저장하므로 삭제 표시도 해제됩니다.
+
+        Args:
+            tables: PokerTable 인스턴스 목록
+
+        Returns:
+            저장된(또는 이미 최신인) 테이블 수, 실패 시 0
+        """
+        tables = list(tables)
+        async with self._flush_lock:
+            for table in tables:
+                self._dirty.pop(table.room_id, None)
+                self._deleted.pop(table.room_id, None)
+            try:
+                await self._write_tables(tables)
+            except Exception as e:
+                for table in tables:
+                    self._dirty.setdefault(table.room_id, table)
+                logger.error(f"[PERSISTENCE] 테이블 일괄 저장 실패: {e}")
+                return 0
+        return len(tables)
+
     async def save_table(self, table) -> bool:
-        """테이블 상태 저장.
+        """테이블 상태 즉시 저장 (한 번의 파이프라인).
 
         Args:
             table: PokerTable 인스턴스
@@ -149,64 +355,42 @@ class TablePersistenceService:
         Returns:
             저장 성공 여부
         """
-        try:
-            from app.game.poker_table import PokerTable
-
-            # 스냅샷 생성
-            players = {}
-            for seat, player in table.players.items():
-                if player:
-                    players[seat] = PlayerSnapshot(
-                        user_id=player.user_id,
-                        username=player.username,
-                        seat=player.seat,
-                        stack=player.stack,
-                        status=player.status,
-                        is_bot=player.is_bot,
-                    )
+        return await self.save_tables([table]) == 1
 
-            snapshot = TableSnapshot(
-                room_id=table.room_id,
-                name=table.name,
-                small_blind=table.small_blind,
-                big_blind=table.big_blind,
-                min_buy_in=table.min_buy_in,
-                max_buy_in=table.max_buy_in,
-                max_players=table.max_players,
-                dealer_seat=table.dealer_seat,
-                hand_number=table.hand_number,
-                phase=table.phase.value,
-                players=players,
-                updated_at=datetime.now(timezone.utc).isoformat(),
-            )
+    async def _write_tables(self, tables: Iterable[Any]) -> int:
+        """변경된 테이블만 SET + HSET + SADD로 파이프라인 저장."""
+        updated_at = datetime.now(timezone.utc).isoformat()
+        pending: list[tuple[str, bytes]] = []
 
-            # JSON 직렬화 + 압축
-            data = json.dumps(snapshot.to_dict(), ensure_ascii=False).encode()
-            compressed = gzip.compress(data)
-            checksum = self._compute_checksum(compressed)
+        pipe = self.redis.pipeline(transaction=False)
+        for table in tables:
+            if self._deleted.get(table.room_id) is table:
+                continue
+            data = encode_table(table)
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if self._saved_digests.get(table.room_id) == digest:
+                continue
 
-            # Redis에 저장
-            await self.redis.set(
-                self._table_key(table.room_id),
-                compressed,
-            )
-            await self.redis.hset(
-                f"{self._table_key(table.room_id)}:meta",
+            key = self._table_key(table.room_id)
+            pipe.set(key, data)
+            pipe.hset(
+                f"{key}:meta",
                 mapping={
-                    "checksum": checksum,
-                    "updated_at": snapshot.updated_at,
+                    "checksum": self._compute_checksum(data),
+                    "updated_at": updated_at,
                 },
             )
+            pending.append((table.room_id, digest))
 
-            # 테이블 목록에 추가
-            await self.redis.sadd(self.TABLE_LIST_KEY, table.room_id)
+        if not pending:
+            return 0
 
-            logger.debug(f"[PERSISTENCE] 테이블 저장: {table.room_id}")
-            return True
+        pipe.sadd(self.TABLE_LIST_KEY, *(room_id for room_id, _ in pending))
+        await pipe.execute()
 
-        except Exception as e:
-            logger.error(f"[PERSISTENCE] 테이블 저장 실패: {table.room_id}, {e}")
-            return False
+        self._saved_digests.update(pending)
+        logger.debug(f"[PERSISTENCE] 테이블 {len(pending)}개 저장")
+        return len(pending)
 
     async def load_table(self, room_id: str) -> TableSnapshot | None:
         """테이블 상태 로드.
@@ -218,41 +402,63 @@ class TablePersistenceService:
             테이블 스냅샷 또는 None
         """
         try:
-            compressed = await self.redis.get(self._table_key(room_id))
-            if not compressed:
+            key = self._table_key(room_id)
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.get(key)
+            pipe.hgetall(f"{key}:meta")
+            data, meta = await pipe.execute()
+            if not data:
                 return None
 
             # 메타데이터에서 체크섬 확인
-            meta = await self.redis.hgetall(f"{self._table_key(room_id)}:meta")
+            updated_at = ""
             if meta:
                 stored_checksum = meta.get(b"checksum", b"").decode()
-                if stored_checksum and not self._verify_checksum(compressed, stored_checksum):
+                if stored_checksum and not self._verify_checksum(data, stored_checksum):
                     logger.error(f"[PERSISTENCE] 체크섬 검증 실패: {room_id}")
                     return None
+                updated_at = meta.get(b"updated_at", b"").decode()
 
-            # 압축 해제 + JSON 파싱
-            data = gzip.decompress(compressed)
-            snapshot_dict = json.loads(data.decode())
+            # 레거시 스냅샷: gzip 압축 JSON
+            if data[:2] == _GZIP_MAGIC:
+                snapshot_dict = json.loads(gzip.decompress(data).decode())
+                return TableSnapshot.from_dict(snapshot_dict)
 
-            return TableSnapshot.from_dict(snapshot_dict)
+            return TableSnapshot.from_compact(data, updated_at=updated_at)
 
         except Exception as e:
             logger.error(f"[PERSISTENCE] 테이블 로드 실패: {room_id}, {e}")
             return None
 
-    async def delete_table(self, room_id: str) -> bool:
+    async def delete_table(self, room_id: str, table=None) -> bool:
         """테이블 상태 삭제.
 
+        진행 중인 플러시가 끝난 뒤 삭제하므로 플러시가 삭제 후 테이블을
+        다시 쓰지 않습니다. 삭제된 테이블 객체는 이후 mark_dirty/플러시에서
+        건너뜁니다.
+
         Args:
             room_id: 테이블 ID
+            table: 삭제되는 PokerTable (없으면 dirty 목록의 테이블)
 
         Returns:
             삭제 성공 여부
         """
+        async with self._flush_lock:
+            table = table if table is not None else self._dirty.get(room_id)
+            self._dirty.pop(room_id, None)
+            self._saved_digests.pop(room_id, None)
+            if table is not None:
+                self._deleted[room_id] = table
+            return await self._delete_keys(room_id)
+
+    async def _delete_keys(self, room_id: str) -> bool:
         try:
-            await self.redis.delete(self._table_key(room_id))
-            await self.redis.delete(f"{self._table_key(room_id)}:meta")
-            await self.redis.srem(self.TABLE_LIST_KEY, room_id)
+            key = self._table_key(room_id)
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.delete(key, f"{key}:meta")
+            pipe.srem(self.TABLE_LIST_KEY, room_id)
+            await pipe.execute()
 
             logger.debug(f"[PERSISTENCE] 테이블 삭제: {room_id}")
             return True
@@ -330,6 +536,9 @@ class TablePersistenceService:
                     player.status = p_snapshot.status
                     table.players[seat] = player
 
+                # 직접 복원한 좌석으로 빈 좌석 인덱스 재구성
+                game_manager.seat_index.track(table)
+
                 restored += 1
                 logger.info(
                     f"[PERSISTENCE] 테이블 복원: {room_id}, "
@@ -347,6 +556,11 @@ class TablePersistenceService:
 _persistence_service: TablePersistenceService | None = None
 
 
+def get_table_persistence() -> TablePersistenceService | None:
+    """Get the initialized table persistence service, if any."""
+    return _persistence_service
+
+
 async def get_table_persistence_service():
     """Get table persistence service singleton."""
     global _persistence_service
@@ -370,3 +584,11 @@ async def init_table_persistence(redis_client) -> TablePersistenceService:
     global _persistence_service
     _persistence_service = TablePersistenceService(redis_client)
     return _persistence_service
+
+
+async def shutdown_table_persistence() -> None:
+    """Flush pending tables and stop the table persistence service."""
+    global _persistence_service
+    if _persistence_service is not None:
+        await _persistence_service.stop()
+        _persistence_service = None
@@ -117,6 +117,17 @@ class RefundInfo(TypedDict):
     amount: int
 
 
+class HandAction(TypedDict):
+    """Player action recorded during a hand (hand history / statistics)."""
+
+    seat: int
+    user_id: str
+    action: str
+    amount: int
+    phase: str
+    timestamp: str
+
+
 class HandResult(TypedDict):
     """Result of hand completion."""
 
@@ -126,6 +137,7 @@ class HandResult(TypedDict):
     communityCards: list[str]
     zeroStackPlayers: NotRequired[list[ZeroStackPlayer]]  # 스택 0인 플레이어 (리바이 모달용)
     refund: NotRequired[RefundInfo | None]  # 환불 정보 (Uncalled bet 반환)
+    actions: NotRequired[list[HandAction]]  # 핸드 액션 기록 (히스토리/통계 저장용)
 
 
 # =============================================================================
@@ -23,7 +23,7 @@ from app.tournament.api import (
     admin_router as tournament_admin_router,
 )
 from app.config import get_settings
-from app.middleware.rate_limit import RateLimitMiddleware
+from app.middleware.rate_limit import RateLimitMiddleware, shutdown_ws_rate_limiter
 from app.middleware.maintenance import MaintenanceMiddleware
 from app.middleware.security_headers import SecurityHeadersMiddleware
 from app.middleware.sentry import init_sentry
@@ -33,12 +33,21 @@ from app.services.user import UserError
 from app.utils.db import close_db, engine, init_db, async_session_factory
 from app.utils.redis_client import close_redis, init_redis, get_redis
 from app.utils.json_utils import ORJSONResponse
+from app.utils.timer_wheel import shutdown_timer_wheel
 from app.utils.secrets_validator import validate_startup_secrets
 from app.ws.gateway import router as ws_router, get_manager, shutdown_manager
 from app.logging_config import configure_logging, get_logger
 from app.services.fraud_event_publisher import init_fraud_publisher
 from app.services.player_session_tracker import init_session_tracker
+from app.services.hand_history_queue import (
+    init_hand_history_queue,
+    shutdown_hand_history_queue,
+)
 from app.game.manager import game_manager
+from app.game.table_persistence import (
+    init_table_persistence,
+    shutdown_table_persistence,
+)
 
 settings = get_settings()
 
@@ -98,6 +107,11 @@ async def lifespan(_app: FastAPI):
         redis_instance = await init_redis()
         logger.info("Redis connection established")
 
+        # Cash table write-behind persistence (fed by GameManager table hooks)
+        await init_table_persistence(redis_instance)
+        restored_tables = await game_manager.restore_tables_from_redis()
+        logger.info(f"Cash tables restored from Redis: {restored_tables}")
+
         # Initialize Fraud Event Publisher (Phase 2.3)
         logger.info("Initializing FraudEventPublisher...")
         fraud_publisher = init_fraud_publisher(redis_instance)
@@ -115,6 +129,13 @@ async def lifespan(_app: FastAPI):
         await get_manager()
         logger.info("WebSocket gateway initialized")
 
+        # Start hand history write-behind queue (replays any leftover spool)
+        logger.info("Starting hand history queue...")
+        hand_history_queue = await init_hand_history_queue()
+        logger.info(
+            f"Hand history queue started (pending={hand_history_queue.pending})"
+        )
+
         # Start GameManager cleanup task (Phase 4.5)
         logger.info("Starting GameManager cleanup task...")
         await game_manager.start_cleanup_task()
@@ -229,6 +250,19 @@ async def lifespan(_app: FastAPI):
         logger.info("Shutting down WebSocket gateway...")
         await shutdown_manager()
         logger.info("WebSocket gateway shutdown complete")
+        await shutdown_ws_rate_limiter()
+
+        # Stop shared timer wheel (heartbeats, token checks, turn timeouts)
+        await shutdown_timer_wheel()
+
+        # Flush hand history queue (before the DB connection closes)
+        logger.info("Flushing hand history queue...")
+        await shutdown_hand_history_queue()
+        logger.info("Hand history queue stopped")
+
+        # Save all cash tables in one batch (before the Redis connection closes)
+        await game_manager.save_all_tables()
+        await shutdown_table_persistence()
 
         # Close database connection
         logger.info("Closing database connection...")
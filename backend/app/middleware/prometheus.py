@@ -46,6 +46,97 @@ WS_MESSAGES_RECEIVED = Counter(
     ["message_type"],
 )
 
+WS_BROADCAST_RECIPIENTS = Histogram(
+    "pokerkit_ws_broadcast_recipients",
+    "Local subscribers targeted per channel broadcast",
+    buckets=[1, 2, 5, 10, 25, 50, 100, 250, 500],
+)
+
+WS_BROADCAST_DURATION = Histogram(
+    "pokerkit_ws_broadcast_duration_seconds",
+    "Time to fan out a channel broadcast to local subscribers",
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5],
+)
+
+WS_BROADCAST_UNDELIVERED = Counter(
+    "pokerkit_ws_broadcast_undelivered_total",
+    "Broadcast sends that missed their deadline or failed",
+    ["reason"],  # slow, dropped
+)
+
+WS_PUBSUB_FLUSH_MESSAGES = Histogram(
+    "pokerkit_ws_pubsub_flush_messages",
+    "Broadcast messages published per cross-instance flush",
+    buckets=[1, 2, 5, 10, 25, 50, 100, 250, 500],
+)
+
+WS_PUBSUB_PUBLISHES = Counter(
+    "pokerkit_ws_pubsub_publishes_total",
+    "Redis PUBLISH commands issued for cross-instance broadcasts",
+)
+
+WS_PUBSUB_SUBSCRIBED_CHANNELS = Gauge(
+    "pokerkit_ws_pubsub_subscribed_channels",
+    "Redis pub/sub channels this instance is subscribed to",
+)
+
+WS_OUTBOUND_QUEUE_DEPTH = Gauge(
+    "pokerkit_ws_outbound_queue_depth",
+    "Messages waiting in per-connection outbound queues",
+)
+
+WS_OUTBOUND_FLUSH_LATENCY = Histogram(
+    "pokerkit_ws_outbound_flush_latency_seconds",
+    "Time from enqueue to socket write for outbound messages",
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0],
+)
+
+WS_OUTBOUND_DISCARDED = Counter(
+    "pokerkit_ws_outbound_discarded_total",
+    "Outbound messages discarded before being written",
+    ["reason"],  # coalesced, overflow, closed
+)
+
+WS_RATE_LIMITED = Counter(
+    "pokerkit_ws_rate_limited_total",
+    "Inbound WebSocket messages rejected by the per-connection rate limiter",
+)
+
+WS_RATE_LIMIT_SLOTS = Gauge(
+    "pokerkit_ws_rate_limit_slots",
+    "Connections tracked by the WebSocket rate limiter",
+)
+
+WS_DB_CHECKOUTS = Counter(
+    "pokerkit_ws_db_checkouts_total",
+    "DB pool checkouts made while handling inbound WebSocket messages",
+    ["event_type"],
+)
+
+WS_DB_CHECKOUT_WAIT = Histogram(
+    "pokerkit_ws_db_checkout_wait_seconds",
+    "Time from a WebSocket handler's first DB use to holding a pooled connection",
+    ["event_type"],
+    buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+)
+
+# Timer wheel metrics (heartbeats, token revalidation, turn timeouts)
+TIMER_SKEW = Histogram(
+    "pokerkit_timer_skew_seconds",
+    "How late timer wheel callbacks fire relative to their deadline",
+    buckets=[0.01, 0.05, 0.1, 0.15, 0.25, 0.5, 1.0, 2.5, 5.0],
+)
+
+TIMER_PENDING = Gauge(
+    "pokerkit_timer_pending",
+    "Timers scheduled on the timer wheel",
+)
+
+TIMER_TICK_BACKLOG = Gauge(
+    "pokerkit_timer_tick_backlog",
+    "Timer wheel ticks processed late in the last driver wakeup",
+)
+
 # Game metrics
 ACTIVE_TABLES = Gauge(
     "pokerkit_active_tables",
@@ -69,6 +160,38 @@ HAND_DURATION = Histogram(
     buckets=[10, 30, 60, 120, 300, 600],
 )
 
+HAND_HISTORY_PENDING = Gauge(
+    "pokerkit_hand_history_pending",
+    "Completed hands spooled locally and not yet written to the database",
+)
+
+HAND_HISTORY_FLUSH_LAG = Gauge(
+    "pokerkit_hand_history_flush_lag_seconds",
+    "Age of the oldest hand history not yet written to the database",
+)
+
+HAND_HISTORY_FLUSH_DELAY = Histogram(
+    "pokerkit_hand_history_flush_delay_seconds",
+    "Time from hand completion to hand history commit",
+    buckets=[0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0],
+)
+
+HAND_HISTORY_FLUSH_HANDS = Histogram(
+    "pokerkit_hand_history_flush_hands",
+    "Hands written per hand history spool segment flush",
+    buckets=[1, 5, 10, 25, 50, 100, 200, 500, 1000],
+)
+
+HAND_HISTORY_FLUSH_FAILURES = Counter(
+    "pokerkit_hand_history_flush_failures_total",
+    "Hand history flushes that failed and were left for retry",
+)
+
+HAND_HISTORY_DEAD_LETTERS = Counter(
+    "pokerkit_hand_history_dead_letters_total",
+    "Hand histories the database rejected, moved to a dead-letter segment",
+)
+
 # Financial metrics
 RAKE_COLLECTED = Counter(
     "pokerkit_rake_collected_krw_total",
@@ -217,6 +340,122 @@ def record_ws_message(direction: str, message_type: str) -> None:
         WS_MESSAGES_RECEIVED.labels(message_type=message_type).inc()
 
 
+def record_ws_broadcast(
+    recipients: int,
+    duration_seconds: float,
+    slow: int = 0,
+    dropped: int = 0,
+) -> None:
+    """Record a channel broadcast fan-out.
+
+    Args:
+        recipients: Number of local subscribers targeted
+        duration_seconds: Time until every send completed or timed out
+        slow: Receivers that missed the per-send deadline
+        dropped: Receivers whose send failed
+    """
+    WS_BROADCAST_RECIPIENTS.observe(recipients)
+    WS_BROADCAST_DURATION.observe(duration_seconds)
+    if slow:
+        WS_BROADCAST_UNDELIVERED.labels(reason="slow").inc(slow)
+    if dropped:
+        WS_BROADCAST_UNDELIVERED.labels(reason="dropped").inc(dropped)
+
+
+def record_ws_pubsub_flush(messages: int, publishes: int) -> None:
+    """Record a batched cross-instance publish flush.
+
+    Args:
+        messages: Broadcast messages included in the flush
+        publishes: PUBLISH commands sent (one per channel)
+    """
+    WS_PUBSUB_FLUSH_MESSAGES.observe(messages)
+    WS_PUBSUB_PUBLISHES.inc(publishes)
+
+
+def update_ws_pubsub_channels(count: int) -> None:
+    """Update the number of subscribed pub/sub channels.
+
+    Args:
+        count: Channels this instance is subscribed to
+    """
+    WS_PUBSUB_SUBSCRIBED_CHANNELS.set(count)
+
+
+def update_ws_outbound_depth(delta: int) -> None:
+    """Adjust the total outbound queue depth.
+
+    Args:
+        delta: Messages added (positive) or removed (negative)
+    """
+    WS_OUTBOUND_QUEUE_DEPTH.inc(delta)
+
+
+def record_ws_outbound_flush(latency_seconds: float) -> None:
+    """Record an outbound message being written to its socket.
+
+    Args:
+        latency_seconds: Time the message spent queued
+    """
+    WS_OUTBOUND_FLUSH_LATENCY.observe(latency_seconds)
+
+
+def record_ws_outbound_discard(reason: str, count: int = 1) -> None:
+    """Record outbound messages discarded before being written.
+
+    Args:
+        reason: "coalesced", "overflow" or "closed"
+        count: Number of messages discarded
+    """
+    WS_OUTBOUND_DISCARDED.labels(reason=reason).inc(count)
+
+
+def record_ws_rate_limited() -> None:
+    """Record an inbound WebSocket message rejected by the rate limiter."""
+    WS_RATE_LIMITED.inc()
+
+
+def update_ws_rate_limit_slots(count: int) -> None:
+    """Update the number of connections tracked by the rate limiter.
+
+    Args:
+        count: Active rate limiter slots
+    """
+    WS_RATE_LIMIT_SLOTS.set(count)
+
+
+def record_ws_db_checkout(event_type: str, wait_seconds: float | None = None) -> None:
+    """Record a DB pool checkout made by a WebSocket handler.
+
+    Args:
+        event_type: Inbound event being handled
+        wait_seconds: Wait for the connection (first checkout of the message only)
+    """
+    WS_DB_CHECKOUTS.labels(event_type=event_type).inc()
+    if wait_seconds is not None:
+        WS_DB_CHECKOUT_WAIT.labels(event_type=event_type).observe(wait_seconds)
+
+
+def record_timer_skew(skew_seconds: float) -> None:
+    """Record how late a timer callback fired.
+
+    Args:
+        skew_seconds: Fire time minus deadline
+    """
+    TIMER_SKEW.observe(max(0.0, skew_seconds))
+
+
+def update_timer_wheel_state(pending: int, backlog_ticks: int) -> None:
+    """Update timer wheel gauges.
+
+    Args:
+        pending: Scheduled timers
+        backlog_ticks: Ticks the driver had to catch up on (1 = on time)
+    """
+    TIMER_PENDING.set(pending)
+    TIMER_TICK_BACKLOG.set(max(0, backlog_ticks - 1))
+
+
 def record_hand_completed(table_type: str, duration_seconds: float) -> None:
     """Record completed hand.
 
@@ -228,6 +467,42 @@ def record_hand_completed(table_type: str, duration_seconds: float) -> None:
     HAND_DURATION.observe(duration_seconds)
 
 
+def record_hand_history_flush(hands: int, oldest_delay_seconds: float) -> None:
+    """Record a spool segment written to the database.
+
+    Args:
+        hands: Hands in the segment
+        oldest_delay_seconds: Time the oldest hand in the segment waited
+    """
+    HAND_HISTORY_FLUSH_HANDS.observe(hands)
+    HAND_HISTORY_FLUSH_DELAY.observe(oldest_delay_seconds)
+
+
+def record_hand_history_flush_failure() -> None:
+    """Record a failed hand history flush (segment kept for retry)."""
+    HAND_HISTORY_FLUSH_FAILURES.inc()
+
+
+def record_hand_history_dead_letters(hands: int) -> None:
+    """Record hands moved to a dead-letter segment.
+
+    Args:
+        hands: Hands the database rejected
+    """
+    HAND_HISTORY_DEAD_LETTERS.inc(hands)
+
+
+def update_hand_history_backlog(pending: int, lag_seconds: float) -> None:
+    """Update the hand history write-behind backlog gauges.
+
+    Args:
+        pending: Hands waiting to be flushed
+        lag_seconds: Age of the oldest waiting hand (0 when empty)
+    """
+    HAND_HISTORY_PENDING.set(pending)
+    HAND_HISTORY_FLUSH_LAG.set(lag_seconds)
+
+
 def record_rake(amount_krw: int) -> None:
     """Record rake collection.
 
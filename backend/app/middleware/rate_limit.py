@@ -7,16 +7,29 @@ Phase 4 Enhancement:
 - User-based rate limiting for authenticated requests
 - WebSocket message rate limiting
 - More accurate Retry-After header calculation
+
+HTTP per-user/per-IP limits are shared across workers and checked with a
+single atomic Lua script (one round trip, including the rejected path).
+WebSocket limits are per connection, and connections live on one worker,
+so they use an in-process token bucket with no network I/O per message.
 """
 
+import itertools
+import math
 import time
+from array import array
 from typing import Callable, Optional
+from uuid import uuid4
 
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from app.config import get_settings
 from app.logging_config import get_logger
+from app.middleware.prometheus import record_ws_rate_limited, update_ws_rate_limit_slots
+from app.utils.redis_client import get_redis
+from app.utils.timer_wheel import TimerHandle, get_timer_wheel
 
 logger = get_logger(__name__)
 
@@ -28,6 +41,32 @@ class SlidingWindowRateLimiter:
     the actual time distribution of requests.
     """
 
+    # Prune, count and (if under the limit) record in one atomic call.
+    # Rejected requests are never added, so nothing has to be undone.
+    # KEYS[1] = key, ARGV = now, window_seconds, limit, member
+    # Returns {allowed, remaining, retry_after_seconds}
+    SLIDING_WINDOW_SCRIPT = """
+    local now = tonumber(ARGV[1])
+    local window = tonumber(ARGV[2])
+    local limit = tonumber(ARGV[3])
+
+    redis.call("ZREMRANGEBYSCORE", KEYS[1], 0, now - window)
+    local count = redis.call("ZCARD", KEYS[1])
+
+    if count >= limit then
+        local retry_after = window
+        local oldest = redis.call("ZRANGE", KEYS[1], 0, 0, "WITHSCORES")
+        if oldest[2] then
+            retry_after = math.max(1, math.floor(tonumber(oldest[2]) + window - now) + 1)
+        end
+        return {0, 0, retry_after}
+    end
+
+    redis.call("ZADD", KEYS[1], now, ARGV[4])
+    redis.call("EXPIRE", KEYS[1], window + 1)
+    return {1, limit - count - 1, 0}
+    """
+
     def __init__(self, redis_client):
         """Initialize rate limiter.
 
@@ -35,6 +74,8 @@ class SlidingWindowRateLimiter:
             redis_client: Redis client instance
         """
         self._redis = redis_client
+        self._script = redis_client.register_script(self.SLIDING_WINDOW_SCRIPT)
+        self._sequence = itertools.count()
 
     async def is_allowed(
         self,
@@ -53,45 +94,14 @@ class SlidingWindowRateLimiter:
             Tuple of (is_allowed, remaining, retry_after_seconds)
         """
         now = time.time()
-        window_start = now - window_seconds
-
-        # Use pipeline for atomic operations
-        pipe = self._redis.pipeline()
+        # Unique member so concurrent requests in the same instant all count
+        request_id = f"{now}:{id(self)}:{next(self._sequence)}"
 
-        # Remove entries outside the window
-        pipe.zremrangebyscore(key, 0, window_start)
-
-        # Count current entries in window
-        pipe.zcard(key)
-
-        # Add current request with timestamp as score
-        request_id = f"{now}:{id(self)}"
-        pipe.zadd(key, {request_id: now})
-
-        # Set key expiry to window size (cleanup)
-        pipe.expire(key, window_seconds + 1)
-
-        results = await pipe.execute()
-        current_count = results[1]  # zcard result
-
-        if current_count >= limit:
-            # Over limit - calculate accurate retry_after
-            # Get the oldest entry to know when it will expire
-            oldest_entries = await self._redis.zrange(key, 0, 0, withscores=True)
-            if oldest_entries:
-                oldest_time = oldest_entries[0][1]
-                retry_after = int(oldest_time + window_seconds - now) + 1
-                retry_after = max(1, retry_after)  # At least 1 second
-            else:
-                retry_after = window_seconds
-
-            # Remove the request we just added since it's rejected
-            await self._redis.zrem(key, request_id)
-
-            return False, 0, retry_after
-
-        remaining = max(0, limit - current_count - 1)
-        return True, remaining, 0
+        allowed, remaining, retry_after = await self._script(
+            keys=[key],
+            args=[repr(now), window_seconds, limit, request_id],
+        )
+        return bool(allowed), int(remaining), int(retry_after)
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
@@ -285,28 +295,59 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
 
 class WebSocketRateLimiter:
-    """Rate limiter for WebSocket messages.
-
-    Limits the number of messages a client can send per time window.
+    """Per-connection token bucket for inbound WebSocket messages.
+
+    Connection IDs are local to one worker, so bucket state stays in
+    process and checking a message does no network I/O:
+
+    - Each connection owns a slot in two parallel float arrays (tokens,
+      last refill time); slots of closed connections are reused
+    - Tokens refill at `messages_per_second` up to `burst_limit`
+    - reconcile() runs periodically on the timer wheel. It frees slots that
+      have been idle long enough to be full again (indistinguishable from a
+      new connection) and reports this worker's slot and rejection counts
+      to Redis in one pipeline
     """
 
+    REPORT_KEY_PREFIX = "ws_ratelimit:worker:"
+
     def __init__(
         self,
-        redis_client,
-        messages_per_second: int = 10,
+        redis_client=None,
+        messages_per_second: float = 10,
         burst_limit: int = 20,
+        reconcile_interval: float = 10.0,
+        instance_id: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic,
     ):
         """Initialize WebSocket rate limiter.
 
         Args:
-            redis_client: Redis client instance
+            redis_client: Redis client for periodic reports (optional)
             messages_per_second: Sustained message rate limit
             burst_limit: Maximum burst of messages allowed
+            reconcile_interval: Seconds between reconcile() runs
+            instance_id: Worker identifier used in the Redis report key
+            clock: Monotonic time source
         """
         self._redis = redis_client
-        self._messages_per_second = messages_per_second
+        self._messages_per_second = float(messages_per_second)
         self._burst_limit = burst_limit
-        self._limiter = SlidingWindowRateLimiter(redis_client) if redis_client else None
+        self._reconcile_interval = reconcile_interval
+        self._instance_id = instance_id or str(uuid4())[:8]
+        self._clock = clock
+
+        self._slots: dict[str, int] = {}
+        self._free_slots: list[int] = []
+        self._tokens = array("d")
+        self._updated = array("d")
+        self._rejected = 0
+        self._reconcile_timer: TimerHandle | None = None
+
+    @property
+    def tracked_connections(self) -> int:
+        """Number of connections with a bucket slot."""
+        return len(self._slots)
 
     async def is_allowed(self, connection_id: str) -> tuple[bool, int]:
         """Check if WebSocket message is allowed.
@@ -317,26 +358,125 @@ class WebSocketRateLimiter:
         Returns:
             Tuple of (is_allowed, retry_after_ms)
         """
-        if self._limiter is None:
-            return True, 0
-
-        key = f"ws_ratelimit:{connection_id}"
+        self._ensure_reconcile()
+        now = self._clock()
 
-        try:
-            is_allowed, remaining, retry_after = await self._limiter.is_allowed(
-                key, self._burst_limit, 1  # 1 second window
+        slot = self._slots.get(connection_id)
+        if slot is None:
+            slot = self._allocate(connection_id)
+            tokens = float(self._burst_limit)
+        else:
+            elapsed = now - self._updated[slot]
+            tokens = min(
+                float(self._burst_limit),
+                self._tokens[slot] + elapsed * self._messages_per_second,
             )
+        self._updated[slot] = now
 
-            if not is_allowed:
-                logger.warning(
-                    "ws_rate_limit_exceeded",
-                    connection_id=connection_id,
-                    burst_limit=self._burst_limit,
-                )
-                return False, retry_after * 1000  # Convert to milliseconds
-
+        if tokens >= 1.0:
+            self._tokens[slot] = tokens - 1.0
             return True, 0
 
+        self._tokens[slot] = tokens
+        self._rejected += 1
+        record_ws_rate_limited()
+        logger.warning(
+            "ws_rate_limit_exceeded",
+            connection_id=connection_id,
+            burst_limit=self._burst_limit,
+        )
+        retry_after_ms = math.ceil((1.0 - tokens) / self._messages_per_second * 1000)
+        return False, max(1, retry_after_ms)
+
+    def release(self, connection_id: str) -> None:
+        """Free the slot of a closed connection."""
+        slot = self._slots.pop(connection_id, None)
+        if slot is not None:
+            self._free_slots.append(slot)
+
+    def _allocate(self, connection_id: str) -> int:
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            slot = len(self._tokens)
+            self._tokens.append(0.0)
+            self._updated.append(0.0)
+        self._slots[connection_id] = slot
+        return slot
+
+    # =========================================================================
+    # Reconciliation
+    # =========================================================================
+
+    async def reconcile(self) -> None:
+        """Free idle slots and report this worker's counters to Redis."""
+        now = self._clock()
+        refill_seconds = self._burst_limit / self._messages_per_second
+        idle = [
+            connection_id
+            for connection_id, slot in self._slots.items()
+            if now - self._updated[slot] >= refill_seconds
+        ]
+        for connection_id in idle:
+            self.release(connection_id)
+        update_ws_rate_limit_slots(len(self._slots))
+
+        if self._redis is None:
+            return
+
+        key = f"{self.REPORT_KEY_PREFIX}{self._instance_id}"
+        try:
+            pipe = self._redis.pipeline()
+            pipe.hset(key, mapping={
+                "connections": len(self._slots),
+                "rejected": self._rejected,
+            })
+            pipe.expire(key, math.ceil(self._reconcile_interval * 3))
+            await pipe.execute()
         except Exception as e:
-            logger.error("ws_rate_limit_check_failed", error=str(e))
-            return True, 0  # Allow on error
+            logger.error("ws_rate_limit_reconcile_failed", error=str(e))
+
+    async def stop(self) -> None:
+        """Cancel periodic reconciliation."""
+        if self._reconcile_timer is not None:
+            self._reconcile_timer.cancel()
+            self._reconcile_timer = None
+
+    def _ensure_reconcile(self) -> None:
+        if self._reconcile_timer is None or not self._reconcile_timer.active:
+            self._reconcile_timer = get_timer_wheel().schedule(
+                self._reconcile_interval, self._on_reconcile
+            )
+
+    async def _on_reconcile(self) -> None:
+        # Re-arm first so is_allowed() doesn't schedule a second timer meanwhile
+        self._reconcile_timer = get_timer_wheel().schedule(
+            self._reconcile_interval, self._on_reconcile
+        )
+        await self.reconcile()
+
+
+# Global WebSocket rate limiter (one per worker process)
+_ws_rate_limiter: Optional[WebSocketRateLimiter] = None
+
+
+def get_ws_rate_limiter() -> WebSocketRateLimiter:
+    """Get or create the global WebSocketRateLimiter instance."""
+    global _ws_rate_limiter
+    if _ws_rate_limiter is None:
+        settings = get_settings()
+        _ws_rate_limiter = WebSocketRateLimiter(
+            get_redis(),
+            messages_per_second=settings.ws_rate_limit_per_second,
+            burst_limit=settings.ws_rate_limit_burst,
+            reconcile_interval=settings.ws_rate_limit_reconcile_interval,
+        )
+    return _ws_rate_limiter
+
+
+async def shutdown_ws_rate_limiter() -> None:
+    """Stop the global WebSocketRateLimiter instance."""
+    global _ws_rate_limiter
+    if _ws_rate_limiter is not None:
+        await _ws_rate_limiter.stop()
+        _ws_rate_limiter = None
@@ -14,6 +14,7 @@ from app.models.partner import (
     SettlementStatus,
 )
 from app.models.partner_stats import PartnerDailyStats
+from app.models.player_stats import PlayerStatCounters
 from app.models.rake import RakeConfig
 from app.models.room import Room
 from app.models.table import Table
@@ -46,6 +47,7 @@ __all__ = [
     "Hand",
     "HandEvent",
     "HandParticipant",
+    "PlayerStatCounters",
     # Audit
     "AuditLog",
     # Wallet (Phase 5)
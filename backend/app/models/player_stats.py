@@ -0,0 +1,80 @@
+"""Player Statistics Counter Model.
+
+플레이어 통계(VPIP/PFR/3Bet/AF/WTSD 등)의 원본 카운터를 사전 집계한 테이블입니다.
+핸드 완료 시 증분 업데이트되며, 프로필 조회는 사용자당 한 행만 읽습니다.
+hand_participants / hand_events로부터 전체 재구축(backfill)할 수 있습니다.
+"""
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.models.base import Base
+
+if TYPE_CHECKING:
+    from app.models.user import User
+
+
+class PlayerStatCounters(Base):
+    """플레이어 통계 카운터 (사전 집계).
+
+    비율 지표는 저장하지 않고 분자/분모 카운터만 저장합니다.
+    비율은 조회 시 StatisticsService에서 계산합니다.
+    """
+
+    __tablename__ = "player_stat_counters"
+
+    user_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    # 기본 통계
+    total_hands: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    hands_won: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    total_winnings: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    biggest_pot: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+
+    # 프리플롭 (핸드 수)
+    vpip_hands: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    pfr_hands: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    three_bet_hands: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+
+    # 공격성 (액션 수, 전체 스트리트)
+    bets: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    raises: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    calls: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    checks: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    total_actions: Mapped[int] = mapped_column(
+        BigInteger,
+        default=0,
+        nullable=False,
+        comment="bet/raise/call/check/fold 합계",
+    )
+
+    # 쇼다운
+    showdown_hands: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+    won_showdowns: Mapped[int] = mapped_column(BigInteger, default=0, nullable=False)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    # Relationship
+    user: Mapped["User"] = relationship("User")
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"<PlayerStatCounters("
+            f"user_id={self.user_id}, "
+            f"total_hands={self.total_hands}"
+            f")>"
+        )
@@ -26,6 +26,7 @@ from app.services.vip import (
 )
 from app.services.wallet import (
     InsufficientBalanceError,
+    LedgerEntry,
     WalletError,
     WalletService,
 )
@@ -44,6 +45,7 @@ __all__ = [
     "WalletService",
     "WalletError",
     "InsufficientBalanceError",
+    "LedgerEntry",
     # Crypto Deposit
     "CryptoDepositService",
     "DepositError",
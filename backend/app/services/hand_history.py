@@ -1,7 +1,9 @@
 """Hand history storage and retrieval service.
 
 This service handles:
-- Saving completed hand results with participant details
+- Saving completed hand results with participant details and action events
+- Bulk idempotent saves for the write-behind queue (hand_history_queue.py)
+- Updating materialized player statistics counters
 - Retrieving user hand history
 - Getting hand details for replay
 """
@@ -12,14 +14,101 @@ from datetime import datetime, timezone
 from typing import Any
 from uuid import uuid4
 
-from sqlalchemy import desc, select
+from sqlalchemy import desc, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.hand import Hand, HandEvent, HandParticipant
+from app.services.statistics import StatisticsService, is_registered_user_id
 
 logger = logging.getLogger(__name__)
 
+# Streets in dealing order with their community card slice
+_STREETS = (
+    ("preflop", None, None),
+    ("flop", "deal_flop", slice(0, 3)),
+    ("turn", "deal_turn", slice(3, 4)),
+    ("river", "deal_river", slice(4, 5)),
+)
+_STREET_INDEX = {name: i for i, (name, _, _) in enumerate(_STREETS)}
+
+REQUIRED_FIELDS = ("table_id", "hand_number", "participants")
+
+
+def build_hand_events(
+    actions: list[dict[str, Any]],
+    community_cards: list[str],
+) -> list[dict[str, Any]]:
+    """Convert a table's per-hand action log into hand_events rows.
+
+    Deal events are inserted at each street change (and for streets run out
+    after the last action) so preflop/postflop boundaries survive in storage.
+
+    Args:
+        actions: PokerTable action log (seat, user_id, action, amount, phase)
+        community_cards: Final community cards
+
+    Returns:
+        List of event dicts (seq_no, event_type, payload), empty without actions
+    """
+    events: list[dict[str, Any]] = []
+    if not actions:
+        return events
+
+    street = 0
+
+    def deal_until(target: int) -> None:
+        nonlocal street
+        while street < target:
+            street += 1
+            _, event_type, cards = _STREETS[street]
+            events.append({
+                "seq_no": len(events) + 1,
+                "event_type": event_type,
+                "payload": {"cards": community_cards[cards]},
+            })
+
+    for action in actions:
+        deal_until(_STREET_INDEX.get(action.get("phase"), street))
+        events.append({
+            "seq_no": len(events) + 1,
+            "event_type": action["action"],
+            "payload": {
+                "seat": action.get("seat"),
+                "user_id": action.get("user_id"),
+                "amount": action.get("amount", 0),
+            },
+        })
+
+    # All-in runout: remaining streets dealt without further actions
+    dealt_streets = {0: 0, 3: 1, 4: 2, 5: 3}.get(len(community_cards), street)
+    deal_until(dealt_streets)
+
+    return events
+
+
+def _validate_hand_result(hand_result: dict) -> None:
+    for field in REQUIRED_FIELDS:
+        if field not in hand_result:
+            raise ValueError(f"Missing required field: {field}")
+
+
+def _participant_row(hand_id: str, participant: dict[str, Any]) -> dict[str, Any]:
+    """Build hand_participants column values for one participant."""
+    # Convert hole_cards list to JSON string
+    hole_cards = participant.get("hole_cards")
+    return {
+        "id": str(uuid4()),
+        "hand_id": hand_id,
+        "user_id": participant["user_id"],
+        "seat": participant.get("seat", 0),
+        "hole_cards": json.dumps(hole_cards) if hole_cards else None,
+        "bet_amount": participant.get("bet_amount", 0),
+        "won_amount": participant.get("won_amount", 0),
+        "final_action": participant.get("final_action", "fold"),
+    }
+
 
 class HandHistoryService:
     """Hand history storage and retrieval service.
@@ -56,6 +145,7 @@ class HandHistoryService:
                 - pot_size: Total pot size
                 - community_cards: List of community cards
                 - participants: List of participant details
+                - actions: PokerTable action log (optional, stored as hand_events)
 
         Returns:
             Hand ID (UUID string)
@@ -63,11 +153,7 @@ class HandHistoryService:
         Raises:
             ValueError: If required fields are missing
         """
-        # Validate required fields
-        required_fields = ["table_id", "hand_number", "participants"]
-        for field in required_fields:
-            if field not in hand_result:
-                raise ValueError(f"Missing required field: {field}")
+        _validate_hand_result(hand_result)
 
         hand_id = hand_result.get("hand_id") or str(uuid4())
         table_id = hand_result["table_id"]
@@ -75,6 +161,7 @@ class HandHistoryService:
         participants = hand_result["participants"]
         pot_size = hand_result.get("pot_size", 0)
         community_cards = hand_result.get("community_cards", [])
+        events = build_hand_events(hand_result.get("actions", []), community_cards)
 
         # Check if hand already exists
         existing_hand = await self._db.get(Hand, hand_id)
@@ -115,27 +202,26 @@ class HandHistoryService:
             )
             self._db.add(hand)
 
-        # Save participant details
+            for event in events:
+                self._db.add(HandEvent(
+                    id=str(uuid4()),
+                    hand_id=hand_id,
+                    seq_no=event["seq_no"],
+                    event_type=event["event_type"],
+                    payload=event["payload"],
+                    state_version=event["seq_no"],
+                ))
+
+        # Save participant details (bots are not in users: FK / UUID)
         for participant in participants:
-            user_id = participant.get("user_id")
-            if not user_id:
+            if not is_registered_user_id(participant.get("user_id")):
                 continue
 
-            # Convert hole_cards list to JSON string
-            hole_cards = participant.get("hole_cards")
-            hole_cards_str = json.dumps(hole_cards) if hole_cards else None
-
-            hand_participant = HandParticipant(
-                id=str(uuid4()),
-                hand_id=hand_id,
-                user_id=user_id,
-                seat=participant.get("seat", 0),
-                hole_cards=hole_cards_str,
-                bet_amount=participant.get("bet_amount", 0),
-                won_amount=participant.get("won_amount", 0),
-                final_action=participant.get("final_action", "fold"),
-            )
-            self._db.add(hand_participant)
+            self._db.add(HandParticipant(**_participant_row(hand_id, participant)))
+
+        # Materialized stats are updated in the same transaction as the rows
+        # they are derived from, so rebuild_counters() reproduces them exactly
+        await StatisticsService(self._db).record_hand(participants, events)
 
         await self._db.commit()
 
@@ -145,6 +231,114 @@ class HandHistoryService:
 
         return hand_id
 
+    async def save_hand_results(self, hand_results: list[dict]) -> list[str]:
+        """Bulk-save completed hands in one transaction (idempotent).
+
+        Hands are inserted with ON CONFLICT (id) DO NOTHING; participants,
+        events and statistics counters are written only for hands that were
+        actually inserted. Replaying a batch that was already committed is
+        therefore a no-op, which gives the write-behind queue at-least-once
+        delivery without double counting.
+
+        Args:
+            hand_results: Hand result dicts as accepted by save_hand_result(),
+                each with a pre-assigned hand_id (ended_at may also be set)
+
+        Returns:
+            IDs of hands that were newly inserted
+
+        Raises:
+            ValueError: If a hand_id or other required field is missing
+        """
+        hand_rows: list[dict[str, Any]] = []
+        by_id: dict[str, dict] = {}
+        now = datetime.now(timezone.utc)
+        for hand_result in hand_results:
+            _validate_hand_result(hand_result)
+            hand_id = hand_result.get("hand_id")
+            if not hand_id:
+                raise ValueError("Missing required field: hand_id")
+            if hand_id in by_id:
+                continue
+            by_id[hand_id] = hand_result
+
+            participants = hand_result["participants"]
+            hand_rows.append({
+                "id": hand_id,
+                "table_id": hand_result["table_id"],
+                "hand_number": hand_result["hand_number"],
+                "started_at": hand_result.get("started_at") or now,
+                "ended_at": hand_result.get("ended_at") or now,
+                "initial_state": {
+                    "participants": [
+                        {"user_id": p["user_id"], "seat": p["seat"]}
+                        for p in participants
+                        if p.get("user_id")
+                    ],
+                },
+                "result": {
+                    "pot_total": hand_result.get("pot_size", 0),
+                    "community_cards": hand_result.get("community_cards", []),
+                    "winners": [
+                        p for p in participants if p.get("won_amount", 0) > 0
+                    ],
+                },
+            })
+
+        if not hand_rows:
+            return []
+
+        result = await self._db.execute(
+            pg_insert(Hand)
+            .values(hand_rows)
+            .on_conflict_do_nothing(index_elements=[Hand.id])
+            .returning(Hand.id)
+        )
+        inserted = set(result.scalars().all())
+
+        participant_rows: list[dict[str, Any]] = []
+        event_rows: list[dict[str, Any]] = []
+        stat_hands: list[tuple[list[dict], list[dict]]] = []
+        for hand_id, hand_result in by_id.items():
+            if hand_id not in inserted:
+                continue
+            participants = hand_result["participants"]
+            events = build_hand_events(
+                hand_result.get("actions", []),
+                hand_result.get("community_cards", []),
+            )
+            stat_hands.append((participants, events))
+
+            for participant in participants:
+                if not is_registered_user_id(participant.get("user_id")):
+                    continue
+                participant_rows.append(_participant_row(hand_id, participant))
+            for event in events:
+                event_rows.append({
+                    "id": str(uuid4()),
+                    "hand_id": hand_id,
+                    "seq_no": event["seq_no"],
+                    "event_type": event["event_type"],
+                    "payload": event["payload"],
+                    "state_version": event["seq_no"],
+                })
+
+        # executemany → multi-row INSERT ... VALUES batches
+        if participant_rows:
+            await self._db.execute(insert(HandParticipant), participant_rows)
+        if event_rows:
+            await self._db.execute(insert(HandEvent), event_rows)
+        await StatisticsService(self._db).record_hands(stat_hands)
+
+        await self._db.commit()
+
+        logger.info(
+            f"Bulk-saved {len(inserted)}/{len(hand_rows)} hands "
+            f"({len(participant_rows)} participants, {len(event_rows)} events)"
+        )
+
+        return [hand_id for hand_id in by_id if hand_id in inserted]
+
     async def get_user_hand_history(
         self,
         user_id: str,
@@ -0,0 +1,441 @@
+"""Write-behind queue for completed hand histories.
+
+Saving a hand used to cost several round trips and a commit on the
+hand-completion path. Completed hands are now appended to a local spool
+file and flushed in batches by a background task:
+
+- enqueue() assigns the hand_id and ended_at and appends one JSON line to
+  the active segment in a worker thread (no database access, no file I/O
+  on the event loop)
+- The flusher seals the active segment, bulk-inserts its hands through
+  HandHistoryService.save_hand_results() and deletes the segment only after
+  the transaction commits
+- A transient failure (connection, timeout) keeps the segment and retries
+  on the next tick; segments left over from a crash are replayed on
+  start(). Hands are inserted with ON CONFLICT (id) DO NOTHING, so replays
+  are harmless (at-least-once)
+- If the database rejects a batch's data, its hands are retried one by one
+  and the rejected ones are moved to a dead-letter segment, so one bad hand
+  never blocks the hands behind it
+
+Spool layout (each worker process locks its own slot directory, so a
+restarted worker picks up whatever a crashed one left behind)::
+
+    worker-<n>/
+        .lock                     # flock held while the worker runs
+        active.jsonl              # hands being appended
+        <time_ns>.sealed.jsonl    # waiting to be flushed, oldest first
+        <time_ns>.dead.jsonl      # rejected by the database, kept for inspection
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fcntl
+import itertools
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.middleware.prometheus import (
+    record_hand_history_dead_letters,
+    record_hand_history_flush,
+    record_hand_history_flush_failure,
+    update_hand_history_backlog,
+)
+from app.services.hand_history import HandHistoryService, _validate_hand_result
+from app.utils.db import get_db_session
+from app.utils.json_utils import json_dumps_bytes, json_loads
+
+logger = logging.getLogger(__name__)
+
+LOCK_FILE = ".lock"
+ACTIVE_SEGMENT = "active.jsonl"
+SEALED_SUFFIX = ".sealed.jsonl"
+DEAD_LETTER_SUFFIX = ".dead.jsonl"
+
+# Errors caused by the hand data itself: retrying the same record cannot
+# succeed, so it is dead-lettered. Anything else (connection loss, timeouts)
+# is treated as transient and the segment is kept for retry.
+PERMANENT_ERRORS = (IntegrityError, DataError, ValueError, TypeError, KeyError)
+
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+
+class HandHistoryQueue:
+    """Durable local write-behind queue for hand histories.
+
+    Usage:
+        queue = HandHistoryQueue("/var/lib/pokerkit/hand_history")
+        await queue.start()
+
+        # Hand completion path (no DB round trip)
+        hand_id = await queue.enqueue(hand_result)
+
+        await queue.stop()  # final flush
+    """
+
+    def __init__(
+        self,
+        spool_dir: str | Path,
+        flush_interval: float = 1.0,
+        batch_size: int = 200,
+        session_factory: SessionFactory = get_db_session,
+    ) -> None:
+        self._spool_root = Path(spool_dir)
+        self._spool_dir = self._spool_root
+        self._lock_file = None
+        self._flush_interval = flush_interval
+        self._batch_size = batch_size
+        self._session_factory = session_factory
+
+        self._active_file = None
+        # Guards the active segment across enqueue/seal worker threads
+        self._io_lock = threading.Lock()
+        self._active_count = 0
+        self._active_first_enqueued_at: float | None = None
+        self._pending = 0
+        # Wall-clock enqueue time of the oldest unflushed hand
+        self._oldest_enqueued_at: float | None = None
+
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def pending(self) -> int:
+        """Number of hands waiting to be flushed."""
+        return self._pending
+
+    @property
+    def lag_seconds(self) -> float:
+        """Age of the oldest unflushed hand (0 when empty)."""
+        if self._oldest_enqueued_at is None:
+            return 0.0
+        return max(0.0, time.time() - self._oldest_enqueued_at)
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    async def start(self) -> None:
+        """Claim a spool slot, recover leftover segments and start flushing."""
+        self._claim_slot()
+
+        # An active segment left by a previous process is sealed as-is
+        self._seal_active()
+        for segment in self._sealed_segments():
+            records = self._read_segment(segment)
+            self._pending += len(records)
+            if records:
+                self._track_oldest(records[0]["enqueued_at"])
+
+        if self._pending:
+            logger.info(
+                f"Recovered {self._pending} unflushed hands from {self._spool_dir}"
+            )
+
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flusher and try a final flush."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Final hand history flush failed (kept in spool): {e}")
+        # Anything enqueued after the final flush is sealed for the next start
+        await asyncio.to_thread(self._seal_active)
+        self._release_slot()
+
+    # =========================================================================
+    # Producer
+    # =========================================================================
+
+    async def enqueue(self, hand_result: dict[str, Any]) -> str:
+        """Append a completed hand to the spool.
+
+        Args:
+            hand_result: Hand result dict (see HandHistoryService.save_hand_result)
+
+        Returns:
+            Hand ID assigned to the hand
+
+        Raises:
+            ValueError: If required fields are missing
+        """
+        _validate_hand_result(hand_result)
+
+        enqueued_at = time.time()
+        record = {
+            **hand_result,
+            "hand_id": hand_result.get("hand_id") or str(uuid4()),
+            "ended_at": hand_result.get("ended_at") or datetime.now(timezone.utc),
+            "enqueued_at": enqueued_at,
+        }
+
+        active_count = await asyncio.to_thread(
+            self._append, json_dumps_bytes(record) + b"\n", enqueued_at
+        )
+        self._pending += 1
+        self._track_oldest(enqueued_at)
+
+        if active_count >= self._batch_size:
+            self._wakeup.set()
+
+        return record["hand_id"]
+
+    def _append(self, line: bytes, enqueued_at: float) -> int:
+        """Write one record to the active segment (worker thread)."""
+        with self._io_lock:
+            if self._active_file is None:
+                self._active_file = open(self._spool_dir / ACTIVE_SEGMENT, "ab")
+            self._active_file.write(line)
+            # Handed to the OS: survives a process crash; fsync happens on seal
+            self._active_file.flush()
+
+            if self._active_count == 0:
+                self._active_first_enqueued_at = enqueued_at
+            self._active_count += 1
+            return self._active_count
+
+    # =========================================================================
+    # Flusher
+    # =========================================================================
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            try:
+                await self.flush()
+            except Exception as e:
+                # Segment stays on disk and is retried on the next tick
+                record_hand_history_flush_failure()
+                logger.error(f"Hand history flush failed: {e}")
+
+            update_hand_history_backlog(self._pending, self.lag_seconds)
+
+    async def flush(self) -> int:
+        """Flush all sealed segments plus the active one.
+
+        Returns:
+            Number of hands flushed
+
+        Raises:
+            Exception: Transient database errors (the failing segment is kept)
+        """
+        async with self._flush_lock:
+            await asyncio.to_thread(self._seal_active)
+
+            flushed = 0
+            try:
+                for segment in self._sealed_segments():
+                    records = await asyncio.to_thread(self._read_segment, segment)
+                    rejected: list[dict[str, Any]] = []
+                    for start in range(0, len(records), self._batch_size):
+                        rejected += await self._save_or_isolate(
+                            records[start:start + self._batch_size]
+                        )
+                    if rejected:
+                        await asyncio.to_thread(self._write_dead_letters, rejected)
+                    segment.unlink()
+
+                    flushed += len(records)
+                    self._pending = max(0, self._pending - len(records))
+                    if records:
+                        oldest = min(r["enqueued_at"] for r in records)
+                        record_hand_history_flush(len(records), time.time() - oldest)
+            finally:
+                if flushed:
+                    self._refresh_oldest()
+
+            return flushed
+
+    async def _save_or_isolate(
+        self, records: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Save a batch; on a data error retry hand by hand.
+
+        Returns:
+            Records the database rejected (to be dead-lettered)
+
+        Raises:
+            Exception: Transient errors, which abort the flush
+        """
+        try:
+            await self._save_batch(records)
+            return []
+        except PERMANENT_ERRORS as e:
+            if len(records) == 1:
+                logger.error(f"Hand history rejected ({records[0].get('hand_id')}): {e}")
+                return list(records)
+            logger.warning(f"Hand history batch rejected, retrying per hand: {e}")
+
+        rejected = []
+        for record in records:
+            try:
+                await self._save_batch([record])
+            except PERMANENT_ERRORS as e:
+                logger.error(f"Hand history rejected ({record.get('hand_id')}): {e}")
+                rejected.append(record)
+        return rejected
+
+    async def _save_batch(self, records: list[dict[str, Any]]) -> None:
+        hand_results = []
+        for record in records:
+            hand_result = dict(record)
+            hand_result.pop("enqueued_at", None)
+            for key in ("started_at", "ended_at"):
+                if isinstance(hand_result.get(key), str):
+                    hand_result[key] = datetime.fromisoformat(hand_result[key])
+            hand_results.append(hand_result)
+
+        async with self._session_factory() as db:
+            await HandHistoryService(db).save_hand_results(hand_results)
+
+    # =========================================================================
+    # Spool Files
+    # =========================================================================
+
+    def _seal_active(self) -> None:
+        """Rename the active segment so new hands go to a fresh file."""
+        with self._io_lock:
+            self._close_active()
+            active = self._spool_dir / ACTIVE_SEGMENT
+            if not active.exists():
+                return
+            if active.stat().st_size == 0:
+                active.unlink()
+                return
+            active.rename(self._spool_dir / f"{time.time_ns():020d}{SEALED_SUFFIX}")
+            self._active_count = 0
+            self._active_first_enqueued_at = None
+
+    def _close_active(self) -> None:
+        if self._active_file is not None:
+            self._active_file.flush()
+            os.fsync(self._active_file.fileno())
+            self._active_file.close()
+            self._active_file = None
+
+    def _write_dead_letters(self, records: list[dict[str, Any]]) -> None:
+        """Move rejected hands to a dead-letter segment (not replayed)."""
+        path = self._spool_dir / f"{time.time_ns():020d}{DEAD_LETTER_SUFFIX}"
+        with open(path, "wb") as f:
+            for record in records:
+                f.write(json_dumps_bytes(record) + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        record_hand_history_dead_letters(len(records))
+        logger.error(f"Moved {len(records)} rejected hand histories to {path.name}")
+
+    def _sealed_segments(self) -> list[Path]:
+        return sorted(self._spool_dir.glob(f"*{SEALED_SUFFIX}"))
+
+    def _read_segment(self, segment: Path) -> list[dict[str, Any]]:
+        records = []
+        with open(segment, "rb") as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    records.append(json_loads(line))
+                except ValueError:
+                    # Torn write from a crash mid-append
+                    logger.warning(f"Skipping corrupt spool line {segment.name}:{line_no}")
+        return records
+
+    def _track_oldest(self, enqueued_at: float) -> None:
+        if self._oldest_enqueued_at is None or enqueued_at < self._oldest_enqueued_at:
+            self._oldest_enqueued_at = enqueued_at
+
+    def _refresh_oldest(self) -> None:
+        """Recompute the oldest pending hand after segments were flushed."""
+        self._oldest_enqueued_at = None
+        if self._pending == 0:
+            return
+        for segment in self._sealed_segments():
+            records = self._read_segment(segment)
+            if records:
+                self._track_oldest(records[0]["enqueued_at"])
+                return
+        if self._active_first_enqueued_at is not None:
+            self._track_oldest(self._active_first_enqueued_at)
+
+    def _claim_slot(self) -> None:
+        """Lock the first free worker-<n> directory under the spool root."""
+        for n in itertools.count():
+            slot = self._spool_root / f"worker-{n}"
+            slot.mkdir(parents=True, exist_ok=True)
+            lock_file = open(slot / LOCK_FILE, "w")
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                lock_file.close()
+                continue
+            self._lock_file = lock_file
+            self._spool_dir = slot
+            return
+
+    def _release_slot(self) -> None:
+        if self._lock_file is not None:
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+            self._lock_file.close()
+            self._lock_file = None
+
+
+# Global queue instance
+_hand_history_queue: HandHistoryQueue | None = None
+
+
+def get_hand_history_queue() -> HandHistoryQueue | None:
+    """Get the global HandHistoryQueue instance."""
+    return _hand_history_queue
+
+
+async def init_hand_history_queue() -> HandHistoryQueue:
+    """Create and start the global HandHistoryQueue instance.
+
+    Returns:
+        Started HandHistoryQueue
+    """
+    global _hand_history_queue
+    settings = get_settings()
+    _hand_history_queue = HandHistoryQueue(
+        spool_dir=settings.hand_history_spool_dir,
+        flush_interval=settings.hand_history_flush_interval,
+        batch_size=settings.hand_history_flush_batch,
+    )
+    await _hand_history_queue.start()
+    return _hand_history_queue
+
+
+async def shutdown_hand_history_queue() -> None:
+    """Flush and stop the global HandHistoryQueue instance."""
+    global _hand_history_queue
+    if _hand_history_queue is not None:
+        await _hand_history_queue.stop()
+        _hand_history_queue = None
@@ -21,7 +21,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.rake import RakeConfig
 from app.models.wallet import TransactionType
-from app.services.wallet import WalletService
+from app.services.wallet import LedgerEntry, WalletService
 
 if TYPE_CHECKING:
     from app.engine.state import GamePhase, HandResult
@@ -312,7 +312,8 @@ class RakeService:
         if rake_result.total_rake <= 0:
             return []
         
-        transactions = []
+        collected = []
+        entries = []
         
         for position, rake_amount in rake_result.rake_per_winner.items():
             user_id = position_to_user_id.get(position)
@@ -321,29 +322,40 @@ class RakeService:
                     f"No user_id for position {position}, skipping rake"
                 )
                 continue
+            if rake_amount <= 0:
+                continue
             
-            try:
-                tx = await self._wallet_service.deduct_rake(
-                    user_id=user_id,
-                    amount=rake_amount,
-                    table_id=table_id,
-                    hand_id=hand_id,
-                )
-                if tx:
-                    transactions.append({
-                        "user_id": user_id,
-                        "position": position,
-                        "amount": rake_amount,
-                        "transaction_id": tx.id,
-                    })
-                    logger.info(
-                        f"Rake collected: user={user_id[:8]}... "
-                        f"amount={rake_amount:,} KRW"
-                    )
-            except Exception as e:
-                logger.error(
-                    f"Failed to collect rake from user {user_id}: {e}"
-                )
+            collected.append((user_id, position, rake_amount))
+            entries.append(LedgerEntry.rake(user_id, rake_amount))
+        
+        if not entries:
+            return []
+        
+        # 모든 승자의 레이크를 한 번에 정산 (원자적: 전부 기록되거나 전부 실패)
+        try:
+            txs = await self._wallet_service.settle_hand(
+                table_id=table_id,
+                hand_id=hand_id,
+                entries=entries,
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to collect rake for hand {hand_id}: {e}"
+            )
+            return []
+        
+        transactions = []
+        for (user_id, position, rake_amount), tx in zip(collected, txs):
+            transactions.append({
+                "user_id": user_id,
+                "position": position,
+                "amount": rake_amount,
+                "transaction_id": tx.id,
+            })
+            logger.info(
+                f"Rake collected: user={user_id[:8]}... "
+                f"amount={rake_amount:,} KRW"
+            )
         
         return transactions
     
@@ -515,7 +515,7 @@ class RoomService:
                         total_refunded += player.stack
 
             # GameManager에서 테이블 제거
-            game_manager.remove_table(room_id)
+            await game_manager.remove_table(room_id)
         else:
             # GameManager에 없으면 DB seats 기준으로 환불
             for pos, seat_data in seats.items():
@@ -11,19 +11,227 @@
 - WSD: Won at Showdown (쇼다운에서 승리한 비율)
 - Win Rate: 승률
 - BB/100: 100핸드당 Big Blind 수익
+
+지표의 원본 카운터는 player_stat_counters 테이블에 사전 집계됩니다.
+핸드 저장 시 record_hand()로 증분 업데이트하고, rebuild_counters()로
+hand_participants / hand_events에서 재구축(backfill)합니다.
+카운터 행이 없는 사용자는 첫 핸드 저장 시 전체 기록에서 재구축되므로
+부분 집계 행이 생기지 않고, 그 전의 조회는 원본에서 계산합니다 (쓰기 없음).
 """
 
 import logging
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
+from uuid import UUID
 
 from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.hand import HandParticipant
+from app.models.player_stats import PlayerStatCounters
 
 logger = logging.getLogger(__name__)
 
+# 프리플롭 자발적 참여 / 레이즈 액션
+VPIP_ACTIONS = frozenset({"call", "bet", "raise", "all_in"})
+PFR_ACTIONS = frozenset({"bet", "raise"})
+
+# 공격성 지표 대상 액션 (전체 스트리트)
+AGGRESSION_ACTIONS = frozenset({"bet", "raise", "call", "check", "fold"})
+
+# 증분 업데이트 시 더해지는 카운터 (biggest_pot은 최대값)
+ADDITIVE_COUNTERS = (
+    "total_hands",
+    "hands_won",
+    "total_winnings",
+    "vpip_hands",
+    "pfr_hands",
+    "three_bet_hands",
+    "bets",
+    "raises",
+    "calls",
+    "checks",
+    "total_actions",
+    "showdown_hands",
+    "won_showdowns",
+)
+COUNTER_COLUMNS = ADDITIVE_COUNTERS + ("biggest_pot",)
+
+# hand_participants / hand_events → 사용자별 카운터
+# hand_stat_counters()와 같은 규칙을 집합 연산으로 적용합니다.
+_COUNTERS_CTE_SQL = """
+    WITH scoped AS (
+        SELECT hp.user_id, hp.hand_id, hp.bet_amount, hp.won_amount, hp.final_action
+        FROM hand_participants hp
+        {user_filter}
+    ),
+    flops AS (
+        SELECT he.hand_id, MIN(he.seq_no) AS flop_seq
+        FROM hand_events he
+        WHERE he.event_type = 'deal_flop'
+          AND he.hand_id IN (SELECT hand_id FROM scoped)
+        GROUP BY he.hand_id
+    ),
+    preflop_raises AS (
+        SELECT he.hand_id, COUNT(*) AS raise_count
+        FROM hand_events he
+        LEFT JOIN flops f ON f.hand_id = he.hand_id
+        WHERE he.event_type IN ('bet', 'raise')
+          AND he.hand_id IN (SELECT hand_id FROM scoped)
+          AND (f.flop_seq IS NULL OR he.seq_no < f.flop_seq)
+        GROUP BY he.hand_id
+    ),
+    user_hand_actions AS (
+        SELECT
+            s.user_id,
+            s.hand_id,
+            BOOL_OR(he.event_type IN ('call', 'bet', 'raise', 'all_in')
+                    AND (f.flop_seq IS NULL OR he.seq_no < f.flop_seq)) AS vpip,
+            BOOL_OR(he.event_type IN ('bet', 'raise')
+                    AND (f.flop_seq IS NULL OR he.seq_no < f.flop_seq)) AS pfr,
+            BOOL_OR(he.event_type = 'raise'
+                    AND (f.flop_seq IS NULL OR he.seq_no < f.flop_seq)
+                    AND COALESCE(pr.raise_count, 0) >= 2) AS three_bet,
+            COUNT(*) FILTER (WHERE he.event_type = 'bet') AS bets,
+            COUNT(*) FILTER (WHERE he.event_type = 'raise') AS raises,
+            COUNT(*) FILTER (WHERE he.event_type = 'call') AS calls,
+            COUNT(*) FILTER (WHERE he.event_type = 'check') AS checks,
+            COUNT(*) FILTER (
+                WHERE he.event_type IN ('bet', 'raise', 'call', 'check', 'fold')
+            ) AS total_actions
+        FROM scoped s
+        JOIN hand_events he
+          ON he.hand_id = s.hand_id
+         AND (he.payload->>'user_id') = CAST(s.user_id AS text)
+        LEFT JOIN flops f ON f.hand_id = s.hand_id
+        LEFT JOIN preflop_raises pr ON pr.hand_id = s.hand_id
+        GROUP BY s.user_id, s.hand_id
+    )
+"""
+_COUNTERS_SELECT_SQL = """
+    SELECT
+        s.user_id,
+        COUNT(*) AS total_hands,
+        COUNT(*) FILTER (WHERE s.won_amount > 0) AS hands_won,
+        COALESCE(SUM(s.won_amount - s.bet_amount), 0) AS total_winnings,
+        COALESCE(MAX(s.won_amount), 0) AS biggest_pot,
+        COUNT(*) FILTER (WHERE a.vpip) AS vpip_hands,
+        COUNT(*) FILTER (WHERE a.pfr) AS pfr_hands,
+        COUNT(*) FILTER (WHERE a.three_bet) AS three_bet_hands,
+        COALESCE(SUM(a.bets), 0) AS bets,
+        COALESCE(SUM(a.raises), 0) AS raises,
+        COALESCE(SUM(a.calls), 0) AS calls,
+        COALESCE(SUM(a.checks), 0) AS checks,
+        COALESCE(SUM(a.total_actions), 0) AS total_actions,
+        COUNT(*) FILTER (WHERE s.final_action = 'showdown') AS showdown_hands,
+        COUNT(*) FILTER (WHERE s.final_action = 'showdown' AND s.won_amount > 0) AS won_showdowns,
+        now() AS updated_at
+    FROM scoped s
+    LEFT JOIN user_hand_actions a ON a.user_id = s.user_id AND a.hand_id = s.hand_id
+    GROUP BY s.user_id
+"""
+
+# 카운터 행이 없는 사용자 조회용 (쓰기 없음)
+_READ_COUNTERS_SQL = _COUNTERS_CTE_SQL + _COUNTERS_SELECT_SQL
+
+# player_stat_counters 재구축 (기존 행은 덮어씀)
+_REBUILD_COUNTERS_SQL = _COUNTERS_CTE_SQL + """
+    INSERT INTO player_stat_counters (
+        user_id, total_hands, hands_won, total_winnings, biggest_pot,
+        vpip_hands, pfr_hands, three_bet_hands,
+        bets, raises, calls, checks, total_actions,
+        showdown_hands, won_showdowns, updated_at
+    )
+""" + _COUNTERS_SELECT_SQL + """
+    ON CONFLICT (user_id) DO UPDATE SET
+        {overwrite}
+"""
+
+
+def _user_filter(user_ids: Iterable[str] | None) -> tuple[str, dict[str, Any]]:
+    """카운터 집계 SQL의 사용자 조건과 파라미터 (None이면 전체)."""
+    if user_ids is None:
+        return "", {}
+    return (
+        "WHERE hp.user_id = ANY(CAST(:user_ids AS uuid[]))",
+        {"user_ids": list(user_ids)},
+    )
+
+
+def is_registered_user_id(user_id: Any) -> bool:
+    """users 테이블의 사용자 ID(UUID)인지 확인.
+
+    봇(livebot_*, bot_* 등)은 UUID가 아니며 users에 없으므로 통계와
+    hand_participants 저장에서 제외합니다.
+    """
+    if not user_id:
+        return False
+    try:
+        UUID(str(user_id))
+    except ValueError:
+        return False
+    return True
+
+
+def hand_stat_counters(
+    user_id: str,
+    participant: dict[str, Any],
+    events: Iterable[dict[str, Any]],
+) -> dict[str, int]:
+    """핸드 하나가 사용자 카운터에 더하는 값.
+
+    Args:
+        user_id: 사용자 ID
+        participant: 참가자 정보 (bet_amount, won_amount, final_action)
+        events: 핸드 이벤트 목록 (event_type, payload, seq_no)
+
+    Returns:
+        COUNTER_COLUMNS 키를 가진 딕셔너리
+    """
+    ordered = sorted(events, key=lambda e: e.get("seq_no", 0))
+
+    preflop_types: set[str] = set()
+    preflop_raises = 0
+    counts = dict.fromkeys(AGGRESSION_ACTIONS, 0)
+    preflop = True
+
+    for event in ordered:
+        event_type = event.get("event_type")
+        if event_type == "deal_flop":
+            preflop = False
+            continue
+
+        is_user = str((event.get("payload") or {}).get("user_id")) == str(user_id)
+        if preflop:
+            if event_type in PFR_ACTIONS:
+                preflop_raises += 1
+            if is_user:
+                preflop_types.add(event_type)
+        if is_user and event_type in counts:
+            counts[event_type] += 1
+
+    bet_amount = participant.get("bet_amount", 0)
+    won_amount = participant.get("won_amount", 0)
+    is_showdown = participant.get("final_action") == "showdown"
+
+    return {
+        "total_hands": 1,
+        "hands_won": int(won_amount > 0),
+        "total_winnings": won_amount - bet_amount,
+        "biggest_pot": won_amount,
+        "vpip_hands": int(bool(preflop_types & VPIP_ACTIONS)),
+        "pfr_hands": int(bool(preflop_types & PFR_ACTIONS)),
+        "three_bet_hands": int("raise" in preflop_types and preflop_raises >= 2),
+        "bets": counts["bet"],
+        "raises": counts["raise"],
+        "calls": counts["call"],
+        "checks": counts["check"],
+        "total_actions": sum(counts.values()),
+        "showdown_hands": int(is_showdown),
+        "won_showdowns": int(is_showdown and won_amount > 0),
+    }
+
 
 @dataclass
 class PlayerStats:
@@ -65,42 +273,41 @@ class StatisticsService:
     async def get_player_stats(self, user_id: str) -> PlayerStats:
         """플레이어 전체 통계 조회.
 
+        사전 집계된 player_stat_counters 한 행만 읽습니다 (쓰기 없음).
+        카운터 행이 아직 없는 사용자(backfill 전)는 hand_participants /
+        hand_events에서 같은 규칙으로 계산합니다. 행은 다음 핸드 저장이나
+        backfill 작업이 채웁니다.
+
         Args:
             user_id: 사용자 ID
 
         Returns:
             PlayerStats 객체
         """
-        stats = PlayerStats()
-
-        # 기본 통계 조회
-        basic = await self._get_basic_stats(user_id)
-        stats.total_hands = basic["total_hands"]
-        stats.total_winnings = basic["total_winnings"]
-        stats.hands_won = basic["hands_won"]
-        stats.biggest_pot = basic["biggest_pot"]
-
-        # VPIP, PFR 계산
-        preflop = await self._get_preflop_stats(user_id)
-        stats.vpip = preflop["vpip"]
-        stats.pfr = preflop["pfr"]
-        stats.three_bet = preflop["three_bet"]
-
-        # 공격성 지표
-        aggression = await self._get_aggression_stats(user_id)
-        stats.af = aggression["af"]
-        stats.agg_freq = aggression["agg_freq"]
-
-        # 쇼다운 통계
-        showdown = await self._get_showdown_stats(user_id)
-        stats.wtsd = showdown["wtsd"]
-        stats.wsd = showdown["wsd"]
-
-        # 수익성 지표
-        if stats.total_hands > 0:
-            stats.win_rate = round(stats.hands_won / stats.total_hands * 100, 1)
-
-        return stats
+        if not is_registered_user_id(user_id):
+            return PlayerStats()
+
+        counters = await self.db.get(PlayerStatCounters, user_id)
+        if counters is None:
+            counters = await self._counters_from_hands(user_id)
+            if counters is None:
+                return PlayerStats()
+
+        return self._stats_from_counters(counters)
+
+    async def _counters_from_hands(self, user_id: str) -> PlayerStatCounters | None:
+        """원본 핸드 기록에서 카운터 계산 (세션에 추가하지 않음)."""
+        user_filter, params = _user_filter([user_id])
+        result = await self.db.execute(
+            text(_READ_COUNTERS_SQL.format(user_filter=user_filter)), params
+        )
+        row = result.mappings().first()
+        if row is None:
+            return None
+        return PlayerStatCounters(
+            user_id=str(row["user_id"]),
+            **{name: row[name] for name in COUNTER_COLUMNS},
+        )
 
     async def get_stats_summary(self, user_id: str) -> dict[str, Any]:
         """통계 요약 (API용).
@@ -141,192 +348,136 @@ class StatisticsService:
             "playStyle": self._analyze_play_style(stats),
         }
 
-    async def _get_basic_stats(self, user_id: str) -> dict[str, int]:
-        """기본 통계 (핸드 수, 승리 수, 수익)."""
-        # 총 핸드 수
-        total_result = await self.db.execute(
-            select(func.count(HandParticipant.id))
-            .where(HandParticipant.user_id == user_id)
-        )
-        total_hands = total_result.scalar() or 0
-
-        # 승리 핸드 수
-        won_result = await self.db.execute(
-            select(func.count(HandParticipant.id))
-            .where(HandParticipant.user_id == user_id)
-            .where(HandParticipant.won_amount > 0)
-        )
-        hands_won = won_result.scalar() or 0
-
-        # 총 수익
-        winnings_result = await self.db.execute(
-            select(func.sum(HandParticipant.won_amount - HandParticipant.bet_amount))
-            .where(HandParticipant.user_id == user_id)
-        )
-        total_winnings = winnings_result.scalar() or 0
+    async def record_hand(
+        self,
+        participants: list[dict[str, Any]],
+        events: list[dict[str, Any]],
+    ) -> None:
+        """완료된 핸드를 참가자별 카운터에 증분 반영.
 
-        # 가장 큰 팟
-        biggest_result = await self.db.execute(
-            select(func.max(HandParticipant.won_amount))
-            .where(HandParticipant.user_id == user_id)
-        )
-        biggest_pot = biggest_result.scalar() or 0
+        호출자의 트랜잭션 안에서 실행되며 커밋하지 않습니다.
 
-        return {
-            "total_hands": total_hands,
-            "hands_won": hands_won,
-            "total_winnings": total_winnings,
-            "biggest_pot": biggest_pot,
-        }
+        Args:
+            participants: 참가자 목록 (user_id, bet_amount, won_amount, final_action)
+            events: 핸드 이벤트 목록 (event_type, payload, seq_no)
+        """
+        await self.record_hands([(participants, events)])
+
+    async def record_hands(
+        self,
+        hands: Iterable[tuple[list[dict[str, Any]], list[dict[str, Any]]]],
+    ) -> None:
+        """여러 핸드를 한 번의 upsert로 카운터에 증분 반영.
+
+        같은 사용자의 값은 먼저 합산(biggest_pot은 최대값)해 사용자당 한 행만
+        씁니다. 모든 사용자는 INSERT ... ON CONFLICT DO UPDATE 증분으로 먼저
+        쓰므로, 같은 신규 사용자의 첫 저장이 동시에 일어나도 행 잠금으로
+        직렬화되어 카운트가 유실되지 않습니다. 카운터 행이 없던 사용자는 그
+        행 잠금을 잡은 상태에서 hand_participants / hand_events 전체로
+        재구축하므로, 호출자는 이 핸드들의 행을 먼저 같은 트랜잭션에 써야
+        합니다. 봇 등 UUID가 아닌 ID는 건너뜁니다.
+        호출자의 트랜잭션 안에서 실행되며 커밋하지 않습니다.
 
-    async def _get_preflop_stats(self, user_id: str) -> dict[str, float]:
-        """프리플롭 통계 (VPIP, PFR, 3Bet)."""
-        query = text("""
-            WITH user_hands AS (
-                SELECT DISTINCT hp.hand_id
-                FROM hand_participants hp
-                WHERE hp.user_id = :user_id
-            ),
-            preflop_actions AS (
-                SELECT
-                    he.hand_id,
-                    he.event_type,
-                    (he.payload->>'user_id') as action_user_id,
-                    he.seq_no
-                FROM hand_events he
-                JOIN user_hands uh ON he.hand_id = uh.hand_id
-                WHERE he.event_type IN ('call', 'bet', 'raise', 'all_in', 'post_blind')
-                  AND (
-                      NOT EXISTS (
-                          SELECT 1 FROM hand_events 
-                          WHERE hand_id = he.hand_id AND event_type = 'deal_flop'
-                      )
-                      OR he.seq_no < (
-                          SELECT MIN(seq_no) FROM hand_events
-                          WHERE hand_id = he.hand_id AND event_type = 'deal_flop'
-                      )
-                  )
-            ),
-            raise_counts AS (
-                SELECT hand_id, COUNT(*) as raise_count
-                FROM preflop_actions
-                WHERE event_type IN ('raise', 'bet')
-                GROUP BY hand_id
+        Args:
+            hands: (participants, events) 튜플 목록
+        """
+        rows: dict[str, dict[str, Any]] = {}
+        for participants, events in hands:
+            for participant in participants:
+                user_id = participant.get("user_id")
+                if not is_registered_user_id(user_id):
+                    continue
+                user_id = str(user_id)
+                counters = hand_stat_counters(user_id, participant, events)
+                row = rows.get(user_id)
+                if row is None:
+                    rows[user_id] = {"user_id": user_id, **counters}
+                    continue
+                for name in ADDITIVE_COUNTERS:
+                    row[name] += counters[name]
+                row["biggest_pot"] = max(row["biggest_pot"], counters["biggest_pot"])
+
+        if not rows:
+            return
+
+        result = await self.db.execute(
+            select(PlayerStatCounters.user_id).where(
+                PlayerStatCounters.user_id.in_(list(rows))
             )
-            SELECT
-                -- VPIP: 자발적으로 팟에 돈 넣은 핸드
-                COUNT(DISTINCT CASE
-                    WHEN pa.action_user_id = CAST(:user_id AS text)
-                         AND pa.event_type IN ('call', 'bet', 'raise', 'all_in')
-                    THEN pa.hand_id
-                END) as vpip_hands,
-                -- PFR: 프리플롭 레이즈 핸드
-                COUNT(DISTINCT CASE
-                    WHEN pa.action_user_id = CAST(:user_id AS text)
-                         AND pa.event_type IN ('bet', 'raise')
-                    THEN pa.hand_id
-                END) as pfr_hands,
-                -- 3Bet: 레이즈 후 다시 레이즈
-                COUNT(DISTINCT CASE
-                    WHEN pa.action_user_id = CAST(:user_id AS text)
-                         AND pa.event_type = 'raise'
-                         AND rc.raise_count >= 2
-                    THEN pa.hand_id
-                END) as three_bet_hands,
-                (SELECT COUNT(*) FROM user_hands) as total_hands
-            FROM preflop_actions pa
-            LEFT JOIN raise_counts rc ON pa.hand_id = rc.hand_id
-        """)
-
-        result = await self.db.execute(query, {"user_id": user_id})
-        row = result.fetchone()
-
-        if not row or row.total_hands == 0:
-            return {"vpip": 0.0, "pfr": 0.0, "three_bet": 0.0}
+        )
+        existing = {str(user_id) for user_id in result.scalars().all()}
+        missing = sorted(set(rows) - existing)
 
-        return {
-            "vpip": round(row.vpip_hands / row.total_hands * 100, 1),
-            "pfr": round(row.pfr_hands / row.total_hands * 100, 1),
-            "three_bet": round(row.three_bet_hands / row.total_hands * 100, 1),
+        # user_id 순으로 잠가 동시 핸드 저장 간 데드락 방지
+        stmt = insert(PlayerStatCounters).values(
+            [rows[user_id] for user_id in sorted(rows)]
+        )
+        update_values: dict[str, Any] = {
+            name: getattr(PlayerStatCounters, name) + getattr(stmt.excluded, name)
+            for name in ADDITIVE_COUNTERS
         }
+        update_values["biggest_pot"] = func.greatest(
+            PlayerStatCounters.biggest_pot, stmt.excluded.biggest_pot
+        )
+        update_values["updated_at"] = func.now()
 
-    async def _get_aggression_stats(self, user_id: str) -> dict[str, float]:
-        """공격성 통계 (AF, Aggression Frequency)."""
-        query = text("""
-            WITH user_actions AS (
-                SELECT
-                    he.event_type,
-                    COUNT(*) as action_count
-                FROM hand_events he
-                JOIN hand_participants hp ON he.hand_id = hp.hand_id
-                WHERE hp.user_id = :user_id
-                  AND (he.payload->>'user_id') = CAST(:user_id AS text)
-                  AND he.event_type IN ('bet', 'raise', 'call', 'check', 'fold')
-                GROUP BY he.event_type
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[PlayerStatCounters.user_id],
+                set_=update_values,
             )
-            SELECT
-                COALESCE(SUM(CASE WHEN event_type = 'bet' THEN action_count ELSE 0 END), 0) as bets,
-                COALESCE(SUM(CASE WHEN event_type = 'raise' THEN action_count ELSE 0 END), 0) as raises,
-                COALESCE(SUM(CASE WHEN event_type = 'call' THEN action_count ELSE 0 END), 0) as calls,
-                COALESCE(SUM(CASE WHEN event_type = 'check' THEN action_count ELSE 0 END), 0) as checks,
-                COALESCE(SUM(action_count), 0) as total_actions
-            FROM user_actions
-        """)
-
-        result = await self.db.execute(query, {"user_id": user_id})
-        row = result.fetchone()
-
-        if not row or row.total_actions == 0:
-            return {"af": 0.0, "agg_freq": 0.0}
-
-        bets = row.bets or 0
-        raises = row.raises or 0
-        calls = row.calls or 0
-        total = row.total_actions or 1
-
-        # Aggression Factor = (Bets + Raises) / Calls
-        af = (bets + raises) / calls if calls > 0 else (bets + raises)
-        
-        # Aggression Frequency = (Bets + Raises) / Total Actions
-        agg_freq = (bets + raises) / total * 100 if total > 0 else 0
+        )
 
-        return {
-            "af": round(af, 2),
-            "agg_freq": round(agg_freq, 1),
-        }
+        if missing:
+            # 행 잠금을 잡은 상태에서 이전 기록까지 포함해 재구축 (부분 집계 행 방지)
+            await self.rebuild_counters(missing)
 
-    async def _get_showdown_stats(self, user_id: str) -> dict[str, float]:
-        """쇼다운 통계 (WTSD, WSD)."""
-        query = text("""
-            WITH user_hands AS (
-                SELECT hp.hand_id, hp.won_amount, hp.final_action
-                FROM hand_participants hp
-                WHERE hp.user_id = :user_id
-            ),
-            showdown_hands AS (
-                SELECT uh.hand_id, uh.won_amount
-                FROM user_hands uh
-                WHERE uh.final_action = 'showdown'
-            )
-            SELECT
-                (SELECT COUNT(*) FROM user_hands) as total_hands,
-                (SELECT COUNT(*) FROM showdown_hands) as showdown_hands,
-                (SELECT COUNT(*) FROM showdown_hands WHERE won_amount > 0) as won_showdowns
-        """)
+    async def rebuild_counters(self, user_ids: list[str] | None = None) -> None:
+        """hand_participants / hand_events에서 카운터 재구축 (backfill).
 
-        result = await self.db.execute(query, {"user_id": user_id})
-        row = result.fetchone()
+        기존 행은 재계산 값으로 덮어씁니다. 호출자가 커밋합니다.
 
-        if not row or row.total_hands == 0:
-            return {"wtsd": 0.0, "wsd": 0.0}
+        Args:
+            user_ids: 재구축할 사용자 ID 목록 (None이면 전체)
+        """
+        user_filter, params = _user_filter(user_ids)
+        overwrite = ",\n        ".join(
+            f"{name} = EXCLUDED.{name}" for name in (*COUNTER_COLUMNS, "updated_at")
+        )
+        query = text(
+            _REBUILD_COUNTERS_SQL.format(user_filter=user_filter, overwrite=overwrite)
+        )
+        await self.db.execute(query, params)
+
+    def _stats_from_counters(self, counters: PlayerStatCounters) -> PlayerStats:
+        """카운터로부터 비율 지표 계산."""
+        stats = PlayerStats(
+            total_hands=counters.total_hands,
+            total_winnings=counters.total_winnings,
+            hands_won=counters.hands_won,
+            biggest_pot=counters.biggest_pot,
+        )
 
-        wtsd = row.showdown_hands / row.total_hands * 100 if row.total_hands > 0 else 0
-        wsd = row.won_showdowns / row.showdown_hands * 100 if row.showdown_hands > 0 else 0
+        total_hands = counters.total_hands
+        if total_hands > 0:
+            stats.vpip = round(counters.vpip_hands / total_hands * 100, 1)
+            stats.pfr = round(counters.pfr_hands / total_hands * 100, 1)
+            stats.three_bet = round(counters.three_bet_hands / total_hands * 100, 1)
+            stats.wtsd = round(counters.showdown_hands / total_hands * 100, 1)
+            stats.win_rate = round(counters.hands_won / total_hands * 100, 1)
+
+        if counters.showdown_hands > 0:
+            stats.wsd = round(counters.won_showdowns / counters.showdown_hands * 100, 1)
+
+        if counters.total_actions > 0:
+            aggressive = counters.bets + counters.raises
+            # Aggression Factor = (Bets + Raises) / Calls
+            af = aggressive / counters.calls if counters.calls > 0 else aggressive
+            # Aggression Frequency = (Bets + Raises) / Total Actions
+            stats.af = round(af, 2)
+            stats.agg_freq = round(aggressive / counters.total_actions * 100, 1)
 
-        return {
-            "wtsd": round(wtsd, 1),
-            "wsd": round(wsd, 1),
-        }
+        return stats
 
     def _analyze_play_style(self, stats: PlayerStats) -> dict[str, Any]:
         """플레이 스타일 분석.
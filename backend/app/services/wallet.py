@@ -4,6 +4,7 @@ Phase 5.7: Core wallet service for balance management.
 
 Features:
 - Atomic KRW transfers (buy-in, cash-out)
+- Batched hand settlement (wins + rake in one ledger write)
 - Distributed locking for concurrent safety
 - Full transaction logging with integrity hash
 - Redis caching for balance lookups
@@ -13,10 +14,12 @@ from __future__ import annotations
 
 import hashlib
 import logging
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 from uuid import uuid4
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
@@ -53,6 +56,32 @@ class InsufficientBalanceError(WalletError):
         self.required = required
 
 
+@dataclass(frozen=True)
+class LedgerEntry:
+    """Single balance change within a hand settlement.
+
+    Attributes:
+        user_id: User ID
+        amount: Amount (positive = credit, negative = debit)
+        tx_type: Transaction type for logging
+        description: Optional description
+    """
+    user_id: str
+    amount: int
+    tx_type: TransactionType
+    description: str | None = None
+
+    @classmethod
+    def win(cls, user_id: str, amount: int) -> LedgerEntry:
+        """Pot winnings credit."""
+        return cls(user_id, amount, TransactionType.WIN, f"Pot won: {amount:,} KRW")
+
+    @classmethod
+    def rake(cls, user_id: str, amount: int) -> LedgerEntry:
+        """Rake debit (amount is positive, will be debited)."""
+        return cls(user_id, -amount, TransactionType.RAKE, f"Rake deducted: {amount:,} KRW")
+
+
 class WalletService:
     """Wallet service for KRW balance operations.
 
@@ -69,6 +98,7 @@ class WalletService:
 
     # Load Lua script
     LUA_SCRIPT: str | None = None
+    SETTLE_LUA_SCRIPT: str | None = None
 
     @classmethod
     def _load_lua_script(cls) -> str:
@@ -79,6 +109,15 @@ class WalletService:
                 cls.LUA_SCRIPT = f.read()
         return cls.LUA_SCRIPT
 
+    @classmethod
+    def _load_settle_script(cls) -> str:
+        """Load hand settlement Lua script from file."""
+        if cls.SETTLE_LUA_SCRIPT is None:
+            script_path = Path(__file__).parent.parent / "utils" / "lua_scripts" / "krw_settle.lua"
+            with open(script_path) as f:
+                cls.SETTLE_LUA_SCRIPT = f.read()
+        return cls.SETTLE_LUA_SCRIPT
+
     def __init__(self, session: AsyncSession) -> None:
         """Initialize wallet service."""
         self.session = session
@@ -282,6 +321,128 @@ class WalletService:
             except Exception as e:
                 logger.error(f"Lock release failed for user {user_id[:8]}...: {e}")
 
+    async def settle_hand(
+        self,
+        table_id: str,
+        hand_id: str,
+        entries: Sequence[LedgerEntry],
+    ) -> list[WalletTransaction]:
+        """Apply every balance change of a hand in one batch.
+
+        All wallets are locked with a single Lua call, users are loaded with
+        one SELECT and all ledger rows are flushed together, so the number
+        of round trips does not grow with the number of winners. Entries are
+        applied in order; either all of them are recorded or none.
+
+        Args:
+            table_id: Table ID
+            hand_id: Hand ID
+            entries: Balance changes (e.g. LedgerEntry.win / LedgerEntry.rake)
+
+        Returns:
+            WalletTransaction records in entry order
+
+        Raises:
+            InsufficientBalanceError: If a debit exceeds balance
+            WalletError: For other errors
+        """
+        entries = [entry for entry in entries if entry.amount != 0]
+        if not entries:
+            return []
+        if any(not entry.user_id for entry in entries):
+            raise WalletError("User ID is required", code="INVALID_USER_ID")
+
+        user_ids = sorted({entry.user_id for entry in entries})
+        keys = [f"{self.LOCK_KEY_PREFIX}{user_id}" for user_id in user_ids] + [
+            f"{self.BALANCE_KEY_PREFIX}{user_id}" for user_id in user_ids
+        ]
+        lock_token = str(uuid4())
+
+        redis = await self._get_redis()
+        script = redis.register_script(self._load_settle_script())
+
+        status, _ = await script(keys=keys, args=["acquire", lock_token, self.LOCK_TTL])
+        if int(status) != 1:
+            logger.warning(f"Lock contention settling hand {hand_id[:8]}...")
+            raise WalletError(
+                "Could not acquire wallet lock, try again",
+                code="LOCK_CONTENTION",
+            )
+
+        try:
+            result = await self.session.execute(
+                select(User).where(User.id.in_(user_ids))
+            )
+            users = {user.id: user for user in result.scalars().all()}
+
+            missing = [user_id for user_id in user_ids if user_id not in users]
+            if missing:
+                raise WalletError(f"User not found: {missing[0]}", code="USER_NOT_FOUND")
+
+            # Validate and build all rows before touching any balance
+            balances = {user_id: users[user_id].krw_balance for user_id in user_ids}
+            transactions = []
+
+            for entry in entries:
+                balance_before = balances[entry.user_id]
+                if entry.amount < 0 and balance_before < abs(entry.amount):
+                    raise InsufficientBalanceError(
+                        current=balance_before,
+                        required=abs(entry.amount),
+                    )
+
+                balance_after = balance_before + entry.amount
+                balances[entry.user_id] = balance_after
+
+                transactions.append(WalletTransaction(
+                    id=str(uuid4()),
+                    user_id=entry.user_id,
+                    tx_type=entry.tx_type,
+                    status=TransactionStatus.COMPLETED,
+                    krw_amount=entry.amount,
+                    krw_balance_before=balance_before,
+                    krw_balance_after=balance_after,
+                    table_id=table_id,
+                    hand_id=hand_id,
+                    description=entry.description,
+                    integrity_hash=self._compute_integrity_hash(
+                        user_id=entry.user_id,
+                        tx_type=entry.tx_type,
+                        amount=entry.amount,
+                        balance_before=balance_before,
+                        balance_after=balance_after,
+                    ),
+                ))
+
+            for user_id, balance in balances.items():
+                users[user_id].krw_balance = balance
+            for entry in entries:
+                # Also update total_rake_paid for VIP calculation
+                if entry.tx_type == TransactionType.RAKE:
+                    users[entry.user_id].total_rake_paid_krw += abs(entry.amount)
+
+            self.session.add_all(transactions)
+            await self.session.flush()
+
+            logger.info(
+                "wallet_settle_hand",
+                extra={
+                    "hand_id": hand_id[:8],
+                    "users": len(user_ids),
+                    "entries": len(transactions),
+                    "net_amount": sum(entry.amount for entry in entries),
+                },
+            )
+
+            return transactions
+
+        finally:
+            # Release locks and invalidate cached balances in one call
+            try:
+                await script(keys=keys, args=["release", lock_token, self.LOCK_TTL])
+            except Exception as e:
+                logger.error(f"Lock release failed for hand {hand_id[:8]}...: {e}")
+
     async def buy_in(
         self,
         user_id: str,
@@ -345,6 +506,8 @@ class WalletService:
     ) -> WalletTransaction:
         """Record pot winnings.
 
+        For a whole hand (several winners and rake) use settle_hand().
+
         Args:
             user_id: User ID
             amount: Win amount (positive)
@@ -372,6 +535,8 @@ class WalletService:
     ) -> WalletTransaction:
         """Deduct rake from player.
 
+        For a whole hand (several winners and rake) use settle_hand().
+
         Args:
             user_id: User ID
             amount: Rake amount (positive, will be debited)
@@ -27,6 +27,7 @@ celery_app = Celery(
     include=[
         "app.tasks.rakeback",
         "app.tasks.fraud_detection",
+        "app.tasks.player_stats",
     ],
 )
 
@@ -0,0 +1,156 @@
+"""Player statistics backfill tasks.
+
+Rebuilds the materialized player_stat_counters table from hand_participants
+and hand_events. Celery Beat triggers it hourly, but it runs to completion
+only once: a Redis marker records the finished backfill and later runs are
+skipped. Pass force=True to rebuild again if counters drift (e.g. hands
+imported outside HandHistoryService).
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+
+from app.tasks.celery_app import celery_app
+
+logger = logging.getLogger(__name__)
+
+# Users rebuilt per transaction
+BACKFILL_BATCH_SIZE = 500
+
+# Set when a backfill has finished; scheduled runs are no-ops afterwards
+BACKFILL_DONE_KEY = "player_stats:backfill:done"
+# Prevents overlapping runs while a long backfill is still in progress
+BACKFILL_LOCK_KEY = "player_stats:backfill:lock"
+BACKFILL_LOCK_TTL = 6 * 3600
+
+
+@celery_app.task(
+    bind=True,
+    name="app.tasks.player_stats.backfill_player_stats_task",
+    max_retries=3,
+    default_retry_delay=300,  # 5 minutes
+)
+def backfill_player_stats_task(
+    self,
+    batch_size: int = BACKFILL_BATCH_SIZE,
+    force: bool = False,
+):
+    """Rebuild player_stat_counters for every user with hand history.
+
+    Args:
+        batch_size: Users rebuilt per transaction
+        force: Rebuild even if a backfill has already completed
+
+    Returns:
+        Summary dict with processing results
+    """
+    logger.info(f"Starting player stats backfill (attempt {self.request.retries + 1})")
+
+    result = asyncio.get_event_loop().run_until_complete(
+        _run_backfill_once(batch_size, force)
+    )
+
+    logger.info(f"Player stats backfill complete: {result}")
+    return result
+
+
+async def _run_backfill_once(batch_size: int, force: bool) -> dict:
+    """Run the backfill unless it already completed or is running elsewhere.
+
+    Args:
+        batch_size: Users rebuilt per transaction
+        force: Ignore the completion marker
+
+    Returns:
+        Summary dict with results
+    """
+    from redis.asyncio import Redis
+
+    from app.config import get_settings
+
+    redis = Redis.from_url(get_settings().redis_url)
+    try:
+        if not force and await redis.exists(BACKFILL_DONE_KEY):
+            return {"status": "skipped", "reason": "already_completed"}
+        if not await redis.set(BACKFILL_LOCK_KEY, "1", nx=True, ex=BACKFILL_LOCK_TTL):
+            return {"status": "skipped", "reason": "in_progress"}
+
+        try:
+            result = await _backfill_player_stats(batch_size)
+            if result["status"] == "success":
+                await redis.set(BACKFILL_DONE_KEY, result["processed_at"])
+            return result
+        finally:
+            await redis.delete(BACKFILL_LOCK_KEY)
+    finally:
+        await redis.aclose()
+
+
+async def _backfill_player_stats(batch_size: int) -> dict:
+    """Rebuild counters in user_id order, one transaction per batch.
+
+    Args:
+        batch_size: Users rebuilt per transaction
+
+    Returns:
+        Summary dict with results
+    """
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from app.config import get_settings
+    from app.services.statistics import StatisticsService
+
+    settings = get_settings()
+
+    engine = create_async_engine(settings.database_url)
+    async_session = sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+    total_users = 0
+    last_user_id = None
+
+    try:
+        while True:
+            async with async_session() as session:
+                # keyset pagination over users with hand history
+                query = "SELECT DISTINCT user_id FROM hand_participants"
+                params: dict = {"limit": batch_size}
+                if last_user_id is not None:
+                    query += " WHERE user_id > CAST(:after AS uuid)"
+                    params["after"] = last_user_id
+                query += " ORDER BY user_id LIMIT :limit"
+
+                result = await session.execute(text(query), params)
+                user_ids = [str(row.user_id) for row in result]
+                if not user_ids:
+                    break
+
+                await StatisticsService(session).rebuild_counters(user_ids)
+                await session.commit()
+
+                total_users += len(user_ids)
+                last_user_id = user_ids[-1]
+                logger.info(f"Rebuilt player stats for {total_users} users")
+
+        return {
+            "status": "success",
+            "total_users": total_users,
+            "processed_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    except Exception as e:
+        logger.error(f"Player stats backfill failed: {e}")
+        return {
+            "status": "error",
+            "error": str(e),
+            "total_users": total_users,
+            "processed_at": datetime.now(timezone.utc).isoformat(),
+        }
+    finally:
+        await engine.dispose()
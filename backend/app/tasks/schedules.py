@@ -50,6 +50,13 @@ CELERY_BEAT_SCHEDULE = {
         "options": {"queue": "analytics"},
     },
 
+    # One-time player stats backfill (no-op once the Redis marker is set)
+    "player-stats-backfill-hourly": {
+        "task": "app.tasks.player_stats.backfill_player_stats_task",
+        "schedule": crontab(minute=45),  # Every hour at :45
+        "options": {"queue": "analytics"},
+    },
+
     # ==========================================================================
     # Daily Tasks
     # ==========================================================================
@@ -126,6 +133,7 @@ CELERY_TASK_ROUTES = {
     # Analytics tasks (lower priority)
     "app.tasks.analytics.*": {"queue": "analytics"},
     "app.tasks.archive.*": {"queue": "analytics"},
+    "app.tasks.player_stats.*": {"queue": "analytics"},
     "app.tasks.reports.*": {"queue": "analytics"},
 
     # Maintenance tasks
@@ -265,11 +265,13 @@ async def start_tournament(tournament_id: str):
 async def get_ranking(
     tournament_id: str,
     top: int = Query(default=100, ge=1, le=500),
+    page: int = Query(default=1, ge=1),
 ):
     """
     실시간 순위 조회.
 
-    Redis Sorted Set 기반 O(log n) 성능.
+    Redis Sorted Set 기반 O(log n) 성능. top은 페이지 크기로 사용되며
+    구간과 집계는 랭킹 엔진 캐시에서 응답합니다.
     """
     engine = get_engine()
     state = engine.get_state(tournament_id)
@@ -279,7 +281,7 @@ async def get_ranking(
             status_code=status.HTTP_404_NOT_FOUND, detail="Tournament not found"
         )
 
-    entries = await engine.get_ranking(tournament_id, top)
+    entries = await engine.ranking.get_page(tournament_id, page, top)
     snapshot = await engine.ranking.get_snapshot(tournament_id)
 
     return RankingResponse(
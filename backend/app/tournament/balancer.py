@@ -95,6 +95,101 @@ class BalancingPlan:
         }
 
 
+class TableOccupancyIndex:
+    """
+    Bucketed table occupancy index.
+
+    테이블을 인원수별 버킷(0..max_seats)에 보관하고 가장 적은/많은 인원
+    버킷 위치를 유지:
+    - set_count/remove: O(1) (버킷 이동 + 최소/최대 포인터 보정은
+      좌석 수 이하 범위만 탐색)
+    - min_count/max_count/fullest/emptiest: O(1)
+    - total_players: 증분 합계
+    """
+
+    def __init__(self, max_seats: int = 9):
+        self._buckets: List[Set[str]] = [set() for _ in range(max_seats + 1)]
+        self._counts: Dict[str, int] = {}
+        self._min = 0
+        self._max = 0
+        self.total_players = 0
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, table_id: str) -> bool:
+        return table_id in self._counts
+
+    def count(self, table_id: str) -> int:
+        return self._counts.get(table_id, 0)
+
+    def counts(self) -> Dict[str, int]:
+        return dict(self._counts)
+
+    def set_count(self, table_id: str, count: int) -> None:
+        """Set player count of a table (adds the table if unknown)."""
+        if count >= len(self._buckets):
+            self._buckets.extend(set() for _ in range(count + 1 - len(self._buckets)))
+
+        previous = self._counts.get(table_id)
+        if previous == count:
+            return
+        if previous is not None:
+            self._buckets[previous].discard(table_id)
+            self.total_players -= previous
+
+        self._buckets[count].add(table_id)
+        self._counts[table_id] = count
+        self.total_players += count
+
+        if len(self._counts) == 1:
+            self._min = self._max = count
+        else:
+            self._min = min(self._min, count)
+            self._max = max(self._max, count)
+        self._fix_bounds()
+
+    def remove(self, table_id: str) -> None:
+        """Remove a table (broken/closed)."""
+        count = self._counts.pop(table_id, None)
+        if count is None:
+            return
+        self._buckets[count].discard(table_id)
+        self.total_players -= count
+        self._fix_bounds()
+
+    def _fix_bounds(self) -> None:
+        if not self._counts:
+            self._min = self._max = 0
+            return
+        while not self._buckets[self._min]:
+            self._min += 1
+        while not self._buckets[self._max]:
+            self._max -= 1
+
+    @property
+    def min_count(self) -> int:
+        return self._min
+
+    @property
+    def max_count(self) -> int:
+        return self._max
+
+    @property
+    def imbalance(self) -> int:
+        return self._max - self._min
+
+    def emptiest(self) -> Optional[str]:
+        """A table with the fewest players."""
+        bucket = self._buckets[self._min]
+        return next(iter(bucket)) if bucket else None
+
+    def fullest(self) -> Optional[str]:
+        """A table with the most players."""
+        bucket = self._buckets[self._max]
+        return next(iter(bucket)) if bucket else None
+
+
 class TableBalancer:
     """
     Tournament Table Balancing Engine.
@@ -102,9 +197,10 @@ class TableBalancer:
     밸런싱 알고리즘 상세:
     ─────────────────────────────────────────────────────────────────
 
-    1. 밸런싱 트리거:
-       - 핸드 종료 시 자동 체크
-       - 플레이어 탈락 시 즉시 체크
+    1. 밸런싱 트리거 (이벤트 기반, 폴링 없음):
+       - 핸드 종료/탈락으로 테이블 인원이 바뀌면 엔진이 update_tables()로
+         인원 인덱스를 갱신하고 needs_balancing()으로 O(1) 체크
+       - 핸드 진행 중이라 미뤄진 이동은 해당 테이블 핸드 종료 즉시 처리
        - 관리자 수동 트리거
 
     2. 밸런싱 조건:
@@ -143,6 +239,70 @@ class TableBalancer:
         # Pending moves (waiting for hand completion)
         self._pending_moves: Dict[str, List[PlayerMove]] = {}  # table_id -> moves
 
+        # Table occupancy per tournament
+        self._occupancy: Dict[str, TableOccupancyIndex] = {}
+
+    # =========================================================================
+    # Occupancy tracking
+    # =========================================================================
+
+    def track_state(self, state: TournamentState) -> TableOccupancyIndex:
+        """
+        Rebuild occupancy index from full state (start / recovery).
+
+        Returns:
+            New occupancy index for the tournament
+        """
+        index = TableOccupancyIndex(self.max_players)
+        for table in state.tables.values():
+            index.set_count(table.table_id, table.player_count)
+        self._occupancy[state.tournament_id] = index
+        return index
+
+    def update_tables(
+        self,
+        tournament_id: str,
+        tables: List[Tuple[str, Optional[TournamentTable]]],
+    ) -> None:
+        """
+        Apply seat count changes of specific tables.
+
+        Args:
+            tournament_id: Tournament ID
+            tables: (table_id, table or None if removed) pairs
+        """
+        index = self._occupancy.get(tournament_id)
+        if index is None:
+            return
+        for table_id, table in tables:
+            if table is None:
+                index.remove(table_id)
+            else:
+                index.set_count(table_id, table.player_count)
+
+    def forget(self, tournament_id: str) -> None:
+        """Drop occupancy index of a finished tournament."""
+        self._occupancy.pop(tournament_id, None)
+
+    def get_occupancy(self, tournament_id: str) -> Optional[TableOccupancyIndex]:
+        return self._occupancy.get(tournament_id)
+
+    def needs_balancing(self, state: TournamentState) -> bool:
+        """
+        O(1) check whether calculate_balancing_plan() can produce moves.
+
+        인덱스가 없으면 전체 상태로 새로 만듭니다.
+        """
+        index = self._occupancy.get(state.tournament_id) or self.track_state(state)
+
+        if len(index) <= 1 or index.total_players == 0:
+            return False
+        if index.total_players <= self.final_table_size:
+            return True
+        if index.min_count < self.min_players:
+            return True
+        return index.imbalance > 1
+
     def calculate_balancing_plan(
         self,
         state: TournamentState,
@@ -584,6 +744,10 @@ class TableBalancer:
         """Get pending moves for a table."""
         return self._pending_moves.get(table_id, [])
 
+    def clear_pending_moves(self, table_id: str) -> List[PlayerMove]:
+        """Remove and return pending moves for a table."""
+        return self._pending_moves.pop(table_id, [])
+
     def complete_move(self, move_id: str) -> None:
         """Mark move as completed."""
         for table_id in list(self._pending_moves.keys()):
@@ -9,7 +9,7 @@ import asyncio
 import random
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple, Callable
+from typing import Any, Dict, List, Optional, Set, Tuple, Callable
 from uuid import uuid4
 
 import redis.asyncio as redis
@@ -101,9 +101,12 @@ class TournamentEngine:
 
         # Background tasks
         self._blind_task: Optional[asyncio.Task] = None
-        self._balance_task: Optional[asyncio.Task] = None
         self._running = False
 
+        # Event-driven balancing (토너먼트별 실행 중 / 재실행 필요 표시)
+        self._balancing: Set[str] = set()
+        self._balance_dirty: Set[str] = set()
+
         # Callbacks for hand execution
         self._hand_started_callback: Optional[Callable] = None
         self._hand_completed_callback: Optional[Callable] = None
@@ -126,7 +129,6 @@ class TournamentEngine:
             logger.info(f"[RECOVERY] {recovered_count}개 토너먼트 자동 복구 완료")
 
         self._blind_task = asyncio.create_task(self._blind_level_loop())
-        self._balance_task = asyncio.create_task(self._balancing_loop())
 
     async def _recover_crashed_tournaments(self) -> int:
         """크래시된 토너먼트 자동 복구.
@@ -180,8 +182,6 @@ class TournamentEngine:
         self._running = False
         if self._blind_task:
             self._blind_task.cancel()
-        if self._balance_task:
-            self._balance_task.cancel()
         await self.event_bus.shutdown()
         await self.lock_manager.cleanup_all()
 
@@ -209,6 +209,7 @@ class TournamentEngine:
         )
 
         self._tournaments[config.tournament_id] = state
+        await self.event_bus.host_tournament(config.tournament_id)
 
         await self.event_bus.publish(
             TournamentEvent(
@@ -258,8 +259,7 @@ class TournamentEngine:
             )
 
             # Update state
-            new_players = dict(state.players)
-            new_players[user_id] = player
+            new_players = state.players.set(user_id, player)
 
             new_state = TournamentState(
                 tournament_id=state.tournament_id,
@@ -326,13 +326,12 @@ class TournamentEngine:
             tables = self._create_tables_and_seat_players(state)
 
             # Update player table assignments
-            new_players = dict(state.players)
-            for table in tables.values():
-                for seat_idx, user_id in enumerate(table.seats):
-                    if user_id and user_id in new_players:
-                        new_players[user_id] = new_players[user_id].at_table(
-                            table.table_id, seat_idx
-                        )
+            new_players = state.players.update(
+                (user_id, state.players[user_id].at_table(table.table_id, seat_idx))
+                for table in tables.values()
+                for seat_idx, user_id in enumerate(table.seats)
+                if user_id and user_id in state.players
+            )
 
             # Prepare shotgun start
             countdown = state.config.shotgun_countdown_seconds
@@ -363,6 +362,7 @@ class TournamentEngine:
             )
 
             self._tournaments[tournament_id] = new_state
+            self.balancer.track_state(new_state)
 
             # Emit start countdown event
             await self.event_bus.publish(
@@ -470,9 +470,11 @@ class TournamentEngine:
                 tables=state.tables,
                 total_prize_pool=state.total_prize_pool,
                 itm_threshold=state.itm_threshold,
+                active_count=state.active_count,
             )
 
             self._tournaments[tournament_id] = new_state
+            await self.snapshot.append_status_delta(new_state)
 
             # Start all tables simultaneously
             start_tasks = []
@@ -544,45 +546,43 @@ class TournamentEngine:
             if not state:
                 raise ValueError("Tournament not found")
 
-            new_players = dict(state.players)
+            # 변경된 플레이어만 모아서 반영 (나머지는 이전 상태와 구조 공유)
+            changed: Dict[str, TournamentPlayer] = {}
             active_count = state.active_player_count
 
             # Apply chip changes
             for user_id, new_chips in chip_changes.items():
-                if user_id in new_players:
-                    new_players[user_id] = new_players[user_id].with_chips(new_chips)
+                player = state.players.get(user_id)
+                if player:
+                    changed[user_id] = player.with_chips(new_chips)
 
             # Process eliminations
+            eliminations: List[Tuple[str, int]] = []
             for user_id in eliminated:
-                if user_id in new_players:
+                player = changed.get(user_id) or state.players.get(user_id)
+                if player:
                     active_count -= 1
-                    new_players[user_id] = new_players[user_id].eliminated(
-                        rank=active_count + 1
-                    )
-
-                    await self.event_bus.emit_player_eliminated(
-                        tournament_id,
-                        user_id,
-                        active_count + 1,
-                        eliminated_by=winners[0] if winners else None,
-                        table_id=table_id,
-                    )
+                    changed[user_id] = player.eliminated(rank=active_count + 1)
+                    eliminations.append((user_id, active_count + 1))
 
             # Update table state (hand complete)
-            new_tables = dict(state.tables)
-            table = new_tables.get(table_id)
+            new_tables = state.tables
+            table = state.tables.get(table_id)
             if table:
                 # Remove eliminated players from table
                 for user_id in eliminated:
                     if user_id:
                         table = table.with_player_removed(user_id)
-                new_tables[table_id] = TournamentTable(
-                    table_id=table.table_id,
-                    table_number=table.table_number,
-                    seats=table.seats,
-                    max_seats=table.max_seats,
-                    hand_in_progress=False,
-                    current_hand_id=None,
+                new_tables = state.tables.set(
+                    table_id,
+                    TournamentTable(
+                        table_id=table.table_id,
+                        table_number=table.table_number,
+                        seats=table.seats,
+                        max_seats=table.max_seats,
+                        hand_in_progress=False,
+                        current_hand_id=None,
+                    ),
                 )
 
             # Check for tournament completion
@@ -594,6 +594,7 @@ class TournamentEngine:
             elif active_count <= state.config.players_per_table:
                 new_status = TournamentStatus.FINAL_TABLE
 
+            new_players = state.players.update(changed)
             new_state = TournamentState(
                 tournament_id=state.tournament_id,
                 config=state.config,
@@ -611,9 +612,25 @@ class TournamentEngine:
                 ranking=state.ranking,
                 total_prize_pool=state.total_prize_pool,
                 itm_threshold=state.itm_threshold,
+                active_count=active_count,
             )
 
+            # 상태 읽기~저장 사이에 await 없음: 테이블 락만 잡은 다른 테이블의
+            # complete_hand와 겹쳐도 서로의 변경을 덮어쓰지 않음
             self._tournaments[tournament_id] = new_state
+            if table:
+                self.balancer.update_tables(
+                    tournament_id, [(table_id, new_tables.get(table_id))]
+                )
+
+            for user_id, rank in eliminations:
+                await self.event_bus.emit_player_eliminated(
+                    tournament_id,
+                    user_id,
+                    rank,
+                    eliminated_by=winners[0] if winners else None,
+                    table_id=table_id,
+                )
 
             # Update ranking
             ranking_updates = [
@@ -622,10 +639,19 @@ class TournamentEngine:
                 if uid in new_players
             ]
             await self.ranking.update_batch(tournament_id, ranking_updates)
+            for user_id, rank in eliminations:
+                await self.ranking.eliminate_player(tournament_id, user_id, rank)
+
+            # 변경된 테이블/플레이어만 델타 로그에 기록
+            await self.snapshot.append_table_delta(new_state, [table_id], changed)
 
             # Clear hand snapshot
             await self.snapshot.complete_hand(tournament_id, table_id)
 
+            if new_status == TournamentStatus.COMPLETED:
+                self.event_bus.release_tournament(tournament_id)
+                self.balancer.forget(tournament_id)
+
             # Emit hand complete event
             await self.event_bus.publish(
                 TournamentEvent(
@@ -636,7 +662,30 @@ class TournamentEngine:
                 )
             )
 
-            return new_state
+            # 핸드 진행 중이라 미뤄둔 이동은 최신 상태로 다시 계획
+            had_pending_moves = bool(self.balancer.clear_pending_moves(table_id))
+
+        # 상태 변경은 테이블 델타와 별도로 토너먼트 락 아래에서 기록
+        # (다른 테이블의 핸드 완료와 순서가 뒤섞여 이전 상태로 덮이지 않도록)
+        if new_status != state.status:
+            await self._append_status_delta(tournament_id)
+
+        # 테이블 락 해제 후 밸런싱 (이동은 다른 테이블 락도 필요)
+        if eliminations or had_pending_moves:
+            await self._request_balance(tournament_id)
+
+        return new_state
+
+    async def _append_status_delta(self, tournament_id: str) -> None:
+        """현재 토너먼트 상태(status/ended_at)를 델타 로그에 기록.
+
+        토너먼트 락으로 기록을 직렬화하고 락 안에서 최신 상태를 읽으므로
+        마지막으로 기록된 상태 델타가 항상 최신 상태입니다.
+        """
+        async with self.lock_manager.lock(tournament_id, LockType.TOURNAMENT):
+            state = self._tournaments.get(tournament_id)
+            if state:
+                await self.snapshot.append_status_delta(state)
 
     # =========================================================================
     # Blind Level Management
@@ -707,6 +756,7 @@ class TournamentEngine:
                 ranking=state.ranking,
                 total_prize_pool=state.total_prize_pool,
                 itm_threshold=state.itm_threshold,
+                active_count=state.active_count,
             )
 
             self._tournaments[tournament_id] = new_state
@@ -720,37 +770,45 @@ class TournamentEngine:
                 blind_config.ante,
             )
 
-            # Save checkpoint
-            await self.snapshot.save_full_snapshot(new_state)
+            # Save checkpoint (레벨 델타, 베이스는 백그라운드 압축이 갱신)
+            await self.snapshot.append_level_delta(new_state)
 
     # =========================================================================
     # Table Balancing
     # =========================================================================
 
-    async def _balancing_loop(self) -> None:
-        """테이블 밸런싱 백그라운드 태스크."""
-        while self._running:
-            try:
-                for tournament_id, state in list(self._tournaments.items()):
-                    if state.status not in (
-                        TournamentStatus.RUNNING,
-                        TournamentStatus.FINAL_TABLE,
-                    ):
-                        continue
-
-                    await self._check_and_balance(tournament_id)
+    async def _request_balance(self, tournament_id: str) -> None:
+        """
+        좌석 수 변경 이벤트에 대한 밸런싱 요청.
 
-                await asyncio.sleep(2)  # Check every 2 seconds
+        토너먼트별로 한 번에 하나만 실행하고, 실행 중 들어온 요청은
+        합쳐서 한 번 더 실행합니다 (같은 상태로 중복 이동 계획 방지).
+        """
+        if tournament_id in self._balancing:
+            self._balance_dirty.add(tournament_id)
+            return
 
-            except asyncio.CancelledError:
-                break
-            except Exception:
-                await asyncio.sleep(2)
+        self._balancing.add(tournament_id)
+        try:
+            while True:
+                self._balance_dirty.discard(tournament_id)
+                await self._check_and_balance(tournament_id)
+                if tournament_id not in self._balance_dirty:
+                    break
+        finally:
+            self._balancing.discard(tournament_id)
 
     async def _check_and_balance(self, tournament_id: str) -> None:
         """테이블 밸런싱 필요 여부 확인 및 실행."""
         state = self._tournaments.get(tournament_id)
-        if not state:
+        if not state or state.status not in (
+            TournamentStatus.RUNNING,
+            TournamentStatus.FINAL_TABLE,
+        ):
+            return
+
+        # 인원 인덱스로 O(1) 체크 후 필요할 때만 계획 계산
+        if not self.balancer.needs_balancing(state):
             return
 
         plan = self.balancer.calculate_balancing_plan(state)
@@ -758,12 +816,20 @@ class TournamentEngine:
         if not plan.moves:
             return
 
-        # Execute moves for tables not in hand
+        # Execute moves for tables not in hand, defer the rest to hand end
+        deferred = []
         for move in plan.moves:
             from_table = state.tables.get(move.from_table_id)
-            if from_table and not from_table.hand_in_progress:
+            if from_table and from_table.hand_in_progress:
+                deferred.append(move)
+            elif from_table:
                 await self._execute_player_move(tournament_id, move)
 
+        if deferred:
+            self.balancer.schedule_moves(
+                BalancingPlan(tournament_id=tournament_id, moves=deferred)
+            )
+
     async def _execute_player_move(
         self,
         tournament_id: str,
@@ -782,26 +848,26 @@ class TournamentEngine:
                 return
 
             # Update tables
-            new_tables = dict(state.tables)
-            from_table = new_tables.get(move.from_table_id)
-            to_table = new_tables.get(move.to_table_id)
+            from_table = state.tables.get(move.from_table_id)
+            to_table = state.tables.get(move.to_table_id)
 
             if not from_table or not to_table:
                 return
 
-            new_tables[move.from_table_id] = from_table.with_player_removed(
-                move.user_id
-            )
-            new_tables[move.to_table_id] = to_table.with_player_seated(
-                move.user_id, move.to_seat
-            )
+            new_tables = state.tables.update({
+                move.from_table_id: from_table.with_player_removed(move.user_id),
+                move.to_table_id: to_table.with_player_seated(
+                    move.user_id, move.to_seat
+                ),
+            })
 
             # Update player
-            new_players = dict(state.players)
-            player = new_players.get(move.user_id)
+            new_players = state.players
+            player = state.players.get(move.user_id)
             if player:
-                new_players[move.user_id] = player.at_table(
-                    move.to_table_id, move.to_seat
+                new_players = state.players.set(
+                    move.user_id,
+                    player.at_table(move.to_table_id, move.to_seat),
                 )
 
             new_state = TournamentState(
@@ -818,9 +884,21 @@ class TournamentEngine:
                 ranking=state.ranking,
                 total_prize_pool=state.total_prize_pool,
                 itm_threshold=state.itm_threshold,
+                active_count=state.active_count,
             )
 
             self._tournaments[tournament_id] = new_state
+            self.balancer.update_tables(
+                tournament_id,
+                [
+                    (move.from_table_id, new_tables[move.from_table_id]),
+                    (move.to_table_id, new_tables[move.to_table_id]),
+                ],
+            )
+
+            await self.snapshot.append_table_delta(
+                new_state, [move.from_table_id, move.to_table_id], [move.user_id]
+            )
 
             # Emit move event
             await self.event_bus.publish(
@@ -872,6 +950,8 @@ class TournamentEngine:
 
         # 메모리에 상태 복원
         self._tournaments[tournament_id] = state
+        self.balancer.track_state(state)
+        await self.event_bus.host_tournament(tournament_id)
 
         # 랭킹 엔진 동기화
         await self.ranking.sync_from_state(state)
@@ -6,13 +6,15 @@ Tournament Event Bus - Asynchronous Event-Driven Architecture.
 설계 원칙:
 1. Fire-and-Forget: 이벤트 발행은 비동기로 즉시 반환
 2. Fan-Out: 하나의 이벤트를 여러 핸들러가 독립적으로 처리
-3. Guaranteed Delivery: Redis Streams로 이벤트 유실 방지
-4. Ordered Processing: 동일 토너먼트/테이블 이벤트는 순서 보장
+3. Guaranteed Delivery: Redis Streams로 이벤트 유실 방지 (at-least-once)
+4. Ordered Processing: 동일 토너먼트 이벤트는 같은 파티션에서 순서 보장
+5. Partitioning: 토너먼트 ID 해시로 스트림을 나누고 각 노드는 자신이
+   호스팅하는 토너먼트의 파티션만 소비
 """
 
 import asyncio
-import json
 import time
+import zlib
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -29,6 +31,8 @@ from uuid import uuid4
 
 import redis.asyncio as redis
 
+from app.utils.json_utils import json_dumps, json_loads
+
 from .models import TournamentEvent, TournamentEventType
 
 
@@ -47,6 +51,19 @@ class Subscription:
     is_active: bool = True
 
 
+@dataclass
+class PartitionMetrics:
+    """Per-partition stream metrics."""
+
+    published: int = 0
+    consumed: int = 0
+    claimed: int = 0
+    lag: int = 0  # 그룹이 아직 읽지 않은 엔트리 수
+    pending: int = 0  # 읽었지만 ACK되지 않은 엔트리 수
+    consumed_per_sec: float = 0.0
+    last_entry_id: Optional[str] = None
+
+
 @dataclass
 class EventMetrics:
     """Event processing metrics."""
@@ -54,8 +71,66 @@ class EventMetrics:
     events_published: int = 0
     events_processed: int = 0
     events_failed: int = 0
+    events_dead_lettered: int = 0
     avg_processing_time_ms: float = 0.0
     last_event_time: Optional[datetime] = None
+    partitions: Dict[int, PartitionMetrics] = field(default_factory=dict)
+
+
+# Stream payload format version (first element of the encoded array)
+EVENT_PAYLOAD_VERSION = 1
+
+
+def _as_str(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def encode_event(event: TournamentEvent, origin: str) -> str:
+    """
+    Encode event as a compact positional array.
+
+    필드명 없이 [version, event_id, type, tournament_id, timestamp, data,
+    table_id, user_id, origin] 순서로 한 필드에 저장. 바이너리가 아닌
+    JSON 텍스트를 쓰는 이유는 decode_responses=True 클라이언트에서도
+    그대로 읽혀야 하기 때문.
+    """
+    return json_dumps([
+        EVENT_PAYLOAD_VERSION,
+        event.event_id,
+        event.event_type.name,
+        event.tournament_id,
+        event.timestamp.isoformat(),
+        event.data,
+        event.table_id,
+        event.user_id,
+        origin,
+    ])
+
+
+def decode_event(payload: Any) -> tuple[TournamentEvent, str]:
+    """
+    Decode stream payload into (event, origin instance id).
+
+    Raises:
+        ValueError: Malformed or unsupported payload
+    """
+    try:
+        (version, event_id, event_type, tournament_id, timestamp,
+         data, table_id, user_id, origin) = json_loads(payload)
+        if version != EVENT_PAYLOAD_VERSION:
+            raise ValueError(f"Unsupported event payload version: {version}")
+        event = TournamentEvent(
+            event_id=event_id,
+            event_type=TournamentEventType[event_type],
+            tournament_id=tournament_id,
+            timestamp=datetime.fromisoformat(timestamp),
+            data=data,
+            table_id=table_id,
+            user_id=user_id,
+        )
+    except (TypeError, KeyError) as e:
+        raise ValueError(f"Malformed event payload: {e}") from e
+    return event, origin
 
 
 class TournamentEventBus:
@@ -65,22 +140,27 @@ class TournamentEventBus:
     아키텍처:
     ─────────────────────────────────────────────────────────────────
 
-    [Producer] -> [Redis Stream] -> [Consumer Group] -> [Handlers]
+    [Producer] -> [Partition Stream p0..pN] -> [Consumer Group] -> [Handlers]
 
     1. Producer (publish):
-       - 이벤트를 Redis Stream에 추가 (XADD)
+       - 토너먼트 ID 해시로 파티션 스트림 선택 후 XADD
        - 비동기로 즉시 반환 (Fire-and-Forget)
        - 로컬 인메모리 핸들러에도 동시 발행
 
-    2. Redis Stream:
+    2. Redis Stream (파티션별):
        - 이벤트 영속성 보장 (서버 재시작 후에도 유지)
        - Consumer Group으로 분산 처리 가능
-       - Stream ID로 순서 보장
+       - 같은 토너먼트는 항상 같은 파티션 → Stream ID로 순서 보장
 
     3. Consumer:
-       - 백그라운드 태스크로 지속적 폴링 (XREADGROUP)
-       - ACK로 처리 완료 확인
-       - 실패 시 Pending List로 재처리
+       - host_tournament()로 등록한 토너먼트의 파티션만 XREADGROUP
+       - 처리 후 ACK, 핸들러 실패 시 Pending List에 남김
+       - 같은 파티션의 다른 노드 토너먼트 이벤트는 ACK하지 않고 Pending에
+         남김 (호스팅 노드가 가져감)
+       - 주기적으로 XPENDING을 훑어 자기 토너먼트의 엔트리를 XCLAIM
+         (다른 노드에 남은 엔트리는 즉시, 자신의 실패 엔트리는 CLAIM_IDLE_MS 후)
+         → Redis 전달 횟수가 MAX_DELIVERY_ATTEMPTS에 도달하면 ACK 후 dead-letter
+       - 자신이 발행한 이벤트는 이미 로컬 디스패치했으므로 ACK만 수행
 
     4. Local Handlers:
        - 인메모리 핸들러는 즉시 처리 (WebSocket 등)
@@ -103,9 +183,25 @@ class TournamentEventBus:
     # Max events to read per poll
     BATCH_SIZE = 100
 
-    # Event retention (1 hour = 3600000 ms)
+    # Event retention per partition
     STREAM_MAX_LEN = 10000
 
+    # Number of hash partitions (tournament_id -> partition)
+    PARTITION_COUNT = 16
+
+    # Own failed entries idle longer than this are retried
+    CLAIM_IDLE_MS = 30000
+    CLAIM_INTERVAL_SECONDS = 5.0
+
+    # Entries of tournaments no node claimed within this are dead-lettered
+    ORPHAN_IDLE_MS = 600000
+
+    # Deliveries before an entry is acknowledged as dead-lettered
+    MAX_DELIVERY_ATTEMPTS = 5
+
+    # Stream entry field holding the encoded event
+    PAYLOAD_FIELD = "e"
+
     def __init__(
         self,
         redis_client: redis.Redis,
@@ -132,22 +228,59 @@ class TournamentEventBus:
         # Event queue for batch processing
         self._event_queue: asyncio.Queue[TournamentEvent] = asyncio.Queue(maxsize=1000)
 
-        # Publisher task
+        # Publisher / pending claimer tasks
         self._publisher_task: Optional[asyncio.Task] = None
+        self._claimer_task: Optional[asyncio.Task] = None
+
+        # Tournaments hosted by this node (partition ownership)
+        self._hosted: Set[str] = set()
+        self._groups_ready: Set[int] = set()
+
+    @property
+    def consumer_name(self) -> str:
+        return f"consumer-{self.instance_id}"
+
+    def partition_for(self, tournament_id: str) -> int:
+        """Stable hash partition for a tournament."""
+        return zlib.crc32(tournament_id.encode()) % self.PARTITION_COUNT
+
+    def stream_key(self, partition: int) -> str:
+        return f"{self.STREAM_KEY_PREFIX}:p{partition}"
+
+    @property
+    def hosted_partitions(self) -> List[int]:
+        return sorted({self.partition_for(tid) for tid in self._hosted})
+
+    def _partition_metrics(self, partition: int) -> PartitionMetrics:
+        metrics = self._metrics.partitions.get(partition)
+        if metrics is None:
+            metrics = self._metrics.partitions[partition] = PartitionMetrics()
+        return metrics
 
     async def initialize(self) -> None:
         """
         Initialize event bus.
 
-        - Redis Stream 및 Consumer Group 생성
+        - 호스팅 중인 파티션의 Consumer Group 생성
         - Background tasks 시작
         """
-        # Create stream and consumer group if not exists
-        stream_key = f"{self.STREAM_KEY_PREFIX}:all"
+        for partition in self.hosted_partitions:
+            await self._ensure_group(partition)
+
+        # Start background tasks
+        self._running = True
+        self._publisher_task = asyncio.create_task(self._batch_publisher())
+        self._consumer_task = asyncio.create_task(self._stream_consumer())
+        self._claimer_task = asyncio.create_task(self._pending_claimer())
+
+    async def _ensure_group(self, partition: int) -> None:
+        """Create partition stream and consumer group if not exists."""
+        if partition in self._groups_ready:
+            return
 
         try:
             await self.redis.xgroup_create(
-                stream_key,
+                self.stream_key(partition),
                 self.CONSUMER_GROUP,
                 id="0",
                 mkstream=True,
@@ -157,10 +290,25 @@ class TournamentEventBus:
             if "BUSYGROUP" not in str(e):
                 raise
 
-        # Start background tasks
-        self._running = True
-        self._publisher_task = asyncio.create_task(self._batch_publisher())
-        self._consumer_task = asyncio.create_task(self._stream_consumer())
+        self._groups_ready.add(partition)
+
+    async def host_tournament(self, tournament_id: str) -> None:
+        """
+        이 노드가 토너먼트를 호스팅함을 등록 (해당 파티션 소비 시작).
+
+        Args:
+            tournament_id: Tournament ID
+        """
+        self._hosted.add(tournament_id)
+        await self._ensure_group(self.partition_for(tournament_id))
+
+    def release_tournament(self, tournament_id: str) -> None:
+        """
+        토너먼트 호스팅 해제.
+
+        같은 파티션의 다른 토너먼트를 호스팅하지 않으면 파티션 소비 중단.
+        """
+        self._hosted.discard(tournament_id)
 
     async def shutdown(self) -> None:
         """Graceful shutdown."""
@@ -173,12 +321,13 @@ class TournamentEventBus:
             except asyncio.CancelledError:
                 pass
 
-        if self._consumer_task:
-            self._consumer_task.cancel()
-            try:
-                await self._consumer_task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._consumer_task, self._claimer_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
 
     def subscribe(
         self,
@@ -257,32 +406,29 @@ class TournamentEventBus:
         for event in events:
             await self.publish(event)
 
+    def _stream_entry(self, event: TournamentEvent) -> tuple[int, Dict[str, str]]:
+        """(partition, stream entry fields) for an event."""
+        return (
+            self.partition_for(event.tournament_id),
+            {self.PAYLOAD_FIELD: encode_event(event, self.instance_id)},
+        )
+
     async def _publish_to_stream(self, event: TournamentEvent) -> str:
         """
-        Publish single event to Redis Stream.
+        Publish single event to its partition stream.
 
         Returns stream entry ID.
         """
-        stream_key = f"{self.STREAM_KEY_PREFIX}:all"
-
-        # Event data for Redis (flat structure)
-        data = {
-            "event_id": event.event_id,
-            "event_type": event.event_type.name,
-            "tournament_id": event.tournament_id,
-            "timestamp": event.timestamp.isoformat(),
-            "data": json.dumps(event.data),
-            "table_id": event.table_id or "",
-            "user_id": event.user_id or "",
-        }
+        partition, data = self._stream_entry(event)
 
         entry_id = await self.redis.xadd(
-            stream_key,
+            self.stream_key(partition),
             data,
             maxlen=self.STREAM_MAX_LEN,
             approximate=True,
         )
 
+        self._partition_metrics(partition).published += 1
         return entry_id
 
     async def _batch_publisher(self) -> None:
@@ -292,7 +438,7 @@ class TournamentEventBus:
         배치 처리로 Redis 호출 최소화:
         - 최대 BATCH_SIZE개 이벤트 수집
         - 또는 100ms 타임아웃 후 발행
-        - Pipeline으로 일괄 전송
+        - Pipeline으로 일괄 전송 (이벤트별 파티션 스트림)
         """
         while self._running:
             batch: List[TournamentEvent] = []
@@ -313,25 +459,16 @@ class TournamentEventBus:
 
                 if batch:
                     # Batch publish with pipeline
-                    stream_key = f"{self.STREAM_KEY_PREFIX}:all"
-
                     async with self.redis.pipeline(transaction=False) as pipe:
                         for event in batch:
-                            data = {
-                                "event_id": event.event_id,
-                                "event_type": event.event_type.name,
-                                "tournament_id": event.tournament_id,
-                                "timestamp": event.timestamp.isoformat(),
-                                "data": json.dumps(event.data),
-                                "table_id": event.table_id or "",
-                                "user_id": event.user_id or "",
-                            }
+                            partition, data = self._stream_entry(event)
                             pipe.xadd(
-                                stream_key,
+                                self.stream_key(partition),
                                 data,
                                 maxlen=self.STREAM_MAX_LEN,
                                 approximate=True,
                             )
+                            self._partition_metrics(partition).published += 1
                         await pipe.execute()
 
             except asyncio.CancelledError:
@@ -342,23 +479,25 @@ class TournamentEventBus:
 
     async def _stream_consumer(self) -> None:
         """
-        Background task for consuming events from Redis Stream.
+        Background task for consuming events from partition streams.
 
         분산 환경 Consumer Group 처리:
-        - 여러 서버 인스턴스가 이벤트를 분산 처리
-        - XREADGROUP으로 자동 부하 분산
+        - 호스팅 중인 토너먼트의 파티션만 XREADGROUP
+        - 여러 서버 인스턴스가 같은 파티션을 분산 처리
         - ACK로 처리 완료 확인
         """
-        stream_key = f"{self.STREAM_KEY_PREFIX}:all"
-        consumer_name = f"consumer-{self.instance_id}"
-
         while self._running:
             try:
+                partitions = self.hosted_partitions
+                if not partitions:
+                    await asyncio.sleep(1)
+                    continue
+
                 # Read new events
                 entries = await self.redis.xreadgroup(
                     groupname=self.CONSUMER_GROUP,
-                    consumername=consumer_name,
-                    streams={stream_key: ">"},  # Only new messages
+                    consumername=self.consumer_name,
+                    streams={self.stream_key(p): ">" for p in partitions},
                     count=self.BATCH_SIZE,
                     block=1000,  # 1 second timeout
                 )
@@ -367,43 +506,209 @@ class TournamentEventBus:
                     continue
 
                 for stream_name, messages in entries:
+                    partition = self._partition_of_key(stream_name)
                     for message_id, data in messages:
-                        try:
-                            # Reconstruct event
-                            event = TournamentEvent(
-                                event_id=data.get("event_id", ""),
-                                event_type=TournamentEventType[
-                                    data.get("event_type", "TOURNAMENT_CREATED")
-                                ],
-                                tournament_id=data.get("tournament_id", ""),
-                                timestamp=datetime.fromisoformat(
-                                    data.get("timestamp", datetime.now(timezone.utc).isoformat())
-                                ),
-                                data=json.loads(data.get("data", "{}")),
-                                table_id=data.get("table_id") or None,
-                                user_id=data.get("user_id") or None,
-                            )
+                        await self._handle_entry(partition, message_id, data)
 
-                            # Process with distributed handlers
-                            await self._dispatch_distributed(event)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                await asyncio.sleep(1)  # Backoff on error
 
-                            # Acknowledge
-                            await self.redis.xack(
-                                stream_key,
-                                self.CONSUMER_GROUP,
-                                message_id,
-                            )
+    async def _pending_claimer(self) -> None:
+        """
+        Background task for at-least-once delivery.
 
-                            self._metrics.events_processed += 1
+        - 호스팅 중인 토너먼트의 Pending 엔트리를 claim_pending으로 가져와
+          재처리 (핸들러 실패, 비호스팅 노드가 남긴 엔트리, 죽은 노드)
+        - 파티션별 lag/pending/처리량 메트릭 갱신
+        """
+        last_consumed: Dict[int, int] = {}
+        last_time = time.monotonic()
 
-                        except Exception as e:
-                            self._metrics.events_failed += 1
-                            # Don't ACK - will retry
+        while self._running:
+            try:
+                await asyncio.sleep(self.CLAIM_INTERVAL_SECONDS)
+
+                for partition in self.hosted_partitions:
+                    await self.claim_pending(partition)
+                    await self._refresh_partition_metrics(partition)
+
+                now = time.monotonic()
+                elapsed = max(now - last_time, 1e-6)
+                for partition, metrics in self._metrics.partitions.items():
+                    previous = last_consumed.get(partition, 0)
+                    metrics.consumed_per_sec = (metrics.consumed - previous) / elapsed
+                    last_consumed[partition] = metrics.consumed
+                last_time = now
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                await asyncio.sleep(1)  # Backoff on error
+                await asyncio.sleep(1)
+
+    async def claim_pending(self, partition: int) -> int:
+        """
+        Reclaim and reprocess pending entries of hosted tournaments.
+
+        XPENDING으로 Pending 엔트리와 전달 횟수를 훑고, 호스팅 중인
+        토너먼트의 엔트리만 XCLAIM합니다 (다른 노드 토너먼트의 엔트리를
+        가져와 전달 횟수를 늘리지 않음):
+
+        - 다른 컨슈머에 남은 엔트리: 즉시 (비호스팅 노드가 남겨둔 엔트리
+          또는 죽은 노드)
+        - 자신의 실패 엔트리: CLAIM_IDLE_MS 후 재시도
+        - 어느 노드도 ORPHAN_IDLE_MS 동안 가져가지 않은 엔트리: ACK 후 dead-letter
+
+        Returns:
+            Number of reclaimed entries
+        """
+        stream_key = self.stream_key(partition)
+        claimed = 0
+        start = "-"
+
+        while True:
+            pending = await self.redis.xpending_range(
+                stream_key,
+                self.CONSUMER_GROUP,
+                min=start,
+                max="+",
+                count=self.BATCH_SIZE,
+            )
+            if not pending:
+                break
+            claimed += await self._claim_batch(partition, pending)
+            if len(pending) < self.BATCH_SIZE:
+                break
+            start = f"({_as_str(pending[-1]['message_id'])}"
+
+        self._partition_metrics(partition).claimed += claimed
+        return claimed
+
+    async def _claim_batch(self, partition: int, pending: List[Dict[str, Any]]) -> int:
+        stream_key = self.stream_key(partition)
+
+        # 토너먼트 ID 확인용으로 엔트리 본문 조회 (XCLAIM 전)
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for entry in pending:
+                message_id = entry["message_id"]
+                pipe.xrange(stream_key, min=message_id, max=message_id)
+            bodies = await pipe.execute()
+
+        deliveries: Dict[str, int] = {}
+        for entry, found in zip(pending, bodies):
+            message_id = _as_str(entry["message_id"])
+            idle = int(entry["time_since_delivered"])
+            tournament_id = self._tournament_of(found[0][1]) if found else None
+
+            if tournament_id is None or tournament_id not in self._hosted:
+                if not found or idle >= self.ORPHAN_IDLE_MS:
+                    # 스트림에서 잘렸거나 가져갈 노드가 없는 엔트리
+                    await self.redis.xack(stream_key, self.CONSUMER_GROUP, message_id)
+                    self._metrics.events_dead_lettered += 1
+                continue
+
+            own = _as_str(entry["consumer"]) == self.consumer_name
+            if own and idle < self.CLAIM_IDLE_MS:
+                continue  # 재시도 대기
+            deliveries[message_id] = int(entry["times_delivered"])
+
+        if not deliveries:
+            return 0
+
+        messages = await self.redis.xclaim(
+            stream_key,
+            self.CONSUMER_GROUP,
+            self.consumer_name,
+            min_idle_time=0,
+            message_ids=list(deliveries),
+        )
+        for message_id, data in messages:
+            # XCLAIM이 전달 횟수를 1 늘림
+            attempts = deliveries.get(_as_str(message_id), 0) + 1
+            await self._handle_entry(partition, message_id, data, attempts)
+        return len(messages)
+
+    async def _refresh_partition_metrics(self, partition: int) -> None:
+        groups = await self.redis.xinfo_groups(self.stream_key(partition))
+        for group in groups:
+            name = group.get("name")
+            if isinstance(name, bytes):
+                name = name.decode()
+            if name == self.CONSUMER_GROUP:
+                metrics = self._partition_metrics(partition)
+                metrics.pending = int(group.get("pending") or 0)
+                metrics.lag = int(group.get("lag") or 0)
+
+    def _partition_of_key(self, stream_key: Any) -> int:
+        return int(_as_str(stream_key).rsplit(":p", 1)[1])
+
+    def _decode_entry(
+        self, data: Optional[Dict[Any, Any]]
+    ) -> tuple[TournamentEvent, str]:
+        """Stream entry fields -> (event, origin). Raises ValueError."""
+        payload = (data or {}).get(self.PAYLOAD_FIELD)
+        if payload is None:
+            payload = (data or {}).get(self.PAYLOAD_FIELD.encode())
+        return decode_event(payload)
+
+    def _tournament_of(self, data: Optional[Dict[Any, Any]]) -> Optional[str]:
+        try:
+            event, _ = self._decode_entry(data)
+        except ValueError:
+            return None
+        return event.tournament_id
+
+    async def _handle_entry(
+        self,
+        partition: int,
+        message_id: Any,
+        data: Optional[Dict[Any, Any]],
+        deliveries: int = 1,
+    ) -> None:
+        """
+        Process one stream entry.
+
+        - 디코딩 불가 엔트리: 즉시 ACK 후 dead-letter
+        - 호스팅하지 않는 토너먼트: ACK하지 않고 Pending에 남김
+          (같은 파티션을 쓰는 호스팅 노드가 claim_pending으로 가져감)
+        - 자신이 발행한 이벤트: 이미 로컬 디스패치됨 → ACK만
+        - 핸들러 실패: ACK하지 않음 (claim_pending이 재처리),
+          전달 횟수가 MAX_DELIVERY_ATTEMPTS에 도달하면 ACK 후 dead-letter
+
+        Args:
+            deliveries: Redis가 기록한 이 엔트리의 전달 횟수
+        """
+        stream_key = self.stream_key(partition)
+        metrics = self._partition_metrics(partition)
+        message_id = _as_str(message_id)
+        metrics.last_entry_id = message_id
+
+        try:
+            event, origin = self._decode_entry(data)
+        except ValueError:
+            await self.redis.xack(stream_key, self.CONSUMER_GROUP, message_id)
+            self._metrics.events_failed += 1
+            self._metrics.events_dead_lettered += 1
+            return
+
+        if event.tournament_id not in self._hosted:
+            return
+
+        try:
+            if origin != self.instance_id:
+                # Process with distributed handlers
+                await self._dispatch_distributed(event)
+        except Exception:
+            if deliveries < self.MAX_DELIVERY_ATTEMPTS:
+                return  # Don't ACK - will retry
+            self._metrics.events_dead_lettered += 1
+        else:
+            metrics.consumed += 1
+            self._metrics.events_processed += 1
+
+        # Acknowledge
+        await self.redis.xack(stream_key, self.CONSUMER_GROUP, message_id)
 
     async def _dispatch_local(self, event: TournamentEvent) -> None:
         """
@@ -416,6 +721,32 @@ class TournamentEventBus:
 
         비동기로 병렬 처리하되 개별 실패가 전체에 영향 없음.
         """
+        await self._call_handlers(event)
+
+    async def _dispatch_distributed(self, event: TournamentEvent) -> None:
+        """
+        Dispatch event from Redis Stream (for distributed handlers).
+
+        분산 핸들러 특성:
+        - 데이터베이스 저장
+        - 외부 서비스 알림
+        - 분석/로깅
+
+        Raises:
+            Exception: 실패한 핸들러의 첫 번째 예외 (엔트리를 ACK하지 않고
+                재전달하도록)
+        """
+        failures = await self._call_handlers(event)
+        if failures:
+            raise failures[0]
+
+    async def _call_handlers(self, event: TournamentEvent) -> List[Exception]:
+        """
+        Run matching handlers concurrently.
+
+        Returns:
+            실패한 핸들러의 예외 목록
+        """
         handlers = self._handlers_by_type.get(event.event_type, [])
 
         tasks = []
@@ -432,47 +763,35 @@ class TournamentEventBus:
 
             # Create task for handler
             task = asyncio.create_task(
-                self._safe_handler_call(subscription.handler, event)
+                self._timed_handler_call(subscription.handler, event)
             )
             tasks.append(task)
 
-        if tasks:
-            # Run all handlers concurrently
-            await asyncio.gather(*tasks, return_exceptions=True)
+        if not tasks:
+            return []
 
-    async def _dispatch_distributed(self, event: TournamentEvent) -> None:
-        """
-        Dispatch event from Redis Stream (for distributed handlers).
+        # Run all handlers concurrently
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        failures = [r for r in results if isinstance(r, Exception)]
+        self._metrics.events_failed += len(failures)
+        return failures
 
-        분산 핸들러 특성:
-        - 데이터베이스 저장
-        - 외부 서비스 알림
-        - 분석/로깅
-        """
-        # Same as local for now - can be extended for remote handlers
-        await self._dispatch_local(event)
-
-    async def _safe_handler_call(
+    async def _timed_handler_call(
         self,
         handler: EventHandler,
         event: TournamentEvent,
     ) -> None:
-        """Safely call handler with error handling."""
-        try:
-            start_time = time.time()
-            await handler(event)
-            elapsed_ms = (time.time() - start_time) * 1000
-
-            # Update average processing time
-            total = self._metrics.events_processed
-            avg = self._metrics.avg_processing_time_ms
-            self._metrics.avg_processing_time_ms = (avg * total + elapsed_ms) / (
-                total + 1
-            )
-
-        except Exception as e:
-            self._metrics.events_failed += 1
-            # Log error but don't propagate
+        """Call handler and track processing time (exceptions propagate)."""
+        start_time = time.time()
+        await handler(event)
+        elapsed_ms = (time.time() - start_time) * 1000
+
+        # Update average processing time
+        total = self._metrics.events_processed
+        avg = self._metrics.avg_processing_time_ms
+        self._metrics.avg_processing_time_ms = (avg * total + elapsed_ms) / (
+            total + 1
+        )
 
     def get_metrics(self) -> EventMetrics:
         """Get event processing metrics."""
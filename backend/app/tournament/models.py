@@ -8,10 +8,12 @@ All mutations go through the TournamentEngine.
 from enum import Enum, auto
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Mapping, Tuple
 from uuid import uuid4
 import json
 
+from .pmap import PersistentMap, as_persistent
+
 
 class TournamentStatus(Enum):
     """Tournament lifecycle states."""
@@ -432,6 +434,10 @@ class TournamentState:
 
     This is the single source of truth for tournament status.
     All mutations return new state instances.
+
+    players/tables는 PersistentMap으로 보관됩니다 (dict를 넘겨도 변환).
+    새 상태는 변경된 항목만 set/update 하여 만들고 나머지 구조는 이전
+    상태와 공유하므로, 스냅샷으로 넘긴 이전 상태는 그대로 유지됩니다.
     """
 
     tournament_id: str
@@ -450,10 +456,10 @@ class TournamentState:
     next_level_at: Optional[datetime] = None
 
     # Players (user_id -> TournamentPlayer)
-    players: Dict[str, TournamentPlayer] = field(default_factory=dict)
+    players: Mapping[str, TournamentPlayer] = field(default_factory=PersistentMap)
 
     # Tables (table_id -> TournamentTable)
-    tables: Dict[str, TournamentTable] = field(default_factory=dict)
+    tables: Mapping[str, TournamentTable] = field(default_factory=PersistentMap)
 
     # Ranking cache (updated periodically)
     ranking: List[str] = field(default_factory=list)  # user_ids sorted by chips
@@ -465,15 +471,28 @@ class TournamentState:
     # Pause reason (admin)
     pause_reason: Optional[str] = None
 
+    # Active player count (None -> 최초 조회 시 players에서 계산 후 캐시)
+    active_count: Optional[int] = field(default=None, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "players", as_persistent(self.players))
+        object.__setattr__(self, "tables", as_persistent(self.tables))
+
     @property
     def active_player_count(self) -> int:
         """Count of players still in tournament."""
-        return sum(1 for p in self.players.values() if p.is_active)
+        if self.active_count is None:
+            object.__setattr__(
+                self,
+                "active_count",
+                sum(1 for p in self.players.values() if p.is_active),
+            )
+        return self.active_count
 
     @property
     def eliminated_player_count(self) -> int:
         """Count of eliminated players."""
-        return sum(1 for p in self.players.values() if not p.is_active)
+        return len(self.players) - self.active_player_count
 
     @property
     def current_blind(self) -> Optional[BlindLevel]:
@@ -0,0 +1,319 @@
+"""
+Persistent Map - structurally shared immutable mapping.
+
+TournamentState의 players/tables 저장용 HAMT (Hash Array Mapped Trie).
+
+핵심:
+─────────────────────────────────────────────────────────────────
+
+- 불변: set/delete/update는 새 맵을 반환하고 기존 맵은 그대로 유지
+  → 이전 TournamentState 스냅샷이 이후 변경의 영향을 받지 않음
+- 구조 공유: 변경된 키의 경로(최대 13개 노드)만 복사, 나머지 노드는
+  이전 버전과 공유 → 10,000명 토너먼트에서도 핸드당 비용은
+  O(변경된 플레이어 × log32 n)
+- Mapping 인터페이스: get / in / [] / items() / values() / len() 등
+  기존 dict 읽기 코드가 그대로 동작
+
+─────────────────────────────────────────────────────────────────
+"""
+
+from collections.abc import ItemsView, Iterable, Iterator, Mapping, ValuesView
+from typing import Any, Optional, Tuple
+
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+_HASH_BITS = 64
+_HASH_MASK = (1 << _HASH_BITS) - 1
+
+_MISSING = object()
+
+
+def _hash(key: Any) -> int:
+    return hash(key) & _HASH_MASK
+
+
+def _bitpos(key_hash: int, shift: int) -> int:
+    return 1 << ((key_hash >> shift) & _MASK)
+
+
+def _index(bitmap: int, bit: int) -> int:
+    return (bitmap & (bit - 1)).bit_count()
+
+
+class _BitmapNode:
+    """
+    Trie node with up to 32 slots.
+
+    Each slot is either a (key, value) tuple or a child node.
+    """
+
+    __slots__ = ("bitmap", "array")
+
+    def __init__(self, bitmap: int, array: Tuple[Any, ...]):
+        self.bitmap = bitmap
+        self.array = array
+
+    def assoc(
+        self, shift: int, key_hash: int, key: Any, value: Any
+    ) -> Tuple["_BitmapNode", bool]:
+        """Return (node with key set, whether a new key was added)."""
+        bit = _bitpos(key_hash, shift)
+        idx = _index(self.bitmap, bit)
+
+        if not self.bitmap & bit:
+            array = self.array[:idx] + ((key, value),) + self.array[idx:]
+            return _BitmapNode(self.bitmap | bit, array), True
+
+        entry = self.array[idx]
+        if isinstance(entry, tuple):
+            k, v = entry
+            if k is key or k == key:
+                if v is value:
+                    return self, False
+                new_entry: Any = (key, value)
+                added = False
+            else:
+                new_entry = _make_node(
+                    shift + _BITS, _hash(k), k, v, key_hash, key, value
+                )
+                added = True
+        else:
+            new_entry, added = entry.assoc(shift + _BITS, key_hash, key, value)
+            if new_entry is entry:
+                return self, False
+
+        array = self.array[:idx] + (new_entry,) + self.array[idx + 1:]
+        return _BitmapNode(self.bitmap, array), added
+
+    def without(self, shift: int, key_hash: int, key: Any) -> Optional["_BitmapNode"]:
+        """Return node without key (self if absent, None if empty)."""
+        bit = _bitpos(key_hash, shift)
+        if not self.bitmap & bit:
+            return self
+
+        idx = _index(self.bitmap, bit)
+        entry = self.array[idx]
+        if isinstance(entry, tuple):
+            k, _ = entry
+            if not (k is key or k == key):
+                return self
+            new_entry = None
+        else:
+            new_entry = entry.without(shift + _BITS, key_hash, key)
+            if new_entry is entry:
+                return self
+
+        if new_entry is None:
+            if self.bitmap == bit:
+                return None
+            array = self.array[:idx] + self.array[idx + 1:]
+            return _BitmapNode(self.bitmap ^ bit, array)
+
+        array = self.array[:idx] + (new_entry,) + self.array[idx + 1:]
+        return _BitmapNode(self.bitmap, array)
+
+    def iter_items(self) -> Iterator[Tuple[Any, Any]]:
+        for entry in self.array:
+            if isinstance(entry, tuple):
+                yield entry
+            else:
+                yield from entry.iter_items()
+
+
+class _CollisionNode:
+    """Leaf for keys whose full 64-bit hashes are equal."""
+
+    __slots__ = ("pairs",)
+
+    def __init__(self, pairs: Tuple[Tuple[Any, Any], ...]):
+        self.pairs = pairs
+
+    def find(self, shift: int, key_hash: int, key: Any, default: Any) -> Any:
+        for k, v in self.pairs:
+            if k is key or k == key:
+                return v
+        return default
+
+    def assoc(
+        self, shift: int, key_hash: int, key: Any, value: Any
+    ) -> Tuple["_CollisionNode", bool]:
+        for i, (k, v) in enumerate(self.pairs):
+            if k is key or k == key:
+                if v is value:
+                    return self, False
+                pairs = self.pairs[:i] + ((key, value),) + self.pairs[i + 1:]
+                return _CollisionNode(pairs), False
+        return _CollisionNode(self.pairs + ((key, value),)), True
+
+    def without(self, shift: int, key_hash: int, key: Any) -> Optional["_CollisionNode"]:
+        for i, (k, _) in enumerate(self.pairs):
+            if k is key or k == key:
+                pairs = self.pairs[:i] + self.pairs[i + 1:]
+                return _CollisionNode(pairs) if pairs else None
+        return self
+
+    def iter_items(self) -> Iterator[Tuple[Any, Any]]:
+        return iter(self.pairs)
+
+
+def _make_node(
+    shift: int,
+    hash1: int,
+    key1: Any,
+    value1: Any,
+    hash2: int,
+    key2: Any,
+    value2: Any,
+) -> Any:
+    """Build the smallest subtree holding two distinct keys."""
+    if shift >= _HASH_BITS:
+        return _CollisionNode(((key1, value1), (key2, value2)))
+
+    bit1 = _bitpos(hash1, shift)
+    bit2 = _bitpos(hash2, shift)
+    if bit1 == bit2:
+        child = _make_node(shift + _BITS, hash1, key1, value1, hash2, key2, value2)
+        return _BitmapNode(bit1, (child,))
+
+    if bit1 < bit2:
+        return _BitmapNode(bit1 | bit2, ((key1, value1), (key2, value2)))
+    return _BitmapNode(bit1 | bit2, ((key2, value2), (key1, value1)))
+
+
+_EMPTY_NODE = _BitmapNode(0, ())
+
+
+def _find(root: _BitmapNode, key: Any, default: Any) -> Any:
+    """Iterative lookup (hot path for state reads)."""
+    key_hash = hash(key) & _HASH_MASK
+    node: Any = root
+    shift = 0
+    while True:
+        if type(node) is _CollisionNode:
+            return node.find(shift, key_hash, key, default)
+        bit = 1 << ((key_hash >> shift) & _MASK)
+        bitmap = node.bitmap
+        if not bitmap & bit:
+            return default
+        entry = node.array[(bitmap & (bit - 1)).bit_count()]
+        if type(entry) is tuple:
+            k, v = entry
+            return v if k is key or k == key else default
+        node = entry
+        shift += _BITS
+
+
+class _ItemsView(ItemsView):
+    def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+        return self._mapping._root.iter_items()
+
+
+class _ValuesView(ValuesView):
+    def __iter__(self) -> Iterator[Any]:
+        for _, value in self._mapping._root.iter_items():
+            yield value
+
+
+class PersistentMap(Mapping):
+    """
+    Immutable mapping with structural sharing.
+
+    사용 예:
+        players = PersistentMap(initial_dict)
+        players2 = players.set(user_id, player)       # players는 그대로
+        players3 = players2.update(changed_players)   # 여러 키 일괄 변경
+    """
+
+    __slots__ = ("_root", "_count")
+
+    def __init__(self, items: Any = ()):
+        root, count = _EMPTY_NODE, 0
+        source = items.items() if isinstance(items, Mapping) else items
+        for key, value in source:
+            root, added = root.assoc(0, _hash(key), key, value)
+            count += added
+        self._root = root
+        self._count = count
+
+    @classmethod
+    def _create(cls, root: _BitmapNode, count: int) -> "PersistentMap":
+        new = cls.__new__(cls)
+        new._root = root
+        new._count = count
+        return new
+
+    # ─────────────────────────────────────────────────────────────
+    # Read
+    # ─────────────────────────────────────────────────────────────
+
+    def __getitem__(self, key: Any) -> Any:
+        value = _find(self._root, key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return _find(self._root, key, default)
+
+    def __contains__(self, key: Any) -> bool:
+        return _find(self._root, key, _MISSING) is not _MISSING
+
+    def __iter__(self) -> Iterator[Any]:
+        for key, _ in self._root.iter_items():
+            yield key
+
+    def __len__(self) -> int:
+        return self._count
+
+    def items(self) -> ItemsView:
+        return _ItemsView(self)
+
+    def values(self) -> ValuesView:
+        return _ValuesView(self)
+
+    # ─────────────────────────────────────────────────────────────
+    # Write (new map, shared structure)
+    # ─────────────────────────────────────────────────────────────
+
+    def set(self, key: Any, value: Any) -> "PersistentMap":
+        """Return new map with key set to value."""
+        root, added = self._root.assoc(0, _hash(key), key, value)
+        if root is self._root:
+            return self
+        return self._create(root, self._count + added)
+
+    def delete(self, key: Any) -> "PersistentMap":
+        """Return new map without key (KeyError if absent)."""
+        root = self._root.without(0, _hash(key), key)
+        if root is self._root:
+            raise KeyError(key)
+        return self._create(root if root is not None else _EMPTY_NODE, self._count - 1)
+
+    def update(self, items: Any = ()) -> "PersistentMap":
+        """Return new map with all given items set."""
+        root, count = self._root, self._count
+        source = items.items() if isinstance(items, Mapping) else items
+        for key, value in source:
+            root, added = root.assoc(0, _hash(key), key, value)
+            count += added
+        if root is self._root:
+            return self
+        return self._create(root, count)
+
+    # ─────────────────────────────────────────────────────────────
+    # Misc
+    # ─────────────────────────────────────────────────────────────
+
+    def __reduce__(self):
+        return (PersistentMap, (list(self.items()),))
+
+    def __repr__(self) -> str:
+        return f"PersistentMap({dict(self.items())!r})"
+
+
+def as_persistent(items: Optional[Iterable]) -> PersistentMap:
+    """Return items as a PersistentMap (no copy if it already is one)."""
+    if isinstance(items, PersistentMap):
+        return items
+    return PersistentMap(items or ())
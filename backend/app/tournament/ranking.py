@@ -5,15 +5,16 @@ Real-time Ranking Engine.
 
 핵심 설계:
 1. Redis Sorted Set으로 O(log n) 순위 조회
-2. 주기적 배치 업데이트로 부하 최소화
-3. 캐싱된 랭킹 스냅샷으로 즉시 응답
+2. 집계(총 칩, 평균 스택, 생존 인원)는 칩 변경/탈락 델타로 증분 유지
+3. 상위 N명/페이지 조회는 캐싱된 구간(window)으로 즉시 응답
+4. 전체 스냅샷(전 인원 조회)은 명시적으로 요청할 때만 재생성
 """
 
 import asyncio
 import json
 import time
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
@@ -72,6 +73,34 @@ class RankingSnapshot:
         }
 
 
+@dataclass
+class _RankingStats:
+    """증분 집계 (토너먼트별)."""
+
+    chips: Dict[str, int] = field(default_factory=dict)
+    inactive: set[str] = field(default_factory=set)
+    total_chips: int = 0
+    version: int = 0
+
+    @property
+    def active_count(self) -> int:
+        return len(self.chips) - len(self.inactive)
+
+    def set_chips(self, user_id: str, chip_count: int) -> None:
+        self.total_chips += chip_count - self.chips.get(user_id, 0)
+        self.chips[user_id] = chip_count
+        self.version += 1
+
+
+@dataclass
+class _RankingWindow:
+    """캐싱된 순위 구간."""
+
+    version: int
+    created_at: float
+    entries: List[RankingEntry]
+
+
 class RankingEngine:
     """
     High-performance Real-time Ranking Engine.
@@ -91,9 +120,10 @@ class RankingEngine:
     - ZCARD: 전체 인원 O(1)
 
     순위 계산 최적화:
-    - 칩 변경 발생 시 Redis 즉시 업데이트
-    - 전체 스냅샷은 1초 주기로 배치 생성
-    - 클라이언트는 캐싱된 스냅샷 수신 (WebSocket)
+    - 칩 변경 발생 시 Redis 즉시 업데이트 + 인메모리 집계 증분 반영
+    - 상위/페이지 구간은 변경이 없거나 1초 이내면 캐시에서 응답
+    - 백그라운드 태스크는 브로드캐스트용 상위 구간만 갱신
+    - 전체 스냅샷은 get_snapshot(full=True) 요청 시에만 생성
 
     ─────────────────────────────────────────────────────────────────
     """
@@ -107,6 +137,9 @@ class RankingEngine:
     # Top players to include in broadcast
     TOP_PLAYERS_BROADCAST = 100
 
+    # 토너먼트당 최대 캐시 구간 수
+    MAX_CACHED_WINDOWS = 64
+
     def __init__(
         self,
         redis_client: redis.Redis,
@@ -123,8 +156,12 @@ class RankingEngine:
         # Active tournaments
         self._active_tournaments: set[str] = set()
 
-        # Player info cache (user_id -> nickname, table_id)
-        self._player_info: Dict[str, Dict[str, str]] = {}
+        # Player info cache (tournament_id -> user_id -> nickname, table_id, is_active)
+        self._player_info: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+        # 증분 집계 / 캐싱된 순위 구간
+        self._stats: Dict[str, _RankingStats] = {}
+        self._windows: Dict[str, Dict[Tuple[int, int], _RankingWindow]] = {}
 
     def _ranking_key(self, tournament_id: str) -> str:
         """Get Redis key for tournament ranking."""
@@ -179,23 +216,15 @@ class RankingEngine:
         )
 
         # Store player info
-        await self.redis.hset(
-            info_key,
-            player.user_id,
-            json.dumps(
-                {
-                    "nickname": player.nickname,
-                    "table_id": player.table_id,
-                    "is_active": player.is_active,
-                }
-            ),
-        )
+        info = self._info_from_player(player)
+        await self.redis.hset(info_key, player.user_id, json.dumps(info))
 
         # Update local cache
-        self._player_info[player.user_id] = {
-            "nickname": player.nickname,
-            "table_id": player.table_id or "",
-        }
+        self._player_info.setdefault(tournament_id, {})[player.user_id] = info
+        stats = self._stats.setdefault(tournament_id, _RankingStats())
+        stats.set_chips(player.user_id, player.chip_count)
+        if not player.is_active:
+            stats.inactive.add(player.user_id)
 
     async def update_chips(
         self,
@@ -235,14 +264,11 @@ class RankingEngine:
             {user_id: chip_count},
         )
 
+        self._apply_chips(tournament_id, [(user_id, chip_count)])
+
         # Update table info if provided
         if table_id is not None:
-            info_key = self._player_info_key(tournament_id)
-            existing = await self.redis.hget(info_key, user_id)
-            if existing:
-                info = json.loads(existing)
-                info["table_id"] = table_id
-                await self.redis.hset(info_key, user_id, json.dumps(info))
+            await self._update_info(tournament_id, user_id, table_id=table_id)
 
         # Get new rank (0-indexed, reversed for chip count)
         rank_0 = await self.redis.zrevrank(ranking_key, user_id)
@@ -277,6 +303,8 @@ class RankingEngine:
 
         await self.redis.zadd(ranking_key, mapping)
 
+        self._apply_chips(tournament_id, updates)
+
     async def eliminate_player(
         self,
         tournament_id: str,
@@ -297,18 +325,18 @@ class RankingEngine:
             final_rank: Player's final rank
         """
         ranking_key = self._ranking_key(tournament_id)
-        info_key = self._player_info_key(tournament_id)
 
         # Set chips to 0
         await self.redis.zadd(ranking_key, {user_id: 0})
 
+        stats = self._apply_chips(tournament_id, [(user_id, 0)])
+        if stats:
+            stats.inactive.add(user_id)
+
         # Update info
-        existing = await self.redis.hget(info_key, user_id)
-        if existing:
-            info = json.loads(existing)
-            info["is_active"] = False
-            info["final_rank"] = final_rank
-            await self.redis.hset(info_key, user_id, json.dumps(info))
+        await self._update_info(
+            tournament_id, user_id, is_active=False, final_rank=final_rank
+        )
 
     async def get_rank(
         self,
@@ -348,43 +376,26 @@ class RankingEngine:
         Returns:
             List of RankingEntry in rank order
         """
-        ranking_key = self._ranking_key(tournament_id)
-        info_key = self._player_info_key(tournament_id)
+        return await self._get_window(tournament_id, 0, count)
 
-        # Get top players with scores
-        top = await self.redis.zrevrange(
-            ranking_key,
-            0,
-            count - 1,
-            withscores=True,
-        )
-
-        entries: List[RankingEntry] = []
+    async def get_page(
+        self,
+        tournament_id: str,
+        page: int = 1,
+        page_size: int = 100,
+    ) -> List[RankingEntry]:
+        """
+        Get one page of the ranking.
 
-        for rank, (user_id, chips) in enumerate(top, 1):
-            # Get player info
-            info_raw = await self.redis.hget(info_key, user_id)
-            if info_raw:
-                info = json.loads(info_raw)
-                nickname = info.get("nickname", user_id[:8])
-                table_id = info.get("table_id")
-                is_active = info.get("is_active", True)
-            else:
-                nickname = user_id[:8]
-                table_id = None
-                is_active = True
-
-            entry = RankingEntry(
-                rank=rank,
-                user_id=user_id,
-                nickname=nickname,
-                chip_count=int(chips),
-                table_id=table_id,
-                is_active=is_active,
-            )
-            entries.append(entry)
+        Args:
+            tournament_id: Tournament ID
+            page: Page number (1-indexed)
+            page_size: Entries per page
 
-        return entries
+        Returns:
+            List of RankingEntry in rank order
+        """
+        return await self._get_window(tournament_id, (page - 1) * page_size, page_size)
 
     async def get_nearby_players(
         self,
@@ -429,57 +440,38 @@ class RankingEngine:
             withscores=True,
         )
 
-        info_key = self._player_info_key(tournament_id)
-        entries: List[RankingEntry] = []
-
-        for idx, (uid, chips) in enumerate(nearby):
-            rank = start + idx + 1  # 1-indexed
-
-            info_raw = await self.redis.hget(info_key, uid)
-            if info_raw:
-                info = json.loads(info_raw)
-                nickname = info.get("nickname", uid[:8])
-                table_id = info.get("table_id")
-                is_active = info.get("is_active", True)
-            else:
-                nickname = uid[:8]
-                table_id = None
-                is_active = True
-
-            entry = RankingEntry(
-                rank=rank,
-                user_id=uid,
-                nickname=nickname,
-                chip_count=int(chips),
-                table_id=table_id,
-                is_active=is_active,
-            )
-            entries.append(entry)
-
-        return entries
+        return await self._build_entries(tournament_id, start, nearby)
 
     async def get_snapshot(
         self,
         tournament_id: str,
+        full: bool = False,
     ) -> RankingSnapshot:
         """
-        Get cached ranking snapshot.
+        Get ranking snapshot.
 
-        캐시된 스냅샷 반환 (1초 이내 신선도).
-        스냅샷 없으면 즉시 생성.
+        기본: 증분 집계 + 캐싱된 상위 TOP_PLAYERS_BROADCAST명 (전 인원 조회 없음).
+        full=True: 전체 순위를 Redis에서 다시 읽어 생성하고 집계도 재동기화.
 
         Returns:
-            Complete RankingSnapshot
+            RankingSnapshot
         """
-        # Check cache
-        cached = self._snapshots.get(tournament_id)
-        if cached:
-            age_ms = (datetime.now(timezone.utc) - cached.timestamp).total_seconds() * 1000
-            if age_ms < self.SNAPSHOT_INTERVAL_MS:
-                return cached
+        stats = self._stats.get(tournament_id)
+        if full or stats is None:
+            return await self._generate_snapshot(tournament_id)
 
-        # Generate new snapshot
-        return await self._generate_snapshot(tournament_id)
+        entries = await self._get_window(tournament_id, 0, self.TOP_PLAYERS_BROADCAST)
+        active_count = stats.active_count
+        snapshot = RankingSnapshot(
+            tournament_id=tournament_id,
+            entries=entries,
+            total_players=len(stats.chips),
+            active_players=active_count,
+            total_chips=stats.total_chips,
+            average_stack=stats.total_chips // active_count if active_count > 0 else 0,
+        )
+        self._snapshots[tournament_id] = snapshot
+        return snapshot
 
     async def _generate_snapshot(
         self,
@@ -488,9 +480,9 @@ class RankingEngine:
         """
         Generate complete ranking snapshot.
 
-        전체 순위 스냅샷 생성:
+        전체 순위 스냅샷 생성 (명시적 요청 시에만):
         1. 전체 플레이어 조회
-        2. 통계 계산 (총 칩, 평균 스택 등)
+        2. 통계 계산 (총 칩, 평균 스택 등) 및 증분 집계 재동기화
         3. 캐시 업데이트
         """
         ranking_key = self._ranking_key(tournament_id)
@@ -504,41 +496,24 @@ class RankingEngine:
             withscores=True,
         )
 
-        entries: List[RankingEntry] = []
-        total_chips = 0
-        active_count = 0
-
         # Batch get all info
         all_info = await self.redis.hgetall(info_key)
-
-        for rank, (user_id, chips) in enumerate(all_players, 1):
-            chips_int = int(chips)
-            total_chips += chips_int
-
-            info_raw = all_info.get(user_id)
-            if info_raw:
-                info = json.loads(info_raw)
-                nickname = info.get("nickname", user_id[:8])
-                table_id = info.get("table_id")
-                is_active = info.get("is_active", True)
-            else:
-                nickname = user_id[:8]
-                table_id = None
-                is_active = True
-
-            if is_active:
-                active_count += 1
-
-            entry = RankingEntry(
-                rank=rank,
-                user_id=user_id,
-                nickname=nickname,
-                chip_count=chips_int,
-                table_id=table_id,
-                is_active=is_active,
-            )
-            entries.append(entry)
-
+        cache = {uid: json.loads(raw) for uid, raw in all_info.items()}
+        self._player_info[tournament_id] = cache
+
+        stats = _RankingStats()
+        for user_id, chips in all_players:
+            stats.set_chips(user_id, int(chips))
+            if not cache.get(user_id, {}).get("is_active", True):
+                stats.inactive.add(user_id)
+        previous = self._stats.get(tournament_id)
+        stats.version = (previous.version + 1) if previous else 0
+        self._stats[tournament_id] = stats
+        self._windows.pop(tournament_id, None)
+
+        entries = await self._build_entries(tournament_id, 0, all_players)
+        total_chips = stats.total_chips
+        active_count = stats.active_count
         total_players = len(entries)
         avg_stack = total_chips // active_count if active_count > 0 else 0
 
@@ -560,12 +535,15 @@ class RankingEngine:
         """
         Background task for periodic snapshot updates.
 
-        모든 활성 토너먼트의 스냅샷을 주기적으로 갱신.
+        모든 활성 토너먼트의 브로드캐스트 구간(상위 N명)을 주기적으로 갱신.
+        변경이 없는 토너먼트는 건너뜀.
         """
         while self._running:
             try:
                 for tournament_id in list(self._active_tournaments):
-                    await self._generate_snapshot(tournament_id)
+                    await self._get_window(
+                        tournament_id, 0, self.TOP_PLAYERS_BROADCAST
+                    )
 
                 await asyncio.sleep(self.SNAPSHOT_INTERVAL_MS / 1000)
 
@@ -596,22 +574,23 @@ class RankingEngine:
         await self.redis.delete(ranking_key, info_key)
 
         # Rebuild from state
+        cache: Dict[str, Dict[str, Any]] = {}
+        stats = _RankingStats()
         async with self.redis.pipeline(transaction=False) as pipe:
             for player in state.players.values():
+                info = self._info_from_player(player)
+                cache[player.user_id] = info
+                stats.set_chips(player.user_id, player.chip_count)
+                if not player.is_active:
+                    stats.inactive.add(player.user_id)
                 pipe.zadd(ranking_key, {player.user_id: player.chip_count})
-                pipe.hset(
-                    info_key,
-                    player.user_id,
-                    json.dumps(
-                        {
-                            "nickname": player.nickname,
-                            "table_id": player.table_id,
-                            "is_active": player.is_active,
-                        }
-                    ),
-                )
+                pipe.hset(info_key, player.user_id, json.dumps(info))
             await pipe.execute()
 
+        self._player_info[tournament_id] = cache
+        self._stats[tournament_id] = stats
+        self._windows.pop(tournament_id, None)
+
         # Initialize for updates
         await self.initialize(tournament_id)
 
@@ -628,3 +607,119 @@ class RankingEngine:
 
         self._active_tournaments.discard(tournament_id)
         self._snapshots.pop(tournament_id, None)
+        self._player_info.pop(tournament_id, None)
+        self._stats.pop(tournament_id, None)
+        self._windows.pop(tournament_id, None)
+
+    # =========================================================================
+    # Internal
+    # =========================================================================
+
+    @staticmethod
+    def _info_from_player(player: TournamentPlayer) -> Dict[str, Any]:
+        return {
+            "nickname": player.nickname,
+            "table_id": player.table_id,
+            "is_active": player.is_active,
+        }
+
+    def _apply_chips(
+        self,
+        tournament_id: str,
+        updates: List[Tuple[str, int]],
+    ) -> Optional[_RankingStats]:
+        """칩 변경을 증분 집계에 반영 (집계가 없으면 다음 조회 시 전체 재생성)."""
+        stats = self._stats.get(tournament_id)
+        if stats is not None:
+            for user_id, chip_count in updates:
+                stats.set_chips(user_id, chip_count)
+        return stats
+
+    async def _update_info(self, tournament_id: str, user_id: str, **changes: Any) -> None:
+        info_key = self._player_info_key(tournament_id)
+        cache = self._player_info.setdefault(tournament_id, {})
+
+        info = cache.get(user_id)
+        if info is None:
+            existing = await self.redis.hget(info_key, user_id)
+            if not existing:
+                return
+            info = json.loads(existing)
+
+        info = {**info, **changes}
+        cache[user_id] = info
+        await self.redis.hset(info_key, user_id, json.dumps(info))
+
+        stats = self._stats.get(tournament_id)
+        if stats is not None:
+            stats.version += 1
+
+    async def _get_window(
+        self,
+        tournament_id: str,
+        start: int,
+        count: int,
+    ) -> List[RankingEntry]:
+        """
+        순위 구간 조회 (캐시 우선).
+
+        변경이 없거나 SNAPSHOT_INTERVAL_MS 이내에 만든 구간이면 캐시에서
+        응답하고, 아니면 ZREVRANGE start..start+count-1만 다시 읽음.
+        """
+        stats = self._stats.get(tournament_id)
+        version = stats.version if stats else None
+        windows = self._windows.setdefault(tournament_id, {})
+
+        cached = windows.get((start, count))
+        now = time.monotonic()
+        if cached and (
+            cached.version == version
+            or (now - cached.created_at) * 1000 < self.SNAPSHOT_INTERVAL_MS
+        ):
+            return cached.entries
+
+        rows = await self.redis.zrevrange(
+            self._ranking_key(tournament_id),
+            start,
+            start + count - 1,
+            withscores=True,
+        )
+        entries = await self._build_entries(tournament_id, start, rows)
+
+        if version is not None:
+            if len(windows) >= self.MAX_CACHED_WINDOWS:
+                windows.clear()
+            windows[(start, count)] = _RankingWindow(version, now, entries)
+
+        return entries
+
+    async def _build_entries(
+        self,
+        tournament_id: str,
+        start: int,
+        rows: List[Tuple[str, float]],
+    ) -> List[RankingEntry]:
+        """ZREVRANGE 결과를 RankingEntry로 변환 (캐시에 없는 정보만 HMGET)."""
+        cache = self._player_info.setdefault(tournament_id, {})
+
+        missing = [uid for uid, _ in rows if uid not in cache]
+        if missing:
+            raw = await self.redis.hmget(self._player_info_key(tournament_id), missing)
+            for uid, info_raw in zip(missing, raw):
+                if info_raw:
+                    cache[uid] = json.loads(info_raw)
+
+        entries: List[RankingEntry] = []
+        for idx, (user_id, chips) in enumerate(rows):
+            info = cache.get(user_id, {})
+            entries.append(
+                RankingEntry(
+                    rank=start + idx + 1,  # 1-indexed
+                    user_id=user_id,
+                    nickname=info.get("nickname", user_id[:8]),
+                    chip_count=int(chips),
+                    table_id=info.get("table_id"),
+                    is_active=info.get("is_active", True),
+                )
+            )
+        return entries
@@ -2,31 +2,40 @@
 Snapshot Manager for Fault Tolerance.
 
 서버 다운 시에도 진행 중인 핸드 상태와 칩 정보를 즉시 복구.
+
+저장 구조 (로그 구조):
+─────────────────────────────────────────────────────────────────
+
+- {prefix}:{tid}:latest   베이스 이미지 (전체 상태 + 반영된 로그 커서)
+- {prefix}:{tid}:log      델타 로그 (Redis Stream). 핸드 완료/플레이어
+                          이동마다 변경된 테이블·플레이어 레코드만 XADD
+- {prefix}:{tid}:hand:{table_id}          진행 중 핸드
+- {prefix}:{tid}:hand:{table_id}:actions  진행 중 핸드 액션 로그
+
+- load_latest: 베이스 + 커서 이후 델타를 순서대로 재생
+- 압축(compaction): 델타가 COMPACT_EVERY개 쌓이면 백그라운드에서
+  베이스 + 로그를 재생해 새 베이스를 쓰고 반영된 로그를 XTRIM
+- 인코딩은 snapshot_codec (버전 헤더 + msgpack, pickle 미사용)
+
+─────────────────────────────────────────────────────────────────
 """
 
 import asyncio
-import gzip
 import hashlib
 import hmac
-import json
-import pickle
-import time
+import logging
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from uuid import uuid4
 
 import redis.asyncio as redis
 
-from .models import (
-    TournamentState,
-    TournamentConfig,
-    TournamentStatus,
-    TournamentPlayer,
-    TournamentTable,
-    BlindLevel,
-)
+from . import snapshot_codec as codec
+from .models import TournamentState
+
+logger = logging.getLogger(__name__)
 
 
 class SnapshotType(Enum):
@@ -71,38 +80,178 @@ class SnapshotManager:
     """Tournament Snapshot Manager for fault tolerance."""
 
     KEY_PREFIX = "tournament:snapshot"
-    MAX_HISTORY = 100
+
+    # 이 개수만큼 델타가 쌓이면 백그라운드 압축
+    COMPACT_EVERY = 500
 
     def __init__(self, redis_client: redis.Redis, hmac_key: str = "key"):
         self.redis = redis_client
         self._hmac_key = hmac_key.encode()
         self._active: set[str] = set()
 
+        # 토너먼트별 마지막 압축 이후 델타 수 / 진행 중인 압축 태스크
+        self._pending_deltas: Dict[str, int] = {}
+        self._compactions: Dict[str, asyncio.Task] = {}
+
     def _latest_key(self, tid: str) -> str:
         return f"{self.KEY_PREFIX}:{tid}:latest"
 
+    def _log_key(self, tid: str) -> str:
+        return f"{self.KEY_PREFIX}:{tid}:log"
+
     def _hand_key(self, tid: str, table_id: str) -> str:
         return f"{self.KEY_PREFIX}:{tid}:hand:{table_id}"
 
+    def _actions_key(self, tid: str, table_id: str) -> str:
+        return f"{self._hand_key(tid, table_id)}:actions"
+
     def _compute_checksum(self, data: bytes) -> str:
         return hmac.new(self._hmac_key, data, hashlib.sha256).hexdigest()
 
+    # =========================================================================
+    # Base image
+    # =========================================================================
+
     async def save_full_snapshot(self, state: TournamentState) -> SnapshotMetadata:
-        """Save complete tournament state."""
-        state_dict = self._serialize_state(state)
-        compressed = gzip.compress(pickle.dumps(state_dict))
-        checksum = self._compute_checksum(compressed)
+        """Save complete tournament state.
 
-        metadata = SnapshotMetadata(
-            tournament_id=state.tournament_id,
+        베이스 이미지를 교체하고 델타 로그를 비웁니다. 동시에 델타를 쓰는
+        핸드가 없을 때(시작 등)만 호출합니다. 진행 중에는 append_*_delta와
+        백그라운드 압축을 사용합니다.
+        """
+        tid = state.tournament_id
+        data = codec.encode_base(state)
+
+        await self.redis.set(self._latest_key(tid), data)
+        await self.redis.delete(self._log_key(tid))
+        self._pending_deltas[tid] = 0
+
+        return SnapshotMetadata(
+            tournament_id=tid,
             blind_level=state.current_blind_level,
             active_players=state.active_player_count,
-            size_bytes=len(compressed),
-            checksum=checksum,
+            size_bytes=len(data),
+            checksum=self._compute_checksum(data),
+        )
+
+    async def load_latest(self, tid: str) -> Optional[TournamentState]:
+        """Load latest tournament snapshot (base + delta replay).
+
+        Raises:
+            ValueError: 손상되었거나 지원하지 않는 버전의 레코드
+        """
+        loaded = await self._replay(tid)
+        if loaded is None:
+            return None
+        fields, _, _ = loaded
+        return TournamentState(**fields)
+
+    async def _replay(self, tid: str) -> Optional[tuple]:
+        """베이스 + 커서 이후 델타 재생.
+
+        Returns:
+            (TournamentState 인자, 마지막으로 반영한 로그 ID, 재생한 델타 수)
+            또는 None
+        """
+        data = await self.redis.get(self._latest_key(tid))
+        if not data:
+            return None
+
+        cursor, fields = codec.decode_base(data)
+        # "(" = 커서 자체는 제외 (이미 베이스에 반영됨)
+        start = f"({cursor}" if cursor else "-"
+        entries = await self.redis.xrange(self._log_key(tid), min=start)
+        for entry_id, entry in entries:
+            codec.apply_delta(fields, entry.get(b"d", entry.get("d")))
+            cursor = entry_id.decode() if isinstance(entry_id, bytes) else entry_id
+        return fields, cursor, len(entries)
+
+    # =========================================================================
+    # Delta log
+    # =========================================================================
+
+    async def append_table_delta(
+        self,
+        state: TournamentState,
+        table_ids: Iterable[str],
+        user_ids: Iterable[str] = (),
+    ) -> None:
+        """핸드 완료/플레이어 이동 델타 기록.
+
+        토너먼트 상태(status/ended_at)는 포함하지 않습니다. 테이블별 델타는
+        서로 다른 테이블 락 아래에서 기록되어 순서가 섞일 수 있으므로 상태
+        변경은 append_status_delta로 따로 기록합니다.
+
+        Args:
+            state: 변경이 반영된 상태
+            table_ids: 변경된 테이블 (state에 없으면 제거로 기록)
+            user_ids: 변경된 플레이어
+        """
+        await self._append(
+            state.tournament_id,
+            codec.encode_delta(state, table_ids, user_ids),
         )
 
-        await self.redis.set(self._latest_key(state.tournament_id), compressed)
-        return metadata
+    async def append_status_delta(self, state: TournamentState) -> None:
+        """토너먼트 상태(status/ended_at) 변경 델타 기록.
+
+        호출자는 토너먼트 락을 잡고 최신 상태를 전달합니다 (마지막 델타가
+        최신 상태가 되도록).
+        """
+        await self._append(
+            state.tournament_id,
+            codec.encode_delta(state, header_fields=codec.STATUS_FIELDS),
+        )
+
+    async def append_level_delta(self, state: TournamentState) -> None:
+        """블라인드 레벨 변경 델타 기록."""
+        await self._append(
+            state.tournament_id,
+            codec.encode_delta(state, header_fields=codec.LEVEL_FIELDS),
+        )
+
+    async def _append(self, tid: str, data: bytes) -> None:
+        await self.redis.xadd(self._log_key(tid), {"d": data})
+
+        pending = self._pending_deltas.get(tid, 0) + 1
+        self._pending_deltas[tid] = pending
+        if pending >= self.COMPACT_EVERY and tid not in self._compactions:
+            task = asyncio.create_task(self.compact(tid))
+            self._compactions[tid] = task
+            task.add_done_callback(lambda _: self._compactions.pop(tid, None))
+
+    async def compact(self, tid: str) -> int:
+        """베이스 + 로그를 새 베이스로 합치고 반영된 로그 삭제.
+
+        상태는 메모리가 아니라 로그 재생으로 만들기 때문에 압축 중에
+        추가되는 델타는 커서 뒤에 남아 다음 재생에 그대로 반영됩니다.
+
+        Returns:
+            새 베이스에 합쳐진 델타 수
+        """
+        try:
+            loaded = await self._replay(tid)
+            if loaded is None:
+                return 0
+            fields, cursor, applied = loaded
+            if not applied:
+                return 0
+
+            await self.redis.set(
+                self._latest_key(tid),
+                codec.encode_base(TournamentState(**fields), cursor=cursor),
+            )
+            # MINID는 커서 이상을 남김 (커서 항목은 재생 시 "("로 제외)
+            await self.redis.xtrim(self._log_key(tid), minid=cursor, approximate=False)
+            self._pending_deltas[tid] = 0
+            return applied
+        except Exception as e:
+            logger.error(f"[SNAPSHOT] 토너먼트 {tid} 스냅샷 압축 실패: {e}")
+            return 0
+
+    # =========================================================================
+    # Hand snapshots
+    # =========================================================================
 
     async def save_hand_snapshot(
         self,
@@ -119,28 +268,43 @@ class SnapshotManager:
             pk_state_bytes=pk_state,
             starting_stacks=stacks,
         )
-        data = pickle.dumps(
-            {
-                "table_id": table_id,
-                "hand_id": hand_id,
-                "pk_state": pk_state,
-                "stacks": stacks,
-            }
+        await self.redis.set(
+            self._hand_key(tid, table_id),
+            codec.encode_hand(table_id, hand_id, pk_state, stacks),
         )
-        await self.redis.set(self._hand_key(tid, table_id), gzip.compress(data))
+        await self.redis.delete(self._actions_key(tid, table_id))
         return snapshot
 
+    async def update_hand_action(
+        self, tid: str, table_id: str, action: Dict[str, Any]
+    ) -> None:
+        """진행 중 핸드 액션 로그에 액션 추가."""
+        await self.redis.rpush(
+            self._actions_key(tid, table_id), codec.encode_action(action)
+        )
+
     async def complete_hand(self, tid: str, table_id: str) -> None:
-        await self.redis.delete(self._hand_key(tid, table_id))
+        await self.redis.delete(
+            self._hand_key(tid, table_id), self._actions_key(tid, table_id)
+        )
 
-    async def load_latest(self, tid: str) -> Optional[TournamentState]:
-        """Load latest tournament snapshot."""
-        compressed = await self.redis.get(self._latest_key(tid))
-        if not compressed:
+    async def load_hand(self, tid: str, table_id: str) -> Optional[HandSnapshot]:
+        data = await self.redis.get(self._hand_key(tid, table_id))
+        if not data:
             return None
-        # 기존 코드: pickle은 HMAC 검증된 내부 데이터에만 사용
-        state_dict = pickle.loads(gzip.decompress(compressed))
-        return self._deserialize_state(state_dict)
+        table_id, hand_id, pk_state, stacks = codec.decode_hand(data)
+        actions = await self.redis.lrange(self._actions_key(tid, table_id), 0, -1)
+        return HandSnapshot(
+            table_id=table_id,
+            hand_id=hand_id,
+            pk_state_bytes=pk_state,
+            starting_stacks=stacks,
+            action_log=codec.decode_actions(actions),
+        )
+
+    # =========================================================================
+    # Recovery / cleanup
+    # =========================================================================
 
     async def list_recoverable_tournaments(self) -> list[str]:
         """진행 중이던 토너먼트 ID 목록 조회 (복구 대상).
@@ -174,8 +338,15 @@ class SnapshotManager:
         Returns:
             삭제 성공 여부
         """
-        # latest 스냅샷 삭제
+        # 진행 중인 압축이 베이스를 다시 쓰지 않도록 먼저 중단
+        task = self._compactions.pop(tid, None)
+        if task:
+            task.cancel()
+        self._pending_deltas.pop(tid, None)
+
+        # latest 스냅샷 + 델타 로그 삭제
         latest_deleted = await self.redis.delete(self._latest_key(tid))
+        await self.redis.delete(self._log_key(tid))
 
         # hand 스냅샷들 삭제 (패턴 매칭)
         hand_pattern = f"{self.KEY_PREFIX}:{tid}:hand:*"
@@ -187,110 +358,3 @@ class SnapshotManager:
             await self.redis.delete(*hand_keys)
 
         return latest_deleted > 0
-
-    async def load_hand(self, tid: str, table_id: str) -> Optional[HandSnapshot]:
-        compressed = await self.redis.get(self._hand_key(tid, table_id))
-        if not compressed:
-            return None
-        data = pickle.loads(gzip.decompress(compressed))
-        return HandSnapshot(
-            table_id=data["table_id"],
-            hand_id=data["hand_id"],
-            pk_state_bytes=data["pk_state"],
-            starting_stacks=data["stacks"],
-        )
-
-    def _serialize_state(self, state: TournamentState) -> Dict[str, Any]:
-        return {
-            "tournament_id": state.tournament_id,
-            "config": self._ser_config(state.config),
-            "status": state.status.value,
-            "current_blind_level": state.current_blind_level,
-            "players": {u: self._ser_player(p) for u, p in state.players.items()},
-            "tables": {t: self._ser_table(tb) for t, tb in state.tables.items()},
-            "ranking": state.ranking,
-            "total_prize_pool": state.total_prize_pool,
-        }
-
-    def _ser_config(self, c: TournamentConfig) -> Dict:
-        return {
-            "tournament_id": c.tournament_id,
-            "name": c.name,
-            "max_players": c.max_players,
-            "buy_in": c.buy_in,
-            "starting_chips": c.starting_chips,
-            "blind_levels": [
-                {
-                    "level": b.level,
-                    "sb": b.small_blind,
-                    "bb": b.big_blind,
-                    "ante": b.ante,
-                }
-                for b in c.blind_levels
-            ],
-        }
-
-    def _ser_player(self, p: TournamentPlayer) -> Dict:
-        return {
-            "user_id": p.user_id,
-            "nickname": p.nickname,
-            "chip_count": p.chip_count,
-            "table_id": p.table_id,
-            "seat_position": p.seat_position,
-            "is_active": p.is_active,
-        }
-
-    def _ser_table(self, t: TournamentTable) -> Dict:
-        return {
-            "table_id": t.table_id,
-            "table_number": t.table_number,
-            "seats": list(t.seats),
-            "hand_in_progress": t.hand_in_progress,
-        }
-
-    def _deserialize_state(self, d: Dict) -> TournamentState:
-        config = self._deser_config(d["config"])
-        players = {u: self._deser_player(p) for u, p in d["players"].items()}
-        tables = {t: self._deser_table(tb) for t, tb in d["tables"].items()}
-        return TournamentState(
-            tournament_id=d["tournament_id"],
-            config=config,
-            status=TournamentStatus(d["status"]),
-            current_blind_level=d["current_blind_level"],
-            players=players,
-            tables=tables,
-            ranking=d.get("ranking", []),
-            total_prize_pool=d.get("total_prize_pool", 0),
-        )
-
-    def _deser_config(self, d: Dict) -> TournamentConfig:
-        levels = tuple(
-            BlindLevel(b["level"], b["sb"], b["bb"], b.get("ante", 0))
-            for b in d.get("blind_levels", [])
-        )
-        return TournamentConfig(
-            tournament_id=d["tournament_id"],
-            name=d["name"],
-            max_players=d["max_players"],
-            buy_in=d["buy_in"],
-            starting_chips=d["starting_chips"],
-            blind_levels=levels,
-        )
-
-    def _deser_player(self, d: Dict) -> TournamentPlayer:
-        return TournamentPlayer(
-            user_id=d["user_id"],
-            nickname=d["nickname"],
-            chip_count=d["chip_count"],
-            table_id=d.get("table_id"),
-            seat_position=d.get("seat_position"),
-            is_active=d["is_active"],
-        )
-
-    def _deser_table(self, d: Dict) -> TournamentTable:
-        return TournamentTable(
-            table_id=d["table_id"],
-            table_number=d["table_number"],
-            seats=tuple(d["seats"]),
-            hand_in_progress=d["hand_in_progress"],
-        )
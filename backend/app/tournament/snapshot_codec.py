@@ -0,0 +1,361 @@
+"""Binary codec for tournament snapshots.
+
+Replaces pickle for everything SnapshotManager writes to Redis. Records
+are msgpack-encoded positional arrays (no field names, no code execution
+on load) behind a small versioned header:
+
+    magic "TSN"  B version  B kind  B flags
+    body (msgpack, zlib-compressed when flags bit 0 is set)
+
+Record kinds:
+
+- BASE:  full tournament image plus the log cursor it includes
+- DELTA: tables and players touched by one change (hand complete,
+         player move) and the tournament header fields it changed
+- HAND:  in-progress hand state for one table
+- ACTION: one hand action appended to the table's action log
+
+Deltas carry absolute records, not increments, so replaying a delta
+whose change is already part of the base is harmless.
+"""
+
+import dataclasses
+import struct
+import zlib
+from datetime import datetime
+from enum import IntEnum
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import msgpack
+
+from .models import (
+    BlindLevel,
+    TournamentConfig,
+    TournamentPlayer,
+    TournamentState,
+    TournamentStatus,
+    TournamentTable,
+)
+
+CODEC_MAGIC = b"TSN"
+CODEC_VERSION = 1
+
+# Bodies larger than this are zlib-compressed
+COMPRESS_THRESHOLD = 1024
+
+_HEADER = struct.Struct(">3sBBB")  # magic, version, kind, flags
+_FLAG_COMPRESSED = 0x01
+
+# Tournament header fields a delta may carry. Table/player deltas carry
+# none: they can be appended out of order across tables, so status
+# changes are logged as their own deltas in order.
+STATUS_FIELDS = ("status", "ended_at")
+LEVEL_FIELDS = ("current_blind_level", "level_started_at", "next_level_at")
+
+_DATETIME_FIELDS = {"ended_at", "level_started_at", "next_level_at"}
+
+
+class RecordKind(IntEnum):
+    """Snapshot record type."""
+
+    BASE = 1
+    DELTA = 2
+    HAND = 3
+    ACTION = 4
+
+
+# =============================================================================
+# Framing
+# =============================================================================
+
+
+def _frame(kind: RecordKind, body: Any) -> bytes:
+    payload = msgpack.packb(body, use_bin_type=True)
+    flags = 0
+    if len(payload) > COMPRESS_THRESHOLD:
+        payload = zlib.compress(payload, 1)
+        flags |= _FLAG_COMPRESSED
+    return _HEADER.pack(CODEC_MAGIC, CODEC_VERSION, kind, flags) + payload
+
+
+def _unframe(data: bytes, expected: RecordKind) -> Any:
+    if len(data) < _HEADER.size:
+        raise ValueError("Snapshot record too short")
+    magic, version, kind, flags = _HEADER.unpack_from(data)
+    if magic != CODEC_MAGIC:
+        raise ValueError("Not a tournament snapshot record")
+    if version != CODEC_VERSION:
+        raise ValueError(f"Unsupported snapshot version: {version}")
+    if kind != expected:
+        raise ValueError(f"Expected {expected.name} record, got kind {kind}")
+
+    payload = data[_HEADER.size:]
+    try:
+        if flags & _FLAG_COMPRESSED:
+            payload = zlib.decompress(payload)
+        return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+    except (zlib.error, ValueError, msgpack.UnpackException) as e:
+        raise ValueError(f"Malformed snapshot record: {e}") from e
+
+
+# =============================================================================
+# Entity records
+# =============================================================================
+
+
+def _dt(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _parse_dt(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _player_record(p: TournamentPlayer) -> list:
+    return [
+        p.user_id,
+        p.nickname,
+        p.chip_count,
+        p.table_id,
+        p.seat_position,
+        p.is_active,
+        p.elimination_rank,
+        p.rebuy_count,
+        p.addon_used,
+    ]
+
+
+def _player_from_record(r: Sequence[Any]) -> TournamentPlayer:
+    return TournamentPlayer(
+        user_id=r[0],
+        nickname=r[1],
+        chip_count=r[2],
+        table_id=r[3],
+        seat_position=r[4],
+        is_active=r[5],
+        elimination_rank=r[6],
+        rebuy_count=r[7],
+        addon_used=r[8],
+    )
+
+
+def _table_record(t: TournamentTable) -> list:
+    return [
+        t.table_id,
+        t.table_number,
+        list(t.seats),
+        t.max_seats,
+        t.hand_in_progress,
+        t.is_breaking,
+    ]
+
+
+def _table_from_record(r: Sequence[Any]) -> TournamentTable:
+    return TournamentTable(
+        table_id=r[0],
+        table_number=r[1],
+        seats=tuple(r[2]),
+        max_seats=r[3],
+        hand_in_progress=r[4],
+        is_breaking=r[5],
+    )
+
+
+def _config_record(c: TournamentConfig) -> Dict[str, Any]:
+    # Written once per base, so keyed by field name (new fields stay readable)
+    record = {}
+    for f in dataclasses.fields(c):
+        value = getattr(c, f.name)
+        if f.name == "blind_levels":
+            value = [
+                [b.level, b.small_blind, b.big_blind, b.ante, b.duration_minutes]
+                for b in value
+            ]
+        elif isinstance(value, datetime):
+            value = _dt(value)
+        elif isinstance(value, tuple):
+            value = list(value)
+        record[f.name] = value
+    return record
+
+
+def _config_from_record(r: Mapping[str, Any]) -> TournamentConfig:
+    known = {f.name for f in dataclasses.fields(TournamentConfig)}
+    values = {k: v for k, v in r.items() if k in known}
+    values["blind_levels"] = tuple(BlindLevel(*b) for b in r["blind_levels"])
+    if "payout_structure" in values:
+        values["payout_structure"] = tuple(values["payout_structure"])
+    if values.get("scheduled_start_time"):
+        values["scheduled_start_time"] = _parse_dt(values["scheduled_start_time"])
+    return TournamentConfig(**values)
+
+
+def _header_values(state: TournamentState, fields: Iterable[str]) -> Dict[str, Any]:
+    values = {}
+    for name in fields:
+        value = getattr(state, name)
+        if name == "status":
+            value = value.value
+        elif name in _DATETIME_FIELDS:
+            value = _dt(value)
+        values[name] = value
+    return values
+
+
+def _apply_header(fields: Dict[str, Any], values: Mapping[str, Any]) -> None:
+    for name, value in values.items():
+        if name == "status":
+            value = TournamentStatus(value)
+        elif name in _DATETIME_FIELDS:
+            value = _parse_dt(value)
+        fields[name] = value
+
+
+# =============================================================================
+# Base image
+# =============================================================================
+
+
+def encode_base(state: TournamentState, cursor: Optional[str] = None) -> bytes:
+    """Encode a full tournament image.
+
+    Args:
+        state: Tournament state
+        cursor: Last delta log entry ID already applied to this image
+
+    Returns:
+        Encoded BASE record
+    """
+    return _frame(RecordKind.BASE, [
+        cursor,
+        state.tournament_id,
+        _config_record(state.config),
+        _header_values(state, STATUS_FIELDS + LEVEL_FIELDS),
+        _dt(state.started_at),
+        state.total_prize_pool,
+        state.itm_threshold,
+        list(state.ranking),
+        [_table_record(t) for t in state.tables.values()],
+        [_player_record(p) for p in state.players.values()],
+    ])
+
+
+def decode_base(data: bytes) -> Tuple[Optional[str], Dict[str, Any]]:
+    """Decode a BASE record.
+
+    Returns:
+        (cursor, TournamentState keyword arguments). Deltas are applied
+        to the arguments with apply_delta() before building the state.
+
+    Raises:
+        ValueError: Malformed or unsupported record
+    """
+    body = _unframe(data, RecordKind.BASE)
+    try:
+        (cursor, tournament_id, config, header, started_at,
+         prize_pool, itm_threshold, ranking, tables, players) = body
+        fields: Dict[str, Any] = {
+            "tournament_id": tournament_id,
+            "config": _config_from_record(config),
+            "started_at": _parse_dt(started_at),
+            "total_prize_pool": prize_pool,
+            "itm_threshold": itm_threshold,
+            "ranking": list(ranking),
+            "tables": {r[0]: _table_from_record(r) for r in tables},
+            "players": {r[0]: _player_from_record(r) for r in players},
+        }
+        _apply_header(fields, header)
+    except (TypeError, IndexError, KeyError) as e:
+        raise ValueError(f"Malformed base record: {e}") from e
+    return cursor, fields
+
+
+# =============================================================================
+# Deltas
+# =============================================================================
+
+
+def encode_delta(
+    state: TournamentState,
+    table_ids: Iterable[str] = (),
+    user_ids: Iterable[str] = (),
+    header_fields: Sequence[str] = (),
+) -> bytes:
+    """Encode the tables/players touched by one change.
+
+    Tables missing from ``state`` are recorded as removed.
+    """
+    return _frame(RecordKind.DELTA, [
+        _header_values(state, header_fields),
+        [
+            [table_id, _table_record(state.tables[table_id])
+             if table_id in state.tables else None]
+            for table_id in table_ids
+        ],
+        [
+            _player_record(state.players[user_id])
+            for user_id in user_ids
+            if user_id in state.players
+        ],
+    ])
+
+
+def apply_delta(fields: Dict[str, Any], data: bytes) -> None:
+    """Apply a DELTA record to decode_base() arguments in place.
+
+    Raises:
+        ValueError: Malformed or unsupported record
+    """
+    body = _unframe(data, RecordKind.DELTA)
+    try:
+        header, tables, players = body
+        _apply_header(fields, header)
+        for table_id, record in tables:
+            if record is None:
+                fields["tables"].pop(table_id, None)
+            else:
+                fields["tables"][table_id] = _table_from_record(record)
+        for record in players:
+            fields["players"][record[0]] = _player_from_record(record)
+    except (TypeError, IndexError, KeyError) as e:
+        raise ValueError(f"Malformed delta record: {e}") from e
+
+
+# =============================================================================
+# Hand records
+# =============================================================================
+
+
+def encode_hand(
+    table_id: str,
+    hand_id: str,
+    pk_state: bytes,
+    stacks: Mapping[str, int],
+) -> bytes:
+    """Encode an in-progress hand snapshot."""
+    return _frame(RecordKind.HAND, [table_id, hand_id, pk_state, dict(stacks)])
+
+
+def decode_hand(data: bytes) -> Tuple[str, str, bytes, Dict[str, int]]:
+    """Decode a HAND record into (table_id, hand_id, pk_state, stacks)."""
+    body = _unframe(data, RecordKind.HAND)
+    try:
+        table_id, hand_id, pk_state, stacks = body
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Malformed hand record: {e}") from e
+    return table_id, hand_id, pk_state, stacks
+
+
+def encode_action(action: Mapping[str, Any]) -> bytes:
+    """Encode one hand action log entry."""
+    return _frame(RecordKind.ACTION, dict(action))
+
+
+def decode_action(data: bytes) -> Dict[str, Any]:
+    """Decode an ACTION record."""
+    return _unframe(data, RecordKind.ACTION)
+
+
+def decode_actions(records: Iterable[bytes]) -> List[Dict[str, Any]]:
+    """Decode an action log."""
+    return [decode_action(r) for r in records]
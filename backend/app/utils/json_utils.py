@@ -90,11 +90,15 @@ def json_dumps_bytes(data: Any) -> bytes:
 
     Returns:
         JSON bytes (useful for WebSocket binary messages)
+
+    Note:
+        Non-string keys (e.g. seat numbers) are stringified like json.dumps
+        so WebSocket payloads encode the same as ``send_json``.
     """
     return orjson.dumps(
         data,
         default=_default_serializer,
-        option=orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY,
+        option=orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
     )
 
 
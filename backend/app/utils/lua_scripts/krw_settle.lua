@@ -0,0 +1,62 @@
+--[[
+KRW Settle Lua Script - Multi-Wallet Lock for Hand Settlement
+
+Batched counterpart of krw_transfer.lua: locks every wallet touched by a
+hand in one round trip so that all win/rake deltas can be written to the
+ledger together, then releases the locks and invalidates the cached
+balances in a second round trip.
+
+Features:
+- All-or-nothing lock acquisition (no partial locks on contention)
+- Ownership-checked lock release
+- Balance cache invalidation together with release
+
+Arguments:
+  KEYS[1..n]    = lock keys (e.g., "wallet:lock:user_id")
+  KEYS[n+1..2n] = balance cache keys (e.g., "wallet:balance:user_id"), same order
+
+  ARGV[1] = operation type: "acquire" or "release"
+  ARGV[2] = lock token (unique identifier for this settlement)
+  ARGV[3] = lock TTL in seconds
+
+Returns:
+  {status, message}
+  status: 1 = success, 0 = failure
+--]]
+
+local operation = ARGV[1]
+local lock_token = ARGV[2]
+local lock_ttl = tonumber(ARGV[3])
+
+local count = #KEYS / 2
+
+if operation == "acquire" then
+    -- Fail without side effects if any wallet is already locked
+    for i = 1, count do
+        if redis.call("EXISTS", KEYS[i]) == 1 then
+            return {0, "LOCK_FAILED: " .. KEYS[i]}
+        end
+    end
+
+    for i = 1, count do
+        redis.call("SET", KEYS[i], lock_token, "EX", lock_ttl)
+    end
+
+    return {1, "OK"}
+
+elseif operation == "release" then
+    local released = 0
+
+    for i = 1, count do
+        if redis.call("GET", KEYS[i]) == lock_token then
+            redis.call("DEL", KEYS[i])
+            released = released + 1
+        end
+        redis.call("DEL", KEYS[count + i])
+    end
+
+    return {1, tostring(released)}
+
+else
+    return {0, "INVALID_OPERATION: " .. operation}
+end
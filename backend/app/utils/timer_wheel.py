@@ -0,0 +1,288 @@
+"""Hierarchical timer wheel shared by per-connection and per-table timers.
+
+Heartbeats, token revalidation, stale-connection checks and turn timeouts
+used to run as one sleeping task each (40k+ tasks per worker at 20k
+connections). They now register deadlines with a single TimerWheel driven
+by one task:
+
+- schedule() and TimerHandle.cancel() are O(1) (dict insert/pop)
+- Level 0 has 256 slots of `tick` seconds; each higher level has 64 slots
+  covering the whole span of the level below. Timers are cascaded down
+  when the lower level wraps (classic Linux kernel timer layout)
+- Callbacks run on the loop: plain functions inline, coroutine functions
+  as short-lived tasks that exist only while the callback is running
+- The driver sleeps while no timers are pending
+
+Metrics: timer skew (how late callbacks fire) and tick backlog (how far the
+driver is behind the clock) expose event-loop lag under load.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import math
+from collections.abc import Callable
+from typing import Any
+
+from app.middleware.prometheus import record_timer_skew, update_timer_wheel_state
+from app.utils.async_utils import cancel_task_safe, create_safe_task
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TICK_SECONDS = 0.1
+
+# Slot bits per level: 256 x 0.1s = 25.6s, then x64 = 27min, 29h, 77 days
+LEVEL_BITS = (8, 6, 6, 6)
+_MAX_SPAN_BITS = sum(LEVEL_BITS)
+
+
+class TimerHandle:
+    """A scheduled callback. Cancel with cancel()."""
+
+    __slots__ = ("deadline", "expires", "_callback", "_args", "_bucket", "_wheel")
+
+    def __init__(
+        self,
+        wheel: TimerWheel,
+        deadline: float,
+        expires: int,
+        callback: Callable[..., Any],
+        args: tuple[Any, ...],
+    ) -> None:
+        self.deadline = deadline  # loop.time() the callback is due
+        self.expires = expires  # wheel tick the callback fires on
+        self._callback = callback
+        self._args = args
+        self._bucket: dict[TimerHandle, None] | None = None
+        self._wheel = wheel
+
+    @property
+    def active(self) -> bool:
+        """True until the timer fires or is cancelled."""
+        return self._bucket is not None
+
+    def cancel(self) -> bool:
+        """Cancel the timer.
+
+        Returns:
+            True if the timer was pending, False if it already fired/was cancelled
+        """
+        if self._bucket is None:
+            return False
+        self._bucket.pop(self, None)
+        self._bucket = None
+        self._wheel._pending -= 1
+        return True
+
+
+class TimerWheel:
+    """Hierarchical timer wheel driven by a single asyncio task.
+
+    Usage:
+        wheel = get_timer_wheel()
+        handle = wheel.schedule(30.0, send_ping, conn)
+        handle.cancel()
+    """
+
+    def __init__(self, tick: float = DEFAULT_TICK_SECONDS) -> None:
+        self._tick = tick
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task | None = None
+        self._wakeup = asyncio.Event()
+        self._reset()
+
+    def _reset(self) -> None:
+        for slots in getattr(self, "_levels", ()):
+            for bucket in slots:
+                for handle in bucket:
+                    handle._bucket = None  # dropped: cancel() becomes a no-op
+        self._levels: list[list[dict[TimerHandle, None]]] = [
+            [{} for _ in range(1 << bits)] for bits in LEVEL_BITS
+        ]
+        self._current = 0  # ticks processed since _origin
+        self._origin = self._loop.time() if self._loop else 0.0
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of scheduled timers."""
+        return self._pending
+
+    # =========================================================================
+    # Scheduling
+    # =========================================================================
+
+    def schedule(
+        self,
+        delay: float,
+        callback: Callable[..., Any],
+        *args: Any,
+    ) -> TimerHandle:
+        """Run callback(*args) after `delay` seconds (rounded up to a tick).
+
+        Must be called from a running event loop; the driver task is started
+        on first use.
+
+        Args:
+            delay: Seconds from now
+            callback: Function or coroutine function
+            *args: Arguments passed to callback
+
+        Returns:
+            Handle for cancellation
+        """
+        self._ensure_running()
+        now = self._loop.time()
+
+        if self._pending == 0:
+            # Idle driver may be behind the clock; nothing to fire, so skip ahead
+            self._current = max(self._current, int((now - self._origin) / self._tick))
+
+        deadline = now + max(0.0, delay)
+        expires = max(
+            self._current + 1,
+            math.ceil((deadline - self._origin) / self._tick),
+        )
+        handle = TimerHandle(self, deadline, expires, callback, args)
+        self._place(handle)
+        self._pending += 1
+
+        if self._pending == 1:
+            self._wakeup.set()
+        return handle
+
+    def _place(self, handle: TimerHandle) -> None:
+        expires = handle.expires
+        delta = expires - self._current
+        if delta >= 1 << _MAX_SPAN_BITS:
+            # Beyond the top level: park in the furthest slot, re-placed on cascade
+            expires = self._current + (1 << _MAX_SPAN_BITS) - 1
+            delta = expires - self._current
+
+        shift = 0
+        for level, bits in enumerate(LEVEL_BITS):
+            if delta < 1 << (shift + bits):
+                bucket = self._levels[level][(expires >> shift) & ((1 << bits) - 1)]
+                bucket[handle] = None
+                handle._bucket = bucket
+                return
+            shift += bits
+
+    # =========================================================================
+    # Driver
+    # =========================================================================
+
+    def _ensure_running(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # New event loop (e.g. tests): timers from the old one can't run
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._reset()
+            self._task = None
+        if self._task is None or self._task.done():
+            self._task = create_safe_task(self._run(), name="timer_wheel")
+
+    async def stop(self) -> None:
+        """Stop the driver and drop all pending timers."""
+        await cancel_task_safe(self._task)
+        self._task = None
+        self._reset()
+
+    async def _run(self) -> None:
+        loop = self._loop
+        while True:
+            if self._pending == 0:
+                self._wakeup.clear()
+                update_timer_wheel_state(0, 0)
+                await self._wakeup.wait()
+                continue
+
+            delay = self._origin + (self._current + 1) * self._tick - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            now = loop.time()
+            # At least one tick is due after the sleep (guards float rounding)
+            due = max(self._current + 1, int((now - self._origin) / self._tick))
+            backlog = due - self._current
+            while self._current < due:
+                self._advance(now)
+
+            update_timer_wheel_state(self._pending, backlog)
+
+    def _advance(self, now: float) -> None:
+        """Process one tick: cascade higher levels, then fire level 0."""
+        self._current += 1
+        current = self._current
+
+        level0_mask = (1 << LEVEL_BITS[0]) - 1
+        if current & level0_mask == 0:
+            shift = LEVEL_BITS[0]
+            for level in range(1, len(LEVEL_BITS)):
+                index = (current >> shift) & ((1 << LEVEL_BITS[level]) - 1)
+                self._cascade(level, index)
+                if index != 0:
+                    break
+                shift += LEVEL_BITS[level]
+
+        slots = self._levels[0]
+        index = current & level0_mask
+        bucket = slots[index]
+        if not bucket:
+            return
+        slots[index] = {}
+
+        for handle in list(bucket):
+            if handle._bucket is not bucket:
+                continue  # cancelled by an earlier callback in this tick
+            handle._bucket = None
+            if handle.expires > current:
+                self._place(handle)
+                continue
+            self._pending -= 1
+            self._fire(handle, now)
+
+    def _cascade(self, level: int, index: int) -> None:
+        slots = self._levels[level]
+        bucket = slots[index]
+        if not bucket:
+            return
+        slots[index] = {}
+        for handle in bucket:
+            self._place(handle)
+
+    def _fire(self, handle: TimerHandle, now: float) -> None:
+        record_timer_skew(now - handle.deadline)
+        callback = handle._callback
+        try:
+            result = callback(*handle._args)
+            if inspect.isawaitable(result):
+                create_safe_task(
+                    result,
+                    name=f"timer:{getattr(callback, '__qualname__', 'callback')}",
+                )
+        except Exception as e:
+            logger.exception(f"Timer callback {callback!r} failed: {e}")
+
+
+# Global timer wheel (one per worker process)
+_timer_wheel: TimerWheel | None = None
+
+
+def get_timer_wheel() -> TimerWheel:
+    """Get or create the global TimerWheel instance."""
+    global _timer_wheel
+    if _timer_wheel is None:
+        _timer_wheel = TimerWheel()
+    return _timer_wheel
+
+
+async def shutdown_timer_wheel() -> None:
+    """Stop the global TimerWheel instance."""
+    global _timer_wheel
+    if _timer_wheel is not None:
+        await _timer_wheel.stop()
+        _timer_wheel = None
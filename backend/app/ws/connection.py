@@ -10,6 +10,9 @@ from typing import Any
 
 from fastapi import WebSocket
 
+from app.ws.outbound import OutboundQueue, OverflowPolicy, coalesce_key
+from app.ws.serializer import encode_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,8 +47,40 @@ class WebSocketConnection:
     # State recovery - track last seen stateVersion per channel
     last_seen_versions: dict[str, int] = field(default_factory=dict)
 
+    # Delta-encoded table state (negotiated via AUTH payload "snapshotDeltas")
+    snapshot_deltas: bool = False
+    snapshot_bases: dict[str, dict[str, Any]] = field(default_factory=dict, repr=False)
+
+    # Outbound queue (started by the gateway; writes go straight to the socket without it)
+    outbound: OutboundQueue | None = field(default=None, repr=False)
+
+    def start_outbound_queue(
+        self,
+        maxsize: int,
+        policy: OverflowPolicy = OverflowPolicy.DISCONNECT,
+    ) -> None:
+        """Route sends through a bounded queue drained by a writer task."""
+        if self.outbound is None:
+            self.outbound = OutboundQueue(
+                self.websocket, self.connection_id, maxsize, policy
+            )
+            self.outbound.start()
+
+    async def stop_outbound_queue(self) -> None:
+        """Stop the writer task and discard pending messages."""
+        if self.outbound is not None:
+            await self.outbound.stop()
+
     async def send(self, message: dict[str, Any]) -> bool:
-        """Send message to client. Returns False if failed."""
+        """Send message to client. Returns False if failed.
+
+        With an outbound queue the message is queued and this never waits on
+        the socket.
+        """
+        if self.outbound is not None:
+            return self.outbound.put(
+                encode_json(message).decode("utf-8"), coalesce_key(message)
+            )
         try:
             await self.websocket.send_json(message)
             return True
@@ -53,6 +88,25 @@ class WebSocketConnection:
             logger.warning(f"Failed to send message to {self.connection_id}: {e}")
             return False
 
+    async def send_serialized(
+        self,
+        payload: str,
+        coalesce: tuple[str, int | None] | None = None,
+    ) -> bool:
+        """Send an already-encoded JSON text frame. Returns False if failed.
+
+        Used by channel broadcasts so a message is serialized once and the
+        same payload is written to every subscriber.
+        """
+        if self.outbound is not None:
+            return self.outbound.put(payload, coalesce)
+        try:
+            await self.websocket.send_text(payload)
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to send message to {self.connection_id}: {e}")
+            return False
+
     async def close(self, code: int = 1000, reason: str = "") -> None:
         """Close the connection."""
         try:
@@ -70,6 +124,10 @@ class WebSocketConnection:
         """Update last seen state version for a channel."""
         self.last_seen_versions[channel] = version
 
+    def reset_snapshot_base(self, channel: str) -> None:
+        """Forget the last table state sent so the next one is a full snapshot."""
+        self.snapshot_bases.pop(channel, None)
+
     def is_subscribed(self, channel: str) -> bool:
         """Check if connection is subscribed to a channel."""
         return channel in self.subscribed_channels
@@ -0,0 +1,111 @@
+"""Per-message database sessions for WebSocket handlers.
+
+The gateway used to open one AsyncSession per socket and keep it for the
+whole connection. Any read left its transaction (and pooled connection)
+open until the next commit, so idle players pinned pool connections and
+CCU was capped by the DB pool size.
+
+Handlers now get a session scoped to the message being handled:
+
+- The gateway wraps each dispatch in message_db_scope(event_type)
+- The session is only created when a handler first touches ``self.db``;
+  messages that never use the DB never reach the pool
+- The session is closed when the message is done, returning its
+  connection (uncommitted work is rolled back, as with get_db_session())
+
+Pool checkouts and the wait for the first connection are exported per
+event type.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.middleware.prometheus import record_ws_db_checkout
+from app.utils.db import async_session_factory
+
+
+class MessageDbScope:
+    """Lazily created DB session for one inbound message."""
+
+    def __init__(
+        self,
+        event_type: str,
+        session_factory: Callable[[], AsyncSession] = async_session_factory,
+    ) -> None:
+        self.event_type = event_type
+        self._session_factory = session_factory
+        self._session: AsyncSession | None = None
+        self._first_use: float | None = None
+
+    @property
+    def session(self) -> AsyncSession:
+        """Session for this message (created on first access)."""
+        if self._session is None:
+            self._first_use = time.perf_counter()
+            self._session = self._session_factory()
+            event.listen(self._session.sync_session, "after_begin", self._on_begin)
+        return self._session
+
+    @property
+    def used(self) -> bool:
+        """True if a handler touched the DB during this message."""
+        return self._session is not None
+
+    def _on_begin(self, session, transaction, connection) -> None:
+        # Each transaction checks a connection out of the pool. The first one
+        # is timed from the handler's first DB use (pool wait + pre-ping).
+        wait = None
+        if self._first_use is not None:
+            wait = time.perf_counter() - self._first_use
+            self._first_use = None
+        record_ws_db_checkout(self.event_type, wait)
+
+    async def close(self) -> None:
+        """Close the session and return its connection to the pool."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+_current_scope: ContextVar[MessageDbScope | None] = ContextVar(
+    "ws_message_db_scope", default=None
+)
+
+
+@asynccontextmanager
+async def message_db_scope(
+    event_type: str,
+    session_factory: Callable[[], AsyncSession] = async_session_factory,
+) -> AsyncIterator[MessageDbScope]:
+    """Scope handler DB access to one message.
+
+    Usage:
+        async with message_db_scope(event.type.value):
+            response = await handler.handle(conn, event)
+    """
+    scope = MessageDbScope(event_type, session_factory)
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+        await scope.close()
+
+
+def current_db_session() -> AsyncSession:
+    """Return the session of the message being handled.
+
+    Raises:
+        RuntimeError: If called outside message_db_scope()
+    """
+    scope = _current_scope.get()
+    if scope is None:
+        raise RuntimeError("No WebSocket message DB scope is active")
+    return scope.session
@@ -0,0 +1,141 @@
+"""Delta-encoded table state stream.
+
+After every action each seated player receives their personalized table
+state. Clients that negotiate ``snapshotDeltas`` in the AUTH payload get a
+TABLE_DELTA with JSON-patch style ops against the last state sent to that
+connection instead of a full TABLE_SNAPSHOT.
+
+Resync rules:
+- No base for the channel (new subscription, recovery) → full snapshot
+- stateVersion did not advance past the base → full snapshot
+- Client sees baseVersion != its own version → sends RECOVERY_REQUEST,
+  which clears the base so the next state goes out in full
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from app.ws.events import EventType
+from app.ws.messages import MessageEnvelope
+
+if TYPE_CHECKING:
+    from app.ws.connection import WebSocketConnection
+
+
+def _escape(token: Any) -> str:
+    """Escape a JSON pointer reference token (RFC 6901)."""
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def diff_state(old: Any, new: Any, path: str = "") -> list[dict[str, Any]]:
+    """Compute JSON-patch style ops turning ``old`` into ``new``.
+
+    Dicts are diffed per key and equal-length lists per index; anything
+    else that differs is replaced wholesale.
+
+    Args:
+        old: Previous document
+        new: New document
+        path: JSON pointer of the current node
+
+    Returns:
+        List of add/remove/replace ops (RFC 6902 subset)
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: list[dict[str, Any]] = [
+            {"op": "remove", "path": f"{path}/{_escape(key)}"}
+            for key in old
+            if key not in new
+        ]
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            elif old[key] != value:
+                ops.extend(diff_state(old[key], value, child))
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        ops = []
+        for index, (before, after) in enumerate(zip(old, new)):
+            if before != after:
+                ops.extend(diff_state(before, after, f"{path}/{index}"))
+        return ops
+
+    if old == new:
+        return []
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def apply_delta(document: Any, ops: list[dict[str, Any]]) -> Any:
+    """Apply ops produced by diff_state (reference client implementation).
+
+    Args:
+        document: Document to patch (modified in place where possible)
+        ops: Ops from diff_state
+
+    Returns:
+        Patched document
+    """
+    for op in ops:
+        if op["path"] == "":
+            document = op["value"]
+            continue
+
+        *parents, last = [_unescape(t) for t in op["path"].split("/")[1:]]
+        target = document
+        for token in parents:
+            target = target[int(token)] if isinstance(target, list) else target[token]
+
+        if isinstance(target, list):
+            target[int(last)] = op["value"]
+        elif op["op"] == "remove":
+            del target[last]
+        else:
+            target[last] = op["value"]
+    return document
+
+
+def build_table_state_message(
+    conn: WebSocketConnection,
+    channel: str,
+    table_id: str,
+    state: dict[str, Any],
+) -> MessageEnvelope | None:
+    """Build the next table state message for one connection.
+
+    Records ``state`` as the connection's new base for ``channel``.
+
+    Returns:
+        TABLE_DELTA or TABLE_SNAPSHOT envelope, None if nothing changed
+    """
+    version = state.get("stateVersion", 0)
+    base = conn.snapshot_bases.get(channel)
+    conn.snapshot_bases[channel] = state
+    conn.update_state_version(channel, version)
+
+    if conn.snapshot_deltas and base is not None:
+        base_version = base.get("stateVersion", 0)
+        ops = diff_state(base, state)
+        if not ops:
+            return None
+        if version > base_version:
+            return MessageEnvelope.create(
+                event_type=EventType.TABLE_DELTA,
+                payload={
+                    "tableId": table_id,
+                    "baseVersion": base_version,
+                    "stateVersion": version,
+                    "ops": ops,
+                },
+            )
+
+    return MessageEnvelope.create(
+        event_type=EventType.TABLE_SNAPSHOT,
+        payload={"tableId": table_id, "state": state},
+    )
@@ -31,6 +31,7 @@ class EventType(str, Enum):
     UNSUBSCRIBE_TABLE = "UNSUBSCRIBE_TABLE"
     TABLE_SNAPSHOT = "TABLE_SNAPSHOT"
     TABLE_STATE_UPDATE = "TABLE_STATE_UPDATE"
+    TABLE_DELTA = "TABLE_DELTA"  # TABLE_SNAPSHOT 대비 변경분 (snapshotDeltas 협상 시)
     TURN_PROMPT = "TURN_PROMPT"
     SEAT_REQUEST = "SEAT_REQUEST"
     SEAT_RESULT = "SEAT_RESULT"
@@ -137,6 +138,7 @@ SERVER_TO_CLIENT_EVENTS = frozenset([
     EventType.ROOM_JOIN_RESULT,
     EventType.TABLE_SNAPSHOT,
     EventType.TABLE_STATE_UPDATE,
+    EventType.TABLE_DELTA,
     EventType.TURN_PROMPT,
     EventType.TURN_CHANGED,
     EventType.SEAT_RESULT,
@@ -14,20 +14,25 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
 from datetime import datetime, timezone
 from typing import Any
 from uuid import uuid4
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import get_settings
+from app.middleware.rate_limit import get_ws_rate_limiter
 from app.utils.db import get_db
 from app.utils.redis_client import get_redis
 from app.utils.security import verify_access_token, TokenError
+from app.utils.timer_wheel import TimerHandle, get_timer_wheel
 from app.ws.connection import WebSocketConnection, ConnectionState
+from app.ws.db_scope import message_db_scope
 from app.ws.events import EventType, CLIENT_TO_SERVER_EVENTS
 from app.ws.manager import ConnectionManager
 from app.ws.messages import MessageEnvelope, create_error_message
+from app.ws.outbound import OverflowPolicy
 from app.ws.handlers.system import SystemHandler, create_connection_state_message
 from app.ws.handlers.lobby import LobbyHandler
 from app.ws.handlers.table import TableHandler
@@ -65,26 +70,25 @@ async def shutdown_manager() -> None:
 
 
 class HandlerRegistry:
-    """Registry for event handlers."""
+    """Registry for event handlers.
 
-    def __init__(
-        self,
-        manager: ConnectionManager,
-        db: AsyncSession,
-    ):
+    Handlers don't hold a DB session; the gateway scopes one to each message
+    (see app.ws.db_scope) so idle connections don't pin pool connections.
+    """
+
+    def __init__(self, manager: ConnectionManager):
         self.manager = manager
-        self.db = db
 
         # Get Redis client (should be initialized by now)
         current_redis_client = get_redis()
 
         # Initialize handlers
         self._system = SystemHandler(manager)
-        self._lobby = LobbyHandler(manager, db)
-        self._table = TableHandler(manager, db)
+        self._lobby = LobbyHandler(manager)
+        self._table = TableHandler(manager)
         # ActionHandler uses GameManager (in-memory) instead of DB
         self._action = ActionHandler(manager, current_redis_client)
-        self._chat = ChatHandler(manager, db, current_redis_client)
+        self._chat = ChatHandler(manager, redis=current_redis_client)
 
         if not current_redis_client:
             logger.warning("Redis client not available, some features may not work")
@@ -126,6 +130,27 @@ def create_reauth_required_message() -> dict[str, Any]:
     }
 
 
+def create_rate_limit_message(data: Any, retry_after_ms: int) -> dict[str, Any]:
+    """Create a RATE_LIMIT_EXCEEDED error for a rejected message.
+
+    The limit is checked before the envelope is parsed, so requestId and
+    traceId are echoed straight from the raw frame when present.
+    """
+    raw = data if isinstance(data, dict) else {}
+    request_id = raw.get("requestId")
+    trace_id = raw.get("traceId")
+    return create_error_message(
+        error_code="RATE_LIMIT_EXCEEDED",
+        error_message="Too many messages. Please slow down.",
+        details={
+            "retryAfterMs": retry_after_ms,
+            "retryAfterSeconds": math.ceil(retry_after_ms / 1000),
+        },
+        request_id=request_id if isinstance(request_id, str) else None,
+        trace_id=trace_id if isinstance(trace_id, str) else None,
+    ).to_dict()
+
+
 # Heartbeat configuration
 HEARTBEAT_INTERVAL_SECONDS = 30.0  # 서버 → 클라이언트 PING 전송 주기
 HEARTBEAT_TIMEOUT_SECONDS = 60.0   # PONG 응답 대기 시간
@@ -138,159 +163,174 @@ class HeartbeatManager:
     - 30초마다 PING 전송
     - 60초 내에 PONG 응답 확인
     - 2회 연속 미응답 시 연결 종료
+
+    연결마다 태스크를 두지 않고 공유 타이머 휠에 다음 PING 시각을 등록합니다.
     """
 
     def __init__(self, connection: WebSocketConnection):
         self.connection = connection
-        self._task: asyncio.Task | None = None
+        self._timer: TimerHandle | None = None
         self._running = False
 
     async def start(self) -> None:
-        """하트비트 루프 시작."""
+        """하트비트 타이머 등록."""
         self._running = True
-        self._task = asyncio.create_task(self._heartbeat_loop())
+        self._schedule()
 
     async def stop(self) -> None:
-        """하트비트 루프 중지."""
+        """하트비트 타이머 취소."""
         self._running = False
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-            self._task = None
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
 
     def record_pong(self) -> None:
         """클라이언트로부터 PONG 수신 시 호출."""
         self.connection.last_pong_at = datetime.now(timezone.utc)
         self.connection.missed_pongs = 0
 
-    async def _heartbeat_loop(self) -> None:
-        """주기적으로 PING 전송하고 응답 확인."""
-        while self._running:
-            try:
-                await asyncio.sleep(HEARTBEAT_INTERVAL_SECONDS)
-
-                if not self._running:
-                    break
-
-                # PING 전송 전에 이전 PONG 응답 확인
-                if self.connection.last_ping_at is not None:
-                    # 마지막 PING 이후 PONG이 없으면 미응답 카운트 증가
-                    if (self.connection.last_pong_at is None or
-                        self.connection.last_pong_at < self.connection.last_ping_at):
-                        self.connection.missed_pongs += 1
-                        logger.warning(
-                            f"하트비트 미응답: user={self.connection.user_id}, "
-                            f"conn={self.connection.connection_id}, "
-                            f"missed={self.connection.missed_pongs}/{MAX_MISSED_PONGS}"
-                        )
+    def _schedule(self) -> None:
+        self._timer = get_timer_wheel().schedule(
+            HEARTBEAT_INTERVAL_SECONDS, self._on_timer
+        )
+
+    async def _on_timer(self) -> None:
+        """타이머 만료: 한 번 확인/전송 후 계속 실행 중이면 다음 PING 예약."""
+        if not self._running:
+            return
+        try:
+            if not await self._heartbeat_tick():
+                self._running = False
+        except Exception as e:
+            logger.warning(f"하트비트 에러: {e}")
+        if self._running:
+            self._schedule()
+
+    async def _heartbeat_tick(self) -> bool:
+        """이전 PING의 PONG 응답을 확인하고 PING 전송.
 
-                        # 최대 미응답 횟수 초과 시 연결 종료
-                        if self.connection.missed_pongs >= MAX_MISSED_PONGS:
-                            logger.info(
-                                f"하트비트 타임아웃으로 연결 종료: "
-                                f"user={self.connection.user_id}, "
-                                f"conn={self.connection.connection_id}"
-                            )
-                            try:
-                                await self.connection.websocket.close(
-                                    4003, "Heartbeat timeout - connection closed"
-                                )
-                            except Exception as e:
-                                logger.warning(f"연결 종료 실패: {e}")
-                            self._running = False
-                            break
-
-                # PING 전송
-                ping_message = {
-                    "type": "PING",
-                    "payload": {},
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                }
-
-                try:
-                    sent = await self.connection.send(ping_message)
-                    if sent:
-                        self.connection.last_ping_at = datetime.now(timezone.utc)
-                    else:
-                        logger.warning(
-                            f"PING 전송 실패: user={self.connection.user_id}"
+        Returns:
+            하트비트를 계속할지 여부 (타임아웃으로 연결 종료 시 False)
+        """
+        # PING 전송 전에 이전 PONG 응답 확인
+        if self.connection.last_ping_at is not None:
+            # 마지막 PING 이후 PONG이 없으면 미응답 카운트 증가
+            if (self.connection.last_pong_at is None or
+                self.connection.last_pong_at < self.connection.last_ping_at):
+                self.connection.missed_pongs += 1
+                logger.warning(
+                    f"하트비트 미응답: user={self.connection.user_id}, "
+                    f"conn={self.connection.connection_id}, "
+                    f"missed={self.connection.missed_pongs}/{MAX_MISSED_PONGS}"
+                )
+
+                # 최대 미응답 횟수 초과 시 연결 종료
+                if self.connection.missed_pongs >= MAX_MISSED_PONGS:
+                    logger.info(
+                        f"하트비트 타임아웃으로 연결 종료: "
+                        f"user={self.connection.user_id}, "
+                        f"conn={self.connection.connection_id}"
+                    )
+                    try:
+                        await self.connection.websocket.close(
+                            4003, "Heartbeat timeout - connection closed"
                         )
-                except Exception as e:
-                    logger.warning(f"PING 전송 에러: {e}")
+                    except Exception as e:
+                        logger.warning(f"연결 종료 실패: {e}")
+                    return False
+
+        # PING 전송
+        ping_message = {
+            "type": "PING",
+            "payload": {},
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
 
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.warning(f"하트비트 루프 에러: {e}")
+        try:
+            sent = await self.connection.send(ping_message)
+            if sent:
+                self.connection.last_ping_at = datetime.now(timezone.utc)
+            else:
+                logger.warning(
+                    f"PING 전송 실패: user={self.connection.user_id}"
+                )
+        except Exception as e:
+            logger.warning(f"PING 전송 에러: {e}")
+
+        return True
 
 
 class TokenValidator:
-    """Handles periodic token validation for WebSocket connections."""
+    """Handles periodic token validation for WebSocket connections.
+
+    Each check is a deadline on the shared timer wheel rather than a
+    per-connection sleeping task.
+    """
 
     def __init__(self, token: str, connection: WebSocketConnection):
         self.token = token
         self.connection = connection
-        self._task: asyncio.Task | None = None
+        self._timer: TimerHandle | None = None
         self._running = False
 
     async def start(self) -> None:
         """Start periodic token validation."""
         self._running = True
-        self._task = asyncio.create_task(self._validation_loop())
+        self._schedule()
 
     async def stop(self) -> None:
         """Stop periodic token validation."""
         self._running = False
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
-            self._task = None
-
-    async def _validation_loop(self) -> None:
-        """Periodically validate the token."""
-        while self._running:
-            try:
-                await asyncio.sleep(TOKEN_VALIDATION_INTERVAL_SECONDS)
-                
-                if not self._running:
-                    break
-
-                # Validate token
-                is_valid = await self._validate_token()
-                
-                if not is_valid:
-                    logger.info(
-                        f"Token expired for user={self.connection.user_id}, "
-                        f"conn={self.connection.connection_id}"
-                    )
-                    # Send re-auth required message
-                    try:
-                        await self.connection.send(create_reauth_required_message())
-                    except Exception as e:
-                        logger.warning(f"Failed to send reauth message: {e}")
-                    
-                    # Close connection with specific code
-                    try:
-                        await self.connection.websocket.close(
-                            4002, "Token expired - re-authentication required"
-                        )
-                    except Exception as e:
-                        logger.warning(f"Failed to close websocket: {e}")
-                    
-                    self._running = False
-                    break
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
 
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.warning(f"Token validation error: {e}")
-                # Continue validation loop on non-fatal errors
+    def _schedule(self) -> None:
+        self._timer = get_timer_wheel().schedule(
+            TOKEN_VALIDATION_INTERVAL_SECONDS, self._on_timer
+        )
+
+    async def _on_timer(self) -> None:
+        """Run one check and reschedule while the connection is valid."""
+        if not self._running:
+            return
+        try:
+            if not await self._check_token():
+                self._running = False
+        except Exception as e:
+            logger.warning(f"Token validation error: {e}")
+            # Keep validating on non-fatal errors
+        if self._running:
+            self._schedule()
+
+    async def _check_token(self) -> bool:
+        """Validate the token, closing the connection if it expired.
+
+        Returns:
+            True if validation should continue, False if the connection was closed
+        """
+        if await self._validate_token():
+            return True
+
+        logger.info(
+            f"Token expired for user={self.connection.user_id}, "
+            f"conn={self.connection.connection_id}"
+        )
+        # Send re-auth required message
+        try:
+            await self.connection.send(create_reauth_required_message())
+        except Exception as e:
+            logger.warning(f"Failed to send reauth message: {e}")
+
+        # Close connection with specific code
+        try:
+            await self.connection.websocket.close(
+                4002, "Token expired - re-authentication required"
+            )
+        except Exception as e:
+            logger.warning(f"Failed to close websocket: {e}")
+
+        return False
 
     async def _validate_token(self) -> bool:
         """Validate the stored token.
@@ -401,9 +441,19 @@ async def websocket_endpoint(websocket: WebSocket):
         connected_at=datetime.now(timezone.utc),
     )
 
+    # Client opts into delta-encoded table state (TABLE_DELTA)
+    conn.snapshot_deltas = bool(auth_data.get("payload", {}).get("snapshotDeltas"))
+
     # 6. Register connection
     await manager.connect(conn)
 
+    # 6.5. Start outbound writer (handlers never wait on this client's socket)
+    settings = get_settings()
+    conn.start_outbound_queue(
+        maxsize=settings.ws_outbound_queue_size,
+        policy=OverflowPolicy(settings.ws_outbound_overflow_policy),
+    )
+
     # 7. Start periodic token validation
     token_validator = TokenValidator(token, conn)
     await token_validator.start()
@@ -422,110 +472,117 @@ async def websocket_endpoint(websocket: WebSocket):
 
     logger.info(f"WebSocket connected: user={user_id}, conn={connection_id}")
 
-    # 9. Get database session for handlers
+    # 9. Initialize handler registry (DB sessions are scoped per message)
     from app.utils.db import async_session_factory
 
-    async with async_session_factory() as db:
-        # 10. Initialize handler registry
-        registry = HandlerRegistry(manager, db)
+    registry = HandlerRegistry(manager)
+    rate_limiter = get_ws_rate_limiter()
 
-        # 11. Message loop
-        try:
-            while True:
-                data = await websocket.receive_json()
-
-                try:
-                    # Parse message
-                    event = MessageEnvelope.from_dict(data)
-
-                    # Validate event direction
-                    if event.type not in CLIENT_TO_SERVER_EVENTS:
-                        error_msg = create_error_message(
-                            error_code="INVALID_EVENT_DIRECTION",
-                            error_message=f"Event {event.type.value} cannot be sent by client",
-                            request_id=event.request_id,
-                            trace_id=event.trace_id,
-                        )
-                        await conn.send(error_msg.to_dict())
-                        continue
+    # 10. Message loop
+    try:
+        while True:
+            data = await websocket.receive_json()
 
-                    # Get handler
-                    handler = registry.get_handler(event.type)
+            allowed, retry_after_ms = await rate_limiter.is_allowed(connection_id)
+            if not allowed:
+                await conn.send(create_rate_limit_message(data, retry_after_ms))
+                continue
 
-                    if handler:
-                        # Process event
-                        response = await handler.handle(conn, event)
-                        if response:
-                            await conn.send(response.to_dict())
-                    else:
-                        # Unknown event type
-                        error_msg = create_error_message(
-                            error_code="UNKNOWN_EVENT",
-                            error_message=f"Unknown event type: {event.type.value}",
-                            request_id=event.request_id,
-                            trace_id=event.trace_id,
-                        )
-                        await conn.send(error_msg.to_dict())
+            try:
+                # Parse message
+                event = MessageEnvelope.from_dict(data)
 
-                except ValueError as e:
-                    # Invalid message format
-                    logger.warning(f"Invalid message format: {e}")
+                # Validate event direction
+                if event.type not in CLIENT_TO_SERVER_EVENTS:
                     error_msg = create_error_message(
-                        error_code="INVALID_MESSAGE",
-                        error_message=f"Invalid message format: {e}",
+                        error_code="INVALID_EVENT_DIRECTION",
+                        error_message=f"Event {event.type.value} cannot be sent by client",
+                        request_id=event.request_id,
+                        trace_id=event.trace_id,
                     )
                     await conn.send(error_msg.to_dict())
+                    continue
+
+                # Get handler
+                handler = registry.get_handler(event.type)
 
-                except Exception as e:
-                    # Handler error
-                    logger.exception(f"Handler error: {e}")
+                if handler:
+                    # Process event (pool connection held only while handling)
+                    async with message_db_scope(event.type.value):
+                        response = await handler.handle(conn, event)
+                    if response:
+                        await conn.send(response.to_dict())
+                else:
+                    # Unknown event type
                     error_msg = create_error_message(
-                        error_code="HANDLER_ERROR",
-                        error_message="Internal handler error",
+                        error_code="UNKNOWN_EVENT",
+                        error_message=f"Unknown event type: {event.type.value}",
+                        request_id=event.request_id,
+                        trace_id=event.trace_id,
                     )
                     await conn.send(error_msg.to_dict())
 
-        except WebSocketDisconnect as e:
-            logger.info(
-                f"WebSocket disconnected: user={user_id}, conn={connection_id}, "
-                f"code={e.code}"
-            )
+            except ValueError as e:
+                # Invalid message format
+                logger.warning(f"Invalid message format: {e}")
+                error_msg = create_error_message(
+                    error_code="INVALID_MESSAGE",
+                    error_message=f"Invalid message format: {e}",
+                )
+                await conn.send(error_msg.to_dict())
 
-        except Exception as e:
-            logger.exception(f"WebSocket error: {e}")
-
-        finally:
-            # Stop token validation and heartbeat
-            await token_validator.stop()
-            await heartbeat_manager.stop()
-
-            # Store state for potential reconnection
-            await manager.store_user_state(
-                user_id,
-                {
-                    "subscribed_channels": list(conn.subscribed_channels),
-                    "last_seen_versions": conn.last_seen_versions,
-                    "disconnected_at": datetime.now(timezone.utc).isoformat(),
-                },
-            )
-
-            # Auto-leave all rooms when WebSocket disconnects
-            # Use a new session for cleanup to ensure it commits properly
-            try:
-                async with async_session_factory() as cleanup_db:
-                    room_service = RoomService(cleanup_db)
-                    left_count = await room_service.leave_all_rooms(user_id)
-                    if left_count > 0:
-                        await cleanup_db.commit()
-                        logger.info(
-                            f"WebSocket disconnect: user={user_id} auto-left {left_count} rooms"
-                        )
             except Exception as e:
-                logger.warning(f"Failed to auto-leave rooms for user={user_id}: {e}")
+                # Handler error
+                logger.exception(f"Handler error: {e}")
+                error_msg = create_error_message(
+                    error_code="HANDLER_ERROR",
+                    error_message="Internal handler error",
+                )
+                await conn.send(error_msg.to_dict())
+
+    except WebSocketDisconnect as e:
+        logger.info(
+            f"WebSocket disconnected: user={user_id}, conn={connection_id}, "
+            f"code={e.code}"
+        )
+
+    except Exception as e:
+        logger.exception(f"WebSocket error: {e}")
+
+    finally:
+        # Stop token validation and heartbeat
+        await token_validator.stop()
+        await heartbeat_manager.stop()
+        await conn.stop_outbound_queue()
+        rate_limiter.release(connection_id)
+
+        # Store state for potential reconnection
+        await manager.store_user_state(
+            user_id,
+            {
+                "subscribed_channels": list(conn.subscribed_channels),
+                "last_seen_versions": conn.last_seen_versions,
+                "disconnected_at": datetime.now(timezone.utc).isoformat(),
+            },
+        )
+
+        # Auto-leave all rooms when WebSocket disconnects
+        # Use a new session for cleanup to ensure it commits properly
+        try:
+            async with async_session_factory() as cleanup_db:
+                room_service = RoomService(cleanup_db)
+                left_count = await room_service.leave_all_rooms(user_id)
+                if left_count > 0:
+                    await cleanup_db.commit()
+                    logger.info(
+                        f"WebSocket disconnect: user={user_id} auto-left {left_count} rooms"
+                    )
+        except Exception as e:
+            logger.warning(f"Failed to auto-leave rooms for user={user_id}: {e}")
 
-            # Cleanup connection
-            await manager.disconnect(connection_id)
-            logger.info(f"WebSocket cleanup complete: conn={connection_id}")
+        # Cleanup connection
+        await manager.disconnect(connection_id)
+        logger.info(f"WebSocket cleanup complete: conn={connection_id}")
 
 
 @router.get("/ws/stats")
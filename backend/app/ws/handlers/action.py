@@ -33,6 +33,7 @@ from app.game.poker_table import PokerTable
 from app.game.types import ActionResult, AvailableActions, HandResult
 from app.utils.async_utils import ResourceTracker, create_safe_task, cancel_task_safe
 from app.utils.redis_client import RedisService
+from app.utils.timer_wheel import TimerHandle, get_timer_wheel
 from app.ws.connection import WebSocketConnection
 from app.ws.events import EventType
 from app.ws.handlers.base import BaseHandler
@@ -41,6 +42,7 @@ from app.ws.schemas import ActionRequestPayload
 from app.logging_config import get_logger
 from app.services.fraud_event_publisher import FraudEventPublisher, get_fraud_publisher
 from app.services.hand_history import HandHistoryService
+from app.services.hand_history_queue import get_hand_history_queue
 from app.services.player_session_tracker import get_session_tracker
 from app.utils.db import get_db_session
 
@@ -102,7 +104,8 @@ class ActionHandler(BaseHandler):
     - COMMUNITY_CARDS: New community cards
     
     Resource Management:
-    - Uses ResourceTracker for automatic cleanup of locks and timeout tasks
+    - Uses ResourceTracker for automatic cleanup of table locks
+    - Turn timeouts are deadlines on the shared timer wheel (no task per turn)
     - Prevents memory leaks from orphaned resources
     """
 
@@ -123,8 +126,8 @@ class ActionHandler(BaseHandler):
             cleanup_interval_seconds=CLEANUP_INTERVAL_SECONDS,
         )
         
-        # 테이블별 타임아웃 태스크 관리 (with tracking)
-        self._timeout_tasks: dict[str, asyncio.Task] = {}
+        # 테이블별 턴 타임아웃 (공유 타이머 휠에 등록된 데드라인)
+        self._turn_timers: dict[str, TimerHandle] = {}
         
         # 테이블별 턴 시작 시간 추적 (응답 시간 측정용)
         self._turn_start_times: dict[str, datetime] = {}
@@ -705,7 +708,9 @@ class ActionHandler(BaseHandler):
                 # Bot decision logic
                 # Live bots use strategy system, dev bots use simple logic
                 if is_livebot_player(current_player):
-                    action, amount = self._decide_livebot_action(
+                    # 전략 결정은 에퀴티 계산(CPU)을 포함하므로 워커 스레드에서 실행
+                    action, amount = await asyncio.to_thread(
+                        self._decide_livebot_action,
                         user_id=current_player.user_id,
                         actions=actions,
                         call_amount=call_amount,
@@ -1025,34 +1030,26 @@ class ActionHandler(BaseHandler):
         if is_bot_player(player):
             return
 
-        async def timeout_handler():
-            try:
-                await asyncio.sleep(turn_time)
-
-                # 아직 이 플레이어 턴인지 확인 후 자동 폴드
-                if table.current_player_seat == position:
-                    await self._execute_timeout_fold(room_id, table, position)
-
-            except asyncio.CancelledError:
-                pass  # 정상적으로 취소됨 (액션 수행)
-
-        self._timeout_tasks[room_id] = create_safe_task(
-            timeout_handler(),
-            name=f"turn_timeout_{room_id}",
+        self._turn_timers[room_id] = get_timer_wheel().schedule(
+            turn_time, self._on_turn_timeout, room_id, table, position
         )
         logger.info(f"[TIMEOUT] Started for room={room_id}, seat={position}, time={turn_time}s")
 
     async def _cancel_turn_timeout(self, room_id: str) -> None:
-        """진행 중인 타임아웃 태스크 취소."""
-        if room_id in self._timeout_tasks:
-            self._timeout_tasks[room_id].cancel()
-            try:
-                await self._timeout_tasks[room_id]
-            except asyncio.CancelledError:
-                pass
-            del self._timeout_tasks[room_id]
+        """대기 중인 턴 타임아웃 취소."""
+        timer = self._turn_timers.pop(room_id, None)
+        if timer and timer.cancel():
             logger.debug(f"[TIMEOUT] Cancelled for room={room_id}")
 
+    async def _on_turn_timeout(self, room_id: str, table: PokerTable, position: int) -> None:
+        """타이머 휠 콜백: 아직 이 플레이어 턴이면 자동 체크/폴드."""
+        timer = self._turn_timers.get(room_id)
+        if timer is not None and not timer.active:
+            del self._turn_timers[room_id]
+
+        if table.current_player_seat == position:
+            await self._execute_timeout_fold(room_id, table, position)
+
     async def _execute_timeout_fold(self, room_id: str, table: PokerTable, position: int) -> None:
         """타임아웃으로 인한 자동 액션 실행.
 
@@ -1520,19 +1517,11 @@ class ActionHandler(BaseHandler):
         await self.manager.broadcast_to_channel(channel, message.to_dict())
 
     async def _broadcast_personalized_states(self, room_id: str, table: PokerTable) -> None:
-        """Send personalized game state to each player."""
+        """Send personalized game state to each player (full or delta)."""
         for seat, player in table.players.items():
             if player:
                 state = table.get_state_for_player(player.user_id)
-                message = MessageEnvelope.create(
-                    event_type=EventType.TABLE_SNAPSHOT,
-                    payload={
-                        "tableId": room_id,
-                        "state": state,
-                    },
-                )
-                # Send to specific user
-                await self.manager.send_to_user(player.user_id, message.to_dict())
+                await self.manager.send_table_state(player.user_id, room_id, state)
 
     async def _auto_start_next_hand(self, room_id: str, table: PokerTable) -> None:
         """Auto-start next hand after delay."""
@@ -1626,12 +1615,12 @@ class ActionHandler(BaseHandler):
         """Clean up all resources associated with a table.
 
         Called when a table is removed or reset.
-        Prevents memory leaks by removing locks and cancelling timeout tasks.
+        Prevents memory leaks by removing locks and cancelling turn timeouts.
 
         Args:
             room_id: The table/room identifier to clean up
         """
-        # Cancel and remove timeout task
+        # Cancel and remove turn timeout
         await self._cancel_turn_timeout(room_id)
 
         # Remove table lock from tracker
@@ -1649,7 +1638,7 @@ class ActionHandler(BaseHandler):
     async def cleanup_all_resources(self) -> None:
         """Clean up all resources. Called on shutdown.
 
-        Cancels all pending timeout tasks, clears all table locks,
+        Cancels all pending turn timeouts, clears all table locks,
         and stops background cleanup tasks.
         Should be called during graceful server shutdown.
         """
@@ -1658,20 +1647,17 @@ class ActionHandler(BaseHandler):
         await cancel_task_safe(self._cleanup_task)
         self._cleanup_task = None
 
-        # Cancel all timeout tasks
-        for room_id in list(self._timeout_tasks.keys()):
+        # Cancel all turn timeouts
+        for room_id in list(self._turn_timers.keys()):
             await self._cancel_turn_timeout(room_id)
 
-        # Clear timeout tasks dict (should already be empty after cancellation)
-        self._timeout_tasks.clear()
-
         # Clear turn start times
         self._turn_start_times.clear()
 
         logger.info(
             f"[CLEANUP] All resources cleaned up: "
             f"locks={len(self._lock_tracker)}, "
-            f"timeouts={len(self._timeout_tasks)}"
+            f"timeouts={len(self._turn_timers)}"
         )
 
     async def _handle_reveal_cards(
@@ -1788,13 +1774,15 @@ class ActionHandler(BaseHandler):
 
             # 핸드 ID 생성 (room_id + hand_number)
             hand_id = f"{room_id}_{table.hand_number}"
+            # 테이블은 이미 다음 핸드용으로 초기화됨 → 초기화 전 보드 사용
+            community_cards = hand_result.get("communityCards") or []
 
             await self._fraud_publisher.publish_hand_completed(
                 hand_id=hand_id,
                 room_id=room_id,
                 hand_number=table.hand_number,
                 pot_size=hand_result.get("pot", 0),
-                community_cards=table.community_cards or [],
+                community_cards=community_cards,
                 participants=participants,
             )
 
@@ -1814,17 +1802,25 @@ class ActionHandler(BaseHandler):
                     )
 
             # Phase 2.5: 핸드 히스토리 DB 저장
+            # 쓰기 지연 큐가 있으면 로컬 스풀에 적재 후 배치 저장 (DB 왕복 없음)
             try:
-                async with get_db_session() as db:
-                    hand_history_service = HandHistoryService(db)
-                    await hand_history_service.save_hand_result({
-                        "table_id": room_id,
-                        "hand_number": table.hand_number,
-                        "pot_size": hand_result.get("pot", 0),
-                        "community_cards": table.community_cards or [],
-                        "participants": participants,
-                    })
-                    logger.info(f"핸드 히스토리 저장 완료: hand_id={hand_id}")
+                history_record = {
+                    "table_id": room_id,
+                    "hand_number": table.hand_number,
+                    "pot_size": hand_result.get("pot", 0),
+                    "community_cards": community_cards,
+                    "participants": participants,
+                    "actions": hand_result.get("actions", []),
+                }
+                hand_history_queue = get_hand_history_queue()
+                if hand_history_queue is not None:
+                    await hand_history_queue.enqueue(history_record)
+                    logger.debug(f"핸드 히스토리 스풀 적재: hand_id={hand_id}")
+                else:
+                    async with get_db_session() as db:
+                        hand_history_service = HandHistoryService(db)
+                        await hand_history_service.save_hand_result(history_record)
+                        logger.info(f"핸드 히스토리 저장 완료: hand_id={hand_id}")
             except Exception as db_error:
                 # DB 저장 실패는 게임 진행에 영향을 주지 않음
                 logger.error(f"핸드 히스토리 DB 저장 실패: {db_error}")
@@ -3,7 +3,10 @@
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.ws.connection import WebSocketConnection
+from app.ws.db_scope import current_db_session
 from app.ws.events import EventType
 from app.ws.messages import MessageEnvelope
 
@@ -16,10 +19,22 @@ class BaseHandler(ABC):
 
     Each handler is responsible for a group of related events.
     Handlers receive events from the gateway and return response messages.
+
+    Handlers that use the database read ``self.db``, which resolves to the
+    session of the message being handled (see app.ws.db_scope) unless a
+    fixed session was passed in.
     """
 
-    def __init__(self, manager: "ConnectionManager"):
+    def __init__(self, manager: "ConnectionManager", db: AsyncSession | None = None):
         self.manager = manager
+        self._db = db
+
+    @property
+    def db(self) -> AsyncSession:
+        """DB session for the current message."""
+        if self._db is not None:
+            return self._db
+        return current_db_session()
 
     @property
     @abstractmethod
@@ -54,11 +54,10 @@ class ChatHandler(BaseHandler):
     def __init__(
         self,
         manager: "ConnectionManager",
-        db: AsyncSession,
+        db: AsyncSession | None = None,
         redis: Redis | None = None,
     ):
-        super().__init__(manager)
-        self.db = db
+        super().__init__(manager, db)
         self.redis = redis
 
     @property
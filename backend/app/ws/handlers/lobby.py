@@ -33,10 +33,12 @@ class LobbyHandler(BaseHandler):
     - ROOM_JOIN_REQUEST: Join an existing room
     """
 
-    def __init__(self, manager: "ConnectionManager", db: AsyncSession):
-        super().__init__(manager)
-        self.db = db
-        self.room_service = RoomService(db)
+    def __init__(self, manager: "ConnectionManager", db: AsyncSession | None = None):
+        super().__init__(manager, db)
+
+    @property
+    def room_service(self) -> RoomService:
+        return RoomService(self.db)
 
     @property
     def handled_events(self) -> tuple[EventType, ...]:
@@ -95,6 +95,10 @@ class SystemHandler(BaseHandler):
             f"tableId={table_id}, lastStateVersion={last_state_version}"
         )
 
+        # Delta stream gap: next table state goes out as a full snapshot
+        if table_id:
+            conn.reset_snapshot_base(f"table:{table_id}")
+
         try:
             # If no table_id specified, just acknowledge the recovery
             if not table_id:
@@ -42,10 +42,12 @@ class TableHandler(BaseHandler):
     - ADD_BOT_REQUEST: Add a bot to the table
     """
 
-    def __init__(self, manager: "ConnectionManager", db: AsyncSession):
-        super().__init__(manager)
-        self.db = db
-        self.room_service = RoomService(db)
+    def __init__(self, manager: "ConnectionManager", db: AsyncSession | None = None):
+        super().__init__(manager, db)
+
+    @property
+    def room_service(self) -> RoomService:
+        return RoomService(self.db)
 
     @property
     def handled_events(self) -> tuple[EventType, ...]:
@@ -1042,11 +1044,7 @@ class TableHandler(BaseHandler):
         for seat, player in game_table.players.items():
             if player:
                 state = game_table.get_state_for_player(player.user_id)
-                state_msg = MessageEnvelope.create(
-                    event_type=EventType.TABLE_SNAPSHOT,
-                    payload={"tableId": room_id, "state": state},
-                )
-                await self.manager.send_to_user(player.user_id, state_msg.to_dict())
+                await self.manager.send_table_state(player.user_id, room_id, state)
 
         # Process first turn (with bot loop)
         await self._process_next_turn(room_id, game_table)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
 from uuid import uuid4
@@ -12,9 +13,18 @@ from uuid import uuid4
 from redis.asyncio import Redis
 
 from app.config import get_settings
+from app.middleware.prometheus import (
+    record_ws_broadcast,
+    record_ws_pubsub_flush,
+    update_ws_pubsub_channels,
+)
 from app.ws.connection import WebSocketConnection, ConnectionState
+from app.ws.delta import build_table_state_message
 from app.ws.events import EventType
 from app.ws.messages import MessageEnvelope
+from app.ws.outbound import coalesce_key
+from app.ws.serializer import decode_msgpack, encode_json, encode_msgpack
+from app.utils.timer_wheel import TimerHandle, get_timer_wheel
 from app.ws.worker_health import WorkerHealthManager
 
 logger = logging.getLogger(__name__)
@@ -25,12 +35,19 @@ CCU_HISTORY_TTL = 86400 * 7  # 7일 보관
 DAU_TTL = 86400 * 31  # 31일 보관 (월간 집계용)
 
 # Constants per spec section 2.3
-HEARTBEAT_CHECK_INTERVAL = 5  # Check every 5 seconds
 SERVER_TIMEOUT = 60  # Close connection if no PING for 60 seconds
 
 # 재접속 상태 TTL (기존 300초 → 1800초로 연장)
 USER_STATE_TTL_SECONDS = 1800  # 30분 (재접속 시 상태 복구용)
 
+# Broadcast delivery outcomes (per receiver)
+_SEND_OK = "sent"
+_SEND_SLOW = "slow"
+_SEND_DROPPED = "dropped"
+
+# Cross-instance broadcast channel prefix
+PUBSUB_PREFIX = "ws:pubsub:"
+
 
 class ConnectionLimitExceeded(Exception):
     """Raised when connection limits are exceeded."""
@@ -55,9 +72,21 @@ class ConnectionManager:
         self._max_connections = self._settings.ws_max_connections
         self._max_connections_per_user = self._settings.ws_max_connections_per_user
 
+        # Per-receiver deadline for channel broadcast fan-out
+        self._broadcast_send_timeout = self._settings.ws_broadcast_send_timeout
+
+        # Cross-instance pub/sub: subscribed only to channels with local members,
+        # outgoing broadcasts buffered per channel and flushed in one pipeline
+        self._pubsub = None
+        self._pubsub_ready = asyncio.Event()  # 첫 구독 전에는 get_message가 RuntimeError
+        self._publish_buffer: dict[str, list[list[Any]]] = {}  # channel -> [[exclude, message]]
+        self._publish_buffered = 0
+        self._publish_flush_task: asyncio.Task | None = None
+        self._publish_flush_interval = self._settings.ws_pubsub_flush_interval
+        self._publish_max_batch = self._settings.ws_pubsub_max_batch
+
         # Background tasks
         self._pubsub_task: asyncio.Task | None = None
-        self._heartbeat_task: asyncio.Task | None = None
         self._ccu_snapshot_task: asyncio.Task | None = None  # Phase 5.1: CCU 스냅샷
         self._running = False
         self._instance_id = str(uuid4())[:8]
@@ -65,6 +94,9 @@ class ConnectionManager:
         # Worker health management (Phase 2.7)
         self._worker_health = WorkerHealthManager(redis, self._instance_id)
 
+        # Stale-connection deadlines on the shared timer wheel (connection_id -> timer)
+        self._stale_timers: dict[str, TimerHandle] = {}
+
     # =========================================================================
     # Lifecycle
     # =========================================================================
@@ -75,7 +107,6 @@ class ConnectionManager:
             return
         self._running = True
         await self._start_pubsub_listener()
-        await self._start_heartbeat_monitor()
         await self._start_ccu_snapshot_task()  # Phase 5.1: CCU 스냅샷
 
         # Start worker health management (Phase 2.7)
@@ -96,6 +127,12 @@ class ConnectionManager:
         self._running = False
         logger.info(f"Stopping ConnectionManager (instance: {self._instance_id})")
 
+        # Deliver anything still buffered for other instances
+        if self._publish_flush_task:
+            self._publish_flush_task.cancel()
+            self._publish_flush_task = None
+        await self._flush_publishes()
+
         if self._pubsub_task:
             self._pubsub_task.cancel()
             try:
@@ -103,13 +140,6 @@ class ConnectionManager:
             except asyncio.CancelledError:
                 pass
 
-        if self._heartbeat_task:
-            self._heartbeat_task.cancel()
-            try:
-                await self._heartbeat_task
-            except asyncio.CancelledError:
-                pass
-
         if self._ccu_snapshot_task:
             self._ccu_snapshot_task.cancel()
             try:
@@ -170,6 +200,8 @@ class ConnectionManager:
             self._user_connections[conn.user_id] = set()
         self._user_connections[conn.user_id].add(conn.connection_id)
 
+        self._schedule_stale_check(conn)
+
         # Store in Redis for cross-instance awareness
         await self.redis.hset(
             f"ws:connections:{conn.user_id}",
@@ -255,6 +287,7 @@ class ConnectionManager:
                     pass
 
         # Step 3: Remove from local connections registry
+        self._cancel_stale_check(connection_id)
         try:
             self._connections.pop(connection_id, None)
         except Exception as e:
@@ -345,9 +378,11 @@ class ConnectionManager:
 
         if channel not in self._channel_members:
             self._channel_members[channel] = set()
+            await self._pubsub_subscribe(channel)
 
         self._channel_members[channel].add(connection_id)
         conn.subscribed_channels.add(channel)
+        conn.reset_snapshot_base(channel)
 
         # Track in Redis for cross-instance broadcast
         await self.redis.sadd(
@@ -378,8 +413,10 @@ class ConnectionManager:
             self._channel_members[channel].discard(connection_id)
             if not self._channel_members[channel]:
                 del self._channel_members[channel]
+                await self._pubsub_unsubscribe(channel)
 
         conn.subscribed_channels.discard(channel)
+        conn.reset_snapshot_base(channel)
         logger.debug(f"Connection {connection_id} unsubscribed from {channel}")
         return True
 
@@ -410,15 +447,8 @@ class ConnectionManager:
 
         Returns count of messages sent to local subscribers.
         """
-        # Publish to Redis for other instances
-        await self.redis.publish(
-            f"ws:pubsub:{channel}",
-            json.dumps({
-                "source_instance": self._instance_id,
-                "exclude_connection": exclude_connection,
-                "message": message,
-            }),
-        )
+        # Buffer for other instances (flushed within ws_pubsub_flush_interval)
+        self._queue_publish(channel, message, exclude_connection)
 
         # Also send to local subscribers
         return await self._send_to_local_channel(channel, message, exclude_connection)
@@ -439,6 +469,30 @@ class ConnectionManager:
 
         return count
 
+    async def send_table_state(
+        self,
+        user_id: str,
+        room_id: str,
+        state: dict[str, Any],
+    ) -> int:
+        """Send a player's personalized table state to all of their connections.
+
+        Connections that negotiated snapshot deltas get a TABLE_DELTA against
+        the last state they were sent; others get a full TABLE_SNAPSHOT.
+        Returns count sent.
+        """
+        channel = f"table:{room_id}"
+        count = 0
+
+        for conn in self.get_user_connections(user_id):
+            message = build_table_state_message(conn, channel, room_id, state)
+            if message is None:
+                continue
+            if await conn.send(message.to_dict()):
+                count += 1
+
+        return count
+
     async def send_to_connection(
         self,
         connection_id: str,
@@ -456,18 +510,66 @@ class ConnectionManager:
         message: dict[str, Any],
         exclude_connection: str | None = None,
     ) -> int:
-        """Send to local channel subscribers only."""
-        connection_ids = self._channel_members.get(channel, set())
-        count = 0
+        """Send to local channel subscribers only.
 
-        for conn_id in list(connection_ids):
-            if conn_id == exclude_connection:
-                continue
-            conn = self._connections.get(conn_id)
-            if conn and await conn.send(message):
-                count += 1
+        The message is encoded once and written to all subscribers
+        concurrently. Each write is bounded by ``ws_broadcast_send_timeout``
+        so a single slow client cannot stall the rest of the channel.
+        """
+        connections = [
+            conn
+            for conn_id in list(self._channel_members.get(channel, ()))
+            if conn_id != exclude_connection
+            and (conn := self._connections.get(conn_id)) is not None
+        ]
+        if not connections:
+            return 0
 
-        return count
+        started = time.perf_counter()
+        payload = encode_json(message).decode("utf-8")
+        coalesce = coalesce_key(message)
+        results = await asyncio.gather(
+            *(
+                self._send_with_deadline(conn, payload, coalesce)
+                for conn in connections
+            )
+        )
+
+        slow = results.count(_SEND_SLOW)
+        dropped = results.count(_SEND_DROPPED)
+        record_ws_broadcast(
+            recipients=len(connections),
+            duration_seconds=time.perf_counter() - started,
+            slow=slow,
+            dropped=dropped,
+        )
+        if slow or dropped:
+            logger.warning(
+                f"Broadcast to {channel} incomplete "
+                f"(recipients: {len(connections)}, slow: {slow}, dropped: {dropped})"
+            )
+
+        return results.count(_SEND_OK)
+
+    async def _send_with_deadline(
+        self,
+        conn: WebSocketConnection,
+        payload: str,
+        coalesce: tuple[str, int | None] | None = None,
+    ) -> str:
+        """Write a pre-encoded payload to one connection within the deadline."""
+        try:
+            sent = await asyncio.wait_for(
+                conn.send_serialized(payload, coalesce),
+                timeout=self._broadcast_send_timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.debug(
+                f"Send to {conn.connection_id} exceeded "
+                f"{self._broadcast_send_timeout}s broadcast deadline"
+            )
+            return _SEND_SLOW
+        return _SEND_OK if sent else _SEND_DROPPED
 
     # =========================================================================
     # Group Broadcasting (Phase 4.2)
@@ -639,18 +741,27 @@ class ConnectionManager:
     # =========================================================================
 
     async def _start_pubsub_listener(self) -> None:
-        """Start listening to Redis pub/sub for cross-instance messages."""
+        """Start listening to Redis pub/sub for cross-instance messages.
+
+        Only channels with local members are subscribed, so an instance never
+        receives traffic for tables it has nobody watching. The listener
+        waits until the first channel is subscribed before polling.
+        """
         pubsub = self.redis.pubsub()
-        await pubsub.psubscribe("ws:pubsub:*")
+        self._pubsub = pubsub
+        for channel in list(self._channel_members):
+            await self._pubsub_subscribe(channel)
 
         async def listener() -> None:
             while self._running:
                 try:
+                    if not self._pubsub_ready.is_set():
+                        await self._pubsub_ready.wait()
                     message = await pubsub.get_message(
                         ignore_subscribe_messages=True,
                         timeout=1.0,
                     )
-                    if message and message["type"] == "pmessage":
+                    if message and message["type"] == "message":
                         await self._handle_pubsub_message(message)
                 except asyncio.CancelledError:
                     break
@@ -658,32 +769,118 @@ class ConnectionManager:
                     logger.error(f"Pub/sub listener error: {e}")
                     await asyncio.sleep(1)
 
-            await pubsub.punsubscribe("ws:pubsub:*")
+            self._pubsub = None
+            self._pubsub_ready.clear()
+            await pubsub.unsubscribe()
             await pubsub.close()
 
         self._pubsub_task = asyncio.create_task(listener())
 
+    async def _pubsub_subscribe(self, channel: str) -> None:
+        """Subscribe this instance to a channel's cross-instance traffic."""
+        if self._pubsub is None:
+            return
+        try:
+            await self._pubsub.subscribe(f"{PUBSUB_PREFIX}{channel}")
+            self._pubsub_ready.set()
+            update_ws_pubsub_channels(len(self._channel_members))
+        except Exception as e:
+            logger.error(f"Failed to subscribe to pub/sub channel {channel}: {e}")
+
+    async def _pubsub_unsubscribe(self, channel: str) -> None:
+        """Stop receiving a channel once it has no local members."""
+        if self._pubsub is None:
+            return
+        try:
+            await self._pubsub.unsubscribe(f"{PUBSUB_PREFIX}{channel}")
+            update_ws_pubsub_channels(len(self._channel_members))
+        except Exception as e:
+            logger.error(f"Failed to unsubscribe from pub/sub channel {channel}: {e}")
+
+    def _queue_publish(
+        self,
+        channel: str,
+        message: dict[str, Any],
+        exclude_connection: str | None,
+    ) -> None:
+        """Buffer a broadcast for other instances and schedule a flush."""
+        self._publish_buffer.setdefault(channel, []).append(
+            [exclude_connection, message]
+        )
+        self._publish_buffered += 1
+
+        if self._publish_buffered >= self._publish_max_batch:
+            if self._publish_flush_task:
+                self._publish_flush_task.cancel()
+            self._publish_flush_task = asyncio.create_task(self._flush_publishes())
+        elif self._publish_flush_task is None:
+            self._publish_flush_task = asyncio.create_task(
+                self._flush_publishes(delay=self._publish_flush_interval)
+            )
+
+    async def _flush_publishes(self, delay: float = 0.0) -> None:
+        """Publish buffered broadcasts, one msgpack batch per channel, in one pipeline."""
+        if delay:
+            await asyncio.sleep(delay)
+
+        if asyncio.current_task() is self._publish_flush_task:
+            self._publish_flush_task = None
+
+        if not self._publish_buffer:
+            return
+
+        buffer = self._publish_buffer
+        buffered = self._publish_buffered
+        self._publish_buffer = {}
+        self._publish_buffered = 0
+
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for channel, messages in buffer.items():
+                pipe.publish(
+                    f"{PUBSUB_PREFIX}{channel}",
+                    encode_msgpack({
+                        "source_instance": self._instance_id,
+                        "messages": messages,
+                    }),
+                )
+            await pipe.execute()
+            record_ws_pubsub_flush(messages=buffered, publishes=len(buffer))
+        except Exception as e:
+            logger.error(
+                f"Failed to publish {buffered} broadcasts to "
+                f"{len(buffer)} channels: {e}"
+            )
+
     async def _handle_pubsub_message(self, message: dict[str, Any]) -> None:
-        """Handle incoming pub/sub message."""
+        """Handle incoming pub/sub message.
+
+        Batches from other gateway instances are msgpack encoded. Single JSON
+        messages are still accepted from admin publishers.
+        """
         try:
             channel_bytes = message.get("channel", b"")
             if isinstance(channel_bytes, bytes):
-                channel = channel_bytes.decode().replace("ws:pubsub:", "")
-            else:
-                channel = str(channel_bytes).replace("ws:pubsub:", "")
+                channel_bytes = channel_bytes.decode()
+            channel = str(channel_bytes).removeprefix(PUBSUB_PREFIX)
 
             data_bytes = message.get("data", b"{}")
-            if isinstance(data_bytes, bytes):
-                data = json.loads(data_bytes.decode())
+            if isinstance(data_bytes, str):
+                data_bytes = data_bytes.encode()
+
+            if data_bytes[:1] == b"{":
+                data = json.loads(data_bytes)
+                batch = [[data.get("exclude_connection"), data["message"]]]
             else:
-                data = json.loads(str(data_bytes))
+                data = decode_msgpack(data_bytes)
+                batch = data["messages"]
 
             # Skip messages from self
             if data.get("source_instance") == self._instance_id:
                 return
 
-            exclude = data.get("exclude_connection")
-            await self._send_to_local_channel(channel, data["message"], exclude)
+            for exclude, payload in batch:
+                await self._send_to_local_channel(channel, payload, exclude)
 
         except Exception as e:
             logger.error(f"Error handling pub/sub message: {e}")
@@ -692,44 +889,51 @@ class ConnectionManager:
     # Heartbeat Management
     # =========================================================================
 
-    async def _start_heartbeat_monitor(self) -> None:
-        """Start heartbeat monitoring task."""
-        async def monitor() -> None:
-            while self._running:
-                try:
-                    await asyncio.sleep(HEARTBEAT_CHECK_INTERVAL)
-                    await self._check_heartbeats()
-                except asyncio.CancelledError:
-                    break
-                except Exception as e:
-                    logger.error(f"Heartbeat monitor error: {e}")
-
-        self._heartbeat_task = asyncio.create_task(monitor())
-
-    async def _check_heartbeats(self) -> None:
-        """Check for stale connections (no PING for 60s per spec)."""
-        now = datetime.now(timezone.utc)
-        stale_timeout = timedelta(seconds=SERVER_TIMEOUT)
-
-        stale_connections = []
-        for conn_id, conn in self._connections.items():
-            if conn.last_ping_at is None:
-                # Use connected_at if no ping received yet
-                if (now - conn.connected_at) > stale_timeout:
-                    stale_connections.append(conn_id)
-            elif (now - conn.last_ping_at) > stale_timeout:
-                stale_connections.append(conn_id)
-
-        for conn_id in stale_connections:
-            logger.warning(f"Connection {conn_id} timed out (no PING for {SERVER_TIMEOUT}s)")
-            conn = self._connections.get(conn_id)
-            if conn:
-                try:
-                    await conn.close(4000, "Connection timeout")
-                except Exception as e:
-                    logger.debug(f"Error closing timed out connection {conn_id}: {e}")
-            # Save state for reconnection on timeout (user might reconnect)
-            await self.disconnect(conn_id, save_state=True)
+    @staticmethod
+    def _last_seen(conn: WebSocketConnection) -> datetime:
+        """Last PING time, or connect time if no PING was received yet."""
+        last_seen = conn.last_ping_at or conn.connected_at
+        if last_seen.tzinfo is None:
+            last_seen = last_seen.replace(tzinfo=timezone.utc)
+        return last_seen
+
+    def _schedule_stale_check(self, conn: WebSocketConnection) -> None:
+        """Register the connection's stale deadline (last PING + SERVER_TIMEOUT)."""
+        last_seen = self._last_seen(conn)
+        delay = (
+            last_seen + timedelta(seconds=SERVER_TIMEOUT) - datetime.now(timezone.utc)
+        ).total_seconds()
+        self._stale_timers[conn.connection_id] = get_timer_wheel().schedule(
+            delay, self._on_stale_deadline, conn.connection_id
+        )
+
+    def _cancel_stale_check(self, connection_id: str) -> None:
+        timer = self._stale_timers.pop(connection_id, None)
+        if timer:
+            timer.cancel()
+
+    async def _on_stale_deadline(self, connection_id: str) -> None:
+        """Close the connection if no PING arrived since the deadline was set."""
+        self._stale_timers.pop(connection_id, None)
+        conn = self._connections.get(connection_id)
+        if conn is None or not self._running:
+            return
+
+        last_seen = self._last_seen(conn)
+        if datetime.now(timezone.utc) - last_seen <= timedelta(seconds=SERVER_TIMEOUT):
+            # PING arrived in the meantime: push the deadline out
+            self._schedule_stale_check(conn)
+            return
+
+        logger.warning(
+            f"Connection {connection_id} timed out (no PING for {SERVER_TIMEOUT}s)"
+        )
+        try:
+            await conn.close(4000, "Connection timeout")
+        except Exception as e:
+            logger.debug(f"Error closing timed out connection {connection_id}: {e}")
+        # Save state for reconnection on timeout (user might reconnect)
+        await self.disconnect(connection_id, save_state=True)
 
     # =========================================================================
     # State Recovery (for reconnection)
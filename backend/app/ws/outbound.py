@@ -0,0 +1,245 @@
+"""Per-connection outbound message queue.
+
+Decouples message producers (handlers holding a table lock, channel
+broadcasts) from the socket write. Each connection gets a bounded queue
+drained by a single writer task, so a slow client only ever slows itself.
+
+- Unsolicited TABLE_SNAPSHOT messages for the same table are coalesced: a
+  queued snapshot is replaced in place by a newer one (by stateVersion when
+  present). Request replies and error snapshots are never coalesced
+- On overflow the policy either drops the oldest queued message or closes
+  the connection so the client reconnects and resyncs via RECOVERY_REQUEST
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from fastapi import WebSocket
+
+from app.middleware.prometheus import (
+    record_ws_outbound_discard,
+    record_ws_outbound_flush,
+    update_ws_outbound_depth,
+)
+from app.ws.events import EventType
+
+logger = logging.getLogger(__name__)
+
+# Close code sent to clients that fall too far behind
+OUTBOUND_OVERFLOW_CLOSE_CODE = 4008
+
+# Event types where only the newest queued message per table matters
+COALESCED_EVENT_TYPES = frozenset({EventType.TABLE_SNAPSHOT.value})
+
+
+class OverflowPolicy(str, Enum):
+    """What to do when a connection's outbound queue is full."""
+
+    DROP_OLDEST = "drop_oldest"
+    DISCONNECT = "disconnect"
+
+
+def coalesce_key(message: dict[str, Any]) -> tuple[str, int | None] | None:
+    """Get the coalescing key and stateVersion for a message.
+
+    Replies to a request (requestId set) and error payloads are delivered
+    as-is; the client is waiting for them.
+
+    Returns:
+        (key, stateVersion) for coalescable messages, None otherwise
+    """
+    msg_type = message.get("type")
+    if msg_type not in COALESCED_EVENT_TYPES or message.get("requestId"):
+        return None
+
+    payload = message.get("payload") or {}
+    table_id = payload.get("tableId")
+    if table_id is None or payload.get("error"):
+        return None
+
+    version = payload.get("stateVersion")
+    state = payload.get("state")
+    if version is None and isinstance(state, dict):
+        version = state.get("stateVersion")
+
+    return f"{msg_type}:{table_id}", version
+
+
+@dataclass(eq=False, slots=True)
+class _Outgoing:
+    """A queued, already-encoded text frame."""
+
+    payload: str
+    key: str | None
+    version: int | None
+    enqueued_at: float
+
+
+class OutboundQueue:
+    """Bounded outbound queue with a dedicated writer task.
+
+    Usage:
+        queue = OutboundQueue(websocket, "conn-1", maxsize=256)
+        queue.start()
+        queue.put(payload, coalesce_key(message))
+        ...
+        await queue.stop()
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        connection_id: str,
+        maxsize: int,
+        policy: OverflowPolicy = OverflowPolicy.DISCONNECT,
+    ):
+        self._websocket = websocket
+        self._connection_id = connection_id
+        self._maxsize = maxsize
+        self._policy = policy
+
+        self._queue: deque[_Outgoing] = deque()
+        self._pending: dict[str, _Outgoing] = {}  # coalesce key -> queued entry
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._overflowed = False
+        self._closed = False
+
+    @property
+    def depth(self) -> int:
+        """Number of messages waiting to be written."""
+        return len(self._queue)
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the queue still accepts messages."""
+        return not (self._closed or self._overflowed)
+
+    def start(self) -> None:
+        """Start the writer task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._writer_loop())
+
+    async def stop(self) -> None:
+        """Stop the writer task and discard anything still queued."""
+        self._closed = True
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._discard_all()
+
+    def put(
+        self,
+        payload: str,
+        coalesce: tuple[str, int | None] | None = None,
+    ) -> bool:
+        """Queue an encoded frame without waiting for the socket.
+
+        Args:
+            payload: Encoded JSON text frame
+            coalesce: Result of coalesce_key() for the source message
+
+        Returns:
+            False if the queue is closed or the message was discarded
+        """
+        if not self.is_open:
+            return False
+
+        key, version = coalesce if coalesce else (None, None)
+
+        if key is not None:
+            queued = self._pending.get(key)
+            if queued is not None:
+                if (
+                    version is not None
+                    and queued.version is not None
+                    and version < queued.version
+                ):
+                    # 이미 더 최신 스냅샷이 대기 중
+                    record_ws_outbound_discard("coalesced")
+                    return False
+                # 같은 큐 위치에서 교체 (뒤에 쌓인 메시지보다 앞서 전송)
+                queued.payload = payload
+                queued.version = version
+                record_ws_outbound_discard("coalesced")
+                return True
+
+        if len(self._queue) >= self._maxsize:
+            if self._policy == OverflowPolicy.DISCONNECT:
+                logger.warning(
+                    f"Outbound queue overflow for {self._connection_id} "
+                    f"({self._maxsize} queued), disconnecting"
+                )
+                self._overflowed = True
+                self._discard_all()
+                self._wakeup.set()
+                return False
+
+            dropped = self._queue.popleft()
+            if dropped.key is not None and self._pending.get(dropped.key) is dropped:
+                del self._pending[dropped.key]
+            update_ws_outbound_depth(-1)
+            record_ws_outbound_discard("overflow")
+
+        entry = _Outgoing(
+            payload=payload,
+            key=key,
+            version=version,
+            enqueued_at=time.perf_counter(),
+        )
+        self._queue.append(entry)
+        if key is not None:
+            self._pending[key] = entry
+        update_ws_outbound_depth(1)
+        self._wakeup.set()
+        return True
+
+    async def _writer_loop(self) -> None:
+        """Drain the queue to the socket, one frame at a time."""
+        while True:
+            while not self._queue and not self._overflowed:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+
+            if self._overflowed:
+                try:
+                    await self._websocket.close(
+                        OUTBOUND_OVERFLOW_CLOSE_CODE, "Client too slow"
+                    )
+                except Exception as e:
+                    logger.debug(f"Error closing slow connection {self._connection_id}: {e}")
+                return
+
+            entry = self._queue.popleft()
+            if entry.key is not None and self._pending.get(entry.key) is entry:
+                del self._pending[entry.key]
+            update_ws_outbound_depth(-1)
+
+            try:
+                await self._websocket.send_text(entry.payload)
+            except Exception as e:
+                logger.warning(f"Failed to send message to {self._connection_id}: {e}")
+                self._closed = True
+                self._discard_all()
+                return
+
+            record_ws_outbound_flush(time.perf_counter() - entry.enqueued_at)
+
+    def _discard_all(self) -> None:
+        """Drop every queued message (connection is going away)."""
+        if self._queue:
+            update_ws_outbound_depth(-len(self._queue))
+            record_ws_outbound_discard("closed", len(self._queue))
+        self._queue.clear()
+        self._pending.clear()
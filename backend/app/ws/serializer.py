@@ -140,6 +140,7 @@ class MessageSerializer:
                 data,
                 raw=False,
                 object_hook=_msgpack_decoder,
+                strict_map_key=False,
             )
         else:
             return json_loads(data)
@@ -184,7 +185,9 @@ def decode_msgpack(data: bytes) -> dict:
     Returns:
         Decoded dict
     """
-    return msgpack.unpackb(data, raw=False, object_hook=_msgpack_decoder)
+    return msgpack.unpackb(
+        data, raw=False, object_hook=_msgpack_decoder, strict_map_key=False
+    )
 
 
 def encode_json(data: dict) -> bytes:
@@ -0,0 +1,170 @@
+"""Headless simulator tests - 봇 전용 테이블 빨리 감기."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.bot.game_loop import BotGameLoop
+from app.bot.simulator import (
+    HeadlessSimulator,
+    SimulationConfig,
+    StrategyDecider,
+    build_table,
+    run_simulation,
+)
+from app.game.manager import game_manager
+from app.game.poker_table import GamePhase, Player
+
+
+class TestHeadlessSimulator:
+    """HeadlessSimulator 테스트."""
+
+    def test_play_hand_builds_history(self):
+        table = build_table(SimulationConfig(num_players=3, starting_stack=1000))
+        simulator = HeadlessSimulator(table)
+
+        hand = simulator.play_hand()
+
+        assert hand is not None
+        assert table.phase == GamePhase.WAITING
+        history = hand.history
+        assert history["table_id"] == table.room_id
+        assert history["hand_number"] == 1
+        assert len(history["participants"]) == 3
+        assert all(len(p["hole_cards"]) == 2 for p in history["participants"])
+        assert history["actions"]
+        # 승자 순이익 = 팟 (칩 보존)
+        assert sum(p["won_amount"] for p in history["participants"]) == history["pot_size"]
+        assert sum(r.new_stack for r in hand.bot_results) == 3000
+
+    def test_run_stops_when_players_bust(self):
+        def shove(table, player, available):
+            for action in ("raise", "bet"):
+                if action in available["actions"]:
+                    return action, available["max_raise"]
+            return ("call", available["call_amount"]) if "call" in available["actions"] else ("check", 0)
+
+        table = build_table(SimulationConfig(num_players=2, starting_stack=100))
+        simulator = HeadlessSimulator(table, decide=shove)
+
+        stats = simulator.run(max_hands=50)
+
+        assert stats.hands >= 1
+        assert stats.aborted_hands == 0
+        assert not table.can_start_hand()
+
+    def test_run_simulation_refills_and_uses_strategies(self):
+        stats = run_simulation(SimulationConfig(
+            hands=20,
+            num_players=4,
+            strategies=["tight_aggressive", "loose_aggressive"],
+            seed=3,
+            keep_history=True,
+        ))
+
+        assert stats.hands == 20
+        assert len(stats.histories) == 20
+        assert stats.failed_actions == 0
+        assert stats.hands_per_second > 0
+
+    @pytest.mark.asyncio
+    async def test_play_hand_async_matches_sync_driver(self):
+        table = build_table(SimulationConfig(num_players=3, starting_stack=1000))
+        simulator = HeadlessSimulator(table)
+
+        hand = await simulator.play_hand_async()
+
+        assert hand is not None
+        assert table.phase == GamePhase.WAITING
+        assert hand.history["hand_number"] == 1
+        assert sum(r.new_stack for r in hand.bot_results) == 3000
+
+    def test_strategy_decider_reuses_instances(self):
+        decider = StrategyDecider({"bot_sim_0": "tight_passive"})
+        table = build_table(SimulationConfig(num_players=2))
+        table.start_new_hand()
+        player = table.players[table.current_player_seat]
+
+        action, _ = decider(table, player, table.get_available_actions(player.user_id))
+
+        assert action in table.get_available_actions(player.user_id)["actions"]
+        assert len(decider._instances) == 1
+
+
+class TestFastForward:
+    """BotGameLoop 빨리 감기 테스트."""
+
+    @pytest.fixture
+    def game_loop(self):
+        loop = BotGameLoop()
+        loop._running = True
+        loop._settings = loop._settings.model_copy(
+            update={"bot_fast_forward_enabled": True}
+        )
+        return loop
+
+    @pytest.fixture
+    def table(self):
+        table = build_table(SimulationConfig(room_id="ff-test", num_players=4))
+        game_manager._tables["ff-test"] = table
+        yield table
+        game_manager._tables.pop("ff-test", None)
+
+    @pytest.mark.asyncio
+    async def test_fast_forward_emits_history_and_stats(self, game_loop, table):
+        orchestrator = AsyncMock()
+        queue = AsyncMock()
+
+        with patch.object(game_loop, "_get_connection_manager", AsyncMock(return_value=None)), \
+             patch("app.bot.orchestrator.get_bot_orchestrator", return_value=orchestrator), \
+             patch("app.bot.game_loop.get_hand_history_queue", return_value=queue), \
+             patch.object(game_loop, "_auto_start_next_hand", AsyncMock()):
+            played = await game_loop.fast_forward("ff-test", max_hands=5)
+
+        assert played == 5
+        # 봇끼리의 핸드도 일반 경로처럼 핸드 기록 큐에 적재
+        records = [c.args[0] for c in queue.enqueue.await_args_list]
+        assert [r["hand_number"] for r in records] == [1, 2, 3, 4, 5]
+        assert orchestrator.notify_hand_complete.await_count == 5 * 4
+
+    @pytest.mark.asyncio
+    async def test_fast_forward_yields_to_event_loop(self, game_loop, table):
+        ticks = 0
+        stop = False
+
+        async def ticker():
+            nonlocal ticks
+            while not stop:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        with patch.object(game_loop, "_get_connection_manager", AsyncMock(return_value=None)), \
+             patch("app.bot.orchestrator.get_bot_orchestrator", return_value=AsyncMock()), \
+             patch("app.bot.game_loop.get_hand_history_queue", return_value=None), \
+             patch.object(game_loop, "_auto_start_next_hand", AsyncMock()):
+            await game_loop.fast_forward("ff-test", max_hands=1)
+        stop = True
+        await task
+        game_manager._table_hand_history.pop("ff-test", None)
+
+        # 액션마다 양보하므로 한 핸드 동안 다른 태스크가 여러 번 실행됨
+        assert ticks > 3
+
+    @pytest.mark.asyncio
+    async def test_human_seat_disables_fast_forward(self, game_loop, table):
+        table.seat_player(5, Player(user_id="human-1", username="Human", seat=5, stack=2000))
+
+        with patch.object(game_loop, "_get_connection_manager", AsyncMock(return_value=None)):
+            assert await game_loop._is_unwatched("ff-test") is False
+
+    @pytest.mark.asyncio
+    async def test_human_subscriber_disables_fast_forward(self, game_loop, table):
+        manager = type("Manager", (), {})()
+        manager.get_channel_connections = lambda channel: [
+            type("Conn", (), {"user_id": "human-1"})()
+        ]
+
+        with patch.object(game_loop, "_get_connection_manager", AsyncMock(return_value=manager)):
+            assert await game_loop._is_unwatched("ff-test") is False
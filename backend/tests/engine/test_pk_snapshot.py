@@ -0,0 +1,184 @@
+"""Tests for binary PokerKit snapshots (pk_snapshot.py)."""
+
+import pytest
+from datetime import datetime
+
+from app.engine import pk_snapshot
+from app.engine.core import GameStateError, PokerKitWrapper
+from app.engine.state import (
+    ActionRequest,
+    ActionType,
+    Player,
+    SeatState,
+    SeatStatus,
+    TableConfig,
+    TableState,
+)
+
+
+@pytest.fixture
+def wrapper() -> PokerKitWrapper:
+    """Wrapper with an empty decoded-state cache."""
+    PokerKitWrapper._pk_state_cache.clear()
+    yield PokerKitWrapper()
+    PokerKitWrapper._pk_state_cache.clear()
+
+
+@pytest.fixture
+def three_player_table() -> TableState:
+    """Create a table with 3 active players (uneven stacks, with ante)."""
+    config = TableConfig(
+        max_seats=6,
+        small_blind=10,
+        big_blind=20,
+        min_buy_in=400,
+        max_buy_in=2000,
+        ante=2,
+    )
+    seats = tuple(
+        SeatState(
+            position=i,
+            player=Player(user_id=f"user{i}", nickname=f"Player{i}") if i < 3 else None,
+            stack=(1000, 600, 1500)[i] if i < 3 else 0,
+            status=SeatStatus.ACTIVE if i < 3 else SeatStatus.EMPTY,
+        )
+        for i in range(6)
+    )
+    return TableState(
+        table_id="table-1",
+        config=config,
+        seats=seats,
+        hand=None,
+        dealer_position=0,
+        state_version=0,
+        updated_at=datetime.utcnow(),
+    )
+
+
+def act(wrapper: PokerKitWrapper, state: TableState, action_type: ActionType, amount=None):
+    new_state, _ = wrapper.apply_action(
+        state,
+        state.hand.current_turn,
+        ActionRequest(request_id="r", action_type=action_type, amount=amount),
+    )
+    return new_state
+
+
+def pk_view(pk_state) -> tuple:
+    """Comparable summary of a PokerKit state."""
+    return (
+        pk_state.status,
+        pk_state.actor_index,
+        tuple(pk_state.stacks),
+        tuple(pk_state.bets),
+        tuple(tuple(map(str, cards)) for cards in pk_state.hole_cards),
+        tuple(map(str, pk_state.deck_cards)),
+        str(pk_state.board_cards),
+        tuple(pk_state.payoffs),
+    )
+
+
+class TestSnapshotFormat:
+    """Tests for the binary layout."""
+
+    def test_snapshot_is_binary_not_pickle(self, wrapper, three_player_table):
+        """Test snapshot data starts with the versioned magic."""
+        state = wrapper.create_initial_hand(three_player_table)
+        data = state._pk_snapshot[32:]
+        assert data[:3] == pk_snapshot.SNAPSHOT_MAGIC
+        assert data[3] == pk_snapshot.SNAPSHOT_VERSION
+        # header + blinds + 3 stacks + 6 hole cards + deck (len + 46 cards)
+        assert len(data) == 7 + 24 + 24 + 6 + 1 + 46
+
+    def test_actions_append_fixed_records(self, wrapper, three_player_table):
+        """Test each action adds one 9-byte record."""
+        state = wrapper.create_initial_hand(three_player_table)
+        before = len(state._pk_snapshot)
+        state = act(wrapper, state, ActionType.RAISE, 60)
+        assert len(state._pk_snapshot) == before + 9
+
+    def test_status_read_from_header(self, wrapper, three_player_table):
+        """Test hand status is readable without a replay."""
+        state = wrapper.create_initial_hand(three_player_table)
+        status = pk_snapshot.read_status(state._pk_snapshot[32:])
+        assert status.active is True
+        assert status.actor_index is not None
+
+
+class TestReplay:
+    """Tests for replaying the event log."""
+
+    def test_replay_matches_live_state(self, wrapper, three_player_table):
+        """Test a replayed state matches the live state at every step."""
+        state = wrapper.create_initial_hand(three_player_table)
+        actions = [
+            (ActionType.RAISE, 60),
+            (ActionType.CALL, None),
+            (ActionType.CALL, None),
+            (ActionType.CHECK, None),  # flop
+            (ActionType.BET, 100),
+            (ActionType.FOLD, None),
+            (ActionType.CALL, None),
+            (ActionType.CHECK, None),  # turn
+            (ActionType.CHECK, None),
+            (ActionType.ALL_IN, None),  # river
+            (ActionType.CALL, None),
+        ]
+        for action_type, amount in actions:
+            if wrapper.is_hand_finished(state):
+                break
+            state = act(wrapper, state, action_type, amount)
+            live = wrapper._deserialize_pk_state(state._pk_snapshot)
+            replayed = pk_snapshot.decode(state._pk_snapshot[32:])
+            assert pk_view(replayed) == pk_view(live)
+
+        assert wrapper.is_hand_finished(state)
+        PokerKitWrapper._pk_state_cache.clear()
+        result = wrapper.evaluate_hand(state)
+        assert sum(w.amount for w in result.winners) > 0
+
+    def test_cache_miss_replays(self, wrapper, three_player_table):
+        """Test actions still apply after the cache is dropped."""
+        state = wrapper.create_initial_hand(three_player_table)
+        state = act(wrapper, state, ActionType.CALL)
+        PokerKitWrapper._pk_state_cache.clear()
+        state = act(wrapper, state, ActionType.CALL)
+        assert len(wrapper.get_valid_actions(state, state.hand.current_turn)) > 0
+
+
+class TestSnapshotCache:
+    """Tests for the decoded-state cache."""
+
+    def test_read_uses_cached_state(self, wrapper, three_player_table):
+        """Test reads of the latest snapshot return the cached state."""
+        state = wrapper.create_initial_hand(three_player_table)
+        first = wrapper._deserialize_pk_state(state._pk_snapshot)
+        assert wrapper._deserialize_pk_state(state._pk_snapshot) is first
+
+    def test_owned_restore_removes_entry(self, wrapper, three_player_table):
+        """Test a mutable restore takes the state out of the cache."""
+        state = wrapper.create_initial_hand(three_player_table)
+        owned = wrapper._deserialize_pk_state(state._pk_snapshot, owned=True)
+        assert wrapper._deserialize_pk_state(state._pk_snapshot) is not owned
+
+
+class TestSnapshotIntegrity:
+    """Tests for tampering and version checks."""
+
+    def test_tampered_snapshot_rejected(self, wrapper, three_player_table):
+        """Test a modified snapshot fails HMAC verification."""
+        state = wrapper.create_initial_hand(three_player_table)
+        tampered = bytearray(state._pk_snapshot)
+        tampered[-1] ^= 0xFF
+        PokerKitWrapper._pk_state_cache.clear()
+        with pytest.raises(GameStateError):
+            wrapper._deserialize_pk_state(bytes(tampered))
+
+    def test_unknown_version_rejected(self, wrapper, three_player_table):
+        """Test a correctly signed snapshot with another version is rejected."""
+        state = wrapper.create_initial_hand(three_player_table)
+        data = bytearray(state._pk_snapshot[32:])
+        data[3] = pk_snapshot.SNAPSHOT_VERSION + 1
+        snapshot = wrapper._sign(bytes(data)) + bytes(data)
+        with pytest.raises(GameStateError):
+            wrapper._deserialize_pk_state(snapshot)
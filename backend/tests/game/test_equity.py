@@ -0,0 +1,147 @@
+"""Unit tests for the bot equity calculator.
+
+Tests exact enumeration on the turn/river, Monte-Carlo sampling on earlier
+streets, the suit-isomorphic LRU cache and input validation.
+"""
+
+import random
+
+import pytest
+
+from app.game import equity as equity_module
+from app.game.equity import calculate_equity, clear_equity_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_equity_cache()
+    yield
+    clear_equity_cache()
+
+
+# =============================================================================
+# Exact Enumeration Tests
+# =============================================================================
+
+
+class TestExactEnumeration:
+    """Tests for exact heads-up enumeration."""
+
+    def test_river_nuts_always_wins(self):
+        """Test the nuts on the river wins every matchup."""
+        result = calculate_equity(["As", "Ks"], ["Qs", "Js", "Ts", "2d", "3c"])
+        assert result.exact is True
+        assert result.samples == 990  # C(45, 2)
+        assert result.win == 1.0
+        assert result.equity == 1.0
+
+    def test_river_board_plays_is_split(self):
+        """Test a board that plays for everyone is always a tie."""
+        result = calculate_equity(["2c", "3d"], ["As", "Ks", "Qs", "Js", "Ts"])
+        assert result.tie == 1.0
+        assert result.equity == pytest.approx(0.5)
+
+    def test_turn_enumerates_every_river(self):
+        """Test turn enumeration covers every river and opponent hand."""
+        result = calculate_equity(["As", "Ks"], ["Qs", "Js", "2d", "3c"], time_budget=10.0)
+        assert result.exact is True
+        assert result.samples == 46 * 990
+        assert 0.0 < result.equity < 1.0
+
+    def test_turn_is_exact_with_default_budget(self):
+        """Test a heads-up turn is enumerated exactly under the default sampling budget."""
+        result = calculate_equity(["As", "Ks"], ["Qs", "Js", "2d", "3c"])
+        assert result.exact is True
+        assert result.samples == 46 * 990
+
+    def test_enumeration_stops_at_deadline(self):
+        """Test the deadline is checked inside the enumeration loop."""
+        result = calculate_equity(
+            ["As", "Ks"], ["Qs", "Js", "2d", "3c"],
+            time_budget=1e-9, exact_time_budget=1e-9, rng=random.Random(4),
+        )
+        assert result.exact is False
+        assert 0 < result.samples < 46 * 990
+        assert result.samples % 990 == 0  # whole runouts only
+
+    def test_python_fallback_matches(self, monkeypatch):
+        """Test the pure-Python path gives the same exact result."""
+        expected = calculate_equity(["Ah", "Td"], ["9c", "8h", "2s", "Kd", "5h"])
+        clear_equity_cache()
+        monkeypatch.setattr(equity_module, "np", None)
+        result = calculate_equity(["Ah", "Td"], ["9c", "8h", "2s", "Kd", "5h"])
+        assert result == expected
+
+
+# =============================================================================
+# Monte-Carlo Tests
+# =============================================================================
+
+
+class TestMonteCarlo:
+    """Tests for Monte-Carlo sampling."""
+
+    def test_preflop_aces_heads_up(self):
+        """Test AA is about 85% against a random hand."""
+        result = calculate_equity(
+            ["As", "Ah"], [], 1,
+            time_budget=10.0, max_samples=4000, rng=random.Random(1),
+        )
+        assert result.exact is False
+        assert result.samples == 4000
+        assert result.equity == pytest.approx(0.85, abs=0.03)
+
+    def test_more_opponents_lower_equity(self):
+        """Test equity drops as opponents are added."""
+        heads_up = calculate_equity(
+            ["Ks", "Kh"], [], 1,
+            time_budget=10.0, max_samples=4000, rng=random.Random(2),
+        )
+        multiway = calculate_equity(
+            ["Ks", "Kh"], [], 4,
+            time_budget=10.0, max_samples=4000, rng=random.Random(2),
+        )
+        assert multiway.equity < heads_up.equity
+
+    def test_time_budget_stops_sampling(self):
+        """Test a zero budget still evaluates one chunk."""
+        result = calculate_equity(
+            ["7h", "2c"], [], 3, time_budget=0.0, max_samples=10**9,
+        )
+        assert 0 < result.samples < 10**9
+
+
+# =============================================================================
+# Cache and Validation Tests
+# =============================================================================
+
+
+class TestEquityCache:
+    """Tests for the per-(hand, board texture) cache."""
+
+    def test_suit_isomorphic_hands_share_entry(self):
+        """Test suit-relabelled hands hit the same cache entry."""
+        first = calculate_equity(["As", "Ks"], ["Qs", "Js", "2d", "3c", "4h"])
+        second = calculate_equity(["Ah", "Kh"], ["Qh", "Jh", "2c", "3d", "4s"])
+        assert second is first
+
+    def test_seeded_calls_bypass_cache(self):
+        """Test calls with an explicit rng are not cached."""
+        calculate_equity(["As", "Ah"], [], rng=random.Random(3), max_samples=100)
+        assert len(equity_module._cache) == 0
+
+
+class TestEquityValidation:
+    """Tests for input validation."""
+
+    @pytest.mark.parametrize("hole,board,opponents", [
+        (["As"], [], 1),
+        (["As", "Ks"], ["Qs"], 1),
+        (["As", "Ks"], ["As", "Qs", "Js"], 1),
+        (["As", "Ks"], [], 0),
+        (["As", "Ks"], [], 10),
+    ])
+    def test_invalid_input(self, hole, board, opponents):
+        """Test invalid cards or opponent counts raise ValueError."""
+        with pytest.raises(ValueError):
+            calculate_equity(hole, board, opponents)
@@ -4,6 +4,9 @@ Tests all hand rankings, preflop strength evaluation, and draw detection.
 Validates Requirements 10.2 from code-quality-security-upgrade spec.
 """
 
+from itertools import combinations
+import random
+
 import pytest
 from app.game.hand_evaluator import (
     HandRank,
@@ -13,6 +16,11 @@ from app.game.hand_evaluator import (
     evaluate_preflop_strength,
     evaluate_postflop_strength,
     evaluate_hand_for_bot,
+    encode_card,
+    encode_cards,
+    evaluate_cards,
+    evaluate_batch,
+    hand_rank_of,
     _find_straight,
     _check_straight_draw,
 )
@@ -484,3 +492,76 @@ class TestEdgeCases:
         # Should find 9-high straight, not 7-high
         assert result.rank == HandRank.STRAIGHT
         assert "9" in result.description or result.strength > 0.75
+
+
+# =============================================================================
+# Lookup Table Evaluator Tests
+# =============================================================================
+
+
+def _value(cards: list[str]) -> int:
+    return evaluate_cards(encode_cards(cards))
+
+
+class TestLookupEvaluator:
+    """Tests for the integer-encoded lookup table evaluator."""
+
+    def test_encode_card(self):
+        """Test card encoding (rank_index * 4 + suit_index)."""
+        assert encode_card("2s") == 0
+        assert encode_card("As") == 48
+        assert encode_card("Ac") == 51
+        assert encode_card("10h") == encode_card("Th")
+        assert encode_card("kd") == encode_card("Kd")
+
+    def test_encode_invalid_card(self):
+        """Test invalid cards are rejected."""
+        with pytest.raises(ValueError):
+            encode_card("Xx")
+
+    @pytest.mark.parametrize("cards,expected", [
+        (["As", "Ks", "Qs", "Js", "Ts", "2h", "3d"], HandRank.ROYAL_FLUSH),
+        (["9s", "8s", "7s", "6s", "5s", "Ah", "Ad"], HandRank.STRAIGHT_FLUSH),
+        (["As", "2s", "3s", "4s", "5s"], HandRank.STRAIGHT_FLUSH),
+        (["As", "Ah", "Ad", "Ac", "Ks", "Kh", "Kd"], HandRank.FOUR_OF_A_KIND),
+        (["As", "Ah", "Ad", "Ks", "Kh", "Kd", "2c"], HandRank.FULL_HOUSE),
+        (["As", "Ts", "7s", "4s", "2s", "Kh", "Kd"], HandRank.FLUSH),
+        (["Ah", "2c", "3d", "4s", "5h", "Kh", "Kd"], HandRank.STRAIGHT),
+        (["As", "Ah", "Ad", "Ks", "Qh"], HandRank.THREE_OF_A_KIND),
+        (["As", "Ah", "Ks", "Kh", "Qh", "Qd", "2c"], HandRank.TWO_PAIR),
+        (["As", "Ah", "Ks", "Qh", "Jd"], HandRank.ONE_PAIR),
+        (["As", "Kh", "9d", "7c", "5s", "3h", "2d"], HandRank.HIGH_CARD),
+    ])
+    def test_hand_rank(self, cards, expected):
+        """Test hand categories match HandRank."""
+        assert hand_rank_of(_value(cards)) == expected
+
+    def test_kickers_break_ties(self):
+        """Test hands of the same category compare by kickers."""
+        assert _value(["As", "Ah", "Kd", "9c", "5s"]) > _value(["Ad", "Ac", "Qd", "Jc", "5h"])
+        assert _value(["Ks", "Kh", "Qd", "Qc", "2s"]) > _value(["Ks", "Kh", "Jd", "Jc", "As"])
+        # 휠은 가장 낮은 스트레이트
+        assert _value(["6h", "2c", "3d", "4s", "5h"]) > _value(["Ah", "2c", "3d", "4s", "5h"])
+        # 같은 보드를 공유하는 스플릿
+        board = ["As", "Ks", "Qd", "Jc", "Th"]
+        assert _value(["2h", "3h"] + board) == _value(["4d", "5d"] + board)
+
+    def test_seven_cards_use_best_five(self):
+        """Test 7-card value equals the best 5-card subset."""
+        rng = random.Random(7)
+        deck = list(range(52))
+        for _ in range(200):
+            cards = rng.sample(deck, 7)
+            best = max(evaluate_cards(c) for c in combinations(cards, 5))
+            assert evaluate_cards(cards) == best
+
+    def test_batch_matches_single(self):
+        """Test batch evaluation returns per-hand values in order."""
+        rng = random.Random(11)
+        deck = list(range(52))
+        hands = [rng.sample(deck, rng.choice([5, 6, 7])) for _ in range(100)]
+        assert evaluate_batch(hands) == [evaluate_cards(h) for h in hands]
+
+    def test_batch_empty(self):
+        """Test batch evaluation of no hands."""
+        assert evaluate_batch([]) == []
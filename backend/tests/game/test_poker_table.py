@@ -632,6 +632,17 @@ class TestEdgeCases:
         assert "players" in state
         assert "myPosition" in state
 
+    def test_state_version_advances_on_changes(self, two_player_table: PokerTable):
+        """Test stateVersion increases with each state change."""
+        before = two_player_table.state_version
+        two_player_table.start_new_hand()
+        started = two_player_table.get_state_for_player("user1")["stateVersion"]
+        assert started > before
+
+        current_player = two_player_table.players.get(two_player_table.current_player_seat)
+        two_player_table.process_action(current_player.user_id, "call", 0)
+        assert two_player_table.get_state_for_player("user1")["stateVersion"] > started
+
     def test_player_sees_own_hole_cards(self, two_player_table: PokerTable):
         """Test player can see their own hole cards."""
         two_player_table.start_new_hand()
@@ -0,0 +1,141 @@
+"""Unit tests for SeatAvailabilityIndex and index-based bot room matching."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.bot import room_matcher
+from app.bot.room_matcher import get_max_bots_for_table, select_room_for_bot
+from app.game.manager import GameManager
+from app.game.poker_table import Player
+from app.game.seat_index import SeatAvailabilityIndex
+
+
+def _player(user_id: str, seat: int, stack: int = 1000) -> Player:
+    return Player(user_id=user_id, username=user_id, seat=seat, stack=stack)
+
+
+@pytest.fixture
+def manager() -> GameManager:
+    return GameManager()
+
+
+def _create(manager: GameManager, room_id: str, big_blind: int = 20, max_players: int = 6):
+    return manager.create_table_sync(
+        room_id=room_id,
+        name=room_id,
+        small_blind=big_blind // 2,
+        big_blind=big_blind,
+        min_buy_in=big_blind * 20,
+        max_buy_in=big_blind * 500,
+        max_players=max_players,
+    )
+
+
+class TestSeatAvailabilityIndex:
+    """좌석 훅으로 갱신되는 인덱스 테스트."""
+
+    def test_tracks_seat_hooks(self, manager):
+        table = _create(manager, "r1")
+        index = manager.seat_index
+
+        assert index.empty_seats("r1") == [0, 1, 2, 3, 4, 5]
+
+        table.seat_player(0, _player("livebot_a", 0))
+        table.seat_player(3, _player("human", 3))
+
+        assert index.empty_seats("r1") == [1, 2, 4, 5]
+        assert index.bot_count("r1") == 1
+
+        table.remove_player(0)
+        assert index.bot_count("r1") == 0
+        assert 0 in index.empty_seats("r1")
+
+    def test_find_rooms_prefers_fewest_bots_in_blind_range(self, manager):
+        low = _create(manager, "low", big_blind=20)
+        busy = _create(manager, "busy", big_blind=40)
+        _create(manager, "high", big_blind=1000)
+        low.seat_player(0, _player("livebot_a", 0))
+        busy.seat_player(0, _player("livebot_b", 0, stack=2000))
+        busy.seat_player(1, _player("livebot_c", 1, stack=2000))
+
+        index = manager.seat_index
+
+        assert index.find_rooms(10, 100, get_max_bots_for_table) == ["low"]
+        assert index.find_rooms(10, 100, get_max_bots_for_table, exclude={"low"}) == ["busy"]
+        assert index.find_rooms(500, 2000, get_max_bots_for_table) == ["high"]
+
+    def test_full_and_bot_capped_tables_are_skipped(self, manager):
+        table = _create(manager, "r1", max_players=6)
+        max_bots = get_max_bots_for_table(6)
+        for seat in range(max_bots):
+            table.seat_player(seat, _player(f"livebot_{seat}", seat))
+
+        assert manager.seat_index.find_rooms(1, 1000, get_max_bots_for_table) == []
+
+        # 봇 상한이 없으면 빈 좌석만 있으면 후보
+        assert manager.seat_index.find_rooms(1, 1000, lambda n: n) == ["r1"]
+
+    def test_untrack_and_rebuild(self, manager):
+        table = _create(manager, "r1")
+        table.players[2] = _player("livebot_x", 2)  # 훅 없이 직접 복원
+
+        manager.seat_index.track(table)
+        assert manager.seat_index.bot_count("r1") == 1
+
+        manager.clear_all()
+        assert "r1" not in manager.seat_index
+        assert manager.seat_index.find_rooms(1, 1000, lambda n: n) == []
+
+    def test_untracked_table_hook_is_noop(self):
+        index = SeatAvailabilityIndex()
+        manager = GameManager()
+        table = _create(manager, "r1")
+
+        index.on_seat_changed(table, 0)
+
+        assert len(index) == 0
+
+
+class TestSelectRoomForBot:
+    """인덱스 기반 봇 방 선택 테스트."""
+
+    @pytest.fixture(autouse=True)
+    def patched_manager(self, manager):
+        with patch.object(room_matcher, "game_manager", manager):
+            yield manager
+
+    @pytest.mark.asyncio
+    async def test_lookup_skips_db_until_sync_due(self, manager):
+        _create(manager, "r1", big_blind=100)
+        db = AsyncMock(return_value=[])
+
+        with patch.object(room_matcher, "get_available_rooms_from_db", db), \
+             patch.object(room_matcher, "_last_db_room_sync", 10**12):
+            result = await select_room_for_bot(10000)
+
+        table, seat = result
+        assert table.room_id == "r1"
+        assert seat in range(6)
+        db.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_loads_unloaded_rooms_when_no_candidate(self, manager):
+        db = AsyncMock(return_value=[{
+            "id": "db-room",
+            "name": "DB Room",
+            "small_blind": 50,
+            "big_blind": 100,
+            "max_seats": 9,
+            "current_players": 0,
+            "buy_in_min": 4000,
+            "buy_in_max": 20000,
+        }])
+
+        with patch.object(room_matcher, "get_available_rooms_from_db", db), \
+             patch.object(room_matcher, "_last_db_room_sync", 10**12):
+            table, _ = await select_room_for_bot(10000)
+
+        assert table.room_id == "db-room"
+        assert "db-room" in manager.seat_index
+        db.assert_awaited_once()
@@ -0,0 +1,333 @@
+"""Table persistence (write-behind) tests."""
+
+import asyncio
+import gzip
+import json
+
+import pytest
+
+from app.game import table_persistence
+from app.game.manager import GameManager
+from app.game.poker_table import Player, PokerTable
+from app.game.table_persistence import (
+    TablePersistenceService,
+    TableSnapshot,
+    encode_table,
+)
+
+
+class MockPipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._commands.append((name, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self):
+        self._redis.executes += 1
+        gate, self._redis.gate = self._redis.gate, None
+        if gate is not None:
+            # 첫 번째 실행만 gate가 열릴 때까지 대기
+            await gate.wait()
+        if self._redis.fail:
+            raise ConnectionError("redis down")
+        results = []
+        for name, args, kwargs in self._commands:
+            results.append(await getattr(self._redis, name)(*args, **kwargs))
+        return results
+
+
+class MockRedis:
+    """Redis mock counting pipeline round trips."""
+
+    def __init__(self):
+        self.values: dict[str, bytes] = {}
+        self.hashes: dict[str, dict] = {}
+        self.sets: dict[str, set] = {}
+        self.executes = 0
+        self.fail = False
+        self.gate: asyncio.Event | None = None
+
+    def pipeline(self, transaction=True):
+        return MockPipeline(self)
+
+    async def set(self, key, value):
+        self.values[key] = value
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(
+            {k.encode(): v.encode() for k, v in mapping.items()}
+        )
+
+    async def hgetall(self, key):
+        return self.hashes.get(key, {})
+
+    async def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(members)
+
+    async def srem(self, key, member):
+        self.sets.get(key, set()).discard(member)
+
+    async def smembers(self, key):
+        return self.sets.get(key, set())
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+            self.hashes.pop(key, None)
+
+
+def make_table(room_id: str = "room-1") -> PokerTable:
+    table = PokerTable(
+        room_id=room_id,
+        name="테스트 테이블",
+        small_blind=10,
+        big_blind=20,
+        min_buy_in=400,
+        max_buy_in=2000,
+        max_players=6,
+    )
+    table.seat_player(0, Player(user_id="u1", username="플레이어1", seat=0, stack=1000))
+    table.seat_player(3, Player(user_id="bot1", username="Bot", seat=3, stack=800, is_bot=True))
+    return table
+
+
+@pytest.fixture
+def redis():
+    return MockRedis()
+
+
+@pytest.fixture
+def persistence(redis):
+    return TablePersistenceService(redis, flush_interval=0.01)
+
+
+class TestCompactEncoding:
+    """컴팩트 인코딩 테스트."""
+
+    def test_round_trip(self):
+        table = make_table()
+        table.dealer_seat = 3
+        table.hand_number = 42
+
+        snapshot = TableSnapshot.from_compact(encode_table(table), updated_at="t")
+
+        assert snapshot.room_id == "room-1"
+        assert snapshot.name == "테스트 테이블"
+        assert snapshot.dealer_seat == 3
+        assert snapshot.hand_number == 42
+        assert snapshot.phase == "waiting"
+        assert snapshot.updated_at == "t"
+        assert set(snapshot.players) == {0, 3}
+        assert snapshot.players[3].is_bot is True
+        assert snapshot.players[0].stack == 1000
+
+    def test_smaller_than_legacy_json(self):
+        table = make_table()
+        legacy = json.dumps(
+            TableSnapshot.from_compact(encode_table(table)).to_dict(),
+            ensure_ascii=False,
+        ).encode()
+
+        assert len(encode_table(table)) < len(legacy)
+
+    def test_unknown_version_rejected(self):
+        with pytest.raises(ValueError):
+            TableSnapshot.from_compact(b'[99,"r","n",1,2,3,4,5,-1,0,"waiting",[]]')
+
+
+class TestWriteBehind:
+    """dirty 표시 / 일괄 플러시 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_mark_dirty_coalesces_changes(self, persistence, redis):
+        """플러시 전 여러 번의 변경은 한 번의 쓰기로 합쳐져야 함."""
+        table = make_table()
+        for stack in (900, 800, 700):
+            table.players[0].stack = stack
+            persistence.mark_dirty(table)
+
+        assert redis.executes == 0
+        assert await persistence.flush() == 1
+        assert redis.executes == 1
+
+        snapshot = await persistence.load_table("room-1")
+        assert snapshot.players[0].stack == 700
+
+    @pytest.mark.asyncio
+    async def test_flush_batches_tables_in_one_round_trip(self, persistence, redis):
+        for i in range(5):
+            persistence.mark_dirty(make_table(f"room-{i}"))
+
+        assert await persistence.flush() == 5
+        assert redis.executes == 1
+        assert len(redis.sets[TablePersistenceService.TABLE_LIST_KEY]) == 5
+
+    @pytest.mark.asyncio
+    async def test_unchanged_table_skipped(self, persistence, redis):
+        table = make_table()
+        persistence.mark_dirty(table)
+        await persistence.flush()
+
+        persistence.mark_dirty(table)
+        assert await persistence.flush() == 0
+        assert redis.executes == 1
+
+        table.hand_number += 1
+        persistence.mark_dirty(table)
+        assert await persistence.flush() == 1
+
+    @pytest.mark.asyncio
+    async def test_background_flusher(self, persistence, redis):
+        persistence.mark_dirty(make_table())
+
+        for _ in range(50):
+            if persistence.dirty_count == 0 and redis.executes:
+                break
+            await asyncio.sleep(0.01)
+
+        assert "game:table:room-1" in redis.values
+        await persistence.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_tables_dirty(self, persistence, redis):
+        persistence.mark_dirty(make_table())
+        redis.fail = True
+
+        with pytest.raises(ConnectionError):
+            await persistence.flush()
+        assert persistence.dirty_count == 1
+
+        redis.fail = False
+        assert await persistence.flush() == 1
+        assert persistence.dirty_count == 0
+
+    @pytest.mark.asyncio
+    async def test_save_tables_single_batch(self, persistence, redis):
+        tables = [make_table(f"room-{i}") for i in range(3)]
+        persistence.mark_dirty(tables[0])
+
+        assert await persistence.save_tables(tables) == 3
+        assert redis.executes == 1
+        assert persistence.dirty_count == 0
+
+    @pytest.mark.asyncio
+    async def test_delete_drops_pending_write(self, persistence, redis):
+        table = make_table()
+        await persistence.save_table(table)
+        persistence.mark_dirty(table)
+
+        await persistence.delete_table("room-1")
+        await persistence.flush()
+
+        assert "game:table:room-1" not in redis.values
+        assert await persistence.list_tables() == []
+
+        # 삭제 후 다시 저장하면 다이제스트와 무관하게 기록되어야 함
+        assert await persistence.save_table(table) is True
+        assert "game:table:room-1" in redis.values
+
+    @pytest.mark.asyncio
+    async def test_delete_during_flush_is_not_overwritten(self, persistence, redis):
+        table = make_table()
+        persistence.mark_dirty(table)
+        gate = redis.gate = asyncio.Event()
+
+        flush = asyncio.create_task(persistence.flush())
+        await asyncio.sleep(0)
+        delete = asyncio.create_task(persistence.delete_table("room-1", table))
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(flush, delete)
+
+        assert "game:table:room-1" not in redis.values
+        assert await persistence.list_tables() == []
+
+    @pytest.mark.asyncio
+    async def test_deleted_table_mark_dirty_ignored(self, persistence, redis):
+        table = make_table()
+        await persistence.delete_table("room-1", table)
+
+        persistence.mark_dirty(table)
+        assert persistence.dirty_count == 0
+
+        # 같은 room_id로 새로 만든 테이블은 다시 저장
+        persistence.mark_dirty(make_table())
+        assert await persistence.flush() == 1
+        assert "game:table:room-1" in redis.values
+
+    @pytest.mark.asyncio
+    async def test_game_manager_seat_change_flushed(self, persistence, redis, monkeypatch):
+        """착석하면 GameManager가 테이블을 표시하고 플러셔가 저장해야 함."""
+        monkeypatch.setattr(table_persistence, "_persistence_service", persistence)
+        manager = GameManager()
+        table = manager.create_table_sync("room-1", "테이블", 10, 20, 400, 2000, 6)
+
+        table.seat_player(2, Player(user_id="u1", username="플레이어1", seat=2, stack=1000))
+
+        for _ in range(50):
+            if "game:table:room-1" in redis.values:
+                break
+            await asyncio.sleep(0.01)
+
+        snapshot = await persistence.load_table("room-1")
+        assert snapshot.players[2].user_id == "u1"
+
+        table.players[2].stack = 1500
+        assert await manager.save_all_tables() == 1
+        assert (await persistence.load_table("room-1")).players[2].stack == 1500
+        await persistence.stop()
+
+    @pytest.mark.asyncio
+    async def test_game_manager_remove_table_drops_pending_flush(
+        self, redis, monkeypatch
+    ):
+        """제거된 테이블의 대기 중 저장은 버리고 Redis 상태도 삭제해야 함."""
+        persistence = TablePersistenceService(redis, flush_interval=60)
+        monkeypatch.setattr(table_persistence, "_persistence_service", persistence)
+        manager = GameManager()
+        table = manager.create_table_sync("room-1", "테이블", 10, 20, 400, 2000, 6)
+        await persistence.save_table(table)
+
+        table.seat_player(2, Player(user_id="u1", username="플레이어1", seat=2, stack=1000))
+        assert persistence.dirty_count == 1
+
+        assert await manager.remove_table("room-1") is True
+
+        assert persistence.dirty_count == 0
+        assert await persistence.flush() == 0
+        assert "game:table:room-1" not in redis.values
+        assert "game:table:room-1:meta" not in redis.hashes
+        assert "room-1" not in redis.sets[TablePersistenceService.TABLE_LIST_KEY]
+        assert "room-1" not in persistence._saved_digests
+        await persistence.stop()
+
+
+class TestLoad:
+    """로드 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_checksum_mismatch_rejected(self, persistence, redis):
+        await persistence.save_table(make_table())
+        redis.values["game:table:room-1"] += b" "
+
+        assert await persistence.load_table("room-1") is None
+
+    @pytest.mark.asyncio
+    async def test_legacy_gzip_snapshot(self, persistence, redis):
+        snapshot = TableSnapshot.from_compact(encode_table(make_table()))
+        data = gzip.compress(json.dumps(snapshot.to_dict()).encode())
+        redis.values["game:table:room-1"] = data
+        redis.hashes["game:table:room-1:meta"] = {
+            b"checksum": persistence._compute_checksum(data).encode(),
+        }
+
+        loaded = await persistence.load_table("room-1")
+        assert loaded.players[0].username == "플레이어1"
@@ -35,10 +35,37 @@ class MockRedisClient:
     def __init__(self):
         self._data: dict[str, list[tuple[str, float]]] = {}
         self._expiry: dict[str, float] = {}
+        self._hashes: dict[str, dict] = {}
+        self.script_calls = 0
 
     def pipeline(self):
         return MockPipeline(self)
 
+    def register_script(self, script: str):
+        """Emulate SlidingWindowRateLimiter.SLIDING_WINDOW_SCRIPT."""
+
+        async def run(keys, args):
+            self.script_calls += 1
+            key = keys[0]
+            now, window, limit, member = float(args[0]), int(args[1]), int(args[2]), args[3]
+
+            entries = [(m, s) for m, s in self._data.get(key, []) if s > now - window]
+            self._data[key] = entries
+            count = len(entries)
+
+            if count >= limit:
+                retry_after = window
+                if entries:
+                    oldest = min(s for _, s in entries)
+                    retry_after = max(1, int(oldest + window - now) + 1)
+                return [0, 0, retry_after]
+
+            entries.append((member, now))
+            self._expiry[key] = time.time() + window + 1
+            return [1, limit - count - 1, 0]
+
+        return run
+
     async def zrange(self, key: str, start: int, end: int, withscores: bool = False):
         """Get range of sorted set."""
         if key not in self._data:
@@ -82,6 +109,10 @@ class MockPipeline:
         self._commands.append(("expire", (key, seconds)))
         return self
 
+    def hset(self, key: str, mapping: dict):
+        self._commands.append(("hset", (key, mapping)))
+        return self
+
     async def execute(self):
         results = []
         for cmd, args in self._commands:
@@ -108,6 +139,10 @@ class MockPipeline:
                 key, seconds = args
                 self._client._expiry[key] = time.time() + seconds
                 results.append(1)
+            elif cmd == "hset":
+                key, mapping = args
+                self._client._hashes.setdefault(key, {}).update(mapping)
+                results.append(len(mapping))
         return results
 
 
@@ -320,6 +355,103 @@ class TestWebSocketRateLimiter:
         assert retry_after >= 1000 or retry_after > 0
 
 
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestWebSocketTokenBucket:
+    """Token bucket behaviour of WebSocketRateLimiter."""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def redis_client(self):
+        return MockRedisClient()
+
+    @pytest.fixture
+    def ws_limiter(self, redis_client, clock):
+        return WebSocketRateLimiter(
+            redis_client,
+            messages_per_second=10,
+            burst_limit=5,
+            instance_id="worker-a",
+            clock=clock,
+        )
+
+    @pytest.mark.asyncio
+    async def test_no_redis_io_per_message(self, ws_limiter, redis_client):
+        """Checking messages should not touch Redis."""
+        for _ in range(10):
+            await ws_limiter.is_allowed("conn")
+
+        assert redis_client.script_calls == 0
+        assert redis_client._data == {}
+
+    @pytest.mark.asyncio
+    async def test_tokens_refill_at_sustained_rate(self, ws_limiter, clock):
+        """Tokens should refill at messages_per_second."""
+        for _ in range(5):
+            await ws_limiter.is_allowed("conn")
+
+        is_allowed, retry_after = await ws_limiter.is_allowed("conn")
+        assert is_allowed is False
+        assert retry_after == 100  # 1 token at 10/s
+
+        clock.now += 0.1
+        assert (await ws_limiter.is_allowed("conn"))[0] is True
+        assert (await ws_limiter.is_allowed("conn"))[0] is False
+
+    @pytest.mark.asyncio
+    async def test_refill_capped_at_burst(self, ws_limiter, clock):
+        """Idle time should not accumulate more than burst_limit tokens."""
+        await ws_limiter.is_allowed("conn")
+        clock.now += 60
+
+        allowed = 0
+        for _ in range(10):
+            if (await ws_limiter.is_allowed("conn"))[0]:
+                allowed += 1
+        assert allowed == 5
+
+    @pytest.mark.asyncio
+    async def test_release_reuses_slot(self, ws_limiter):
+        """Released slots should be reused by new connections."""
+        await ws_limiter.is_allowed("conn-1")
+        slot = ws_limiter._slots["conn-1"]
+
+        ws_limiter.release("conn-1")
+        ws_limiter.release("conn-1")  # Idempotent
+        await ws_limiter.is_allowed("conn-2")
+
+        assert ws_limiter._slots["conn-2"] == slot
+        assert len(ws_limiter._tokens) == 1
+        assert ws_limiter.tracked_connections == 1
+
+    @pytest.mark.asyncio
+    async def test_reconcile_prunes_idle_and_reports(self, ws_limiter, redis_client, clock):
+        """reconcile() should free refilled slots and report to Redis."""
+        for _ in range(6):
+            await ws_limiter.is_allowed("idle")
+        clock.now += 1.0
+        await ws_limiter.is_allowed("active")
+
+        await ws_limiter.reconcile()
+
+        assert ws_limiter.tracked_connections == 1
+        assert "active" in ws_limiter._slots
+        report = redis_client._hashes["ws_ratelimit:worker:worker-a"]
+        assert report == {"connections": 1, "rejected": 1}
+        await ws_limiter.stop()
+
+
 class TestRateLimitPropertyBased:
     """Property-based tests for rate limiting."""
 
@@ -440,7 +572,12 @@ class TestRateLimitEdgeCases:
         middleware = RateLimitMiddleware(app, redis_client=None)
         assert middleware._limiter is None
 
-    def test_ws_limiter_without_redis(self):
-        """WebSocket limiter should work without Redis."""
-        limiter = WebSocketRateLimiter(None)
-        assert limiter._limiter is None
+    @pytest.mark.asyncio
+    async def test_ws_limiter_without_redis(self):
+        """WebSocket limiter should still enforce limits without Redis."""
+        limiter = WebSocketRateLimiter(None, burst_limit=2)
+
+        assert (await limiter.is_allowed("conn"))[0] is True
+        assert (await limiter.is_allowed("conn"))[0] is True
+        assert (await limiter.is_allowed("conn"))[0] is False
+        await limiter.reconcile()  # No Redis report, no error
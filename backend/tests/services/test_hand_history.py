@@ -14,7 +14,8 @@ from uuid import uuid4
 import pytest
 from hypothesis import given, settings, strategies as st
 
-from app.services.hand_history import HandHistoryService
+from app.models.hand import HandEvent
+from app.services.hand_history import HandHistoryService, build_hand_events
 
 
 # ============================================================================
@@ -56,7 +57,7 @@ def create_mock_db_session():
     mock_session = AsyncMock()
     mock_session.add = MagicMock()
     mock_session.commit = AsyncMock()
-    mock_session.execute = AsyncMock()
+    mock_session.execute = AsyncMock(return_value=MagicMock())
     mock_session.get = AsyncMock(return_value=None)
     return mock_session
 
@@ -266,14 +267,82 @@ class TestSaveHandResult:
                     "won_amount": 0,
                     "final_action": "fold",
                 },
+                {
+                    # Bot - not a users row, should be skipped
+                    "user_id": "livebot_abc123",
+                    "seat": 2,
+                    "bet_amount": 100,
+                    "won_amount": 0,
+                    "final_action": "fold",
+                },
             ],
         }
 
         await service.save_hand_result(hand_result)
 
-        # Hand + 1 participant (second one skipped) = 2 add calls
+        # Hand + 1 participant (second and third skipped) = 2 add calls
         assert mock_db.add.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_save_hand_result_stores_events_and_updates_stats(self):
+        """액션 로그는 hand_events로 저장되고 통계 카운터가 갱신됨."""
+        mock_db = create_mock_db_session()
+        service = HandHistoryService(mock_db)
+        user_id = str(uuid4())
+
+        hand_result = {
+            "table_id": str(uuid4()),
+            "hand_number": 1,
+            "community_cards": [],
+            "participants": [
+                {"user_id": user_id, "seat": 0, "bet_amount": 20, "won_amount": 0,
+                 "final_action": "fold"},
+            ],
+            "actions": [
+                {"seat": 0, "user_id": user_id, "action": "fold", "amount": 0,
+                 "phase": "preflop"},
+            ],
+        }
+
+        await service.save_hand_result(hand_result)
+
+        added = [call.args[0] for call in mock_db.add.call_args_list]
+        events = [obj for obj in added if isinstance(obj, HandEvent)]
+        assert [e.event_type for e in events] == ["fold"]
+        # 기존 카운터 조회 + 증분 upsert + 카운터가 없던 사용자 재구축
+        assert mock_db.execute.call_count == 3
+        assert mock_db.execute.call_args.args[1] == {"user_ids": [user_id]}
+
+
+class TestBuildHandEvents:
+    """build_hand_events 테스트."""
+
+    def test_deal_events_inserted_at_street_changes(self):
+        """스트리트가 바뀌면 딜 이벤트 삽입."""
+        cards = ["Ah", "Kd", "Qc", "Js", "Th"]
+        actions = [
+            {"seat": 0, "user_id": "u1", "action": "raise", "amount": 60, "phase": "preflop"},
+            {"seat": 1, "user_id": "u2", "action": "call", "amount": 60, "phase": "preflop"},
+            {"seat": 1, "user_id": "u2", "action": "check", "amount": 0, "phase": "flop"},
+            {"seat": 0, "user_id": "u1", "action": "all_in", "amount": 940, "phase": "flop"},
+            {"seat": 1, "user_id": "u2", "action": "call", "amount": 940, "phase": "flop"},
+        ]
+
+        events = build_hand_events(actions, cards)
+
+        assert [e["event_type"] for e in events] == [
+            "raise", "call", "deal_flop", "check", "all_in", "call",
+            "deal_turn", "deal_river",
+        ]
+        assert [e["seq_no"] for e in events] == list(range(1, 9))
+        assert events[2]["payload"] == {"cards": ["Ah", "Kd", "Qc"]}
+        assert events[7]["payload"] == {"cards": ["Th"]}
+        assert events[0]["payload"] == {"seat": 0, "user_id": "u1", "amount": 60}
+
+    def test_no_actions_no_events(self):
+        """액션 로그가 없으면 이벤트 없음."""
+        assert build_hand_events([], ["Ah", "Kd", "Qc"]) == []
+
 
 class TestGetUserHandHistory:
     """get_user_hand_history 메서드 테스트."""
@@ -654,3 +723,63 @@ class TestHandHistoryStorageProperty:
             
             # Verify net_result calculation
             assert hand["net_result"] == hand["user_won_amount"] - hand["user_bet_amount"]
+
+
+class TestSaveHandResults:
+    """save_hand_results (일괄 저장) 테스트."""
+
+    @staticmethod
+    def _hand(hand_id: str, user_id: str) -> dict:
+        return {
+            "hand_id": hand_id,
+            "table_id": str(uuid4()),
+            "hand_number": 1,
+            "pot_size": 40,
+            "community_cards": [],
+            "participants": [
+                {"user_id": user_id, "seat": 0, "bet_amount": 20,
+                 "won_amount": 40, "final_action": "showdown"},
+            ],
+            "actions": [
+                {"seat": 0, "user_id": user_id, "action": "call", "amount": 20,
+                 "phase": "preflop"},
+            ],
+        }
+
+    @pytest.mark.asyncio
+    async def test_only_inserted_hands_write_children(self):
+        """이미 저장된 핸드는 참가자/이벤트/통계를 다시 쓰지 않음."""
+        mock_db = create_mock_db_session()
+        new_user = str(uuid4())
+        inserted = MagicMock()
+        inserted.scalars.return_value.all.return_value = ["h-new"]
+        counters = MagicMock()
+        counters.scalars.return_value.all.return_value = [new_user]
+        mock_db.execute.side_effect = [inserted, None, None, counters, None]
+        service = HandHistoryService(mock_db)
+
+        saved = await service.save_hand_results([
+            self._hand("h-old", str(uuid4())),
+            self._hand("h-new", new_user),
+        ])
+
+        assert saved == ["h-new"]
+        # hands upsert, participants, events, counter lookup, counter upsert
+        assert mock_db.execute.call_count == 5
+        hands_stmt = str(mock_db.execute.call_args_list[0].args[0].compile())
+        assert "ON CONFLICT (id) DO NOTHING" in hands_stmt
+        participant_rows = mock_db.execute.call_args_list[1].args[1]
+        assert [row["hand_id"] for row in participant_rows] == ["h-new"]
+        event_rows = mock_db.execute.call_args_list[2].args[1]
+        assert [row["event_type"] for row in event_rows] == ["call"]
+        mock_db.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_requires_hand_id(self):
+        """일괄 저장은 hand_id가 미리 할당되어야 함."""
+        service = HandHistoryService(create_mock_db_session())
+        hand = self._hand("h1", "u1")
+        del hand["hand_id"]
+
+        with pytest.raises(ValueError, match="hand_id"):
+            await service.save_hand_results([hand])
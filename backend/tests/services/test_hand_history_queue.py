@@ -0,0 +1,181 @@
+"""Tests for the hand history write-behind queue."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.services.hand_history_queue import (
+    DEAD_LETTER_SUFFIX,
+    SEALED_SUFFIX,
+    HandHistoryQueue,
+)
+
+
+def make_hand(hand_number: int = 1) -> dict:
+    return {
+        "table_id": "table-1",
+        "hand_number": hand_number,
+        "pot_size": 40,
+        "community_cards": ["Ah", "Kd", "Qc"],
+        "participants": [
+            {"user_id": "u1", "seat": 0, "bet_amount": 20, "won_amount": 40},
+        ],
+        "actions": [],
+    }
+
+
+@asynccontextmanager
+async def fake_session():
+    yield MagicMock()
+
+
+@pytest.fixture
+def save_hand_results():
+    """Patch HandHistoryService.save_hand_results and return the mock."""
+    mock = AsyncMock(return_value=[])
+    with patch(
+        "app.services.hand_history_queue.HandHistoryService"
+    ) as service_cls:
+        service_cls.return_value.save_hand_results = mock
+        yield mock
+
+
+def make_queue(tmp_path, batch_size: int = 200) -> HandHistoryQueue:
+    return HandHistoryQueue(
+        tmp_path,
+        flush_interval=60,
+        batch_size=batch_size,
+        session_factory=fake_session,
+    )
+
+
+class TestHandHistoryQueue:
+    """HandHistoryQueue 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_assigns_ids_and_flushes_in_batches(
+        self, tmp_path, save_hand_results
+    ):
+        """enqueue는 hand_id를 할당하고, flush는 배치 단위로 저장."""
+        queue = make_queue(tmp_path, batch_size=2)
+        await queue.start()
+
+        hand_ids = [await queue.enqueue(make_hand(i)) for i in range(3)]
+        assert len(set(hand_ids)) == 3
+        assert queue.pending == 3
+        assert queue.lag_seconds >= 0
+
+        assert await queue.flush() == 3
+        batches = [call.args[0] for call in save_hand_results.call_args_list]
+        assert [len(b) for b in batches] == [2, 1]
+        assert [h["hand_id"] for b in batches for h in b] == hand_ids
+        assert "enqueued_at" not in batches[0][0]
+        assert batches[0][0]["ended_at"].tzinfo is not None
+        assert queue.pending == 0
+        assert queue.lag_seconds == 0
+
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_segment_for_retry(
+        self, tmp_path, save_hand_results
+    ):
+        """저장 실패 시 세그먼트를 남기고 다음 flush에서 재시도."""
+        queue = make_queue(tmp_path)
+        await queue.start()
+        hand_id = await queue.enqueue(make_hand())
+
+        save_hand_results.side_effect = RuntimeError("db down")
+        with pytest.raises(RuntimeError):
+            await queue.flush()
+        assert queue.pending == 1
+        assert list((tmp_path / "worker-0").glob(f"*{SEALED_SUFFIX}"))
+
+        save_hand_results.side_effect = None
+        assert await queue.flush() == 1
+        assert save_hand_results.call_args.args[0][0]["hand_id"] == hand_id
+        assert not list((tmp_path / "worker-0").glob(f"*{SEALED_SUFFIX}"))
+
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_restart_replays_unflushed_spool(self, tmp_path, save_hand_results):
+        """프로세스 재시작 시 남은 스풀을 복구해 저장."""
+        crashed = make_queue(tmp_path)
+        await crashed.start()
+        hand_id = await crashed.enqueue(make_hand())
+        # Simulate a crash: no stop(), just drop the flusher and lock
+        crashed._task.cancel()
+        crashed._close_active()
+        crashed._release_slot()
+
+        queue = make_queue(tmp_path)
+        await queue.start()
+        assert queue.pending == 1
+
+        assert await queue.flush() == 1
+        assert save_hand_results.call_args.args[0][0]["hand_id"] == hand_id
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_queues_use_separate_slots(
+        self, tmp_path, save_hand_results
+    ):
+        """동시에 실행되는 워커는 서로 다른 스풀 디렉토리를 사용."""
+        first = make_queue(tmp_path)
+        second = make_queue(tmp_path)
+        await first.start()
+        await second.start()
+
+        await first.enqueue(make_hand(1))
+        await second.enqueue(make_hand(2))
+
+        assert (tmp_path / "worker-0" / "active.jsonl").exists()
+        assert (tmp_path / "worker-1" / "active.jsonl").exists()
+
+        await first.stop()
+        await second.stop()
+        assert save_hand_results.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_enqueue_validates_required_fields(self, tmp_path):
+        """필수 필드가 없으면 ValueError."""
+        queue = make_queue(tmp_path)
+        with pytest.raises(ValueError):
+            await queue.enqueue({"table_id": "t"})
+
+    @pytest.mark.asyncio
+    async def test_rejected_hand_is_dead_lettered(self, tmp_path, save_hand_results):
+        """데이터 오류로 거부된 핸드만 dead-letter로 옮기고 나머지는 저장."""
+        queue = make_queue(tmp_path)
+        await queue.start()
+        good = await queue.enqueue(make_hand(1))
+        bad = await queue.enqueue(make_hand(2))
+
+        def save(hands):
+            if any(h["hand_id"] == bad for h in hands):
+                raise IntegrityError("INSERT", {}, Exception("fk violation"))
+            return [h["hand_id"] for h in hands]
+
+        save_hand_results.side_effect = save
+        assert await queue.flush() == 2
+
+        saved = [h["hand_id"] for call in save_hand_results.call_args_list
+                 for h in call.args[0]]
+        # batch, then per-hand retry
+        assert saved == [good, bad, good, bad]
+        slot = tmp_path / "worker-0"
+        assert not list(slot.glob(f"*{SEALED_SUFFIX}"))
+        dead = list(slot.glob(f"*{DEAD_LETTER_SUFFIX}"))
+        assert len(dead) == 1
+        assert bad in dead[0].read_text()
+        assert queue.pending == 0
+
+        # Later hands are no longer blocked
+        save_hand_results.side_effect = None
+        await queue.enqueue(make_hand(3))
+        assert await queue.flush() == 1
+
+        await queue.stop()
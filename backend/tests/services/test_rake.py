@@ -4,7 +4,7 @@ Phase 6.1: Rake & Economy System tests.
 """
 
 from decimal import Decimal
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -235,3 +235,61 @@ class TestRakeServiceHighStakes:
         max_rake = 100000 * config.cap_bb
         
         assert result.total_rake <= max_rake
+
+
+class TestRakeServiceCollection:
+    """Tests for rake collection."""
+    
+    @pytest.fixture
+    def rake_service(self):
+        """Create RakeService with mocked wallet service."""
+        service = RakeService(MagicMock())
+        service._wallet_service = MagicMock()
+        service._wallet_service.settle_hand = AsyncMock(
+            side_effect=lambda table_id, hand_id, entries: [
+                MagicMock(id=f"tx-{i}") for i in range(len(entries))
+            ]
+        )
+        return service
+    
+    @pytest.mark.asyncio
+    async def test_collect_rake_settles_once(self, rake_service):
+        """All winners' rake should be settled in a single batch."""
+        rake_result = RakeResult(
+            total_rake=3000,
+            rake_per_winner={0: 2000, 3: 1000, 5: 500},
+            pot_after_rake=57000,
+            applied_nfnd=False,
+        )
+        
+        transactions = await rake_service.collect_rake(
+            table_id="table-1",
+            hand_id="hand-1",
+            rake_result=rake_result,
+            position_to_user_id={0: "user-a", 3: "user-b"},
+        )
+        
+        rake_service._wallet_service.settle_hand.assert_awaited_once()
+        entries = rake_service._wallet_service.settle_hand.await_args.kwargs["entries"]
+        assert [(e.user_id, e.amount) for e in entries] == [("user-a", -2000), ("user-b", -1000)]
+        assert [t["transaction_id"] for t in transactions] == ["tx-0", "tx-1"]
+    
+    @pytest.mark.asyncio
+    async def test_collect_rake_failure_records_nothing(self, rake_service):
+        """A failed settlement should not report partial collection."""
+        rake_service._wallet_service.settle_hand.side_effect = Exception("boom")
+        rake_result = RakeResult(
+            total_rake=3000,
+            rake_per_winner={0: 2000, 3: 1000},
+            pot_after_rake=57000,
+            applied_nfnd=False,
+        )
+        
+        transactions = await rake_service.collect_rake(
+            table_id="table-1",
+            hand_id="hand-1",
+            rake_result=rake_result,
+            position_to_user_id={0: "user-a", 3: "user-b"},
+        )
+        
+        assert transactions == []
@@ -1,8 +1,25 @@
 """통계 서비스 테스트."""
 
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
-from app.services.statistics import PlayerStats, StatisticsService
+from app.models.player_stats import PlayerStatCounters
+from app.services.statistics import (
+    COUNTER_COLUMNS,
+    PlayerStats,
+    StatisticsService,
+    hand_stat_counters,
+    is_registered_user_id,
+)
+
+U1 = "00000000-0000-0000-0000-000000000001"
+U2 = "00000000-0000-0000-0000-000000000002"
+
+
+def event(seq_no: int, event_type: str, user_id: str | None = None) -> dict:
+    payload = {"user_id": user_id} if user_id else {"cards": []}
+    return {"seq_no": seq_no, "event_type": event_type, "payload": payload}
 
 
 class TestPlayerStats:
@@ -191,3 +208,221 @@ class TestStatsDataclass:
         assert isinstance(stats.vpip, float)
         assert isinstance(stats.pfr, float)
         assert isinstance(stats.af, float)
+
+
+class TestHandStatCounters:
+    """hand_stat_counters 테스트 (증분 업데이트 규칙)."""
+
+    def test_preflop_raise_and_three_bet(self):
+        """프리플롭 리레이즈는 VPIP/PFR/3Bet 모두 카운트."""
+        events = [
+            event(1, "post_blind", "u1"),
+            event(2, "raise", "u2"),
+            event(3, "raise", "u1"),
+            event(4, "call", "u2"),
+            event(5, "deal_flop"),
+            event(6, "bet", "u1"),
+            event(7, "fold", "u2"),
+        ]
+        participant = {"bet_amount": 120, "won_amount": 300, "final_action": "fold"}
+
+        counters = hand_stat_counters("u1", participant, events)
+
+        assert counters["vpip_hands"] == 1
+        assert counters["pfr_hands"] == 1
+        assert counters["three_bet_hands"] == 1
+        assert counters["bets"] == 1
+        assert counters["raises"] == 1
+        assert counters["total_actions"] == 2
+        assert counters["total_winnings"] == 180
+        assert counters["hands_won"] == 1
+
+    def test_open_raise_is_not_three_bet(self):
+        """첫 레이즈는 3Bet 아님."""
+        events = [event(1, "raise", "u2"), event(2, "call", "u1")]
+
+        counters = hand_stat_counters("u2", {"bet_amount": 60}, events)
+
+        assert counters["pfr_hands"] == 1
+        assert counters["three_bet_hands"] == 0
+
+    def test_postflop_actions_do_not_count_as_vpip(self):
+        """플롭 이후 액션은 VPIP에 포함되지 않음."""
+        events = [
+            event(1, "check", "u1"),
+            event(2, "deal_flop"),
+            event(3, "bet", "u1"),
+        ]
+
+        counters = hand_stat_counters("u1", {}, events)
+
+        assert counters["vpip_hands"] == 0
+        assert counters["pfr_hands"] == 0
+        assert counters["checks"] == 1
+        assert counters["bets"] == 1
+
+    def test_showdown_counters(self):
+        """쇼다운 진출/승리 카운트."""
+        counters = hand_stat_counters(
+            "u1", {"bet_amount": 100, "won_amount": 200, "final_action": "showdown"}, []
+        )
+
+        assert counters["showdown_hands"] == 1
+        assert counters["won_showdowns"] == 1
+        assert set(counters) == set(COUNTER_COLUMNS)
+
+
+class TestMaterializedStats:
+    """player_stat_counters 기반 조회 테스트."""
+
+    @staticmethod
+    def make_counters(**values) -> PlayerStatCounters:
+        counters = PlayerStatCounters(user_id=U1)
+        for name in COUNTER_COLUMNS:
+            setattr(counters, name, values.get(name, 0))
+        return counters
+
+    @pytest.mark.asyncio
+    async def test_get_player_stats_reads_single_row(self):
+        """카운터 한 행만 읽어 비율 계산."""
+        db = MagicMock()
+        db.get = AsyncMock(return_value=self.make_counters(
+            total_hands=200, hands_won=50, vpip_hands=50, pfr_hands=30,
+            three_bet_hands=10, bets=30, raises=30, calls=20, checks=10,
+            total_actions=120, showdown_hands=40, won_showdowns=22,
+        ))
+        db.execute = AsyncMock()
+
+        stats = await StatisticsService(db).get_player_stats(U1)
+
+        db.execute.assert_not_called()
+        assert stats.vpip == 25.0
+        assert stats.pfr == 15.0
+        assert stats.three_bet == 5.0
+        assert stats.af == 3.0
+        assert stats.agg_freq == 50.0
+        assert stats.wtsd == 20.0
+        assert stats.wsd == 55.0
+        assert stats.win_rate == 25.0
+
+    @pytest.mark.asyncio
+    async def test_missing_counters_computed_from_hands_without_writes(self):
+        """카운터 행이 없으면 원본 핸드 기록에서 계산 (INSERT 없음)."""
+        row = {"user_id": U1, **dict.fromkeys(COUNTER_COLUMNS, 0)}
+        row.update(total_hands=10, hands_won=4, vpip_hands=5, pfr_hands=2)
+        found = MagicMock()
+        found.mappings.return_value.first.return_value = row
+        db = MagicMock()
+        db.get = AsyncMock(return_value=None)
+        db.execute = AsyncMock(return_value=found)
+
+        stats = await StatisticsService(db).get_player_stats(U1)
+
+        query, params = db.execute.call_args.args
+        assert "INSERT" not in str(query)
+        assert params == {"user_ids": [U1]}
+        assert stats.total_hands == 10
+        assert stats.vpip == 50.0
+        assert stats.pfr == 20.0
+        assert stats.win_rate == 40.0
+
+    @pytest.mark.asyncio
+    async def test_user_without_hands_returns_empty_stats(self):
+        found = MagicMock()
+        found.mappings.return_value.first.return_value = None
+        db = MagicMock()
+        db.get = AsyncMock(return_value=None)
+        db.execute = AsyncMock(return_value=found)
+
+        assert await StatisticsService(db).get_player_stats(U1) == PlayerStats()
+
+    @pytest.mark.asyncio
+    async def test_bot_ids_are_not_queried(self):
+        """봇 ID는 UUID가 아니므로 조회 없이 기본값."""
+        db = MagicMock()
+        db.get = AsyncMock()
+
+        stats = await StatisticsService(db).get_player_stats("livebot_123")
+
+        db.get.assert_not_called()
+        assert stats == PlayerStats()
+
+    @staticmethod
+    def make_db(existing: list[str]) -> MagicMock:
+        """첫 execute(기존 카운터 조회)가 existing을 반환하는 세션."""
+        found = MagicMock()
+        found.scalars.return_value.all.return_value = existing
+        db = MagicMock()
+        db.execute = AsyncMock(side_effect=[found, MagicMock(), MagicMock()])
+        return db
+
+    @pytest.mark.asyncio
+    async def test_record_hand_upserts_each_participant(self):
+        """참가자별 카운터 upsert 한 번 (봇 / user_id 없는 참가자 제외)."""
+        db = self.make_db([U1, U2])
+
+        await StatisticsService(db).record_hand(
+            [
+                {"user_id": U2, "bet_amount": 10, "won_amount": 0},
+                {"user_id": U1, "bet_amount": 10, "won_amount": 20},
+                {"user_id": "livebot_1", "bet_amount": 10, "won_amount": 0},
+                {"seat": 3},
+            ],
+            [event(1, "raise", U1), event(2, "fold", U2)],
+        )
+
+        assert db.execute.await_count == 2
+        stmt = db.execute.call_args.args[0]
+        compiled = stmt.compile()
+        assert "ON CONFLICT (user_id) DO UPDATE" in str(compiled.string)
+        assert compiled.params["user_id_m0"] == U1
+        assert compiled.params["user_id_m1"] == U2
+
+    @pytest.mark.asyncio
+    async def test_record_hands_merges_rows_per_user(self):
+        """여러 핸드의 같은 사용자 값은 한 행으로 합산."""
+        db = self.make_db([U1])
+
+        await StatisticsService(db).record_hands([
+            ([{"user_id": U1, "bet_amount": 10, "won_amount": 50}],
+             [event(1, "raise", U1)]),
+            ([{"user_id": U1, "bet_amount": 30, "won_amount": 0}],
+             [event(1, "call", U1)]),
+        ])
+
+        assert db.execute.await_count == 2
+        params = db.execute.call_args.args[0].compile().params
+        assert params["user_id_m0"] == U1
+        assert "user_id_m1" not in params
+        assert params["total_hands_m0"] == 2
+        assert params["total_winnings_m0"] == 10
+        assert params["biggest_pot_m0"] == 50
+        assert params["raises_m0"] == 1
+        assert params["calls_m0"] == 1
+
+    @pytest.mark.asyncio
+    async def test_users_without_counters_are_upserted_then_rebuilt(self):
+        """신규 사용자도 증분 upsert로 먼저 쓰고 (동시 첫 저장 유실 방지),
+        그 행 잠금을 잡은 채 전체 기록에서 재구축."""
+        db = self.make_db([U1])
+
+        await StatisticsService(db).record_hand(
+            [
+                {"user_id": U1, "bet_amount": 10, "won_amount": 20},
+                {"user_id": U2, "bet_amount": 10, "won_amount": 0},
+            ],
+            [],
+        )
+
+        upsert, rebuild = db.execute.call_args_list[1:]
+        compiled = upsert.args[0].compile()
+        assert "ON CONFLICT (user_id) DO UPDATE" in str(compiled.string)
+        assert compiled.params["user_id_m0"] == U1
+        assert compiled.params["user_id_m1"] == U2
+        assert rebuild.args[1] == {"user_ids": [U2]}
+
+    def test_is_registered_user_id(self):
+        assert is_registered_user_id(U1)
+        assert not is_registered_user_id("livebot_abc")
+        assert not is_registered_user_id("bot_1")
+        assert not is_registered_user_id(None)
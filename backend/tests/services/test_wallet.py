@@ -13,6 +13,7 @@ import pytest
 from app.models.wallet import TransactionStatus, TransactionType, WalletTransaction
 from app.services.wallet import (
     InsufficientBalanceError,
+    LedgerEntry,
     WalletError,
     WalletService,
 )
@@ -338,3 +339,137 @@ class TestWalletServiceRake:
         )
 
         assert result is None
+
+
+class TestWalletServiceSettleHand:
+    """Tests for batched hand settlement."""
+
+    @pytest.fixture
+    def settle_script(self):
+        """Settle Lua script stub (acquire/release both succeed)."""
+        return AsyncMock(return_value=[1, "OK"])
+
+    @pytest.fixture
+    def wallet_service(self, settle_script):
+        """Create WalletService with mocked dependencies."""
+        mock_session = MagicMock()
+        mock_session.add_all = MagicMock()
+        mock_session.flush = AsyncMock()
+        service = WalletService(mock_session)
+        service._redis = AsyncMock()
+        service._redis.register_script = MagicMock(return_value=settle_script)
+        return service
+
+    @staticmethod
+    def _users(wallet_service, *users):
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = list(users)
+        wallet_service.session.execute = AsyncMock(return_value=result)
+
+    @staticmethod
+    def _user(user_id, balance, rake_paid=0):
+        user = MagicMock()
+        user.id = user_id
+        user.krw_balance = balance
+        user.total_rake_paid_krw = rake_paid
+        return user
+
+    @pytest.mark.asyncio
+    async def test_settle_multiway_pot(self, wallet_service, settle_script):
+        """Should record all wins and rake in one batch."""
+        alice = self._user("user-a", 100000, rake_paid=1000)
+        bob = self._user("user-b", 50000)
+        self._users(wallet_service, alice, bob)
+
+        txs = await wallet_service.settle_hand(
+            table_id="table-1",
+            hand_id="hand-1",
+            entries=[
+                LedgerEntry.win("user-a", 30000),
+                LedgerEntry.rake("user-a", 1500),
+                LedgerEntry.win("user-b", 10000),
+            ],
+        )
+
+        assert [tx.krw_amount for tx in txs] == [30000, -1500, 10000]
+        assert txs[1].krw_balance_before == 130000
+        assert txs[1].krw_balance_after == 128500
+        assert txs[1].tx_type == TransactionType.RAKE
+        assert all(WalletService.verify_integrity(tx) for tx in txs)
+        assert alice.krw_balance == 128500
+        assert alice.total_rake_paid_krw == 2500
+        assert bob.krw_balance == 60000
+
+        # One SELECT, one flush, one lock + one release call
+        wallet_service.session.execute.assert_awaited_once()
+        wallet_service.session.add_all.assert_called_once_with(txs)
+        wallet_service.session.flush.assert_awaited_once()
+        assert [c.kwargs["args"][0] for c in settle_script.await_args_list] == [
+            "acquire", "release",
+        ]
+        assert settle_script.await_args.kwargs["keys"] == [
+            "wallet:lock:user-a", "wallet:lock:user-b",
+            "wallet:balance:user-a", "wallet:balance:user-b",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_settle_insufficient_balance_is_atomic(self, wallet_service, settle_script):
+        """Should apply nothing when any debit fails."""
+        alice = self._user("user-a", 100000)
+        bob = self._user("user-b", 1000)
+        self._users(wallet_service, alice, bob)
+
+        with pytest.raises(InsufficientBalanceError):
+            await wallet_service.settle_hand(
+                table_id="table-1",
+                hand_id="hand-1",
+                entries=[
+                    LedgerEntry.win("user-a", 30000),
+                    LedgerEntry.rake("user-b", 5000),
+                ],
+            )
+
+        assert alice.krw_balance == 100000
+        wallet_service.session.add_all.assert_not_called()
+        assert settle_script.await_args.kwargs["args"][0] == "release"
+
+    @pytest.mark.asyncio
+    async def test_settle_lock_contention(self, wallet_service, settle_script):
+        """Should fail without touching the DB when any wallet is locked."""
+        settle_script.return_value = [0, "LOCK_FAILED: wallet:lock:user-a"]
+
+        with pytest.raises(WalletError, match="Could not acquire wallet lock"):
+            await wallet_service.settle_hand(
+                table_id="table-1",
+                hand_id="hand-1",
+                entries=[LedgerEntry.win("user-a", 30000)],
+            )
+
+        settle_script.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_settle_unknown_user(self, wallet_service):
+        """Should raise error when a user does not exist."""
+        self._users(wallet_service, self._user("user-a", 100000))
+
+        with pytest.raises(WalletError, match="User not found"):
+            await wallet_service.settle_hand(
+                table_id="table-1",
+                hand_id="hand-1",
+                entries=[
+                    LedgerEntry.win("user-a", 30000),
+                    LedgerEntry.win("user-b", 30000),
+                ],
+            )
+
+    @pytest.mark.asyncio
+    async def test_settle_empty_is_noop(self, wallet_service, settle_script):
+        """Should skip Redis and DB when there is nothing to settle."""
+        txs = await wallet_service.settle_hand(
+            table_id="table-1",
+            hand_id="hand-1",
+            entries=[LedgerEntry.rake("user-a", 0)],
+        )
+
+        assert txs == []
+        settle_script.assert_not_awaited()
@@ -0,0 +1,319 @@
+"""
+Tournament Event Bus Tests - 파티션 스트림 / Consumer Group.
+"""
+
+import pytest
+
+from app.tournament.event_bus import (
+    TournamentEventBus,
+    decode_event,
+    encode_event,
+)
+from app.tournament.models import TournamentEvent, TournamentEventType
+
+
+class StreamRedis:
+    """Minimal Redis Streams mock (XADD / XREADGROUP / XACK / XPENDING / XCLAIM)."""
+
+    def __init__(self):
+        self.streams = {}
+        self.groups = set()
+        self.acked = []
+        self.delivered = {}
+        # stream -> message_id -> [consumer, idle_ms, times_delivered]
+        self.pending = {}
+
+    async def xgroup_create(self, stream, group, id="0", mkstream=False):
+        self.groups.add((stream, group))
+        self.streams.setdefault(stream, [])
+
+    async def xadd(self, stream, data, maxlen=None, approximate=False):
+        entries = self.streams.setdefault(stream, [])
+        entry_id = f"{len(entries) + 1}-0"
+        entries.append((entry_id, dict(data)))
+        return entry_id
+
+    async def xreadgroup(self, groupname, consumername, streams, count=None, block=None):
+        result = []
+        for key in streams:
+            entries = self.streams.get(key, [])
+            new = entries[self.delivered.get(key, 0):]
+            self.delivered[key] = len(entries)
+            for message_id, _ in new:
+                self.pending.setdefault(key, {})[message_id] = [consumername, 0, 1]
+            result.append((key, new))
+        return result
+
+    async def xack(self, stream, group, message_id):
+        self.acked.append((stream, message_id))
+        self.pending.get(stream, {}).pop(message_id, None)
+        return 1
+
+    async def xpending_range(self, name, groupname, min, max, count, consumername=None, idle=None):
+        return [
+            {
+                "message_id": message_id,
+                "consumer": consumer,
+                "time_since_delivered": idle_ms,
+                "times_delivered": times,
+            }
+            for message_id, (consumer, idle_ms, times) in sorted(
+                self.pending.get(name, {}).items()
+            )
+        ][:count]
+
+    async def xrange(self, name, min="-", max="+", count=None):
+        return [e for e in self.streams.get(name, []) if e[0] == min]
+
+    async def xclaim(self, name, groupname, consumername, min_idle_time, message_ids):
+        claimed = []
+        for message_id in message_ids:
+            entry = self.pending[name][message_id]
+            entry[0], entry[1], entry[2] = consumername, 0, entry[2] + 1
+            claimed.extend(e for e in self.streams[name] if e[0] == message_id)
+        return claimed
+
+    def pipeline(self, transaction=False):
+        return StreamPipeline(self)
+
+    async def xinfo_groups(self, name):
+        return [{"name": "tournament-engine", "pending": 2, "lag": 7}]
+
+    def age(self, stream, idle_ms):
+        for entry in self.pending.get(stream, {}).values():
+            entry[1] = idle_ms
+
+
+class StreamPipeline:
+    def __init__(self, redis):
+        self._redis = redis
+        self._calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    def xrange(self, *args, **kwargs):
+        self._calls.append(self._redis.xrange(*args, **kwargs))
+
+    async def execute(self):
+        return [await call for call in self._calls]
+
+
+def _event(tournament_id: str = "t1") -> TournamentEvent:
+    return TournamentEvent(
+        event_type=TournamentEventType.PLAYER_ELIMINATED,
+        tournament_id=tournament_id,
+        user_id="u1",
+        table_id="table-1",
+        data={"rank": 10},
+    )
+
+
+@pytest.fixture
+def redis_mock():
+    return StreamRedis()
+
+
+@pytest.fixture
+def bus(redis_mock):
+    return TournamentEventBus(redis_mock, instance_id="node-a")
+
+
+class TestEventPayload:
+    """이벤트 페이로드 인코딩 테스트."""
+
+    def test_round_trip(self):
+        event = _event()
+
+        decoded, origin = decode_event(encode_event(event, "node-a"))
+
+        assert origin == "node-a"
+        assert decoded.event_id == event.event_id
+        assert decoded.event_type == TournamentEventType.PLAYER_ELIMINATED
+        assert decoded.data == {"rank": 10}
+        assert decoded.table_id == "table-1"
+        assert decoded.timestamp == event.timestamp
+
+    def test_rejects_malformed(self):
+        with pytest.raises(ValueError):
+            decode_event('[99, "id"]')
+        with pytest.raises(ValueError):
+            decode_event("not json")
+
+
+class TestPartitionedStreams:
+    """파티션 스트림 발행/소비 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_publish_routes_to_partition(self, bus, redis_mock):
+        await bus._publish_to_stream(_event("t1"))
+        await bus._publish_to_stream(_event("t1"))
+
+        key = bus.stream_key(bus.partition_for("t1"))
+        assert len(redis_mock.streams[key]) == 2
+        assert bus.get_metrics().partitions[bus.partition_for("t1")].published == 2
+
+    @pytest.mark.asyncio
+    async def test_hosted_partitions(self, bus, redis_mock):
+        await bus.host_tournament("t1")
+        await bus.host_tournament("t2")
+
+        assert bus.hosted_partitions == sorted(
+            {bus.partition_for("t1"), bus.partition_for("t2")}
+        )
+        assert (bus.stream_key(bus.partition_for("t1")), bus.CONSUMER_GROUP) in (
+            redis_mock.groups
+        )
+
+        bus.release_tournament("t1")
+        bus.release_tournament("t2")
+        assert bus.hosted_partitions == []
+
+    @pytest.mark.asyncio
+    async def test_remote_events_dispatched_and_acked(self, bus, redis_mock):
+        received = []
+
+        async def handler(event):
+            received.append(event)
+
+        bus.subscribe({TournamentEventType.PLAYER_ELIMINATED}, handler)
+        await bus.host_tournament("t1")
+
+        remote = TournamentEventBus(redis_mock, instance_id="node-b")
+        await remote._publish_to_stream(_event("t1"))
+        await bus._publish_to_stream(_event("t1"))  # 자체 발행 (로컬 디스패치 완료)
+
+        partition = bus.partition_for("t1")
+        for _, messages in await redis_mock.xreadgroup(
+            bus.CONSUMER_GROUP, bus.consumer_name, {bus.stream_key(partition): ">"}
+        ):
+            for message_id, data in messages:
+                await bus._handle_entry(partition, message_id, data)
+
+        assert len(received) == 1
+        assert len(redis_mock.acked) == 2
+        assert bus.get_metrics().partitions[partition].consumed == 2
+
+    async def _consume(self, bus, redis_mock, partition):
+        for _, messages in await redis_mock.xreadgroup(
+            bus.CONSUMER_GROUP, bus.consumer_name, {bus.stream_key(partition): ">"}
+        ):
+            for message_id, data in messages:
+                await bus._handle_entry(partition, message_id, data)
+
+    @pytest.mark.asyncio
+    async def test_failing_handler_retried_then_dead_lettered(self, bus, redis_mock):
+        calls = []
+
+        async def failing(event):
+            calls.append(event)
+            raise RuntimeError("boom")
+
+        bus.subscribe({TournamentEventType.PLAYER_ELIMINATED}, failing)
+        bus.MAX_DELIVERY_ATTEMPTS = 3
+        await bus.host_tournament("t1")
+        partition = bus.partition_for("t1")
+        key = bus.stream_key(partition)
+        remote = TournamentEventBus(redis_mock, instance_id="node-b")
+        await remote._publish_to_stream(_event("t1"))
+
+        await self._consume(bus, redis_mock, partition)
+        assert redis_mock.acked == []  # Pending에 남음
+
+        # 아직 CLAIM_IDLE_MS 전이면 재시도하지 않음
+        assert await bus.claim_pending(partition) == 0
+
+        redis_mock.age(key, bus.CLAIM_IDLE_MS)
+        assert await bus.claim_pending(partition) == 1
+        assert redis_mock.acked == []
+
+        redis_mock.age(key, bus.CLAIM_IDLE_MS)
+        assert await bus.claim_pending(partition) == 1
+
+        # Redis 전달 횟수 3회에서 dead-letter
+        assert len(calls) == 3
+        assert redis_mock.acked == [(key, "1-0")]
+        assert bus.get_metrics().events_dead_lettered == 1
+        assert bus.get_metrics().partitions[partition].claimed == 2
+
+    @pytest.mark.asyncio
+    async def test_one_failing_handler_blocks_ack(self, bus, redis_mock):
+        received = []
+
+        async def ok(event):
+            received.append(event)
+
+        async def failing(event):
+            raise RuntimeError("boom")
+
+        bus.subscribe({TournamentEventType.PLAYER_ELIMINATED}, ok)
+        bus.subscribe({TournamentEventType.PLAYER_ELIMINATED}, failing)
+        await bus.host_tournament("t1")
+        partition = bus.partition_for("t1")
+        await TournamentEventBus(redis_mock, instance_id="node-b")._publish_to_stream(
+            _event("t1")
+        )
+
+        await self._consume(bus, redis_mock, partition)
+
+        assert len(received) == 1
+        assert redis_mock.acked == []
+        assert bus.get_metrics().events_failed == 1
+
+    @pytest.mark.asyncio
+    async def test_other_nodes_tournament_left_for_host(self, redis_mock):
+        node_a, node_b, node_c = (
+            TournamentEventBus(redis_mock, instance_id=f"node-{n}") for n in "abc"
+        )
+        for node in (node_a, node_b, node_c):
+            node.PARTITION_COUNT = 1  # 같은 파티션 충돌
+        received = []
+
+        async def handler(event):
+            received.append(event)
+
+        node_b.subscribe({TournamentEventType.PLAYER_ELIMINATED}, handler)
+        await node_a.host_tournament("t1")
+        await node_b.host_tournament("t2")
+        await node_c._publish_to_stream(_event("t2"))
+
+        # node-a가 먼저 읽어도 ACK하지 않고, 자신의 claim에서도 가져가지 않음
+        await self._consume(node_a, redis_mock, 0)
+        assert await node_a.claim_pending(0) == 0
+        assert redis_mock.acked == []
+
+        # 호스팅 노드는 idle 시간과 관계없이 바로 가져감
+        assert await node_b.claim_pending(0) == 1
+        assert len(received) == 1
+        assert redis_mock.acked == [(node_b.stream_key(0), "1-0")]
+
+    @pytest.mark.asyncio
+    async def test_orphaned_entry_dead_lettered(self, bus, redis_mock):
+        bus.PARTITION_COUNT = 1
+        await bus.host_tournament("t1")
+        await bus._publish_to_stream(_event("gone"))
+        await self._consume(bus, redis_mock, 0)
+
+        redis_mock.age(bus.stream_key(0), bus.ORPHAN_IDLE_MS)
+        assert await bus.claim_pending(0) == 0
+
+        assert redis_mock.acked == [(bus.stream_key(0), "1-0")]
+        assert bus.get_metrics().events_dead_lettered == 1
+
+    @pytest.mark.asyncio
+    async def test_malformed_entry_is_acked(self, bus, redis_mock):
+        await bus._handle_entry(0, "1-0", {bus.PAYLOAD_FIELD: "garbage"})
+
+        assert redis_mock.acked == [(bus.stream_key(0), "1-0")]
+        assert bus.get_metrics().events_dead_lettered == 1
+
+    @pytest.mark.asyncio
+    async def test_partition_metrics_refresh(self, bus):
+        await bus._refresh_partition_metrics(3)
+
+        metrics = bus.get_metrics().partitions[3]
+        assert metrics.lag == 7
+        assert metrics.pending == 2
@@ -0,0 +1,204 @@
+"""
+Persistent Map Tests - 구조 공유 토너먼트 상태.
+"""
+
+import pickle
+import random
+
+import pytest
+
+from app.tournament.models import (
+    TournamentConfig,
+    TournamentPlayer,
+    TournamentState,
+    TournamentTable,
+)
+from app.tournament.pmap import PersistentMap, as_persistent
+
+from tests.tournament.test_tournament_engine import MockRedis
+
+
+class CollidingKey:
+    """Key with a fixed hash to force collision nodes."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __hash__(self):
+        return 42
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and other.name == self.name
+
+
+class TestPersistentMap:
+    """PersistentMap 기본 동작 테스트."""
+
+    def test_set_returns_new_map(self):
+        m1 = PersistentMap({"a": 1})
+        m2 = m1.set("b", 2)
+
+        assert dict(m1) == {"a": 1}
+        assert dict(m2.items()) == {"a": 1, "b": 2}
+        assert len(m1) == 1 and len(m2) == 2
+
+    def test_set_same_value_is_noop(self):
+        value = object()
+        m = PersistentMap({"a": value})
+
+        assert m.set("a", value) is m
+
+    def test_delete(self):
+        m = PersistentMap({"a": 1, "b": 2})
+
+        assert dict(m.delete("a")) == {"b": 2}
+        assert "a" in m
+        with pytest.raises(KeyError):
+            m.delete("missing")
+
+    def test_collisions(self):
+        keys = [CollidingKey(str(i)) for i in range(5)]
+        m = PersistentMap((k, i) for i, k in enumerate(keys))
+
+        assert len(m) == 5
+        assert [m[k] for k in keys] == [0, 1, 2, 3, 4]
+        m = m.delete(keys[2]).set(keys[0], 10)
+        assert keys[2] not in m
+        assert m[keys[0]] == 10
+        assert len(m) == 4
+
+    def test_matches_dict_under_random_ops(self):
+        rng = random.Random(7)
+        expected = {}
+        m = PersistentMap()
+        versions = []
+
+        for _ in range(5000):
+            key = rng.randrange(2000)
+            if key in expected and rng.random() < 0.3:
+                del expected[key]
+                m = m.delete(key)
+            else:
+                expected[key] = rng.random()
+                m = m.set(key, expected[key])
+            if rng.random() < 0.01:
+                versions.append((m, dict(expected)))
+
+        assert dict(m.items()) == expected
+        assert len(m) == len(expected)
+        # 이전 버전은 이후 변경의 영향을 받지 않음
+        for version, snapshot in versions:
+            assert dict(version.items()) == snapshot
+
+    def test_mapping_interface(self):
+        m = PersistentMap({"a": 1, "b": 2})
+
+        assert m == {"a": 1, "b": 2}
+        assert {"a": 1, "b": 2} == m
+        assert sorted(m.values()) == [1, 2]
+        assert ("a", 1) in m.items()
+        assert m.get("c", 3) == 3
+
+    def test_pickle_round_trip(self):
+        m = PersistentMap({f"user-{i}": i for i in range(100)})
+
+        assert pickle.loads(pickle.dumps(m)) == m
+
+    def test_as_persistent_no_copy(self):
+        m = PersistentMap({"a": 1})
+
+        assert as_persistent(m) is m
+        assert isinstance(as_persistent({"a": 1}), PersistentMap)
+        assert len(as_persistent(None)) == 0
+
+
+class TestStructurallySharedState:
+    """TournamentState 구조 공유 테스트."""
+
+    @staticmethod
+    def _state(num_players: int = 18) -> TournamentState:
+        config = TournamentConfig(name="MTT", max_players=num_players)
+        tables = {
+            "t1": TournamentTable(table_id="t1", table_number=1),
+            "t2": TournamentTable(table_id="t2", table_number=2),
+        }
+        players = {}
+        for i in range(num_players):
+            table_id = "t1" if i < 9 else "t2"
+            seat = i % 9
+            tables[table_id] = tables[table_id].with_player_seated(f"u{i}", seat)
+            players[f"u{i}"] = TournamentPlayer(
+                user_id=f"u{i}",
+                nickname=f"P{i}",
+                chip_count=10000,
+                table_id=table_id,
+                seat_position=seat,
+            )
+        return TournamentState(
+            tournament_id=config.tournament_id,
+            config=config,
+            players=players,
+            tables=tables,
+        )
+
+    def test_dicts_are_converted(self):
+        state = self._state()
+
+        assert isinstance(state.players, PersistentMap)
+        assert isinstance(state.tables, PersistentMap)
+        assert state.active_player_count == 18
+        assert state.eliminated_player_count == 0
+
+    @pytest.mark.asyncio
+    async def test_complete_hand_shares_unchanged_players(self):
+        from app.tournament.engine import TournamentEngine
+
+        engine = TournamentEngine(MockRedis())
+        state = self._state()
+        engine._tournaments[state.tournament_id] = state
+
+        new_state = await engine.complete_hand(
+            state.tournament_id,
+            "t1",
+            winners=["u0"],
+            chip_changes={"u0": 20000, "u1": 0},
+            eliminated=["u1"],
+        )
+
+        # 이전 상태(스냅샷)는 그대로
+        assert state.players["u0"].chip_count == 10000
+        assert state.players["u1"].is_active
+        assert state.tables["t1"].player_count == 9
+
+        assert new_state.players["u0"].chip_count == 20000
+        assert new_state.players["u1"].elimination_rank == 18
+        assert new_state.active_player_count == 17
+        assert new_state.tables["t1"].player_count == 8
+        # 변경되지 않은 플레이어/테이블은 같은 객체를 공유
+        assert new_state.players["u5"] is state.players["u5"]
+        assert new_state.tables["t2"] is state.tables["t2"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tables_do_not_overwrite(self):
+        """다른 테이블의 핸드 완료가 서로의 변경을 덮어쓰지 않음."""
+        import asyncio
+
+        from app.tournament.engine import TournamentEngine
+
+        engine = TournamentEngine(MockRedis())
+        state = self._state()
+        engine._tournaments[state.tournament_id] = state
+
+        await asyncio.gather(
+            engine.complete_hand(
+                state.tournament_id, "t1", ["u0"], {"u0": 20000, "u1": 0}, ["u1"]
+            ),
+            engine.complete_hand(
+                state.tournament_id, "t2", ["u9"], {"u9": 20000, "u10": 0}, ["u10"]
+            ),
+        )
+
+        final = engine.get_state(state.tournament_id)
+        assert final.players["u0"].chip_count == 20000
+        assert final.players["u9"].chip_count == 20000
+        assert final.active_player_count == 16
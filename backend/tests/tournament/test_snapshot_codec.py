@@ -0,0 +1,116 @@
+"""
+Snapshot Codec Tests - 토너먼트 스냅샷 바이너리 인코딩.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from app.tournament import snapshot_codec as codec
+from app.tournament.models import (
+    TournamentConfig,
+    TournamentPlayer,
+    TournamentState,
+    TournamentStatus,
+    TournamentTable,
+)
+
+
+def _state(num_players: int = 27) -> TournamentState:
+    config = TournamentConfig(
+        name="MTT", max_players=num_players, allow_rebuy=True, max_rebuys=2
+    )
+    tables = {}
+    players = {}
+    for i in range(num_players):
+        table_id = f"t{i // 9}"
+        table = tables.get(table_id) or TournamentTable(
+            table_id=table_id, table_number=i // 9 + 1
+        )
+        tables[table_id] = table.with_player_seated(f"u{i}", i % 9)
+        players[f"u{i}"] = TournamentPlayer(
+            user_id=f"u{i}",
+            nickname=f"P{i}",
+            chip_count=10000 + i,
+            table_id=table_id,
+            seat_position=i % 9,
+        )
+    now = datetime.now(timezone.utc)
+    return TournamentState(
+        tournament_id=config.tournament_id,
+        config=config,
+        status=TournamentStatus.RUNNING,
+        started_at=now,
+        current_blind_level=5,
+        level_started_at=now,
+        next_level_at=now,
+        players=players,
+        tables=tables,
+        total_prize_pool=270000,
+        itm_threshold=4,
+    )
+
+
+class TestSnapshotCodec:
+    """스냅샷 코덱 테스트."""
+
+    def test_base_round_trip(self):
+        state = _state()
+
+        data = codec.encode_base(state, cursor="5-0")
+        cursor, fields = codec.decode_base(data)
+        loaded = TournamentState(**fields)
+
+        assert data[:3] == codec.CODEC_MAGIC
+        assert cursor == "5-0"
+        assert loaded.config == state.config
+        assert loaded.status == TournamentStatus.RUNNING
+        assert loaded.current_blind_level == 5
+        assert loaded.next_level_at == state.next_level_at
+        assert loaded.itm_threshold == 4
+        assert dict(loaded.tables.items()) == dict(state.tables.items())
+        assert {uid: p.chip_count for uid, p in loaded.players.items()} == {
+            uid: p.chip_count for uid, p in state.players.items()
+        }
+        assert loaded.players["u3"].chip_count == 10003
+        assert loaded.players["u3"].seat_position == 3
+
+    def test_large_base_is_compressed(self):
+        data = codec.encode_base(_state(900))
+
+        assert data[5] & 0x01
+        _, fields = codec.decode_base(data)
+        assert len(fields["players"]) == 900
+
+    def test_delta_applies_tables_players_and_header(self):
+        state = _state()
+        _, fields = codec.decode_base(codec.encode_base(state))
+
+        changed = state.players["u0"].eliminated(rank=27)
+        new_state = TournamentState(
+            tournament_id=state.tournament_id,
+            config=state.config,
+            status=TournamentStatus.FINAL_TABLE,
+            players=state.players.set("u0", changed),
+            tables=state.tables.delete("t2"),
+        )
+        codec.apply_delta(
+            fields,
+            codec.encode_delta(new_state, ["t2"], ["u0"], codec.STATUS_FIELDS),
+        )
+
+        assert fields["status"] == TournamentStatus.FINAL_TABLE
+        assert fields["players"]["u0"].elimination_rank == 27
+        assert "t2" not in fields["tables"]
+        # 헤더에 없는 필드는 그대로
+        assert fields["current_blind_level"] == 5
+
+    def test_rejects_unknown_version_and_kind(self):
+        data = codec.encode_base(_state(2))
+
+        with pytest.raises(ValueError):
+            codec.decode_base(data[:3] + bytes([99]) + data[4:])
+        with pytest.raises(ValueError):
+            codec.apply_delta({}, data)
+        with pytest.raises(ValueError):
+            codec.decode_base(b"\x80\x04pickle")
@@ -79,6 +79,9 @@ class MockRedis:
 
     def register_script(self, script):
         async def mock_script(keys=None, args=None):
+            # Lock release: owner가 일치하면 삭제
+            if '"del"' in script and keys and self._data.get(keys[0]) == args[0]:
+                del self._data[keys[0]]
             return 1
 
         return mock_script
@@ -234,6 +237,72 @@ class TestTableBalancer:
 
         plan = balancer.calculate_balancing_plan(state)
         assert len(plan.moves) == 0
+        assert balancer.needs_balancing(state) is False
+
+    def test_occupancy_index(self):
+        from app.tournament.balancer import TableOccupancyIndex
+
+        index = TableOccupancyIndex(max_seats=9)
+        index.set_count("a", 9)
+        index.set_count("b", 7)
+        index.set_count("c", 8)
+
+        assert (index.min_count, index.max_count) == (7, 9)
+        assert index.fullest() == "a"
+        assert index.emptiest() == "b"
+        assert index.total_players == 24
+
+        index.set_count("a", 6)
+        index.remove("b")
+
+        assert (index.min_count, index.max_count) == (6, 8)
+        assert index.imbalance == 2
+        assert index.total_players == 14
+        assert "b" not in index and len(index) == 2
+
+    def test_needs_balancing_tracks_updates(self):
+        from app.tournament.balancer import TableBalancer
+        from app.tournament.models import (
+            TournamentState,
+            TournamentConfig,
+            TournamentPlayer,
+            TournamentTable,
+        )
+
+        balancer = TableBalancer()
+        tables = {}
+        players = {}
+        for t in range(3):
+            table_id = f"table_{t}"
+            table = TournamentTable(table_id=table_id, table_number=t + 1)
+            for s in range(7):
+                user_id = f"user_{t}_{s}"
+                table = table.with_player_seated(user_id, s)
+                players[user_id] = TournamentPlayer(
+                    user_id=user_id,
+                    nickname=f"Player{t}{s}",
+                    chip_count=10000,
+                    table_id=table_id,
+                    seat_position=s,
+                )
+            tables[table_id] = table
+
+        state = TournamentState(
+            tournament_id="t1",
+            config=TournamentConfig(),
+            players=players,
+            tables=tables,
+        )
+        balancer.track_state(state)
+        assert balancer.needs_balancing(state) is False
+
+        # table_0에서 2명 탈락 → 5 vs 7
+        table = state.tables["table_0"]
+        table = table.with_player_removed("user_0_0").with_player_removed("user_0_1")
+        balancer.update_tables("t1", [("table_0", table)])
+
+        assert balancer.needs_balancing(state) is True
+        assert balancer.get_occupancy("t1").emptiest() == "table_0"
 
 
 class TestRankingEngine:
@@ -266,6 +335,94 @@ class TestRankingEngine:
         new_rank = await engine.update_chips(tid, "user_0", 20000)
         assert new_rank == 1
 
+    @pytest.mark.asyncio
+    async def test_snapshot_stats_are_incremental(self, mock_redis):
+        from app.tournament.ranking import RankingEngine
+        from app.tournament.models import TournamentPlayer
+
+        engine = RankingEngine(mock_redis)
+        tid = "t1"
+
+        for i in range(4):
+            await engine.register_player(
+                tid,
+                TournamentPlayer(user_id=f"user_{i}", nickname=f"P{i}", chip_count=10000),
+            )
+
+        await engine.update_batch(tid, [("user_0", 25000), ("user_1", 5000)])
+        await engine.eliminate_player(tid, "user_3", final_rank=4)
+
+        # 전체 조회 없이 집계 유지
+        mock_redis.hgetall = None
+        snapshot = await engine.get_snapshot(tid)
+        assert snapshot.total_players == 4
+        assert snapshot.active_players == 3
+        assert snapshot.total_chips == 40000
+        assert snapshot.average_stack == 13333
+        assert [e.user_id for e in snapshot.entries][:2] == ["user_0", "user_2"]
+        assert snapshot.entries[-1].is_active is False
+
+    @pytest.mark.asyncio
+    async def test_pages_served_from_cached_window(self, mock_redis):
+        from app.tournament.ranking import RankingEngine
+        from app.tournament.models import TournamentPlayer
+
+        engine = RankingEngine(mock_redis)
+        tid = "t1"
+
+        for i in range(10):
+            await engine.register_player(
+                tid,
+                TournamentPlayer(user_id=f"user_{i}", nickname=f"P{i}", chip_count=1000 * i),
+            )
+
+        page = await engine.get_page(tid, page=2, page_size=3)
+        assert [e.rank for e in page] == [4, 5, 6]
+        assert [e.user_id for e in page] == ["user_6", "user_5", "user_4"]
+
+        calls = []
+        original = mock_redis.zrevrange
+
+        async def counting_zrevrange(*args, **kwargs):
+            calls.append(args)
+            return await original(*args, **kwargs)
+
+        mock_redis.zrevrange = counting_zrevrange
+
+        # 변경 없음 → 캐시
+        assert await engine.get_page(tid, page=2, page_size=3) == page
+        assert calls == []
+
+        # 변경 후 갱신 주기가 지나면 다시 조회
+        await engine.update_chips(tid, "user_0", 50000)
+        engine.SNAPSHOT_INTERVAL_MS = 0
+        page = await engine.get_page(tid, page=2, page_size=3)
+        assert len(calls) == 1
+        assert [e.user_id for e in page] == ["user_7", "user_6", "user_5"]
+
+    @pytest.mark.asyncio
+    async def test_full_snapshot_resyncs_stats(self, mock_redis):
+        from app.tournament.ranking import RankingEngine
+        from app.tournament.models import TournamentPlayer
+
+        engine = RankingEngine(mock_redis)
+        tid = "t1"
+
+        for i in range(3):
+            await engine.register_player(
+                tid,
+                TournamentPlayer(user_id=f"user_{i}", nickname=f"P{i}", chip_count=10000),
+            )
+
+        # 다른 경로로 Redis가 바뀐 경우 full=True로 재동기화
+        await mock_redis.zadd(engine._ranking_key(tid), {"user_2": 40000})
+        snapshot = await engine.get_snapshot(tid, full=True)
+
+        assert len(snapshot.entries) == 3
+        assert snapshot.entries[0].user_id == "user_2"
+        assert snapshot.total_chips == 60000
+        assert (await engine.get_snapshot(tid)).total_chips == 60000
+
 
 class TestTournamentEngine:
     """Test tournament engine."""
@@ -305,6 +462,111 @@ class TestTournamentEngine:
         assert player.user_id == "user1"
         assert player.is_active is True
 
+    @pytest.mark.asyncio
+    async def test_elimination_triggers_balancing(self, mock_redis):
+        from app.tournament.engine import TournamentEngine
+        from app.tournament.models import (
+            TournamentConfig,
+            TournamentPlayer,
+            TournamentState,
+            TournamentStatus,
+            TournamentTable,
+        )
+
+        engine = TournamentEngine(mock_redis)
+        config = TournamentConfig(name="Test", max_players=20)
+        tables = {}
+        players = {}
+        for t in range(2):
+            table_id = f"table_{t}"
+            table = TournamentTable(table_id=table_id, table_number=t + 1)
+            for s in range(8):
+                user_id = f"user_{t}_{s}"
+                table = table.with_player_seated(user_id, s)
+                players[user_id] = TournamentPlayer(
+                    user_id=user_id,
+                    nickname=f"Player{t}{s}",
+                    chip_count=10000,
+                    table_id=table_id,
+                    seat_position=s,
+                )
+            tables[table_id] = table
+        state = TournamentState(
+            tournament_id=config.tournament_id,
+            config=config,
+            status=TournamentStatus.RUNNING,
+            players=players,
+            tables=tables,
+        )
+        engine._tournaments[state.tournament_id] = state
+        engine.balancer.track_state(state)
+
+        # 한 핸드에 2명 탈락 → 6 vs 8, 핸드 종료 직후 이동
+        new_state = await engine.complete_hand(
+            state.tournament_id,
+            "table_0",
+            winners=["user_0_0"],
+            chip_changes={"user_0_0": 30000, "user_0_1": 0, "user_0_2": 0},
+            eliminated=["user_0_1", "user_0_2"],
+        )
+        assert new_state.tables["table_0"].player_count == 6
+
+        final = engine.get_state(state.tournament_id)
+        assert final.tables["table_0"].player_count == 7
+        assert final.tables["table_1"].player_count == 7
+        occupancy = engine.balancer.get_occupancy(state.tournament_id)
+        assert occupancy.counts() == {"table_0": 7, "table_1": 7}
+
+    @pytest.mark.asyncio
+    async def test_status_change_logged_as_own_delta(self, mock_redis):
+        from unittest.mock import AsyncMock
+
+        from app.tournament.engine import TournamentEngine
+        from app.tournament.models import (
+            TournamentConfig,
+            TournamentPlayer,
+            TournamentState,
+            TournamentStatus,
+            TournamentTable,
+        )
+
+        engine = TournamentEngine(mock_redis)
+        config = TournamentConfig(name="Test", max_players=20)
+        table = TournamentTable(table_id="table_0", table_number=1)
+        players = {}
+        for s in range(3):
+            user_id = f"user_{s}"
+            table = table.with_player_seated(user_id, s)
+            players[user_id] = TournamentPlayer(
+                user_id=user_id,
+                nickname=f"Player{s}",
+                chip_count=10000,
+                table_id="table_0",
+                seat_position=s,
+            )
+        state = TournamentState(
+            tournament_id=config.tournament_id,
+            config=config,
+            status=TournamentStatus.FINAL_TABLE,
+            players=players,
+            tables={"table_0": table},
+        )
+        engine._tournaments[state.tournament_id] = state
+        engine.balancer.track_state(state)
+        engine.snapshot.append_status_delta = AsyncMock()
+
+        await engine.complete_hand(
+            state.tournament_id,
+            "table_0",
+            winners=["user_0"],
+            chip_changes={"user_0": 20000, "user_1": 0},
+            eliminated=["user_1"],
+        )
+
+        engine.snapshot.append_status_delta.assert_awaited_once()
+        logged = engine.snapshot.append_status_delta.await_args.args[0]
+        assert logged.status == TournamentStatus.HEADS_UP
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
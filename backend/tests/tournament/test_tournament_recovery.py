@@ -10,7 +10,8 @@ P0 - 상용화 필수 항목:
 """
 
 import asyncio
-from datetime import datetime, timedelta
+from dataclasses import replace
+from datetime import timedelta
 from typing import Optional
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -24,6 +25,9 @@ class MockRedis:
         self._data = {}
         self._sorted_sets = {}
         self._hashes = {}
+        self._streams = {}
+        self._stream_seq = {}
+        self._lists = {}
         self._scan_results = []
 
     async def set(self, key, value, nx=False, px=None, ex=None):
@@ -38,9 +42,10 @@ class MockRedis:
     async def delete(self, *keys):
         count = 0
         for key in keys:
-            if key in self._data:
-                del self._data[key]
-                count += 1
+            for store in (self._data, self._streams, self._lists):
+                if key in store:
+                    del store[key]
+                    count += 1
         return count
 
     async def exists(self, key):
@@ -102,7 +107,37 @@ class MockRedis:
         pass
 
     async def xadd(self, stream, data, maxlen=None, approximate=False):
-        return f"{datetime.utcnow().timestamp()}-0"
+        seq = self._stream_seq.get(stream, 0) + 1
+        self._stream_seq[stream] = seq
+        entry_id = f"{seq}-0"
+        self._streams.setdefault(stream, []).append((entry_id, dict(data)))
+        return entry_id
+
+    @staticmethod
+    def _seq(entry_id):
+        return int(entry_id.split("-")[0])
+
+    async def xrange(self, stream, min="-", max="+", count=None):
+        entries = self._streams.get(stream, [])
+        if min.startswith("("):
+            entries = [e for e in entries if self._seq(e[0]) > self._seq(min[1:])]
+        elif min != "-":
+            entries = [e for e in entries if self._seq(e[0]) >= self._seq(min)]
+        return entries[:count] if count else list(entries)
+
+    async def xtrim(self, stream, maxlen=None, approximate=True, minid=None):
+        entries = self._streams.get(stream, [])
+        kept = [e for e in entries if self._seq(e[0]) >= self._seq(minid)]
+        self._streams[stream] = kept
+        return len(entries) - len(kept)
+
+    async def rpush(self, key, *values):
+        self._lists.setdefault(key, []).extend(values)
+        return len(self._lists[key])
+
+    async def lrange(self, key, start, end):
+        items = self._lists.get(key, [])
+        return items[start:] if end == -1 else items[start:end + 1]
 
     async def xreadgroup(
         self, groupname, consumername, streams, count=None, block=None
@@ -300,6 +335,131 @@ class TestSnapshotManager:
         assert loaded is None
 
 
+    @pytest.mark.asyncio
+    async def test_load_replays_table_deltas(
+        self, snapshot_manager, sample_tournament_state
+    ):
+        """베이스 이후 델타가 로드 시 재생되는지 테스트."""
+        state = sample_tournament_state
+        await snapshot_manager.save_full_snapshot(state)
+
+        user1 = state.players["user1"].with_chips(25000)
+        user3 = state.players["user3"].eliminated(rank=3)
+        state = replace(
+            state,
+            players=state.players.update({"user1": user1, "user3": user3}),
+            tables=state.tables.set(
+                "table1", state.tables["table1"].with_player_removed("user3")
+            ),
+            active_count=None,
+        )
+        await snapshot_manager.append_table_delta(state, ["table1"], ["user1", "user3"])
+
+        state = replace(state, current_blind_level=4)
+        await snapshot_manager.append_level_delta(state)
+
+        loaded = await snapshot_manager.load_latest("test-tournament-123")
+
+        assert loaded.players["user1"].chip_count == 25000
+        assert loaded.players["user3"].elimination_rank == 3
+        assert loaded.active_player_count == 2
+        assert loaded.tables["table1"].player_count == 2
+        assert loaded.current_blind_level == 4
+
+    @pytest.mark.asyncio
+    async def test_late_table_delta_keeps_status(
+        self, snapshot_manager, sample_tournament_state
+    ):
+        """늦게 기록된 테이블 델타가 상태 델타를 되돌리지 않는지 테스트."""
+        from app.tournament.models import TournamentStatus
+
+        state = sample_tournament_state
+        await snapshot_manager.save_full_snapshot(state)
+
+        # 다른 테이블 핸드 완료로 상태가 바뀐 뒤, 이전 상태로 만든 델타가 도착
+        stale = replace(
+            state,
+            players=state.players.set("user2", state.players["user2"].with_chips(9000)),
+        )
+        final = replace(stale, status=TournamentStatus.FINAL_TABLE)
+        await snapshot_manager.append_status_delta(final)
+        await snapshot_manager.append_table_delta(stale, ["table1"], ["user2"])
+
+        loaded = await snapshot_manager.load_latest("test-tournament-123")
+        assert loaded.status == TournamentStatus.FINAL_TABLE
+        assert loaded.players["user2"].chip_count == 9000
+
+    @pytest.mark.asyncio
+    async def test_compact_folds_log_into_base(
+        self, mock_redis, snapshot_manager, sample_tournament_state
+    ):
+        """압축 후 로그가 비워지고 이후 델타만 재생되는지 테스트."""
+        state = sample_tournament_state
+        await snapshot_manager.save_full_snapshot(state)
+
+        for chips in (11000, 12000, 13000):
+            state = replace(
+                state,
+                players=state.players.set(
+                    "user2", state.players["user2"].with_chips(chips)
+                ),
+            )
+            await snapshot_manager.append_table_delta(state, ["table1"], ["user2"])
+
+        log_key = snapshot_manager._log_key("test-tournament-123")
+        assert await snapshot_manager.compact("test-tournament-123") == 3
+        assert len(await mock_redis.xrange(log_key, min="(3-0")) == 0
+        # 이미 압축된 상태에서는 재압축하지 않음
+        assert await snapshot_manager.compact("test-tournament-123") == 0
+
+        state = replace(
+            state,
+            players=state.players.set("user2", state.players["user2"].with_chips(14000)),
+        )
+        await snapshot_manager.append_table_delta(state, ["table1"], ["user2"])
+
+        loaded = await snapshot_manager.load_latest("test-tournament-123")
+        assert loaded.players["user2"].chip_count == 14000
+        assert loaded.players["user1"].chip_count == 15000
+
+    @pytest.mark.asyncio
+    async def test_compaction_scheduled_after_threshold(
+        self, snapshot_manager, sample_tournament_state
+    ):
+        """COMPACT_EVERY개 델타 후 백그라운드 압축이 실행되는지 테스트."""
+        snapshot_manager.COMPACT_EVERY = 2
+        await snapshot_manager.save_full_snapshot(sample_tournament_state)
+
+        for _ in range(2):
+            await snapshot_manager.append_table_delta(
+                sample_tournament_state, ["table1"], ["user1"]
+            )
+        task = snapshot_manager._compactions["test-tournament-123"]
+        assert await task == 2
+        assert snapshot_manager._pending_deltas["test-tournament-123"] == 0
+
+    @pytest.mark.asyncio
+    async def test_hand_snapshot_with_actions(self, snapshot_manager):
+        """진행 중 핸드 스냅샷 + 액션 로그 저장/로드 테스트."""
+        await snapshot_manager.save_hand_snapshot(
+            "t1", "table1", "hand-1", b"\x00pk", {"user1": 1000}
+        )
+        await snapshot_manager.update_hand_action(
+            "t1", "table1", {"user_id": "user1", "action": "raise", "amount": 200}
+        )
+
+        hand = await snapshot_manager.load_hand("t1", "table1")
+        assert hand.hand_id == "hand-1"
+        assert hand.pk_state_bytes == b"\x00pk"
+        assert hand.starting_stacks == {"user1": 1000}
+        assert hand.action_log == [
+            {"user_id": "user1", "action": "raise", "amount": 200}
+        ]
+
+        await snapshot_manager.complete_hand("t1", "table1")
+        assert await snapshot_manager.load_hand("t1", "table1") is None
+
+
 class TestTournamentEngineRecovery:
     """Test TournamentEngine recovery functionality."""
 
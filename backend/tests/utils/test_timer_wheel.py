@@ -0,0 +1,141 @@
+"""Tests for the hierarchical timer wheel."""
+
+import asyncio
+import random
+
+import pytest
+
+from app.utils.timer_wheel import LEVEL_BITS, TimerWheel
+
+
+class FakeClock:
+    """Manually advanced loop clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+def manual_wheel(tick: float = 0.1) -> tuple[TimerWheel, FakeClock]:
+    """Wheel driven by hand (no driver task)."""
+    wheel = TimerWheel(tick=tick)
+    clock = FakeClock()
+    wheel._loop = clock
+    wheel._reset()
+    wheel._ensure_running = lambda: None
+    return wheel, clock
+
+
+def run_until(wheel: TimerWheel, clock: FakeClock, seconds: float) -> None:
+    """Advance the clock tick by tick, like the driver would."""
+    for _ in range(round(seconds / wheel._tick)):
+        clock.now = wheel._origin + (wheel._current + 1) * wheel._tick
+        wheel._advance(clock.now)
+
+
+class TestTimerWheel:
+    """TimerWheel 테스트."""
+
+    def test_fires_in_deadline_order_across_levels(self):
+        """모든 레벨(캐스케이드 포함)에서 데드라인 이후 한 틱 이내에 실행."""
+        wheel, clock = manual_wheel()
+        fired: list[tuple[float, float]] = []
+        rng = random.Random(7)
+
+        # 25.6s = level 0 span; 27min = level 1 span
+        delays = [rng.uniform(0, 3000) for _ in range(500)] + [0, 0.05, 25.6, 1638.4]
+        for delay in delays:
+            deadline = clock.now + delay
+            wheel.schedule(delay, lambda d=deadline: fired.append((d, clock.now)))
+        assert wheel.pending == len(delays)
+
+        run_until(wheel, clock, 3100)
+
+        assert wheel.pending == 0
+        assert len(fired) == len(delays)
+        for deadline, fired_at in fired:
+            assert deadline <= fired_at + 1e-6
+            assert fired_at - deadline <= wheel._tick + 1e-6
+
+    def test_cancel_is_idempotent(self):
+        """취소된 타이머는 실행되지 않음."""
+        wheel, clock = manual_wheel()
+        fired = []
+        handle = wheel.schedule(1.0, fired.append, "a")
+        wheel.schedule(1.0, fired.append, "b")
+
+        assert handle.cancel() is True
+        assert handle.cancel() is False
+        assert wheel.pending == 1
+
+        run_until(wheel, clock, 2)
+        assert fired == ["b"]
+        assert not handle.active
+
+    def test_callback_can_cancel_timer_in_same_tick(self):
+        """같은 틱의 다른 타이머를 콜백에서 취소해도 안전."""
+        wheel, clock = manual_wheel()
+        fired = []
+        handles = {}
+
+        def first():
+            fired.append("first")
+            handles["second"].cancel()
+
+        handles["first"] = wheel.schedule(0.5, first)
+        handles["second"] = wheel.schedule(0.5, fired.append, "second")
+
+        run_until(wheel, clock, 1)
+        assert fired == ["first"]
+        assert wheel.pending == 0
+
+    def test_beyond_top_level_is_clamped(self):
+        """최상위 레벨 범위를 넘는 타이머도 결국 실행."""
+        wheel, clock = manual_wheel(tick=1.0)
+        span_ticks = 1 << sum(LEVEL_BITS)
+        fired = []
+        wheel.schedule(span_ticks + 10, fired.append, True)
+
+        # Jump close to the end instead of ticking through the whole span
+        wheel._current = span_ticks - 5
+        clock.now = wheel._origin + wheel._current
+        for level_slots in wheel._levels:
+            for bucket in level_slots:
+                for handle in list(bucket):
+                    bucket.pop(handle)
+                    wheel._place(handle)
+
+        run_until(wheel, clock, 20)
+        assert fired == [True]
+
+    @pytest.mark.asyncio
+    async def test_driver_runs_coroutine_callbacks(self):
+        """드라이버 태스크가 코루틴 콜백을 실행."""
+        wheel = TimerWheel(tick=0.01)
+        done = asyncio.Event()
+
+        async def callback(value):
+            assert value == 42
+            done.set()
+
+        wheel.schedule(0.02, callback, 42)
+        await asyncio.wait_for(done.wait(), 1.0)
+        assert wheel.pending == 0
+        await wheel.stop()
+
+    @pytest.mark.asyncio
+    async def test_idle_driver_skips_ahead(self):
+        """대기 후 다시 스케줄해도 밀린 틱을 처리하지 않음."""
+        wheel = TimerWheel(tick=0.01)
+        first = asyncio.Event()
+        wheel.schedule(0, first.set)
+        await asyncio.wait_for(first.wait(), 1.0)
+
+        await asyncio.sleep(0.05)  # idle
+        second = asyncio.Event()
+        handle = wheel.schedule(0.01, second.set)
+        assert handle.expires - wheel._current <= 2
+        await asyncio.wait_for(second.wait(), 1.0)
+        await wheel.stop()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 from datetime import datetime, timedelta, timezone
 from typing import Any, AsyncGenerator
 from unittest.mock import AsyncMock, MagicMock
@@ -90,6 +91,11 @@ class MockWebSocket:
             raise RuntimeError("WebSocket closed")
         self.sent_messages.append(data)
 
+    async def send_text(self, data: str) -> None:
+        if self.closed:
+            raise RuntimeError("WebSocket closed")
+        self.sent_messages.append(json.loads(data))
+
     async def receive_json(self) -> dict[str, Any]:
         if self.closed:
             raise RuntimeError("WebSocket closed")
@@ -195,18 +201,48 @@ class MockRedis:
     async def expire(self, key: str, seconds: int) -> bool:
         return True
 
-    async def publish(self, channel: str, message: str) -> int:
+    async def publish(self, channel: str, message: str | bytes) -> int:
+        self._pubsub_channels.setdefault(channel, []).append(message)
         return 1
 
+    def pipeline(self, transaction: bool = True) -> "MockPipeline":
+        return MockPipeline(self)
+
     def pubsub(self):
         return MockPubSub()
 
 
+class MockPipeline:
+    """Mock Redis pipeline (publish only)."""
+
+    def __init__(self, redis: MockRedis):
+        self._redis = redis
+        self._commands: list[tuple[str, str | bytes]] = []
+
+    def publish(self, channel: str, message: str | bytes) -> None:
+        self._commands.append((channel, message))
+
+    async def execute(self) -> list[int]:
+        return [await self._redis.publish(c, m) for c, m in self._commands]
+
+
 class MockPubSub:
     """Mock Redis pub/sub."""
 
     def __init__(self):
         self._subscribed: set[str] = set()
+        self._connected = False  # redis-py: 첫 subscribe 때 연결 생성
+        self.get_message_calls = 0
+
+    async def subscribe(self, *channels: str) -> None:
+        self._subscribed.update(channels)
+        self._connected = True
+
+    async def unsubscribe(self, *channels: str) -> None:
+        if channels:
+            self._subscribed.difference_update(channels)
+        else:
+            self._subscribed.clear()
 
     async def psubscribe(self, pattern: str) -> None:
         self._subscribed.add(pattern)
@@ -222,6 +258,9 @@ class MockPubSub:
         ignore_subscribe_messages: bool = True,
         timeout: float = 1.0,
     ) -> dict[str, Any] | None:
+        if not self._connected:
+            raise RuntimeError("pubsub connection not set: did you forget to call subscribe()")
+        self.get_message_calls += 1
         await asyncio.sleep(0.01)  # Simulate async
         return None
 
@@ -16,6 +16,7 @@ from app.ws.connection import WebSocketConnection
 from app.ws.events import EventType
 from app.ws.messages import MessageEnvelope
 from app.game.poker_table import PokerTable, Player, GamePhase
+from app.utils.timer_wheel import get_timer_wheel
 
 
 # =============================================================================
@@ -244,18 +245,15 @@ class TestTimeoutManagement:
 
     @pytest.mark.asyncio
     async def test_cancel_turn_timeout_with_task(self, action_handler):
-        """Test cancelling existing timeout task."""
-        # Create a dummy task
-        async def dummy_task():
-            await asyncio.sleep(100)
-        
-        task = asyncio.create_task(dummy_task())
-        action_handler._timeout_tasks["room1"] = task
+        """Test cancelling existing timeout timer."""
+        # Register a dummy timer
+        handle = get_timer_wheel().schedule(100, lambda: None)
+        action_handler._turn_timers["room1"] = handle
         
         await action_handler._cancel_turn_timeout("room1")
         
-        assert "room1" not in action_handler._timeout_tasks
-        assert task.cancelled()
+        assert "room1" not in action_handler._turn_timers
+        assert not handle.active
 
 
 # =============================================================================
@@ -272,17 +270,15 @@ class TestCleanup:
         # Setup resources
         action_handler._table_locks["room1"] = asyncio.Lock()
         
-        async def dummy_task():
-            await asyncio.sleep(100)
-        
-        task = asyncio.create_task(dummy_task())
-        action_handler._timeout_tasks["room1"] = task
+        handle = get_timer_wheel().schedule(100, lambda: None)
+        action_handler._turn_timers["room1"] = handle
         
         # Cleanup
         await action_handler.cleanup_table_resources("room1")
         
         assert "room1" not in action_handler._table_locks
-        assert "room1" not in action_handler._timeout_tasks
+        assert "room1" not in action_handler._turn_timers
+        assert not handle.active
 
     @pytest.mark.asyncio
     async def test_cleanup_all_resources(self, action_handler):
@@ -291,19 +287,15 @@ class TestCleanup:
         action_handler._table_locks["room1"] = asyncio.Lock()
         action_handler._table_locks["room2"] = asyncio.Lock()
         
-        async def dummy_task():
-            await asyncio.sleep(100)
-        
-        task1 = asyncio.create_task(dummy_task())
-        task2 = asyncio.create_task(dummy_task())
-        action_handler._timeout_tasks["room1"] = task1
-        action_handler._timeout_tasks["room2"] = task2
+        wheel = get_timer_wheel()
+        action_handler._turn_timers["room1"] = wheel.schedule(100, lambda: None)
+        action_handler._turn_timers["room2"] = wheel.schedule(100, lambda: None)
         
         # Cleanup all
         await action_handler.cleanup_all_resources()
         
         assert len(action_handler._table_locks) == 0
-        assert len(action_handler._timeout_tasks) == 0
+        assert len(action_handler._turn_timers) == 0
 
     @pytest.mark.asyncio
     async def test_cleanup_idempotent(self, action_handler):
@@ -582,19 +574,18 @@ class TestActionHandlerIntegration:
         """Test cleanup properly cancels active timeout."""
         timeout_executed = False
         
-        async def timeout_handler():
+        def timeout_handler():
             nonlocal timeout_executed
-            await asyncio.sleep(0.5)
             timeout_executed = True
         
-        task = asyncio.create_task(timeout_handler())
-        action_handler._timeout_tasks["room1"] = task
+        handle = get_timer_wheel().schedule(0.2, timeout_handler)
+        action_handler._turn_timers["room1"] = handle
         
         # Cleanup immediately
         await action_handler.cleanup_table_resources("room1")
         
-        # Wait a bit to ensure timeout didn't execute
-        await asyncio.sleep(0.1)
+        # Wait past the deadline to ensure timeout didn't execute
+        await asyncio.sleep(0.4)
         
         assert timeout_executed is False
-        assert task.cancelled()
+        assert not handle.active
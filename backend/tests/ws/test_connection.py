@@ -1,6 +1,7 @@
 """Tests for WebSocket connection management."""
 
 import asyncio
+import json
 from datetime import datetime, timedelta
 from uuid import uuid4
 
@@ -9,6 +10,7 @@ import pytest_asyncio
 
 from app.ws.connection import WebSocketConnection, ConnectionState
 from app.ws.manager import ConnectionManager
+from app.ws.serializer import decode_msgpack, encode_msgpack
 from tests.ws.conftest import MockWebSocket, MockRedis
 
 
@@ -306,6 +308,83 @@ class TestConnectionManager:
         assert len(conn1.websocket.sent_messages) == 0
         assert len(conn2.websocket.sent_messages) == 1
 
+    @pytest.mark.asyncio
+    async def test_broadcast_slow_receiver_does_not_block_others(
+        self,
+        manager: ConnectionManager,
+    ):
+        """Test a stalled subscriber is skipped after the send deadline."""
+
+        class StalledWebSocket(MockWebSocket):
+            async def send_text(self, data: str) -> None:
+                await asyncio.sleep(10)
+
+        slow = WebSocketConnection(
+            websocket=StalledWebSocket(),
+            user_id="user-1",
+            session_id="session-1",
+            connection_id=str(uuid4()),
+            connected_at=datetime.utcnow(),
+        )
+        fast = WebSocketConnection(
+            websocket=MockWebSocket(),
+            user_id="user-2",
+            session_id="session-2",
+            connection_id=str(uuid4()),
+            connected_at=datetime.utcnow(),
+        )
+
+        await manager.connect(slow)
+        await manager.connect(fast)
+        await manager.subscribe(slow.connection_id, "table:123")
+        await manager.subscribe(fast.connection_id, "table:123")
+        manager._broadcast_send_timeout = 0.05
+
+        count = await asyncio.wait_for(
+            manager.broadcast_to_channel("table:123", {"type": "TABLE_UPDATE"}),
+            timeout=1.0,
+        )
+
+        assert count == 1
+        assert fast.websocket.sent_messages == [{"type": "TABLE_UPDATE"}]
+
+    @pytest.mark.asyncio
+    async def test_broadcast_counts_only_successful_sends(
+        self,
+        manager: ConnectionManager,
+    ):
+        """Test failed sends are not counted as delivered."""
+        conn1 = WebSocketConnection(
+            websocket=MockWebSocket(),
+            user_id="user-1",
+            session_id="session-1",
+            connection_id=str(uuid4()),
+            connected_at=datetime.utcnow(),
+        )
+        conn2 = WebSocketConnection(
+            websocket=MockWebSocket(),
+            user_id="user-2",
+            session_id="session-2",
+            connection_id=str(uuid4()),
+            connected_at=datetime.utcnow(),
+        )
+
+        await manager.connect(conn1)
+        await manager.connect(conn2)
+        await manager.subscribe(conn1.connection_id, "table:123")
+        await manager.subscribe(conn2.connection_id, "table:123")
+        conn1.websocket.closed = True
+
+        count = await manager.broadcast_to_channel(
+            "table:123",
+            {"type": "TABLE_UPDATE", "seats": {0: "user-2"}},
+        )
+
+        assert count == 1
+        assert conn2.websocket.sent_messages == [
+            {"type": "TABLE_UPDATE", "seats": {"0": "user-2"}}
+        ]
+
     @pytest.mark.asyncio
     async def test_user_state_storage(
         self,
@@ -355,3 +434,137 @@ class TestConnectionManager:
 
         assert connection.connection_id not in manager.get_channel_subscribers("lobby")
         assert connection.connection_id not in manager.get_channel_subscribers("table:123")
+
+
+class TestCrossInstanceBroadcast:
+    """Tests for batched, per-channel Redis pub/sub."""
+
+    @pytest_asyncio.fixture
+    async def manager(self) -> ConnectionManager:
+        """Create a started connection manager with mock Redis."""
+        mgr = ConnectionManager(MockRedis())
+        await mgr.start()
+        yield mgr
+        await mgr.stop()
+
+    def _connection(self, user_id: str) -> WebSocketConnection:
+        return WebSocketConnection(
+            websocket=MockWebSocket(),
+            user_id=user_id,
+            session_id="session-1",
+            connection_id=str(uuid4()),
+            connected_at=datetime.utcnow(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_subscribes_only_to_channels_with_local_members(
+        self,
+        manager: ConnectionManager,
+    ):
+        """Test pub/sub subscription follows local channel membership."""
+        conn = self._connection("user-1")
+        await manager.connect(conn)
+
+        await manager.subscribe(conn.connection_id, "table:123")
+        assert manager._pubsub._subscribed == {"ws:pubsub:table:123"}
+
+        await manager.unsubscribe(conn.connection_id, "table:123")
+        assert manager._pubsub._subscribed == set()
+
+    @pytest.mark.asyncio
+    async def test_listener_waits_for_first_subscription(
+        self,
+        manager: ConnectionManager,
+    ):
+        """Test an idle instance does not poll pub/sub before any channel is subscribed."""
+        await asyncio.sleep(0.05)
+        assert manager._pubsub.get_message_calls == 0
+
+        conn = self._connection("user-1")
+        await manager.connect(conn)
+        await manager.subscribe(conn.connection_id, "table:123")
+        await asyncio.sleep(0.05)
+
+        assert manager._pubsub.get_message_calls > 0
+
+    @pytest.mark.asyncio
+    async def test_publishes_are_batched_per_channel(
+        self,
+        manager: ConnectionManager,
+    ):
+        """Test broadcasts in one flush window become one msgpack publish per channel."""
+        await manager.broadcast_to_channel("table:123", {"type": "A"})
+        await manager.broadcast_to_channel("table:123", {"type": "B"}, exclude_connection="c1")
+        await manager.broadcast_to_channel("lobby", {"type": "C"})
+
+        assert manager.redis._pubsub_channels == {}
+        await asyncio.sleep(manager._publish_flush_interval + 0.05)
+
+        published = manager.redis._pubsub_channels
+        assert set(published) == {"ws:pubsub:table:123", "ws:pubsub:lobby"}
+        assert len(published["ws:pubsub:table:123"]) == 1
+
+        envelope = decode_msgpack(published["ws:pubsub:table:123"][0])
+        assert envelope["source_instance"] == manager._instance_id
+        assert envelope["messages"] == [[None, {"type": "A"}], ["c1", {"type": "B"}]]
+
+    @pytest.mark.asyncio
+    async def test_remote_batch_is_delivered_locally(
+        self,
+        manager: ConnectionManager,
+    ):
+        """Test a batch from another instance reaches local subscribers in order."""
+        conn1 = self._connection("user-1")
+        conn2 = self._connection("user-2")
+        await manager.connect(conn1)
+        await manager.connect(conn2)
+        await manager.subscribe(conn1.connection_id, "table:123")
+        await manager.subscribe(conn2.connection_id, "table:123")
+
+        await manager._handle_pubsub_message({
+            "type": "message",
+            "channel": b"ws:pubsub:table:123",
+            "data": encode_msgpack({
+                "source_instance": "other",
+                "messages": [
+                    [None, {"type": "A", "seats": {0: "x"}}],
+                    [conn1.connection_id, {"type": "B"}],
+                ],
+            }),
+        })
+
+        assert conn1.websocket.sent_messages == [{"type": "A", "seats": {"0": "x"}}]
+        assert conn2.websocket.sent_messages == [
+            {"type": "A", "seats": {"0": "x"}},
+            {"type": "B"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_legacy_json_and_own_messages(
+        self,
+        manager: ConnectionManager,
+    ):
+        """Test admin JSON publishes are delivered and own batches are skipped."""
+        conn = self._connection("user-1")
+        await manager.connect(conn)
+        await manager.subscribe(conn.connection_id, "lobby")
+
+        await manager._handle_pubsub_message({
+            "type": "message",
+            "channel": b"ws:pubsub:lobby",
+            "data": json.dumps({
+                "source_instance": "admin-backend",
+                "exclude_connection": None,
+                "message": {"type": "ANNOUNCEMENT"},
+            }).encode(),
+        })
+        await manager._handle_pubsub_message({
+            "type": "message",
+            "channel": b"ws:pubsub:lobby",
+            "data": encode_msgpack({
+                "source_instance": manager._instance_id,
+                "messages": [[None, {"type": "ECHO"}]],
+            }),
+        })
+
+        assert conn.websocket.sent_messages == [{"type": "ANNOUNCEMENT"}]
@@ -0,0 +1,106 @@
+"""Tests for per-message WebSocket DB session scoping."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.ws.db_scope import MessageDbScope, current_db_session, message_db_scope
+from app.ws.handlers.lobby import LobbyHandler
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    factory = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    yield factory
+    await engine.dispose()
+
+
+class TestMessageDbScope:
+    """message_db_scope() 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_session_created_lazily(self, session_factory):
+        """DB를 사용하지 않는 메시지는 세션을 만들지 않아야 함."""
+        async with message_db_scope("PING", session_factory) as scope:
+            assert scope.used is False
+        assert scope.used is False
+
+    @pytest.mark.asyncio
+    async def test_same_session_within_message(self, session_factory):
+        """한 메시지 안에서는 같은 세션을 사용해야 함."""
+        async with message_db_scope("SEAT_REQUEST", session_factory) as scope:
+            first = current_db_session()
+            assert current_db_session() is first
+            assert scope.used is True
+
+    @pytest.mark.asyncio
+    async def test_new_session_per_message(self, session_factory):
+        """메시지마다 새 세션을 사용해야 함."""
+        async with message_db_scope("SEAT_REQUEST", session_factory):
+            first = current_db_session()
+        async with message_db_scope("SEAT_REQUEST", session_factory):
+            second = current_db_session()
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_connection_returned_after_message(self, session_factory):
+        """메시지 처리 후 풀 커넥션이 반환되어야 함."""
+        async with message_db_scope("SUBSCRIBE_LOBBY", session_factory):
+            session = current_db_session()
+            await session.execute(text("SELECT 1"))
+            assert session.in_transaction()
+        assert not session.in_transaction()
+
+    def test_outside_scope_raises(self):
+        """메시지 범위 밖에서는 세션을 얻을 수 없어야 함."""
+        with pytest.raises(RuntimeError):
+            current_db_session()
+
+    @pytest.mark.asyncio
+    async def test_checkout_recorded_per_event_type(self, session_factory):
+        """트랜잭션마다 체크아웃이 이벤트 타입별로 기록되어야 함."""
+        with patch("app.ws.db_scope.record_ws_db_checkout") as record:
+            async with message_db_scope("ROOM_JOIN_REQUEST", session_factory):
+                session = current_db_session()
+                await session.execute(text("SELECT 1"))
+                await session.commit()
+                await session.execute(text("SELECT 1"))
+
+        assert record.call_count == 2
+        first, second = record.call_args_list
+        assert first.args[0] == "ROOM_JOIN_REQUEST"
+        assert first.args[1] >= 0  # 첫 체크아웃만 대기 시간 기록
+        assert second.args == ("ROOM_JOIN_REQUEST", None)
+
+
+class TestHandlerDbResolution:
+    """핸들러의 self.db 해석 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_handler_uses_message_session(self, session_factory):
+        """고정 세션이 없으면 현재 메시지 세션을 사용해야 함."""
+        handler = LobbyHandler(MagicMock())
+
+        async with message_db_scope("ROOM_CREATE_REQUEST", session_factory):
+            assert handler.db is current_db_session()
+            assert handler.room_service.db is handler.db
+
+    def test_handler_fixed_session(self):
+        """생성 시 전달한 세션이 우선해야 함."""
+        db = MagicMock()
+        handler = LobbyHandler(MagicMock(), db)
+
+        assert handler.db is db
+        assert handler.room_service.db is db
+
+    def test_scope_without_session_factory_call(self):
+        """세션 팩토리는 첫 접근 시에만 호출되어야 함."""
+        factory = MagicMock()
+        scope = MessageDbScope("PING", factory)
+
+        factory.assert_not_called()
+        assert scope.used is False
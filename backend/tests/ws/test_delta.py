@@ -0,0 +1,174 @@
+"""Tests for delta-encoded table state."""
+
+import copy
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+
+from app.ws.connection import WebSocketConnection
+from app.ws.delta import apply_delta, build_table_state_message, diff_state
+from app.ws.events import EventType
+from app.ws.manager import ConnectionManager
+from tests.ws.conftest import MockRedis, MockWebSocket
+
+
+def make_state(version: int, pot: int = 0, stack: int = 1000) -> dict:
+    player = {"seat": 0, "userId": "user-1", "stack": stack, "holeCards": ["Ah", "Kd"]}
+    return {
+        "tableId": "room-1",
+        "stateVersion": version,
+        "phase": "preflop",
+        "pot": pot,
+        "communityCards": [],
+        "players": [player, None],
+        "seats": {"0": player, "1": None},
+    }
+
+
+def make_connection(snapshot_deltas: bool = True) -> WebSocketConnection:
+    return WebSocketConnection(
+        websocket=MockWebSocket(),
+        user_id="user-1",
+        session_id="session-1",
+        connection_id=str(uuid4()),
+        connected_at=datetime.utcnow(),
+        snapshot_deltas=snapshot_deltas,
+    )
+
+
+class TestDiffState:
+    """diff_state / apply_delta 테스트."""
+
+    def test_identical_documents_produce_no_ops(self):
+        assert diff_state(make_state(1), make_state(1)) == []
+
+    def test_changed_leaf_is_replaced(self):
+        ops = diff_state(make_state(1, pot=0), make_state(2, pot=30))
+
+        assert {"op": "replace", "path": "/pot", "value": 30} in ops
+        assert {"op": "replace", "path": "/stateVersion", "value": 2} in ops
+
+    def test_round_trip(self):
+        old = make_state(1)
+        new = make_state(2, pot=60, stack=970)
+        new["communityCards"] = ["2c", "7d", "Ts"]
+        new["players"][1] = {"seat": 1, "userId": "user-2", "stack": 500}
+        new["seats"]["1"] = new["players"][1]
+        del new["phase"]
+        new["myPosition"] = 0
+
+        patched = apply_delta(copy.deepcopy(old), diff_state(old, new))
+
+        assert patched == new
+
+    def test_pointer_tokens_are_escaped(self):
+        ops = diff_state({"a/b": 1}, {"a/b": 2})
+
+        assert ops == [{"op": "replace", "path": "/a~1b", "value": 2}]
+        assert apply_delta({"a/b": 1}, ops) == {"a/b": 2}
+
+
+class TestBuildTableStateMessage:
+    """build_table_state_message 테스트."""
+
+    def test_first_state_is_full_snapshot(self):
+        conn = make_connection()
+
+        message = build_table_state_message(conn, "table:room-1", "room-1", make_state(1))
+
+        assert message.type == EventType.TABLE_SNAPSHOT
+        assert conn.last_seen_versions["table:room-1"] == 1
+
+    def test_following_state_is_delta(self):
+        conn = make_connection()
+        build_table_state_message(conn, "table:room-1", "room-1", make_state(1))
+
+        message = build_table_state_message(
+            conn, "table:room-1", "room-1", make_state(2, pot=30)
+        )
+
+        assert message.type == EventType.TABLE_DELTA
+        assert message.payload["baseVersion"] == 1
+        assert message.payload["stateVersion"] == 2
+        assert apply_delta(make_state(1), message.payload["ops"]) == make_state(2, pot=30)
+
+    def test_unchanged_state_is_skipped(self):
+        conn = make_connection()
+        build_table_state_message(conn, "table:room-1", "room-1", make_state(1))
+
+        assert build_table_state_message(conn, "table:room-1", "room-1", make_state(1)) is None
+
+    def test_version_not_advanced_sends_full_snapshot(self):
+        conn = make_connection()
+        build_table_state_message(conn, "table:room-1", "room-1", make_state(3))
+
+        message = build_table_state_message(
+            conn, "table:room-1", "room-1", make_state(3, stack=500)
+        )
+
+        assert message.type == EventType.TABLE_SNAPSHOT
+
+    def test_reset_base_forces_full_snapshot(self):
+        conn = make_connection()
+        build_table_state_message(conn, "table:room-1", "room-1", make_state(1))
+        conn.reset_snapshot_base("table:room-1")
+
+        message = build_table_state_message(
+            conn, "table:room-1", "room-1", make_state(2, pot=30)
+        )
+
+        assert message.type == EventType.TABLE_SNAPSHOT
+
+    def test_clients_without_deltas_always_get_snapshots(self):
+        conn = make_connection(snapshot_deltas=False)
+        build_table_state_message(conn, "table:room-1", "room-1", make_state(1))
+
+        message = build_table_state_message(
+            conn, "table:room-1", "room-1", make_state(2, pot=30)
+        )
+
+        assert message.type == EventType.TABLE_SNAPSHOT
+
+
+class TestSendTableState:
+    """ConnectionManager.send_table_state 테스트."""
+
+    @pytest_asyncio.fixture
+    async def manager(self) -> ConnectionManager:
+        return ConnectionManager(MockRedis())
+
+    @pytest.mark.asyncio
+    async def test_each_connection_gets_its_own_stream(self, manager: ConnectionManager):
+        delta_conn = make_connection(snapshot_deltas=True)
+        full_conn = make_connection(snapshot_deltas=False)
+        await manager.connect(delta_conn)
+        await manager.connect(full_conn)
+        await manager.subscribe(delta_conn.connection_id, "table:room-1")
+
+        await manager.send_table_state("user-1", "room-1", make_state(1))
+        count = await manager.send_table_state("user-1", "room-1", make_state(2, pot=30))
+
+        assert count == 2
+        assert [m["type"] for m in delta_conn.websocket.sent_messages] == [
+            "TABLE_SNAPSHOT",
+            "TABLE_DELTA",
+        ]
+        assert [m["type"] for m in full_conn.websocket.sent_messages] == [
+            "TABLE_SNAPSHOT",
+            "TABLE_SNAPSHOT",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_resubscribe_resets_delta_base(self, manager: ConnectionManager):
+        conn = make_connection()
+        await manager.connect(conn)
+        await manager.subscribe(conn.connection_id, "table:room-1")
+        await manager.send_table_state("user-1", "room-1", make_state(1))
+
+        await manager.unsubscribe(conn.connection_id, "table:room-1")
+        await manager.subscribe(conn.connection_id, "table:room-1")
+        await manager.send_table_state("user-1", "room-1", make_state(2, pot=30))
+
+        assert conn.websocket.sent_messages[-1]["type"] == "TABLE_SNAPSHOT"
@@ -5,6 +5,7 @@ Property 3: 봇 플레이어 액션 이벤트 미발행
 """
 
 import asyncio
+import json
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -200,16 +201,19 @@ class TestHandCompletedEventPublishing:
 
         mock_table = MagicMock()
         mock_table.hand_number = 42
-        mock_table.community_cards = ["Ah", "Kh", "Qh", "Jh", "Th"]
+        mock_table.community_cards = []  # 핸드 종료 후 이미 초기화된 상태
         mock_table.players = {0: mock_player, 1: None}
 
         hand_result = {
             "pot": 1000,
             "winners": [{"userId": "user-123", "amount": 1000}],
             "showdown": [{"userId": "user-123", "cards": ["As", "Kd"]}],
+            "communityCards": ["Ah", "Kh", "Qh", "Jh", "Th"],
         }
+        queue = AsyncMock()
 
-        with patch("app.ws.handlers.action.game_manager") as mock_gm:
+        with patch("app.ws.handlers.action.game_manager") as mock_gm, \
+             patch("app.ws.handlers.action.get_hand_history_queue", return_value=queue):
             mock_gm.get_table.return_value = mock_table
 
             await action_handler._publish_hand_completed_event(
@@ -224,6 +228,11 @@ class TestHandCompletedEventPublishing:
             call_args = mock_redis.publish.call_args
             assert call_args[0][0] == "fraud:hand_completed"
 
+            # 초기화 전 보드가 이벤트와 핸드 히스토리에 기록됨
+            assert json.loads(call_args[0][1])["community_cards"] == hand_result["communityCards"]
+            record = queue.enqueue.call_args.args[0]
+            assert record["community_cards"] == hand_result["communityCards"]
+
     @pytest.mark.asyncio
     async def test_hand_completed_event_disabled(self, mock_manager):
         """Redis 없으면 이벤트 발행 안 함."""
@@ -3,7 +3,7 @@
 import pytest
 import asyncio
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 from app.ws.gateway import (
     HeartbeatManager,
@@ -55,29 +55,32 @@ class TestHeartbeatManager:
         manager = HeartbeatManager(mock_connection)
         assert manager.connection == mock_connection
         assert manager._running is False
-        assert manager._task is None
+        assert manager._timer is None
 
     @pytest.mark.asyncio
     async def test_start_sets_running_flag(self, mock_connection):
-        """start()는 running 플래그를 설정하고 task를 생성해야 함."""
+        """start()는 running 플래그를 설정하고 타이머를 등록해야 함."""
         manager = HeartbeatManager(mock_connection)
 
         await manager.start()
         assert manager._running is True
-        assert manager._task is not None
+        assert manager._timer is not None
+        assert manager._timer.active
 
         await manager.stop()
 
     @pytest.mark.asyncio
-    async def test_stop_cancels_task(self, mock_connection):
-        """stop()은 task를 취소해야 함."""
+    async def test_stop_cancels_timer(self, mock_connection):
+        """stop()은 타이머를 취소해야 함."""
         manager = HeartbeatManager(mock_connection)
 
         await manager.start()
+        timer = manager._timer
         await manager.stop()
 
         assert manager._running is False
-        assert manager._task is None
+        assert manager._timer is None
+        assert not timer.active
 
     @pytest.mark.asyncio
     async def test_record_pong_updates_connection(self, mock_connection):
@@ -91,22 +94,11 @@ class TestHeartbeatManager:
         assert mock_connection.missed_pongs == 0
 
     @pytest.mark.asyncio
-    async def test_heartbeat_loop_sends_ping(self, mock_connection):
-        """하트비트 루프는 PING 메시지를 전송해야 함."""
+    async def test_heartbeat_tick_sends_ping(self, mock_connection):
+        """하트비트 틱은 PING 메시지를 전송해야 함."""
         manager = HeartbeatManager(mock_connection)
 
-        call_count = 0
-
-        async def mock_sleep(seconds):
-            nonlocal call_count
-            call_count += 1
-            # 두 번째 sleep에서 종료 (첫 번째 sleep 후 PING 전송됨)
-            if call_count >= 2:
-                manager._running = False
-
-        with patch('app.ws.gateway.asyncio.sleep', side_effect=mock_sleep):
-            manager._running = True
-            await manager._heartbeat_loop()
+        assert await manager._heartbeat_tick() is True
 
         # PING 메시지 전송 확인
         mock_connection.send.assert_called()
@@ -115,7 +107,7 @@ class TestHeartbeatManager:
         assert "timestamp" in call_args
 
     @pytest.mark.asyncio
-    async def test_heartbeat_loop_increments_missed_pongs_on_no_response(self, mock_connection):
+    async def test_heartbeat_tick_increments_missed_pongs_on_no_response(self, mock_connection):
         """PONG 응답이 없으면 missed_pongs가 증가해야 함."""
         manager = HeartbeatManager(mock_connection)
 
@@ -124,24 +116,13 @@ class TestHeartbeatManager:
         mock_connection.last_pong_at = None
         mock_connection.missed_pongs = 0
 
-        call_count = 0
-
-        async def mock_sleep(seconds):
-            nonlocal call_count
-            call_count += 1
-            # 두 번째 sleep에서 종료 (첫 번째 sleep 후 missed_pongs 증가)
-            if call_count >= 2:
-                manager._running = False
-
-        with patch('app.ws.gateway.asyncio.sleep', side_effect=mock_sleep):
-            manager._running = True
-            await manager._heartbeat_loop()
+        assert await manager._heartbeat_tick() is True
 
         # missed_pongs가 증가해야 함
         assert mock_connection.missed_pongs == 1
 
     @pytest.mark.asyncio
-    async def test_heartbeat_loop_closes_connection_on_max_missed(self, mock_connection):
+    async def test_heartbeat_tick_closes_connection_on_max_missed(self, mock_connection):
         """최대 미응답 횟수 초과 시 연결을 종료해야 함."""
         manager = HeartbeatManager(mock_connection)
 
@@ -150,9 +131,7 @@ class TestHeartbeatManager:
         mock_connection.last_pong_at = None
         mock_connection.missed_pongs = 1  # 다음에 2가 되면 종료
 
-        with patch('app.ws.gateway.asyncio.sleep', new_callable=AsyncMock):
-            manager._running = True
-            await manager._heartbeat_loop()
+        assert await manager._heartbeat_tick() is False
 
         # 연결 종료 확인
         mock_connection.websocket.close.assert_called_once()
@@ -161,7 +140,7 @@ class TestHeartbeatManager:
         assert "Heartbeat timeout" in close_args[0][1]
 
     @pytest.mark.asyncio
-    async def test_heartbeat_loop_resets_missed_pongs_on_pong(self, mock_connection):
+    async def test_heartbeat_tick_resets_missed_pongs_on_pong(self, mock_connection):
         """PONG 응답을 받으면 missed_pongs가 리셋되어야 함."""
         manager = HeartbeatManager(mock_connection)
 
@@ -170,17 +149,7 @@ class TestHeartbeatManager:
         mock_connection.last_pong_at = datetime.utcnow()  # PING 이후 PONG 수신
         mock_connection.missed_pongs = 0
 
-        call_count = 0
-
-        async def mock_sleep(seconds):
-            nonlocal call_count
-            call_count += 1
-            if call_count >= 1:
-                manager._running = False
-
-        with patch('app.ws.gateway.asyncio.sleep', side_effect=mock_sleep):
-            manager._running = True
-            await manager._heartbeat_loop()
+        assert await manager._heartbeat_tick() is True
 
         # missed_pongs는 0 유지
         assert mock_connection.missed_pongs == 0
@@ -192,22 +161,39 @@ class TestHeartbeatManager:
         """PING 전송 후 last_ping_at이 업데이트되어야 함."""
         manager = HeartbeatManager(mock_connection)
 
-        call_count = 0
-
-        async def mock_sleep(seconds):
-            nonlocal call_count
-            call_count += 1
-            # 두 번째 sleep에서 종료 (첫 번째 sleep 후 PING 전송)
-            if call_count >= 2:
-                manager._running = False
-
-        with patch('app.ws.gateway.asyncio.sleep', side_effect=mock_sleep):
-            manager._running = True
-            await manager._heartbeat_loop()
+        await manager._heartbeat_tick()
 
         # last_ping_at이 설정되어야 함
         assert mock_connection.last_ping_at is not None
 
+    @pytest.mark.asyncio
+    async def test_timer_reschedules_next_ping(self, mock_connection):
+        """타이머 만료 후 다음 PING이 예약되어야 함."""
+        manager = HeartbeatManager(mock_connection)
+        manager._running = True
+
+        await manager._on_timer()
+
+        mock_connection.send.assert_called_once()
+        assert manager._timer is not None
+        assert manager._timer.active
+
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_timer_stops_after_timeout_close(self, mock_connection):
+        """하트비트 타임아웃으로 종료되면 다시 예약하지 않아야 함."""
+        manager = HeartbeatManager(mock_connection)
+        mock_connection.last_ping_at = datetime.utcnow() - timedelta(seconds=35)
+        mock_connection.last_pong_at = None
+        mock_connection.missed_pongs = 1
+        manager._running = True
+
+        await manager._on_timer()
+
+        assert manager._running is False
+        assert manager._timer is None
+
 
 class TestHeartbeatErrorHandling:
     """HeartbeatManager 에러 처리 테스트."""
@@ -228,25 +214,14 @@ class TestHeartbeatErrorHandling:
 
     @pytest.mark.asyncio
     async def test_handles_send_failure(self, mock_connection):
-        """send 실패 시에도 루프가 계속되어야 함."""
+        """send 실패 시에도 하트비트가 계속되어야 함."""
         manager = HeartbeatManager(mock_connection)
         mock_connection.send.return_value = False
 
-        call_count = 0
-
-        async def mock_sleep(seconds):
-            nonlocal call_count
-            call_count += 1
-            if call_count >= 2:
-                manager._running = False
-
-        with patch('app.ws.gateway.asyncio.sleep', side_effect=mock_sleep):
-            manager._running = True
-            # 에러 없이 완료되어야 함
-            await manager._heartbeat_loop()
-
-        # 여러 번 시도했어야 함
-        assert call_count >= 1
+        # 에러 없이 완료되어야 함
+        assert await manager._heartbeat_tick() is True
+        # 전송 실패 시 last_ping_at은 갱신되지 않음
+        assert mock_connection.last_ping_at is None
 
     @pytest.mark.asyncio
     async def test_handles_close_error(self, mock_connection):
@@ -258,32 +233,26 @@ class TestHeartbeatErrorHandling:
         mock_connection.missed_pongs = 1  # 다음에 2가 되면 종료 시도
         mock_connection.websocket.close.side_effect = Exception("Close failed")
 
-        with patch('app.ws.gateway.asyncio.sleep', new_callable=AsyncMock):
-            manager._running = True
-            # 에러 없이 완료되어야 함
-            await manager._heartbeat_loop()
+        manager._running = True
+        # 에러 없이 완료되어야 함
+        await manager._on_timer()
 
-        # 루프가 종료되어야 함
+        # 하트비트가 종료되어야 함
         assert manager._running is False
 
     @pytest.mark.asyncio
     async def test_handles_send_exception(self, mock_connection):
-        """send 예외 발생 시에도 루프가 계속되어야 함."""
+        """send 예외 발생 시에도 하트비트가 계속되어야 함."""
         manager = HeartbeatManager(mock_connection)
         mock_connection.send.side_effect = Exception("Send exception")
 
-        call_count = 0
+        manager._running = True
+        # 에러 없이 완료되어야 함
+        await manager._on_timer()
 
-        async def mock_sleep(seconds):
-            nonlocal call_count
-            call_count += 1
-            if call_count >= 2:
-                manager._running = False
-
-        with patch('app.ws.gateway.asyncio.sleep', side_effect=mock_sleep):
-            manager._running = True
-            # 에러 없이 완료되어야 함
-            await manager._heartbeat_loop()
+        assert manager._running is True
+        assert manager._timer.active
+        await manager.stop()
 
 
 class TestSystemHandlerPong:
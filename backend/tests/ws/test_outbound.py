@@ -0,0 +1,192 @@
+"""Tests for per-connection outbound queues."""
+
+import asyncio
+import json
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+
+from app.ws.connection import WebSocketConnection
+from app.ws.outbound import (
+    OUTBOUND_OVERFLOW_CLOSE_CODE,
+    OutboundQueue,
+    OverflowPolicy,
+    coalesce_key,
+)
+from tests.ws.conftest import MockWebSocket
+
+
+class GatedWebSocket(MockWebSocket):
+    """MockWebSocket whose writes block until released."""
+
+    def __init__(self):
+        super().__init__()
+        self.gate = asyncio.Event()
+
+    async def send_text(self, data: str) -> None:
+        await self.gate.wait()
+        await super().send_text(data)
+
+
+def snapshot(table_id: str, version: int) -> dict:
+    return {
+        "type": "TABLE_SNAPSHOT",
+        "payload": {"tableId": table_id, "stateVersion": version},
+    }
+
+
+def encode(message: dict) -> str:
+    return json.dumps(message)
+
+
+async def drain(queue: OutboundQueue) -> None:
+    for _ in range(50):
+        if queue.depth == 0:
+            break
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+
+class TestCoalesceKey:
+    """coalesce_key 테스트."""
+
+    def test_snapshot_is_coalescable(self):
+        assert coalesce_key(snapshot("t1", 7)) == ("TABLE_SNAPSHOT:t1", 7)
+
+    def test_version_read_from_nested_state(self):
+        message = {
+            "type": "TABLE_SNAPSHOT",
+            "payload": {"tableId": "t1", "state": {"stateVersion": 3}},
+        }
+        assert coalesce_key(message) == ("TABLE_SNAPSHOT:t1", 3)
+
+    def test_other_events_are_not_coalesced(self):
+        assert coalesce_key({"type": "ACTION_RESULT", "payload": {"tableId": "t1"}}) is None
+
+    def test_request_reply_is_not_coalesced(self):
+        message = {**snapshot("t1", 7), "requestId": "req-1"}
+        assert coalesce_key(message) is None
+
+    def test_error_snapshot_is_not_coalesced(self):
+        message = {
+            "type": "TABLE_SNAPSHOT",
+            "payload": {"tableId": "t1", "error": "TABLE_NOT_FOUND"},
+        }
+        assert coalesce_key(message) is None
+
+
+class TestOutboundQueue:
+    """OutboundQueue 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_writer_delivers_in_order(self):
+        ws = MockWebSocket()
+        queue = OutboundQueue(ws, "conn-1", maxsize=10)
+        queue.start()
+
+        for i in range(3):
+            assert queue.put(encode({"type": "TEST", "n": i}))
+        await drain(queue)
+
+        assert [m["n"] for m in ws.sent_messages] == [0, 1, 2]
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_newer_snapshot_replaces_queued_one(self):
+        ws = GatedWebSocket()
+        queue = OutboundQueue(ws, "conn-1", maxsize=10)
+        queue.start()
+
+        queue.put(encode({"type": "HEAD"}))
+        await asyncio.sleep(0)  # writer picks up HEAD and blocks on the gate
+
+        first = snapshot("t1", 1)
+        queue.put(encode(first), coalesce_key(first))
+        queue.put(encode({"type": "ACTION_RESULT"}))
+        second = snapshot("t1", 2)
+        queue.put(encode(second), coalesce_key(second))
+
+        assert queue.depth == 2
+
+        ws.gate.set()
+        await drain(queue)
+
+        # 교체된 스냅샷은 원래 위치 (뒤에 쌓인 메시지보다 앞) 에서 전송
+        assert [m["type"] for m in ws.sent_messages] == [
+            "HEAD",
+            "TABLE_SNAPSHOT",
+            "ACTION_RESULT",
+        ]
+        assert ws.sent_messages[1]["payload"]["stateVersion"] == 2
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_stale_snapshot_is_discarded(self):
+        queue = OutboundQueue(MockWebSocket(), "conn-1", maxsize=10)
+
+        newer = snapshot("t1", 5)
+        older = snapshot("t1", 4)
+        assert queue.put(encode(newer), coalesce_key(newer))
+        assert not queue.put(encode(older), coalesce_key(older))
+        assert queue.depth == 1
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_policy(self):
+        ws = MockWebSocket()
+        queue = OutboundQueue(ws, "conn-1", maxsize=2, policy=OverflowPolicy.DROP_OLDEST)
+
+        for i in range(3):
+            assert queue.put(encode({"type": "TEST", "n": i}))
+
+        queue.start()
+        await drain(queue)
+
+        assert [m["n"] for m in ws.sent_messages] == [1, 2]
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_policy_closes_connection(self):
+        ws = MockWebSocket()
+        queue = OutboundQueue(ws, "conn-1", maxsize=2, policy=OverflowPolicy.DISCONNECT)
+
+        queue.put(encode({"type": "TEST"}))
+        queue.put(encode({"type": "TEST"}))
+        assert not queue.put(encode({"type": "TEST"}))
+        assert not queue.is_open
+
+        queue.start()
+        await asyncio.sleep(0)
+
+        assert ws.closed
+        assert ws.close_code == OUTBOUND_OVERFLOW_CLOSE_CODE
+        assert ws.sent_messages == []
+        await queue.stop()
+
+
+class TestConnectionOutbound:
+    """WebSocketConnection outbound queue integration."""
+
+    @pytest.mark.asyncio
+    async def test_send_does_not_wait_for_slow_socket(self):
+        ws = GatedWebSocket()
+        conn = WebSocketConnection(
+            websocket=ws,
+            user_id="user-1",
+            session_id="session-1",
+            connection_id=str(uuid4()),
+            connected_at=datetime.utcnow(),
+        )
+        conn.start_outbound_queue(maxsize=10)
+
+        result = await asyncio.wait_for(conn.send({"type": "TEST"}), timeout=0.5)
+
+        assert result is True
+        assert ws.sent_messages == []
+
+        ws.gate.set()
+        await drain(conn.outbound)
+        assert ws.sent_messages == [{"type": "TEST"}]
+
+        await conn.stop_outbound_queue()
+        assert await conn.send({"type": "TEST"}) is False
@@ -0,0 +1,37 @@
+"""Tests for the RATE_LIMIT_EXCEEDED error message."""
+
+from app.ws.gateway import create_rate_limit_message
+
+
+class TestRateLimitMessage:
+    """레이트 리밋 에러 메시지 테스트."""
+
+    def test_echoes_request_and_trace_ids(self):
+        """원본 메시지의 requestId/traceId를 그대로 돌려줘야 함."""
+        msg = create_rate_limit_message(
+            {"type": "ACTION_REQUEST", "requestId": "req-1", "traceId": "trace-1"},
+            1500,
+        )
+
+        assert msg["type"] == "ERROR"
+        assert msg["requestId"] == "req-1"
+        assert msg["traceId"] == "trace-1"
+        assert msg["payload"]["errorCode"] == "RATE_LIMIT_EXCEEDED"
+        assert msg["payload"]["details"] == {
+            "retryAfterMs": 1500,
+            "retryAfterSeconds": 2,
+        }
+
+    def test_ignores_missing_or_invalid_ids(self):
+        """requestId가 없거나 문자열이 아니면 생략해야 함."""
+        msg = create_rate_limit_message({"requestId": 42}, 100)
+
+        assert "requestId" not in msg
+        assert isinstance(msg["traceId"], str)
+
+    def test_non_dict_frame(self):
+        """dict가 아닌 프레임도 에러 메시지를 만들 수 있어야 함."""
+        msg = create_rate_limit_message(["not", "an", "envelope"], 100)
+
+        assert msg["payload"]["errorCode"] == "RATE_LIMIT_EXCEEDED"
+        assert "requestId" not in msg
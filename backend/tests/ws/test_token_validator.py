@@ -67,30 +67,33 @@ class TestTokenValidator:
         assert validator.token == valid_token
         assert validator.connection == mock_connection
         assert validator._running is False
-        assert validator._task is None
+        assert validator._timer is None
 
     @pytest.mark.asyncio
     async def test_start_sets_running_flag(self, mock_connection, valid_token):
-        """Start should set running flag and create task."""
+        """Start should set running flag and register a timer."""
         validator = TokenValidator(valid_token, mock_connection)
         
         # Start and immediately stop to avoid long wait
         await validator.start()
         assert validator._running is True
-        assert validator._task is not None
+        assert validator._timer is not None
+        assert validator._timer.active
         
         await validator.stop()
 
     @pytest.mark.asyncio
     async def test_stop_cancels_task(self, mock_connection, valid_token):
-        """Stop should cancel the validation task."""
+        """Stop should cancel the validation timer."""
         validator = TokenValidator(valid_token, mock_connection)
         
         await validator.start()
+        timer = validator._timer
         await validator.stop()
         
         assert validator._running is False
-        assert validator._task is None
+        assert validator._timer is None
+        assert not timer.active
 
     @pytest.mark.asyncio
     async def test_validate_token_returns_true_for_valid(self, mock_connection, valid_token):
@@ -117,16 +120,13 @@ class TestTokenValidator:
         assert result is False
 
     @pytest.mark.asyncio
-    async def test_validation_loop_sends_reauth_on_expiry(self, mock_connection, expired_token):
-        """Validation loop should send REAUTH_REQUIRED when token expires."""
+    async def test_validation_timer_sends_reauth_on_expiry(self, mock_connection, expired_token):
+        """Validation timer should send REAUTH_REQUIRED when token expires."""
         validator = TokenValidator(expired_token, mock_connection)
+        validator._running = True
         
-        # Patch sleep to return immediately
-        with patch('asyncio.sleep', new_callable=AsyncMock):
-            validator._running = True
-            
-            # Run one iteration of the loop
-            await validator._validation_loop()
+        # Fire the timer once
+        await validator._on_timer()
         
         # Should have sent reauth message
         mock_connection.send.assert_called_once()
@@ -138,29 +138,28 @@ class TestTokenValidator:
         close_args = mock_connection.websocket.close.call_args
         assert close_args[0][0] == 4002  # Close code
 
+        # Should not reschedule
+        assert validator._running is False
+        assert validator._timer is None
+
     @pytest.mark.asyncio
-    async def test_validation_loop_continues_on_valid_token(self, mock_connection, valid_token):
-        """Validation loop should continue when token is valid."""
+    async def test_validation_timer_reschedules_on_valid_token(self, mock_connection, valid_token):
+        """Validation timer should reschedule itself when token is valid."""
         validator = TokenValidator(valid_token, mock_connection)
+        validator._running = True
         
-        call_count = 0
-        
-        async def mock_sleep(seconds):
-            nonlocal call_count
-            call_count += 1
-            if call_count >= 2:
-                validator._running = False
-            return None
-        
-        with patch('asyncio.sleep', side_effect=mock_sleep):
-            validator._running = True
-            await validator._validation_loop()
+        await validator._on_timer()
         
         # Should not have sent reauth message
         mock_connection.send.assert_not_called()
         
         # Should not have closed connection
         mock_connection.websocket.close.assert_not_called()
+        
+        # Next check registered
+        assert validator._timer is not None
+        assert validator._timer.active
+        await validator.stop()
 
     @pytest.mark.asyncio
     async def test_stop_while_running(self, mock_connection, valid_token):
@@ -215,10 +214,9 @@ class TestTokenValidatorErrorHandling:
         # Make send raise an exception
         mock_connection.send.side_effect = Exception("Send failed")
         
-        with patch('asyncio.sleep', new_callable=AsyncMock):
-            validator._running = True
-            # Should not raise
-            await validator._validation_loop()
+        validator._running = True
+        # Should not raise
+        await validator._on_timer()
         
         # Should still try to close connection
         mock_connection.websocket.close.assert_called_once()
@@ -235,10 +233,9 @@ class TestTokenValidatorErrorHandling:
         # Make close raise an exception
         mock_connection.websocket.close.side_effect = Exception("Close failed")
         
-        with patch('asyncio.sleep', new_callable=AsyncMock):
-            validator._running = True
-            # Should not raise
-            await validator._validation_loop()
+        validator._running = True
+        # Should not raise
+        await validator._on_timer()
         
         # Should have stopped running
         assert validator._running is False
@@ -248,22 +245,15 @@ class TestTokenValidatorErrorHandling:
         """Should handle unexpected validation exceptions."""
         validator = TokenValidator("some-token", mock_connection)
         
-        call_count = 0
-        
-        async def mock_sleep(seconds):
-            nonlocal call_count
-            call_count += 1
-            if call_count >= 2:
-                validator._running = False
-        
-        with patch('asyncio.sleep', side_effect=mock_sleep):
-            with patch.object(
-                validator, '_validate_token',
-                side_effect=Exception("Unexpected error")
-            ):
-                validator._running = True
-                # Should not raise, should continue loop
-                await validator._validation_loop()
+        with patch.object(
+            validator, '_validate_token',
+            side_effect=Exception("Unexpected error")
+        ):
+            validator._running = True
+            # Should not raise, should keep validating
+            await validator._on_timer()
         
-        # Should have continued after error
-        assert call_count >= 1
+        # Should have rescheduled after error
+        assert validator._running is True
+        assert validator._timer.active
+        await validator.stop()